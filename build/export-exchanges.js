@@ -644,8 +644,8 @@ async function exportEverything () {
         },
         {
             file: './python/ccxt/__init__.py',
-            regex: /(?:from ccxt\.[^\.]+ import [^\s]+\s+\# noqa\: F401[\r]?[\n])+[\r]?[\n]exchanges/,
-            replacement: ids.map (id => ('from ccxt.' + id + ' import ' + id).padEnd (70) + '# noqa: F401').join ("\n") + "\n\nexchanges",
+            regex: /if TYPE_CHECKING\:[\r]?[\n](?:    from [^\n]+[\r]?[\n])+/,
+            replacement: "if TYPE_CHECKING:\n" + ids.map (id => ('    from ccxt.' + id + ' import ' + id).padEnd (70) + '# noqa: F401').join ("\n") + "\n",
         },
         {
             file: './python/ccxt/__init__.py',
@@ -659,8 +659,8 @@ async function exportEverything () {
         },
         {
             file: './python/ccxt/async_support/__init__.py',
-            regex: /(?:from ccxt\.async_support\.[^\.]+ import [^\s]+\s+\# noqa\: F401[\r]?[\n])+[\r]?[\n]exchanges/,
-            replacement: ids.map (id => ('from ccxt.async_support.' + id + ' import ' + id).padEnd (80) + '# noqa: F401').join ("\n") + "\n\nexchanges",
+            regex: /if TYPE_CHECKING\:[\r]?[\n](?:    from [^\n]+[\r]?[\n])+/,
+            replacement: "if TYPE_CHECKING:\n" + ids.map (id => ('    from ccxt.async_support.' + id + ' import ' + id).padEnd (70) + '# noqa: F401').join ("\n") + "\n",
         },
         {
             file: './python/ccxt/async_support/__init__.py',
@@ -679,8 +679,8 @@ async function exportEverything () {
         },
         {
             file: './python/ccxt/pro/__init__.py',
-            regex: /(?:from ccxt\.pro\.[^\.]+ import [^\s]+\s+\# noqa\: F401[\r]?[\n])+[\r]?[\n]exchanges/,
-            replacement: wsIds.map (id => ('from ccxt.pro.' + id + ' import ' + id).padEnd (74) + '# noqa: F401').join ("\n") + "\n\nexchanges",
+            regex: /if TYPE_CHECKING\:[\r]?[\n](?:    from [^\n]+[\r]?[\n])+/,
+            replacement: "if TYPE_CHECKING:\n" + wsIds.map (id => ('    from ccxt.pro.' + id + ' import ' + id).padEnd (70) + '# noqa: F401').join ("\n") + "\n",
         },
         {
             file: './python/ccxt/pro/__init__.py',
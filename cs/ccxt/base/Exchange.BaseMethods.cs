@@ -1561,6 +1561,172 @@ public partial class Exchange
         return add(add(symbol, " : "), "orderbook data checksum validation failed. You can reconnect by calling watchOrderBook again or you can mute the error by setting exchange.options[\"watchOrderBook\"][\"checksum\"] = false");
     }
 
+    public virtual object orderBookChecksum(object symbol, object orderbook, object format, object depth, object keyIndex = null, object priceLength = null, object amountLength = null)
+    {
+        //
+        // crc32 of the top depth levels of the orderbook in the layout the exchange checksums
+        //
+        //     'interleaved' bid price:bid amount:ask price:ask amount:... (okx)
+        //     'signed'      same as interleaved with negative ask amounts (bitfinex)
+        //     'stripped'    asks then bids, decimals padded to priceLength/amountLength, no dot, no leading zeros (kraken)
+        //
+        // the strings of the levels that stay in the top depth are reused between updates
+        // and the previous checksum is returned when none of the top depth levels changed
+        //
+        keyIndex ??= 0;
+        object previous = this.safeDict(this.orderbookChecksums, symbol, new Dictionary<string, object>() {});
+        object previousBids = new List<object>() {};
+        object previousAsks = new List<object>() {};
+        object checksum = null;
+        object sameFormat = isTrue(isTrue((isEqual(this.safeString(previous, "format"), format))) && isTrue((isEqual(this.safeInteger(previous, "depth"), depth)))) && isTrue((isEqual(this.safeInteger(previous, "keyIndex"), keyIndex)));
+        object sameLengths = isTrue((isEqual(this.safeInteger(previous, "priceLength"), priceLength))) && isTrue((isEqual(this.safeInteger(previous, "amountLength"), amountLength)));
+        if (isTrue(isTrue(sameFormat) && isTrue(sameLengths)))
+        {
+            previousBids = getValue(previous, "bids");
+            previousAsks = getValue(previous, "asks");
+            checksum = this.safeInteger(previous, "checksum");
+        }
+        object bids = this.orderBookChecksumLevels(getValue(orderbook, "bids"), previousBids, format, depth, keyIndex, priceLength, amountLength, false);
+        object asks = this.orderBookChecksumLevels(getValue(orderbook, "asks"), previousAsks, format, depth, keyIndex, priceLength, amountLength, true);
+        if (isTrue(isTrue(isTrue((isEqual(checksum, null))) || isTrue(getValue(bids, "changed"))) || isTrue(getValue(asks, "changed"))))
+        {
+            object payload = this.orderBookChecksumPayload(getValue(bids, "levels"), getValue(asks, "levels"), format, depth);
+            checksum = this.crc32(payload, !isEqual(format, "stripped"));
+        }
+        ((IDictionary<string,object>)this.orderbookChecksums)[(string)symbol] = new Dictionary<string, object>() {
+            { "format", format },
+            { "depth", depth },
+            { "keyIndex", keyIndex },
+            { "priceLength", priceLength },
+            { "amountLength", amountLength },
+            { "bids", getValue(bids, "levels") },
+            { "asks", getValue(asks, "levels") },
+            { "checksum", checksum },
+        };
+        return checksum;
+    }
+
+    public virtual object orderBookChecksumLevels(object bookside, object previous, object format, object depth, object keyIndex, object priceLength, object amountLength, object isAsk)
+    {
+        // returns [ key, amount, keyString, amountString ] for the top depth levels of one side
+        object booksideLength = getArrayLength(bookside);
+        object previousLength = getArrayLength(previous);
+        object count = mathMin(depth, booksideLength);
+        object negate = isTrue(isAsk) && isTrue((isEqual(format, "signed")));
+        object changed = (!isEqual(count, previousLength));
+        object levels = new List<object>() {};
+        object j = 0;
+        for (object i = 0; isLessThan(i, count); postFixIncrement(ref i))
+        {
+            object level = getValue(bookside, i);
+            object key = getValue(level, keyIndex);
+            object amount = getValue(level, 1);
+            object keyString = null;
+            object amountString = null;
+            // a level added or removed above shifts the level by a few positions
+            for (object offset = 0; isLessThan(offset, 4); postFixIncrement(ref offset))
+            {
+                object k = add(j, offset);
+                if (isTrue(isGreaterThanOrEqual(k, previousLength)))
+                {
+                    break;
+                }
+                object entry = getValue(previous, k);
+                if (isTrue(isEqual(getValue(entry, 0), key)))
+                {
+                    keyString = getValue(entry, 2);
+                    if (isTrue(isEqual(getValue(entry, 1), amount)))
+                    {
+                        amountString = getValue(entry, 3);
+                    }
+                    if (isTrue(!isEqual(k, i)))
+                    {
+                        changed = true;
+                    }
+                    j = add(k, 1);
+                    break;
+                }
+            }
+            if (isTrue(isEqual(keyString, null)))
+            {
+                keyString = this.orderBookChecksumString(key, format, priceLength, false);
+                changed = true;
+            }
+            if (isTrue(isEqual(amountString, null)))
+            {
+                amountString = this.orderBookChecksumString(amount, format, amountLength, negate);
+                changed = true;
+            }
+            ((IList<object>)levels).Add(new List<object>() {key, amount, keyString, amountString});
+        }
+        return new Dictionary<string, object>() {
+            { "levels", levels },
+            { "changed", changed },
+        };
+    }
+
+    public virtual object orderBookChecksumString(object value, object format, object length = null, object negate = null)
+    {
+        negate ??= false;
+        if (isTrue(negate))
+        {
+            return this.numberToString(prefixUnaryNeg(ref value));
+        }
+        object stringNumber = this.numberToString(value);
+        if (isTrue(!isEqual(format, "stripped")))
+        {
+            return stringNumber;
+        }
+        object parts = ((string)stringNumber).Split(new [] {((string)".")}, StringSplitOptions.None).ToList<object>();
+        object integer = this.safeString(parts, 0);
+        object decimals = this.safeString(parts, 1, "");
+        object paddedDecimals = (decimals as String).PadRight(Convert.ToInt32(length), Convert.ToChar("0"));
+        object joined = add(integer, paddedDecimals);
+        object i = 0;
+        while (isTrue(isTrue((isLessThan(i, ((string)joined).Length))) && isTrue((isEqual(getValue(joined, i), "0")))))
+        {
+            i = add(i, 1);
+        }
+        if (isTrue(isGreaterThan(i, 0)))
+        {
+            return slice(joined, i, null);
+        }
+        return joined;
+    }
+
+    public virtual object orderBookChecksumPayload(object bids, object asks, object format, object depth)
+    {
+        object bidsLength = getArrayLength(bids);
+        object asksLength = getArrayLength(asks);
+        object payloadArray = new List<object>() {};
+        if (isTrue(isEqual(format, "stripped")))
+        {
+            for (object i = 0; isLessThan(i, asksLength); postFixIncrement(ref i))
+            {
+                ((IList<object>)payloadArray).Add(add(getValue(getValue(asks, i), 2), getValue(getValue(asks, i), 3)));
+            }
+            for (object i = 0; isLessThan(i, bidsLength); postFixIncrement(ref i))
+            {
+                ((IList<object>)payloadArray).Add(add(getValue(getValue(bids, i), 2), getValue(getValue(bids, i), 3)));
+            }
+            return String.Join("", ((IList<object>)payloadArray).ToArray());
+        }
+        for (object i = 0; isLessThan(i, depth); postFixIncrement(ref i))
+        {
+            if (isTrue(isLessThan(i, bidsLength)))
+            {
+                ((IList<object>)payloadArray).Add(getValue(getValue(bids, i), 2));
+                ((IList<object>)payloadArray).Add(getValue(getValue(bids, i), 3));
+            }
+            if (isTrue(isLessThan(i, asksLength)))
+            {
+                ((IList<object>)payloadArray).Add(getValue(getValue(asks, i), 2));
+                ((IList<object>)payloadArray).Add(getValue(getValue(asks, i), 3));
+            }
+        }
+        return String.Join(":", ((IList<object>)payloadArray).ToArray());
+    }
+
     public virtual void createNetworksByIdObject()
     {
         // automatically generate network-id-to-code mappings
@@ -1876,111 +2042,446 @@ public partial class Exchange
 
     public virtual object setMarkets(object markets, object currencies = null)
     {
-        object values = new List<object>() {};
+        // one pass over the markets builds the markets, markets_by_id and the currencies derived from them
+        // the defaults every market is merged with are merged once
+        this.markets = ((object)new Dictionary<string, object>() {});
         this.markets_by_id = new Dictionary<string, object>() {};
+        this.markets_by_id_type = null;
+        this.markets_index = null;
+        object template = this.marketTemplate();
+        object defaultCurrencyPrecision = ((bool) isTrue((isEqual(this.precisionMode, DECIMAL_PLACES)))) ? 8 : this.parseNumber("1e-8");
+        object baseCurrencies = new List<object>() {};
+        object quoteCurrencies = new List<object>() {};
         // handle marketId conflicts
         // we insert spot markets first
         object marketValues = this.sortBy(this.toArray(markets), "spot", true, true);
         for (object i = 0; isLessThan(i, getArrayLength(marketValues)); postFixIncrement(ref i))
         {
             object value = getValue(marketValues, i);
-            if (isTrue(inOp(this.markets_by_id, getValue(value, "id"))))
+            object marketId = getValue(value, "id");
+            if (isTrue(inOp(this.markets_by_id, marketId)))
             {
-                object marketsByIdArray = ((object)getValue(this.markets_by_id, getValue(value, "id")));
+                object marketsByIdArray = ((object)getValue(this.markets_by_id, marketId));
                 ((IList<object>)marketsByIdArray).Add(value);
-                ((IDictionary<string,object>)this.markets_by_id)[(string)getValue(value, "id")] = marketsByIdArray;
+                ((IDictionary<string,object>)this.markets_by_id)[(string)marketId] = marketsByIdArray;
             } else
             {
-                ((IDictionary<string,object>)this.markets_by_id)[(string)getValue(value, "id")] = ((object)new List<object>() {value});
+                ((IDictionary<string,object>)this.markets_by_id)[(string)marketId] = ((object)new List<object>() {value});
             }
-            object market = this.deepExtend(this.safeMarketStructure(), new Dictionary<string, object>() {
-                { "precision", this.precision },
-                { "limits", this.limits },
-            }, getValue(this.fees, "trading"), value);
-            if (isTrue(getValue(market, "linear")))
+            object market = this.extendMarket(template, value);
+            object symbol = this.safeString(market, "symbol");
+            if (isTrue(!isEqual(symbol, null)))
             {
-                ((IDictionary<string,object>)market)["subType"] = "linear";
-            } else if (isTrue(getValue(market, "inverse")))
+                ((IDictionary<string,object>)this.markets)[(string)symbol] = market;
+            }
+            if (isTrue(isEqual(currencies, null)))
             {
-                ((IDictionary<string,object>)market)["subType"] = "inverse";
+                if (isTrue(inOp(market, "base")))
+                {
+                    ((IList<object>)baseCurrencies).Add(this.marketCurrency(market, "base", defaultCurrencyPrecision));
+                }
+                if (isTrue(inOp(market, "quote")))
+                {
+                    ((IList<object>)quoteCurrencies).Add(this.marketCurrency(market, "quote", defaultCurrencyPrecision));
+                }
+            }
+        }
+        this.symbols = new List<object>(((IDictionary<string,object>)this.keysort(this.markets)).Keys);
+        this.ids = new List<object>(((IDictionary<string,object>)this.keysort(this.markets_by_id)).Keys);
+        this.setMarketCurrencies(currencies, baseCurrencies, quoteCurrencies);
+        return this.markets;
+    }
+
+    public virtual object updateMarkets(object markets, object currencies = null)
+    {
+        // setMarkets for a reload that keeps the loaded market objects
+        // markets fetched unchanged keep their object, changed ones are updated in place,
+        // this.markets and this.markets_by_id are updated instead of replaced
+        // onMarketsChange is called with the added, removed and changed markets
+        if (isTrue(this.isEmpty(this.markets)))
+        {
+            return this.setMarkets(markets, currencies);
+        }
+        object marketsById = new Dictionary<string, object>() {};
+        object fetched = new Dictionary<string, object>() {};
+        object unchanged = new Dictionary<string, object>() {};
+        object template = this.marketTemplate();
+        object defaultCurrencyPrecision = ((bool) isTrue((isEqual(this.precisionMode, DECIMAL_PLACES)))) ? 8 : this.parseNumber("1e-8");
+        object baseCurrencies = new List<object>() {};
+        object quoteCurrencies = new List<object>() {};
+        object marketValues = this.sortBy(this.toArray(markets), "spot", true, true);
+        for (object i = 0; isLessThan(i, getArrayLength(marketValues)); postFixIncrement(ref i))
+        {
+            object value = getValue(marketValues, i);
+            object marketId = getValue(value, "id");
+            if (isTrue(inOp(marketsById, marketId)))
+            {
+                object marketsByIdArray = getValue(marketsById, marketId);
+                ((IList<object>)marketsByIdArray).Add(value);
+                ((IDictionary<string,object>)marketsById)[(string)marketId] = marketsByIdArray;
             } else
             {
-                ((IDictionary<string,object>)market)["subType"] = null;
+                ((IDictionary<string,object>)marketsById)[(string)marketId] = new List<object>() {value};
+            }
+            object market = null;
+            object symbol = this.safeString(value, "symbol");
+            if (isTrue(isTrue(isTrue((!isEqual(symbol, null))) && isTrue((inOp(this.markets, symbol)))) && !isTrue((inOp(fetched, symbol)))))
+            {
+                object loaded = getValue(this.markets, symbol);
+                if (isTrue(isEqual(this.json(this.loadedMarketValue(loaded)), this.json(value))))
+                {
+                    market = loaded;
+                    ((IDictionary<string,object>)unchanged)[(string)symbol] = true;
+                }
+            }
+            if (isTrue(isEqual(market, null)))
+            {
+                market = this.extendMarket(template, value);
+            }
+            object marketSymbol = this.safeString(market, "symbol");
+            if (isTrue(!isEqual(marketSymbol, null)))
+            {
+                ((IDictionary<string,object>)fetched)[(string)marketSymbol] = market;
+            }
+            if (isTrue(isEqual(currencies, null)))
+            {
+                if (isTrue(inOp(market, "base")))
+                {
+                    ((IList<object>)baseCurrencies).Add(this.marketCurrency(market, "base", defaultCurrencyPrecision));
+                }
+                if (isTrue(inOp(market, "quote")))
+                {
+                    ((IList<object>)quoteCurrencies).Add(this.marketCurrency(market, "quote", defaultCurrencyPrecision));
+                }
+            }
+        }
+        object added = new List<object>() {};
+        object removed = new List<object>() {};
+        object changed = new List<object>() {};
+        object fetchedSymbols = new List<object>(((IDictionary<string,object>)fetched).Keys);
+        for (object i = 0; isLessThan(i, getArrayLength(fetchedSymbols)); postFixIncrement(ref i))
+        {
+            object symbol = getValue(fetchedSymbols, i);
+            object market = getValue(fetched, symbol);
+            if (!isTrue((inOp(this.markets, symbol))))
+            {
+                ((IDictionary<string,object>)this.markets)[(string)symbol] = market;
+                ((IList<object>)added).Add(market);
+            } else if (!isTrue((inOp(unchanged, symbol))))
+            {
+                object loaded = getValue(this.markets, symbol);
+                object loadedKeys = new List<object>(((IDictionary<string,object>)loaded).Keys);
+                for (object j = 0; isLessThan(j, getArrayLength(loadedKeys)); postFixIncrement(ref j))
+                {
+                    object key = getValue(loadedKeys, j);
+                    if (!isTrue((inOp(market, key))))
+                    {
+                        ((IDictionary<string,object>)loaded).Remove((string)key);
+                    }
+                }
+                object marketKeys = new List<object>(((IDictionary<string,object>)market).Keys);
+                for (object j = 0; isLessThan(j, getArrayLength(marketKeys)); postFixIncrement(ref j))
+                {
+                    object key = getValue(marketKeys, j);
+                    ((IDictionary<string,object>)loaded)[(string)key] = getValue(market, key);
+                }
+                ((IDictionary<string,object>)this.markets)[(string)symbol] = loaded;
+                ((IList<object>)changed).Add(loaded);
+            }
+        }
+        object loadedSymbols = new List<object>(((IDictionary<string,object>)this.markets).Keys);
+        for (object i = 0; isLessThan(i, getArrayLength(loadedSymbols)); postFixIncrement(ref i))
+        {
+            object symbol = getValue(loadedSymbols, i);
+            if (!isTrue((inOp(fetched, symbol))))
+            {
+                ((IList<object>)removed).Add(getValue(this.markets, symbol));
+                ((IDictionary<string,object>)this.markets).Remove((string)symbol);
+            }
+        }
+        object loadedIds = new List<object>(((IDictionary<string,object>)this.markets_by_id).Keys);
+        for (object i = 0; isLessThan(i, getArrayLength(loadedIds)); postFixIncrement(ref i))
+        {
+            ((IDictionary<string,object>)this.markets_by_id).Remove((string)getValue(loadedIds, i));
+        }
+        object fetchedIds = new List<object>(((IDictionary<string,object>)marketsById).Keys);
+        for (object i = 0; isLessThan(i, getArrayLength(fetchedIds)); postFixIncrement(ref i))
+        {
+            object marketId = getValue(fetchedIds, i);
+            ((IDictionary<string,object>)this.markets_by_id)[(string)marketId] = getValue(marketsById, marketId);
+        }
+        this.markets_by_id_type = null;
+        this.markets_index = null;
+        this.symbols = new List<object>(((IDictionary<string,object>)this.keysort(this.markets)).Keys);
+        this.ids = new List<object>(((IDictionary<string,object>)this.keysort(this.markets_by_id)).Keys);
+        this.setMarketCurrencies(currencies, baseCurrencies, quoteCurrencies);
+        if (isTrue(isTrue(isTrue((isGreaterThan(getArrayLength(added), 0))) || isTrue((isGreaterThan(getArrayLength(removed), 0)))) || isTrue((isGreaterThan(getArrayLength(changed), 0)))))
+        {
+            this.onMarketsChange(added, removed, changed);
+        }
+        return this.markets;
+    }
+
+    public virtual object applyMarkets(object markets, object currencies = null)
+    {
+        // options['incrementalReload'] = true reloads the markets with updateMarkets
+        if (isTrue(!isTrue(this.isEmpty(this.markets)) && isTrue(this.safeBool(this.options, "incrementalReload", false))))
+        {
+            return this.updateMarkets(markets, currencies);
+        }
+        return this.setMarkets(markets, currencies);
+    }
+
+    public virtual object loadedMarketValue(object market)
+    {
+        // the fetched market a loaded market was built from
+        object values = this.safeList(this.markets_by_id, getValue(market, "id"), new List<object>() {});
+        object result = null;
+        for (object i = 0; isLessThan(i, getArrayLength(values)); postFixIncrement(ref i))
+        {
+            if (isTrue(isEqual(this.safeString(getValue(values, i), "symbol"), getValue(market, "symbol"))))
+            {
+                result = getValue(values, i);
             }
-            ((IList<object>)values).Add(market);
         }
-        this.markets = ((object)this.indexBy(values, "symbol"));
-        object marketsSortedBySymbol = this.keysort(this.markets);
-        object marketsSortedById = this.keysort(this.markets_by_id);
-        this.symbols = new List<object>(((IDictionary<string,object>)marketsSortedBySymbol).Keys);
-        this.ids = new List<object>(((IDictionary<string,object>)marketsSortedById).Keys);
+        return result;
+    }
+
+    public virtual object marketTemplate()
+    {
+        // the defaults every market is merged with
+        return this.deepExtend(this.safeMarketStructure(), new Dictionary<string, object>() {
+            { "precision", this.precision },
+            { "limits", this.limits },
+        }, getValue(this.fees, "trading"));
+    }
+
+    public virtual object extendMarket(object template, object value)
+    {
+        object market = this.deepExtend(template, value);
+        if (isTrue(getValue(market, "linear")))
+        {
+            ((IDictionary<string,object>)market)["subType"] = "linear";
+        } else if (isTrue(getValue(market, "inverse")))
+        {
+            ((IDictionary<string,object>)market)["subType"] = "inverse";
+        } else
+        {
+            ((IDictionary<string,object>)market)["subType"] = null;
+        }
+        return market;
+    }
+
+    public virtual object marketCurrency(object market, object key, object defaultPrecision)
+    {
+        // [ code, id, numericId, precision ] of the base or the quote currency of a market
+        object marketPrecision = this.safeDict(market, "precision", new Dictionary<string, object>() {});
+        object precisionKey = ((bool) isTrue((isEqual(key, "base")))) ? "amount" : "price";
+        return new List<object>() {this.safeString(market, key), this.safeString2(market, add(key, "Id"), key), this.safeInteger(market, add(key, "NumericId")), this.safeValue2(marketPrecision, key, precisionKey, defaultPrecision)};
+    }
+
+    public virtual void setMarketCurrencies(object currencies, object baseCurrencies, object quoteCurrencies)
+    {
         if (isTrue(!isEqual(currencies, null)))
         {
             // currencies is always undefined when called in constructor but not when called from loadMarkets
             this.currencies = this.deepExtend(this.currencies, currencies);
         } else
         {
-            object baseCurrencies = new List<object>() {};
-            object quoteCurrencies = new List<object>() {};
-            for (object i = 0; isLessThan(i, getArrayLength(values)); postFixIncrement(ref i))
+            // the last base and quote currency of each code, and its most precise currency
+            // quote currencies compete for the highest precision after all base currencies of the same code
+            object lastBase = new Dictionary<string, object>() {};
+            object lastQuote = new Dictionary<string, object>() {};
+            object best = new Dictionary<string, object>() {};
+            object lowestIsHighestPrecision = (isEqual(this.precisionMode, TICK_SIZE));
+            object numBase = getArrayLength(baseCurrencies);
+            object allCurrencies = this.arrayConcat(baseCurrencies, quoteCurrencies);
+            for (object i = 0; isLessThan(i, getArrayLength(allCurrencies)); postFixIncrement(ref i))
             {
-                object market = getValue(values, i);
-                object defaultCurrencyPrecision = ((bool) isTrue((isEqual(this.precisionMode, DECIMAL_PLACES)))) ? 8 : this.parseNumber("1e-8");
-                object marketPrecision = this.safeDict(market, "precision", new Dictionary<string, object>() {});
-                if (isTrue(inOp(market, "base")))
+                object currency = getValue(allCurrencies, i);
+                object code = getValue(currency, 0);
+                if (isTrue(!isEqual(code, null)))
                 {
-                    object currency = this.safeCurrencyStructure(new Dictionary<string, object>() {
-                        { "id", this.safeString2(market, "baseId", "base") },
-                        { "numericId", this.safeInteger(market, "baseNumericId") },
-                        { "code", this.safeString(market, "base") },
-                        { "precision", this.safeValue2(marketPrecision, "base", "amount", defaultCurrencyPrecision) },
-                    });
-                    ((IList<object>)baseCurrencies).Add(currency);
+                    if (isTrue(isLessThan(i, numBase)))
+                    {
+                        ((IDictionary<string,object>)lastBase)[(string)code] = currency;
+                    } else
+                    {
+                        ((IDictionary<string,object>)lastQuote)[(string)code] = currency;
+                    }
+                    if (!isTrue((inOp(best, code))))
+                    {
+                        ((IDictionary<string,object>)best)[(string)code] = currency;
+                    } else if (isTrue(lowestIsHighestPrecision))
+                    {
+                        if (isTrue(isLessThan(getValue(currency, 3), getValue(getValue(best, code), 3))))
+                        {
+                            ((IDictionary<string,object>)best)[(string)code] = currency;
+                        }
+                    } else if (isTrue(isGreaterThan(getValue(currency, 3), getValue(getValue(best, code), 3))))
+                    {
+                        ((IDictionary<string,object>)best)[(string)code] = currency;
+                    }
                 }
-                if (isTrue(inOp(market, "quote")))
+            }
+            this.baseCurrencies = this.marketsCurrencyStructures(lastBase);
+            this.quoteCurrencies = this.marketsCurrencyStructures(lastQuote);
+            this.currencies = this.deepExtend(this.currencies, this.marketsCurrencyStructures(best));
+        }
+        this.codes = new List<object>(((IDictionary<string,object>)this.keysort(this.currencies)).Keys);
+        this.currencies_by_id = new Dictionary<string, object>() {};
+        for (object i = 0; isLessThan(i, getArrayLength(this.codes)); postFixIncrement(ref i))
+        {
+            object currency = getValue(this.currencies, getValue(this.codes, i));
+            object currencyId = this.safeValue(currency, "id");
+            if (isTrue(!isEqual(currencyId, null)))
+            {
+                ((IDictionary<string,object>)this.currencies_by_id)[(string)currencyId] = currency;
+            }
+        }
+    }
+
+    public virtual object marketsCurrencyStructures(object currencies)
+    {
+        // code: currency structure sorted by code, for code: [ code, id, numericId, precision ]
+        object result = new Dictionary<string, object>() {};
+        object codes = new List<object>(((IDictionary<string,object>)this.keysort(currencies)).Keys);
+        for (object i = 0; isLessThan(i, getArrayLength(codes)); postFixIncrement(ref i))
+        {
+            object code = getValue(codes, i);
+            object currency = getValue(currencies, code);
+            ((IDictionary<string,object>)result)[(string)code] = this.safeCurrencyStructure(new Dictionary<string, object>() {
+                { "id", getValue(currency, 1) },
+                { "numericId", getValue(currency, 2) },
+                { "code", code },
+                { "precision", getValue(currency, 3) },
+            });
+        }
+        return result;
+    }
+
+    public virtual object filterMarkets(object type = null, object subType = null, object bs = null, object quote = null, object settle = null, object expiry = null, object underlying = null)
+    {
+        /**
+         * @method
+         * @name Exchange#filterMarkets
+         * @description markets matching all of the given fields, sorted by symbol
+         * @param {string} [type] 'spot', 'margin', 'swap', 'future' or 'option'
+         * @param {string} [subType] 'linear' or 'inverse'
+         * @param {string} [base] unified base currency code
+         * @param {string} [quote] unified quote currency code
+         * @param {string} [settle] unified settle currency code
+         * @param {int} [expiry] expiry timestamp in ms
+         * @param {string} [underlying] base/quote of the derivatives, like BTC/USD for BTC/USD:BTC-240927-60000-C
+         * @returns {object[]} a list of [market structures]{@link https://docs.ccxt.com/#/?id=market-structure}
+         */
+        object criteria = new Dictionary<string, object>() {
+            { "type", type },
+            { "subType", subType },
+            { "base", bs },
+            { "quote", quote },
+            { "settle", settle },
+            { "expiry", this.numberToString(expiry) },
+            { "underlying", underlying },
+        };
+        object index = this.getMarketsIndex();
+        object fields = new List<object>(((IDictionary<string,object>)criteria).Keys);
+        object selected = new List<object>() {};
+        object candidates = null;
+        for (object i = 0; isLessThan(i, getArrayLength(fields)); postFixIncrement(ref i))
+        {
+            object field = getValue(fields, i);
+            object value = getValue(criteria, field);
+            if (isTrue(!isEqual(value, null)))
+            {
+                object marketsByValue = this.safeList(getValue(index, field), value, new List<object>() {});
+                if (isTrue(isTrue((isEqual(candidates, null))) || isTrue((isLessThan(getArrayLength(marketsByValue), getArrayLength(candidates))))))
                 {
-                    object currency = this.safeCurrencyStructure(new Dictionary<string, object>() {
-                        { "id", this.safeString2(market, "quoteId", "quote") },
-                        { "numericId", this.safeInteger(market, "quoteNumericId") },
-                        { "code", this.safeString(market, "quote") },
-                        { "precision", this.safeValue2(marketPrecision, "quote", "price", defaultCurrencyPrecision) },
-                    });
-                    ((IList<object>)quoteCurrencies).Add(currency);
+                    candidates = marketsByValue;
                 }
+                ((IList<object>)selected).Add(field);
             }
-            baseCurrencies = this.sortBy(baseCurrencies, "code", false, "");
-            quoteCurrencies = this.sortBy(quoteCurrencies, "code", false, "");
-            this.baseCurrencies = this.indexBy(baseCurrencies, "code");
-            this.quoteCurrencies = this.indexBy(quoteCurrencies, "code");
-            object allCurrencies = this.arrayConcat(baseCurrencies, quoteCurrencies);
-            object groupedCurrencies = this.groupBy(allCurrencies, "code");
-            object codes = new List<object>(((IDictionary<string,object>)groupedCurrencies).Keys);
-            object resultingCurrencies = new List<object>() {};
-            for (object i = 0; isLessThan(i, getArrayLength(codes)); postFixIncrement(ref i))
-            {
-                object code = getValue(codes, i);
-                object groupedCurrenciesCode = this.safeList(groupedCurrencies, code, new List<object>() {});
-                object highestPrecisionCurrency = this.safeValue(groupedCurrenciesCode, 0);
-                for (object j = 1; isLessThan(j, getArrayLength(groupedCurrenciesCode)); postFixIncrement(ref j))
+        }
+        object result = new List<object>() {};
+        if (isTrue(isEqual(candidates, null)))
+        {
+            object symbols = ((bool) isTrue((isEqual(this.symbols, null)))) ? new List<object>() {} : this.symbols;
+            for (object i = 0; isLessThan(i, getArrayLength(symbols)); postFixIncrement(ref i))
+            {
+                ((IList<object>)result).Add(getValue(this.markets, getValue(symbols, i)));
+            }
+            return result;
+        }
+        // the markets of the most selective field that match all other fields
+        for (object i = 0; isLessThan(i, getArrayLength(candidates)); postFixIncrement(ref i))
+        {
+            object market = getValue(candidates, i);
+            object matches = true;
+            for (object j = 0; isLessThan(j, getArrayLength(selected)); postFixIncrement(ref j))
+            {
+                object field = getValue(selected, j);
+                if (isTrue(!isEqual(this.marketIndexValue(market, field), getValue(criteria, field))))
                 {
-                    object currentCurrency = getValue(groupedCurrenciesCode, j);
-                    if (isTrue(isEqual(this.precisionMode, TICK_SIZE)))
-                    {
-                        highestPrecisionCurrency = ((bool) isTrue((isLessThan(getValue(currentCurrency, "precision"), getValue(highestPrecisionCurrency, "precision"))))) ? currentCurrency : highestPrecisionCurrency;
-                    } else
+                    matches = false;
+                    break;
+                }
+            }
+            if (isTrue(matches))
+            {
+                ((IList<object>)result).Add(market);
+            }
+        }
+        return result;
+    }
+
+    public virtual object getMarketsIndex()
+    {
+        // field: value: markets sorted by symbol, built on the first query
+        // setMarkets and updateMarkets drop it
+        if (isTrue(isEqual(this.markets_index, null)))
+        {
+            object fields = new List<object>() {"type", "subType", "base", "quote", "settle", "expiry", "underlying"};
+            object index = new Dictionary<string, object>() {};
+            for (object i = 0; isLessThan(i, getArrayLength(fields)); postFixIncrement(ref i))
+            {
+                ((IDictionary<string,object>)index)[(string)getValue(fields, i)] = new Dictionary<string, object>() {};
+            }
+            object symbols = ((bool) isTrue((isEqual(this.symbols, null)))) ? new List<object>() {} : this.symbols;
+            for (object i = 0; isLessThan(i, getArrayLength(symbols)); postFixIncrement(ref i))
+            {
+                object market = getValue(this.markets, getValue(symbols, i));
+                for (object j = 0; isLessThan(j, getArrayLength(fields)); postFixIncrement(ref j))
+                {
+                    object field = getValue(fields, j);
+                    object value = this.marketIndexValue(market, field);
+                    if (isTrue(!isEqual(value, null)))
                     {
-                        highestPrecisionCurrency = ((bool) isTrue((isGreaterThan(getValue(currentCurrency, "precision"), getValue(highestPrecisionCurrency, "precision"))))) ? currentCurrency : highestPrecisionCurrency;
+                        if (isTrue(inOp(getValue(index, field), value)))
+                        {
+                            ((IList<object>)getValue(getValue(index, field), value)).Add(market);
+                        } else
+                        {
+                            ((IDictionary<string,object>)getValue(index, field))[(string)value] = new List<object>() {market};
+                        }
                     }
                 }
-                ((IList<object>)resultingCurrencies).Add(highestPrecisionCurrency);
             }
-            object sortedCurrencies = this.sortBy(resultingCurrencies, "code");
-            this.currencies = this.deepExtend(this.currencies, this.indexBy(sortedCurrencies, "code"));
+            this.markets_index = index;
         }
-        this.currencies_by_id = this.indexBy(this.currencies, "id");
-        object currenciesSortedByCode = this.keysort(this.currencies);
-        this.codes = new List<object>(((IDictionary<string,object>)currenciesSortedByCode).Keys);
-        return this.markets;
+        return this.markets_index;
+    }
+
+    public virtual object marketIndexValue(object market, object field)
+    {
+        if (isTrue(isEqual(field, "underlying")))
+        {
+            if (isTrue(isTrue(isTrue(getValue(market, "spot")) || isTrue((isEqual(getValue(market, "base"), null)))) || isTrue((isEqual(getValue(market, "quote"), null)))))
+            {
+                return null;
+            }
+            return add(add(getValue(market, "base"), "/"), getValue(market, "quote"));
+        }
+        return this.safeString(market, field);
     }
 
     public virtual object getDescribeForExtendedWsExchange(object currentRestInstance, object parentRestInstance, object wsBaseDescribe)
@@ -3520,17 +4021,81 @@ public partial class Exchange
     {
         parameters ??= new Dictionary<string, object>();
         trades = this.toArray(trades);
-        object result = new List<object>() {};
-        for (object i = 0; isLessThan(i, getArrayLength(trades)); postFixIncrement(ref i))
+        object result = this.parseTradesBatch(trades, market);
+        if (!isTrue(this.isEmpty(parameters)))
         {
-            object trade = this.extend(this.parseTrade(getValue(trades, i), market), parameters);
-            ((IList<object>)result).Add(trade);
+            for (object i = 0; isLessThan(i, getArrayLength(result)); postFixIncrement(ref i))
+            {
+                ((IList<object>)result)[Convert.ToInt32(i)] = this.extend(getValue(result, i), parameters);
+            }
         }
         result = this.sortBy2(result, "timestamp", "id");
         object symbol = ((bool) isTrue((!isEqual(market, null)))) ? getValue(market, "symbol") : null;
         return this.filterBySymbolSinceLimit(result, symbol, since, limit);
     }
 
+    public virtual object parseTradesBatch(object trades, object market = null)
+    {
+        // parseTrade for every trade, exchanges override it with loops over the trades of their most common responses
+        object result = new List<object>() {};
+        for (object i = 0; isLessThan(i, getArrayLength(trades)); postFixIncrement(ref i))
+        {
+            ((IList<object>)result).Add(this.parseTrade(getValue(trades, i), market));
+        }
+        return result;
+    }
+
+    public virtual object safeTradeWithoutFee(object trade, object contractSize = null, object inverse = null)
+    {
+        // safeTrade for a trade without a fee, with string or undefined price, amount and cost
+        // contractSize and inverse are the safeString and safeBool of the market, looked up once per batch
+        inverse ??= false;
+        object price = getValue(trade, "price");
+        object amount = getValue(trade, "amount");
+        object cost = getValue(trade, "cost");
+        if (isTrue(isEqual(cost, null)))
+        {
+            // contract trading
+            object multiplyPrice = price;
+            if (isTrue(!isEqual(contractSize, null)))
+            {
+                if (isTrue(inverse))
+                {
+                    multiplyPrice = Precise.stringDiv("1", price);
+                }
+                multiplyPrice = Precise.stringMul(multiplyPrice, contractSize);
+            }
+            cost = Precise.stringMul(multiplyPrice, amount);
+        }
+        ((IDictionary<string,object>)trade)["fee"] = new Dictionary<string, object>() {
+            { "cost", null },
+            { "currency", null },
+        };
+        ((IDictionary<string,object>)trade)["fees"] = new List<object>() {};
+        ((IDictionary<string,object>)trade)["amount"] = this.parseNumber(amount);
+        ((IDictionary<string,object>)trade)["price"] = this.parseNumber(price);
+        ((IDictionary<string,object>)trade)["cost"] = this.parseNumber(cost);
+        return trade;
+    }
+
+    public virtual object hasOnlyKeys(object value, object keys)
+    {
+        // true if value is a dictionary and every key of it is a key of keys
+        if (isTrue(isTrue(isTrue((!isEqual(value, null))) && isTrue(((value is IDictionary<string, object>)))) && !isTrue(((value is IList<object>) || (value.GetType().IsGenericType && value.GetType().GetGenericTypeDefinition().IsAssignableFrom(typeof(List<>)))))))
+        {
+            object valueKeys = new List<object>(((IDictionary<string,object>)value).Keys);
+            for (object i = 0; isLessThan(i, getArrayLength(valueKeys)); postFixIncrement(ref i))
+            {
+                if (!isTrue((inOp(keys, getValue(valueKeys, i)))))
+                {
+                    return false;
+                }
+            }
+            return true;
+        }
+        return false;
+    }
+
     public virtual object parseTransactions(object transactions, object currency = null, object since = null, object limit = null, object parameters = null)
     {
         parameters ??= new Dictionary<string, object>();
@@ -3790,6 +4355,49 @@ public partial class Exchange
     }
 
     public async virtual Task<object> fetch2(object path, object api = null, object method = null, object parameters = null, object headers = null, object body = null, object config = null)
+    {
+        api ??= "public";
+        method ??= "GET";
+        parameters ??= new Dictionary<string, object>();
+        config ??= new Dictionary<string, object>();
+        if (isTrue(this.isSingleFlightRequest(api, method)))
+        {
+            return await this.fetchSingleFlight(path, api, method, parameters, headers, body, config);
+        }
+        return await this.sendRequest(path, api, method, parameters, headers, body, config);
+    }
+
+    public virtual object isSingleFlightRequest(object api, object method)
+    {
+        // options['singleFlight'] shares identical public GET requests between concurrent callers
+        // sections named private are signed and never shared
+        object singleFlight = this.safeValue(this.options, "singleFlight");
+        if (isTrue((!isEqual(method, "GET")) || !isTrue(singleFlight)))
+        {
+            return false;
+        }
+        object parts = api;
+        if (!isTrue(((api is IList<object>) || (api.GetType().IsGenericType && api.GetType().GetGenericTypeDefinition().IsAssignableFrom(typeof(List<>))))))
+        {
+            parts = new List<object>() {api};
+        }
+        object isPublic = false;
+        for (object i = 0; isLessThan(i, getArrayLength(parts)); postFixIncrement(ref i))
+        {
+            object part = ((string)getValue(parts, i)).ToLower();
+            if (isTrue(isGreaterThanOrEqual(getIndexOf(part, "private"), 0)))
+            {
+                return false;
+            }
+            if (isTrue(isGreaterThanOrEqual(getIndexOf(part, "public"), 0)))
+            {
+                isPublic = true;
+            }
+        }
+        return isPublic;
+    }
+
+    public async virtual Task<object> sendRequest(object path, object api = null, object method = null, object parameters = null, object headers = null, object body = null, object config = null, object request = null)
     {
         api ??= "public";
         method ??= "GET";
@@ -3798,10 +4406,13 @@ public partial class Exchange
         if (isTrue(this.enableRateLimit))
         {
             object cost = this.calculateRateLimiterCost(api, method, path, parameters, config);
-            await this.throttle(cost);
+            await this.throttle(cost, api);
         }
         this.lastRestRequestTimestamp = this.milliseconds();
-        object request = this.sign(path, api, method, parameters, headers, body);
+        if (isTrue(isEqual(request, null)))
+        {
+            request = this.sign(path, api, method, parameters, headers, body);
+        }
         this.last_request_headers = getValue(request, "headers");
         this.last_request_body = getValue(request, "body");
         this.last_request_url = getValue(request, "url");
@@ -4088,58 +4699,70 @@ public partial class Exchange
 
     public virtual object safeMarket(object marketId = null, object market = null, object delimiter = null, object marketType = null)
     {
-        object result = this.safeMarketStructure(new Dictionary<string, object>() {
-            { "symbol", marketId },
-            { "marketId", marketId },
-        });
-        if (isTrue(!isEqual(marketId, null)))
+        if (isTrue(isTrue((isEqual(marketId, null))) && isTrue((!isEqual(market, null)))))
         {
-            if (isTrue(isTrue((!isEqual(this.markets_by_id, null))) && isTrue((inOp(this.markets_by_id, marketId)))))
+            return market;
+        }
+        if (isTrue(isTrue(isTrue((!isEqual(marketId, null))) && isTrue((!isEqual(this.markets_by_id, null)))) && isTrue((inOp(this.markets_by_id, marketId)))))
+        {
+            // known market ids are returned before the structure for unknown ones is built
+            object markets = getValue(this.markets_by_id, marketId);
+            object numMarkets = getArrayLength(markets);
+            if (isTrue(isEqual(numMarkets, 1)))
             {
-                object markets = getValue(this.markets_by_id, marketId);
-                object numMarkets = getArrayLength(markets);
-                if (isTrue(isEqual(numMarkets, 1)))
+                return getValue(markets, 0);
+            }
+            if (isTrue(isEqual(marketType, null)))
+            {
+                if (isTrue(isEqual(market, null)))
                 {
-                    return getValue(markets, 0);
+                    throw new ArgumentsRequired ((string)add(add(add(this.id, " safeMarket() requires a fourth argument for "), marketId), " to disambiguate between different markets with the same market id")) ;
                 } else
                 {
-                    if (isTrue(isEqual(marketType, null)))
-                    {
-                        if (isTrue(isEqual(market, null)))
-                        {
-                            throw new ArgumentsRequired ((string)add(add(add(this.id, " safeMarket() requires a fourth argument for "), marketId), " to disambiguate between different markets with the same market id")) ;
-                        } else
-                        {
-                            marketType = getValue(market, "type");
-                        }
-                    }
-                    for (object i = 0; isLessThan(i, getArrayLength(markets)); postFixIncrement(ref i))
-                    {
-                        object currentMarket = getValue(markets, i);
-                        if (isTrue(getValue(currentMarket, marketType)))
-                        {
-                            return currentMarket;
-                        }
-                    }
+                    marketType = getValue(market, "type");
                 }
-            } else if (isTrue(isTrue(!isEqual(delimiter, null)) && isTrue(!isEqual(delimiter, ""))))
+            }
+            // the market of a type is memoized for market ids shared by markets of different types
+            if (isTrue(isEqual(this.markets_by_id_type, null)))
             {
-                object parts = ((string)marketId).Split(new [] {((string)delimiter)}, StringSplitOptions.None).ToList<object>();
-                object partsLength = getArrayLength(parts);
-                if (isTrue(isEqual(partsLength, 2)))
-                {
-                    ((IDictionary<string,object>)result)["baseId"] = this.safeString(parts, 0);
-                    ((IDictionary<string,object>)result)["quoteId"] = this.safeString(parts, 1);
-                    ((IDictionary<string,object>)result)["base"] = this.safeCurrencyCode(getValue(result, "baseId"));
-                    ((IDictionary<string,object>)result)["quote"] = this.safeCurrencyCode(getValue(result, "quoteId"));
-                    ((IDictionary<string,object>)result)["symbol"] = add(add(getValue(result, "base"), "/"), getValue(result, "quote"));
-                    return result;
-                } else
+                this.markets_by_id_type = new Dictionary<string, object>() {};
+            }
+            if (!isTrue((inOp(this.markets_by_id_type, marketType))))
+            {
+                ((IDictionary<string,object>)this.markets_by_id_type)[(string)marketType] = new Dictionary<string, object>() {};
+            }
+            if (isTrue(inOp(getValue(this.markets_by_id_type, marketType), marketId)))
+            {
+                return getValue(getValue(this.markets_by_id_type, marketType), marketId);
+            }
+            for (object i = 0; isLessThan(i, getArrayLength(markets)); postFixIncrement(ref i))
+            {
+                object currentMarket = getValue(markets, i);
+                if (isTrue(getValue(currentMarket, marketType)))
                 {
-                    return result;
+                    ((IDictionary<string,object>)getValue(this.markets_by_id_type, marketType))[(string)marketId] = currentMarket;
+                    return currentMarket;
                 }
             }
         }
+        object result = this.safeMarketStructure(new Dictionary<string, object>() {
+            { "symbol", marketId },
+            { "marketId", marketId },
+        });
+        if (isTrue(isTrue(isTrue(isTrue((!isEqual(marketId, null))) && isTrue((!isEqual(delimiter, null)))) && isTrue((!isEqual(delimiter, "")))) && !isTrue((isTrue((!isEqual(this.markets_by_id, null))) && isTrue((inOp(this.markets_by_id, marketId)))))))
+        {
+            object parts = ((string)marketId).Split(new [] {((string)delimiter)}, StringSplitOptions.None).ToList<object>();
+            object partsLength = getArrayLength(parts);
+            if (isTrue(isEqual(partsLength, 2)))
+            {
+                ((IDictionary<string,object>)result)["baseId"] = this.safeString(parts, 0);
+                ((IDictionary<string,object>)result)["quoteId"] = this.safeString(parts, 1);
+                ((IDictionary<string,object>)result)["base"] = this.safeCurrencyCode(getValue(result, "baseId"));
+                ((IDictionary<string,object>)result)["quote"] = this.safeCurrencyCode(getValue(result, "quoteId"));
+                ((IDictionary<string,object>)result)["symbol"] = add(add(getValue(result, "base"), "/"), getValue(result, "quote"));
+            }
+            return result;
+        }
         if (isTrue(!isEqual(market, null)))
         {
             return market;
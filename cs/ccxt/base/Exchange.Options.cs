@@ -38,6 +38,12 @@ public partial class Exchange
 
     public dict markets_by_id { get; set; } = null;
 
+    public object markets_by_id_type { get; set; } = null; // marketType: marketId: market, filled by safeMarket
+
+    public object markets_index { get; set; } = null; // field: value: markets, built by filterMarkets
+
+    public Action<object, object, object> markets_change_callback { get; set; } = null; // called with the added, removed and changed markets of an incremental reload
+
     public List<object> symbols { get; set; } = new list();
 
     public List<object> codes { get; set; } = new list();
@@ -179,6 +185,7 @@ public partial class Exchange
     public object myLiquidations = new ccxt.pro.CustomConcurrentDictionary<string, object>();
     public object trades = new ccxt.pro.CustomConcurrentDictionary<string, object>();
     public object orderbooks = new ccxt.pro.CustomConcurrentDictionary<string, object>();
+    public object orderbookChecksums = new ccxt.pro.CustomConcurrentDictionary<string, object>();
 
     public object ohlcvs = new ccxt.pro.CustomConcurrentDictionary<string, object>();
     public object wssProxy { get; set; } = null;
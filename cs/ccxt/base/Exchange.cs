@@ -150,6 +150,12 @@ public partial class Exchange
         }
     }
 
+    public async virtual Task<object> fetchSingleFlight(object path, object api = null, object method = null, object parameters = null, object headers = null, object body = null, object config = null)
+    {
+        // identical requests are only shared by the python async client, here every caller sends its own
+        return await this.sendRequest(path, api, method, parameters, headers, body, config);
+    }
+
     public async virtual Task<object> fetch(object url2, object method2 = null, object headers2 = null, object body2 = null)
     {
 
@@ -462,7 +468,15 @@ public partial class Exchange
             currencies = await this.fetchCurrencies();
         }
         var markets = await this.fetchMarkets();
-        return this.setMarkets(markets, currencies);
+        return this.applyMarkets(markets, currencies);
+    }
+
+    public virtual void onMarketsChange(object added, object removed, object changed)
+    {
+        if (this.markets_change_callback != null)
+        {
+            this.markets_change_callback(added, removed, changed);
+        }
     }
 
     public virtual Task<object> loadMarkets(object reload2 = null, object parameters2 = null)
@@ -572,7 +586,7 @@ public partial class Exchange
         return amount * scale;
     }
 
-    public async Task throttle(object cost)
+    public async Task throttle(object cost, object api = null)
     {
         await (await this.throttler.throttle(cost));
     }
@@ -1295,6 +1295,19 @@ public partial class binance : Exchange
             { "precisionMode", TICK_SIZE },
             { "options", new Dictionary<string, object>() {
                 { "sandboxMode", false },
+                { "rateLimiter", new Dictionary<string, object>() {
+                    { "headers", new Dictionary<string, object>() {
+                        { "x-mbx-used-weight-1m", new Dictionary<string, object>() {
+                            { "window", 60000 },
+                            { "limit", new Dictionary<string, object>() {
+                                { "api", 6000 },
+                                { "fapi", 2400 },
+                                { "dapi", 2400 },
+                                { "papi", 6000 },
+                            } },
+                        } },
+                    } },
+                } },
                 { "fetchMargins", true },
                 { "fetchMarkets", new List<object>() {"spot", "linear", "inverse"} },
                 { "loadAllOptions", false },
@@ -5046,6 +5059,63 @@ public partial class binance : Exchange
         }, market);
     }
 
+    public override object parseTradesBatch(object trades, object market = null)
+    {
+        // aggregate trades of the public endpoints, { "a", "p", "q", "f", "l", "T", "m", "M" }, are parsed in one loop
+        // that only reads their fields, other trades and option markets go through parseTrade
+        if (isTrue(isTrue((isEqual(market, null))) || isTrue(getValue(market, "option"))))
+        {
+            return base.parseTradesBatch(trades, market);
+        }
+        object aggregateTradeKeys = new Dictionary<string, object>() {
+            { "a", true },
+            { "p", true },
+            { "q", true },
+            { "f", true },
+            { "l", true },
+            { "T", true },
+            { "m", true },
+            { "M", true },
+        };
+        object symbol = getValue(market, "symbol");
+        object contractSize = this.safeString(market, "contractSize");
+        object inverse = this.safeBool(market, "inverse", false);
+        object result = new List<object>() {};
+        for (object i = 0; isLessThan(i, getArrayLength(trades)); postFixIncrement(ref i))
+        {
+            object trade = getValue(trades, i);
+            if (isTrue(this.hasOnlyKeys(trade, aggregateTradeKeys)))
+            {
+                object timestamp = this.safeInteger(trade, "T");
+                object buyerMaker = this.safeBool(trade, "m");
+                object side = null;
+                if (isTrue(!isEqual(buyerMaker, null)))
+                {
+                    side = ((bool) isTrue(buyerMaker)) ? "sell" : "buy"; // this is reversed intentionally
+                }
+                ((IList<object>)result).Add(this.safeTradeWithoutFee(new Dictionary<string, object>() {
+                    { "info", trade },
+                    { "timestamp", timestamp },
+                    { "datetime", this.iso8601(timestamp) },
+                    { "symbol", symbol },
+                    { "id", this.safeString(trade, "a") },
+                    { "order", null },
+                    { "type", null },
+                    { "side", side },
+                    { "takerOrMaker", null },
+                    { "price", this.safeString(trade, "p") },
+                    { "amount", this.safeString(trade, "q") },
+                    { "cost", null },
+                    { "fee", null },
+                }, contractSize, inverse));
+            } else
+            {
+                ((IList<object>)result).Add(this.parseTrade(trade, market));
+            }
+        }
+        return result;
+    }
+
     /**
      * @method
      * @name binance#fetchTrades
@@ -9886,27 +9956,23 @@ public partial class binance : Exchange
             //         ...
             //     }
             //
-            object symbols = new List<object>(((IDictionary<string,object>)this.markets).Keys);
+            object markets = this.filterMarkets(null, "linear");
             object result = new Dictionary<string, object>() {};
             object feeTier = this.safeInteger(response, "feeTier");
             object feeTiers = getValue(getValue(getValue(this.fees, "linear"), "trading"), "tiers");
             object maker = getValue(getValue(getValue(feeTiers, "maker"), feeTier), 1);
             object taker = getValue(getValue(getValue(feeTiers, "taker"), feeTier), 1);
-            for (object i = 0; isLessThan(i, getArrayLength(symbols)); postFixIncrement(ref i))
+            for (object i = 0; isLessThan(i, getArrayLength(markets)); postFixIncrement(ref i))
             {
-                object symbol = getValue(symbols, i);
-                object market = getValue(this.markets, symbol);
-                if (isTrue(getValue(market, "linear")))
-                {
-                    ((IDictionary<string,object>)result)[(string)symbol] = new Dictionary<string, object>() {
-                        { "info", new Dictionary<string, object>() {
-                            { "feeTier", feeTier },
-                        } },
-                        { "symbol", symbol },
-                        { "maker", maker },
-                        { "taker", taker },
-                    };
-                }
+                object symbol = getValue(getValue(markets, i), "symbol");
+                ((IDictionary<string,object>)result)[(string)symbol] = new Dictionary<string, object>() {
+                    { "info", new Dictionary<string, object>() {
+                        { "feeTier", feeTier },
+                    } },
+                    { "symbol", symbol },
+                    { "maker", maker },
+                    { "taker", taker },
+                };
             }
             return result;
         } else if (isTrue(isInverse))
@@ -9920,27 +9986,23 @@ public partial class binance : Exchange
             //         "updateTime": 0
             //     }
             //
-            object symbols = new List<object>(((IDictionary<string,object>)this.markets).Keys);
+            object markets = this.filterMarkets(null, "inverse");
             object result = new Dictionary<string, object>() {};
             object feeTier = this.safeInteger(response, "feeTier");
             object feeTiers = getValue(getValue(getValue(this.fees, "inverse"), "trading"), "tiers");
             object maker = getValue(getValue(getValue(feeTiers, "maker"), feeTier), 1);
             object taker = getValue(getValue(getValue(feeTiers, "taker"), feeTier), 1);
-            for (object i = 0; isLessThan(i, getArrayLength(symbols)); postFixIncrement(ref i))
+            for (object i = 0; isLessThan(i, getArrayLength(markets)); postFixIncrement(ref i))
             {
-                object symbol = getValue(symbols, i);
-                object market = getValue(this.markets, symbol);
-                if (isTrue(getValue(market, "inverse")))
-                {
-                    ((IDictionary<string,object>)result)[(string)symbol] = new Dictionary<string, object>() {
-                        { "info", new Dictionary<string, object>() {
-                            { "feeTier", feeTier },
-                        } },
-                        { "symbol", symbol },
-                        { "maker", maker },
-                        { "taker", taker },
-                    };
-                }
+                object symbol = getValue(getValue(markets, i), "symbol");
+                ((IDictionary<string,object>)result)[(string)symbol] = new Dictionary<string, object>() {
+                    { "info", new Dictionary<string, object>() {
+                        { "feeTier", feeTier },
+                    } },
+                    { "symbol", symbol },
+                    { "maker", maker },
+                    { "taker", taker },
+                };
             }
             return result;
         }
@@ -953,6 +953,18 @@ public partial class bybit : Exchange
             } },
             { "precisionMode", TICK_SIZE },
             { "options", new Dictionary<string, object>() {
+                { "rateLimiter", new Dictionary<string, object>() {
+                    { "headers", new Dictionary<string, object>() {
+                        { "x-bapi-limit-status", new Dictionary<string, object>() {
+                            { "type", "remaining" },
+                            { "limitHeader", "x-bapi-limit" },
+                            { "resetHeader", "x-bapi-limit-reset-timestamp" },
+                            { "resetType", "timestamp" },
+                            { "window", 1000 },
+                            { "scope", "path" },
+                        } },
+                    } },
+                } },
                 { "usePrivateInstrumentsInfo", false },
                 { "enableDemoTrading", false },
                 { "fetchMarkets", new List<object>() {"spot", "linear", "inverse", "option"} },
@@ -3224,6 +3236,64 @@ public partial class bybit : Exchange
         }, market);
     }
 
+    public override object parseTradesBatch(object trades, object market = null)
+    {
+        // public trades, { "execId", "symbol", "price", "size", "side", "time", "isBlockTrade" }, are parsed in one loop
+        // that only reads their fields and resolves every symbol once, other trades go through parseTrade
+        object publicTradeKeys = new Dictionary<string, object>() {
+            { "execId", true },
+            { "symbol", true },
+            { "price", true },
+            { "size", true },
+            { "side", true },
+            { "time", true },
+            { "isBlockTrade", true },
+            { "isRPITrade", true },
+            { "seq", true },
+            { "mP", true },
+            { "iP", true },
+            { "mIv", true },
+            { "iv", true },
+        };
+        object marketType = ((bool) isTrue((isEqual(market, null)))) ? "spot" : getValue(market, "type");
+        object markets = new Dictionary<string, object>() {};
+        object result = new List<object>() {};
+        for (object i = 0; isLessThan(i, getArrayLength(trades)); postFixIncrement(ref i))
+        {
+            object trade = getValue(trades, i);
+            object marketId = ((bool) isTrue(this.hasOnlyKeys(trade, publicTradeKeys))) ? this.safeString(trade, "symbol") : null;
+            if (isTrue(isEqual(marketId, null)))
+            {
+                ((IList<object>)result).Add(this.parseTrade(trade, market));
+            } else
+            {
+                if (!isTrue((inOp(markets, marketId))))
+                {
+                    object tradeMarket = this.safeMarket(marketId, market, null, marketType);
+                    ((IDictionary<string,object>)markets)[(string)marketId] = new List<object>() {getValue(tradeMarket, "symbol"), this.safeString(tradeMarket, "contractSize"), this.safeBool(tradeMarket, "inverse", false)};
+                }
+                object cached = getValue(markets, marketId);
+                object timestamp = this.safeInteger(trade, "time");
+                ((IList<object>)result).Add(this.safeTradeWithoutFee(new Dictionary<string, object>() {
+                    { "id", this.safeString(trade, "execId") },
+                    { "info", trade },
+                    { "timestamp", timestamp },
+                    { "datetime", this.iso8601(timestamp) },
+                    { "symbol", getValue(cached, 0) },
+                    { "order", null },
+                    { "type", null },
+                    { "side", this.safeStringLower(trade, "side") },
+                    { "takerOrMaker", null },
+                    { "price", this.safeString(trade, "price") },
+                    { "amount", this.safeString(trade, "size") },
+                    { "cost", null },
+                    { "fee", null },
+                }, getValue(cached, 1), getValue(cached, 2)));
+            }
+        }
+        return result;
+    }
+
     /**
      * @method
      * @name bybit#fetchTrades
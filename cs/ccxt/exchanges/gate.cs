@@ -637,6 +637,18 @@ public partial class gate : Exchange
                 { "X-Gate-Channel-Id", "ccxt" },
             } },
             { "options", new Dictionary<string, object>() {
+                { "rateLimiter", new Dictionary<string, object>() {
+                    { "headers", new Dictionary<string, object>() {
+                        { "x-gate-ratelimit-requests-remain", new Dictionary<string, object>() {
+                            { "type", "remaining" },
+                            { "limitHeader", "x-gate-ratelimit-limit" },
+                            { "resetHeader", "x-gate-ratelimit-reset-timestamp" },
+                            { "resetType", "timestamp" },
+                            { "window", 10000 },
+                            { "scope", "path" },
+                        } },
+                    } },
+                } },
                 { "timeDifference", 0 },
                 { "adjustForTimeDifference", false },
                 { "sandboxMode", false },
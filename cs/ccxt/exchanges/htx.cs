@@ -2097,7 +2097,7 @@ public partial class htx : Exchange
         {
             return getValue(futureMarketIdsForSymbols, symbolOrMarketId);
         }
-        object futureMarkets = this.filterBy(this.markets, "future", true);
+        object futureMarkets = this.filterMarkets("future");
         object futuresCharsMaps = new Dictionary<string, object>() {
             { "this_week", "CW" },
             { "next_week", "NW" },
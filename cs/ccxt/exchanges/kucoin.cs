@@ -568,6 +568,17 @@ public partial class kucoin : Exchange
                 { "FUD", "FTX Users' Debt" },
             } },
             { "options", new Dictionary<string, object>() {
+                { "rateLimiter", new Dictionary<string, object>() {
+                    { "headers", new Dictionary<string, object>() {
+                        { "gw-ratelimit-remaining", new Dictionary<string, object>() {
+                            { "type", "remaining" },
+                            { "limitHeader", "gw-ratelimit-limit" },
+                            { "resetHeader", "gw-ratelimit-reset" },
+                            { "resetType", "delta" },
+                            { "window", 30000 },
+                        } },
+                    } },
+                } },
                 { "hf", null },
                 { "version", "v1" },
                 { "symbolSeparator", "-" },
@@ -2265,6 +2265,58 @@ public partial class okx : Exchange
         }, market);
     }
 
+    public override object parseTradesBatch(object trades, object market = null)
+    {
+        // public trades, { "instId", "side", "sz", "px", "tradeId", "ts" }, are parsed in one loop
+        // that only reads their fields and resolves every instId once, other trades go through parseTrade
+        object publicTradeKeys = new Dictionary<string, object>() {
+            { "instId", true },
+            { "side", true },
+            { "sz", true },
+            { "px", true },
+            { "tradeId", true },
+            { "ts", true },
+            { "count", true },
+            { "source", true },
+        };
+        object markets = new Dictionary<string, object>() {};
+        object result = new List<object>() {};
+        for (object i = 0; isLessThan(i, getArrayLength(trades)); postFixIncrement(ref i))
+        {
+            object trade = getValue(trades, i);
+            object marketId = ((bool) isTrue(this.hasOnlyKeys(trade, publicTradeKeys))) ? this.safeString(trade, "instId") : null;
+            if (isTrue(isEqual(marketId, null)))
+            {
+                ((IList<object>)result).Add(this.parseTrade(trade, market));
+            } else
+            {
+                if (!isTrue((inOp(markets, marketId))))
+                {
+                    object tradeMarket = this.safeMarket(marketId, market, "-");
+                    ((IDictionary<string,object>)markets)[(string)marketId] = new List<object>() {getValue(tradeMarket, "symbol"), this.safeString(tradeMarket, "contractSize"), this.safeBool(tradeMarket, "inverse", false)};
+                }
+                object cached = getValue(markets, marketId);
+                object timestamp = this.safeInteger(trade, "ts");
+                ((IList<object>)result).Add(this.safeTradeWithoutFee(new Dictionary<string, object>() {
+                    { "info", trade },
+                    { "timestamp", timestamp },
+                    { "datetime", this.iso8601(timestamp) },
+                    { "symbol", getValue(cached, 0) },
+                    { "id", this.safeString(trade, "tradeId") },
+                    { "order", null },
+                    { "type", null },
+                    { "takerOrMaker", null },
+                    { "side", this.safeString(trade, "side") },
+                    { "price", this.safeString(trade, "px") },
+                    { "amount", this.safeString(trade, "sz") },
+                    { "cost", null },
+                    { "fee", null },
+                }, getValue(cached, 1), getValue(cached, 2)));
+            }
+        }
+        return result;
+    }
+
     /**
      * @method
      * @name okx#fetchTrades
@@ -185,7 +185,7 @@ public partial class alpaca : ccxt.alpaca
         if (isTrue(isEqual(stored, null)))
         {
             object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             ((IDictionary<string,object>)this.ohlcvs)[(string)symbol] = stored;
         }
         object parsed = this.parseOHLCV(message);
@@ -560,7 +560,7 @@ public partial class apex : ccxt.apex
         if (isTrue(isEqual(this.safeValue(ohlcvsByTimeframe, timeframe), null)))
         {
             object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-            ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = new ArrayCacheByTimestamp(limit);
+            ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = this.ohlcvCache(limit);
         }
         object stored = getValue(getValue(this.ohlcvs, symbol), timeframe);
         for (object i = 0; isLessThan(i, getArrayLength(data)); postFixIncrement(ref i))
@@ -1023,7 +1023,7 @@ public partial class bingx : ccxt.bingx
             object subscriptionHash = dataType;
             object subscription = getValue(((WebSocketClient)client).subscriptions, subscriptionHash);
             object limit = this.safeInteger(subscription, "limit");
-            ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)unifiedTimeframe] = new ArrayCacheByTimestamp(limit);
+            ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)unifiedTimeframe] = this.ohlcvCache(limit);
         }
         object stored = getValue(getValue(this.ohlcvs, symbol), unifiedTimeframe);
         for (object i = 0; isLessThan(i, getArrayLength(candles)); postFixIncrement(ref i))
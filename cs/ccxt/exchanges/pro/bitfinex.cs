@@ -190,7 +190,7 @@ public partial class bitfinex : ccxt.bitfinex
         if (isTrue(isEqual(stored, null)))
         {
             object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = stored;
         }
         object ohlcvsLength = getArrayLength(ohlcvs);
@@ -724,32 +724,11 @@ public partial class bitfinex : ccxt.bitfinex
         {
             return;
         }
-        object depth = 25; // covers the first 25 bids and asks
-        object stringArray = new List<object>() {};
-        object bids = getValue(book, "bids");
-        object asks = getValue(book, "asks");
         object prec = this.safeString(subscription, "prec", "P0");
         object isRaw = (isEqual(prec, "R0"));
         object idToCheck = ((bool) isTrue(isRaw)) ? 2 : 0;
-        // pepperoni pizza from bitfinex
-        for (object i = 0; isLessThan(i, depth); postFixIncrement(ref i))
-        {
-            object bid = this.safeValue(bids, i);
-            object ask = this.safeValue(asks, i);
-            if (isTrue(!isEqual(bid, null)))
-            {
-                ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(bids, i), idToCheck)));
-                ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(bids, i), 1)));
-            }
-            if (isTrue(!isEqual(ask, null)))
-            {
-                ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(asks, i), idToCheck)));
-                object aski1 = getValue(getValue(asks, i), 1);
-                ((IList<object>)stringArray).Add(this.numberToString(prefixUnaryNeg(ref aski1)));
-            }
-        }
-        object payload = String.Join(":", ((IList<object>)stringArray).ToArray());
-        object localChecksum = this.crc32(payload, true);
+        // pepperoni pizza from bitfinex, covers the first 25 bids and asks
+        object localChecksum = this.orderBookChecksum(symbol, book, "signed", 25, idToCheck);
         object responseChecksum = this.safeInteger(message, 2);
         if (isTrue(!isEqual(responseChecksum, localChecksum)))
         {
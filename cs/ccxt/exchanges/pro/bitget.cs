@@ -543,7 +543,7 @@ public partial class bitget : ccxt.bitget
         if (isTrue(isEqual(stored, null)))
         {
             object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = stored;
         }
         object data = this.safeValue(message, "data", new List<object>() {});
@@ -1354,7 +1354,7 @@ public partial class bitmart : ccxt.bitmart
                 if (isTrue(isEqual(stored, null)))
                 {
                     object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-                    stored = new ArrayCacheByTimestamp(limit);
+                    stored = this.ohlcvCache(limit);
                     ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = stored;
                 }
                 callDynamically(stored, "append", new object[] {parsed});
@@ -1372,7 +1372,7 @@ public partial class bitmart : ccxt.bitmart
             if (isTrue(isEqual(stored, null)))
             {
                 object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-                stored = new ArrayCacheByTimestamp(limit);
+                stored = this.ohlcvCache(limit);
                 ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = stored;
             }
             for (object i = 0; isLessThan(i, getArrayLength(items)); postFixIncrement(ref i))
@@ -1418,19 +1418,9 @@ public partial class bitmart : ccxt.bitmart
         return (orderbook as IOrderBook).limit();
     }
 
-    public override void handleDelta(object bookside, object delta)
-    {
-        object price = this.safeFloat(delta, 0);
-        object amount = this.safeFloat(delta, 1);
-        (bookside as IOrderBookSide).store(price, amount);
-    }
-
     public override void handleDeltas(object bookside, object deltas)
     {
-        for (object i = 0; isLessThan(i, getArrayLength(deltas)); postFixIncrement(ref i))
-        {
-            this.handleDelta(bookside, getValue(deltas, i));
-        }
+        (bookside as IOrderBookSide).storeDeltas(deltas);
     }
 
     public virtual object handleOrderBookMessage(WebSocketClient client, object message, object orderbook)
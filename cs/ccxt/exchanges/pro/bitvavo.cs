@@ -377,7 +377,7 @@ public partial class bitvavo : ccxt.bitvavo
         if (isTrue(isEqual(stored, null)))
         {
             object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = stored;
         }
         for (object i = 0; isLessThan(i, getArrayLength(candles)); postFixIncrement(ref i))
@@ -428,19 +428,9 @@ public partial class bitvavo : ccxt.bitvavo
         return (orderbook as IOrderBook).limit();
     }
 
-    public override void handleDelta(object bookside, object delta)
-    {
-        object price = this.safeFloat(delta, 0);
-        object amount = this.safeFloat(delta, 1);
-        (bookside as IOrderBookSide).store(price, amount);
-    }
-
     public override void handleDeltas(object bookside, object deltas)
     {
-        for (object i = 0; isLessThan(i, getArrayLength(deltas)); postFixIncrement(ref i))
-        {
-            this.handleDelta(bookside, getValue(deltas, i));
-        }
+        (bookside as IOrderBookSide).storeDeltas(deltas);
     }
 
     public virtual object handleOrderBookMessage(WebSocketClient client, object message, object orderbook)
@@ -492,7 +492,7 @@ public partial class blofin : ccxt.blofin
         if (isTrue(isEqual(stored, null)))
         {
             object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)unifiedTimeframe] = stored;
         }
         for (object i = 0; isLessThan(i, getArrayLength(data)); postFixIncrement(ref i))
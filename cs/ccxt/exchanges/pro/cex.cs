@@ -1201,7 +1201,7 @@ public partial class cex : ccxt.cex
         object messageHash = add("ohlcv:", symbol);
         object data = this.safeValue(message, "data", new List<object>() {});
         object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-        var stored = new ArrayCacheByTimestamp(limit);
+        var stored = this.ohlcvCache(limit);
         object sorted = this.sortBy(data, 0);
         for (object i = 0; isLessThan(i, getArrayLength(sorted)); postFixIncrement(ref i))
         {
@@ -534,7 +534,7 @@ public partial class coinbaseinternational : ccxt.coinbaseinternational
         if (isTrue(isEqual(this.safeValue(getValue(this.ohlcvs, symbol), timeframe), null)))
         {
             object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-            ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = new ArrayCacheByTimestamp(limit);
+            ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = this.ohlcvCache(limit);
         }
         object stored = getValue(getValue(this.ohlcvs, symbol), timeframe);
         object data = this.safeList(message, "candles", new List<object>() {});
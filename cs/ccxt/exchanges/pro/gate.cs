@@ -1024,7 +1024,7 @@ public partial class gate : ccxt.gate
             if (isTrue(isEqual(stored, null)))
             {
                 object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-                stored = new ArrayCacheByTimestamp(limit);
+                stored = this.ohlcvCache(limit);
                 ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframeId] = stored;
             }
             callDynamically(stored, "append", new object[] {parsed});
@@ -146,7 +146,7 @@ public partial class hashkey : ccxt.hashkey
         if (!isTrue((inOp(getValue(this.ohlcvs, symbol), timeframe))))
         {
             object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-            ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = new ArrayCacheByTimestamp(limit);
+            ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = this.ohlcvCache(limit);
         }
         object data = this.safeList(message, "data", new List<object>() {});
         object stored = getValue(getValue(this.ohlcvs, symbol), timeframe);
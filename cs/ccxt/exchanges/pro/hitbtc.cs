@@ -825,7 +825,7 @@ public partial class hitbtc : ccxt.hitbtc
             if (isTrue(isEqual(stored, null)))
             {
                 object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-                stored = new ArrayCacheByTimestamp(limit);
+                stored = this.ohlcvCache(limit);
                 ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = stored;
             }
             object ohlcvs = this.parseWsOHLCVs(getValue(data, marketId), market);
@@ -343,7 +343,7 @@ public partial class htx : ccxt.htx
         if (isTrue(isEqual(stored, null)))
         {
             object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = stored;
         }
         object tick = this.safeValue(message, "tick");
@@ -525,19 +525,9 @@ public partial class htx : ccxt.htx
         return null;
     }
 
-    public override void handleDelta(object bookside, object delta)
-    {
-        object price = this.safeFloat(delta, 0);
-        object amount = this.safeFloat(delta, 1);
-        (bookside as IOrderBookSide).store(price, amount);
-    }
-
     public override void handleDeltas(object bookside, object deltas)
     {
-        for (object i = 0; isLessThan(i, getArrayLength(deltas)); postFixIncrement(ref i))
-        {
-            this.handleDelta(bookside, getValue(deltas, i));
-        }
+        (bookside as IOrderBookSide).storeDeltas(deltas);
     }
 
     public virtual void handleOrderBookMessage(WebSocketClient client, object message)
@@ -806,7 +806,7 @@ public partial class hyperliquid : ccxt.hyperliquid
         if (!isTrue((inOp(getValue(this.ohlcvs, symbol), timeframe))))
         {
             object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-            var stored = new ArrayCacheByTimestamp(limit);
+            var stored = this.ohlcvCache(limit);
             ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = stored;
         }
         object ohlcv = getValue(getValue(this.ohlcvs, symbol), timeframe);
@@ -455,7 +455,7 @@ public partial class kraken : ccxt.kraken
             if (isTrue(isEqual(stored, null)))
             {
                 object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-                stored = new ArrayCacheByTimestamp(limit);
+                stored = this.ohlcvCache(limit);
                 ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = stored;
             }
             callDynamically(stored, "append", new object[] {result});
@@ -904,22 +904,11 @@ public partial class kraken : ccxt.kraken
                 object amountParts = ((string)amountString).Split(new [] {((string)".")}, StringSplitOptions.None).ToList<object>();
                 object priceLength = subtract(((string)getValue(priceParts, 1)).Length, 0);
                 object amountLength = subtract(((string)getValue(amountParts, 1)).Length, 0);
-                object payloadArray = new List<object>() {};
+                object localChecksum = null;
                 if (isTrue(!isEqual(c, null)))
                 {
-                    for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
-                    {
-                        object formatted = add(this.formatNumber(getValue(getValue(storedAsks, i), 0), priceLength), this.formatNumber(getValue(getValue(storedAsks, i), 1), amountLength));
-                        ((IList<object>)payloadArray).Add(formatted);
-                    }
-                    for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
-                    {
-                        object formatted = add(this.formatNumber(getValue(getValue(storedBids, i), 0), priceLength), this.formatNumber(getValue(getValue(storedBids, i), 1), amountLength));
-                        ((IList<object>)payloadArray).Add(formatted);
-                    }
+                    localChecksum = this.orderBookChecksum(symbol, orderbook, "stripped", 10, 0, priceLength, amountLength);
                 }
-                object payload = String.Join("", ((IList<object>)payloadArray).ToArray());
-                object localChecksum = this.crc32(payload, false);
                 if (isTrue(!isEqual(localChecksum, c)))
                 {
                     var error = new ChecksumError(add(add(this.id, " "), this.orderbookChecksumMessage(symbol)));
@@ -936,28 +925,6 @@ public partial class kraken : ccxt.kraken
         }
     }
 
-    public virtual object formatNumber(object n, object length)
-    {
-        object stringNumber = this.numberToString(n);
-        object parts = ((string)stringNumber).Split(new [] {((string)".")}, StringSplitOptions.None).ToList<object>();
-        object integer = this.safeString(parts, 0);
-        object decimals = this.safeString(parts, 1, "");
-        object paddedDecimals = (decimals as String).PadRight(Convert.ToInt32(length), Convert.ToChar("0"));
-        object joined = add(integer, paddedDecimals);
-        object i = 0;
-        while (isEqual(getValue(joined, i), "0"))
-        {
-            i = add(i, 1);
-        }
-        if (isTrue(isGreaterThan(i, 0)))
-        {
-            return slice(joined, i, null);
-        } else
-        {
-            return joined;
-        }
-    }
-
     public virtual object customHandleDeltas(object bookside, object deltas, object timestamp = null)
     {
         for (object j = 0; isLessThan(j, getArrayLength(deltas)); postFixIncrement(ref j))
@@ -524,7 +524,7 @@ public partial class phemex : ccxt.phemex
             if (isTrue(isEqual(stored, null)))
             {
                 object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-                stored = new ArrayCacheByTimestamp(limit);
+                stored = this.ohlcvCache(limit);
                 ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))[(string)timeframe] = stored;
             }
             for (object i = 0; isLessThan(i, getArrayLength(ohlcvs)); postFixIncrement(ref i))
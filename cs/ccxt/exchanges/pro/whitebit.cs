@@ -134,7 +134,7 @@ public partial class whitebit : ccxt.whitebit
             if (!isTrue((inOp(getValue(this.ohlcvs, symbol), "unknown"))))
             {
                 object limit = this.safeInteger(this.options, "OHLCVLimit", 1000);
-                var stored = new ArrayCacheByTimestamp(limit);
+                var stored = this.ohlcvCache(limit);
                 ((IDictionary<string,object>)getValue(this.ohlcvs, symbol))["unknown"] = stored;
             }
             object ohlcv = getValue(getValue(this.ohlcvs, symbol), "unknown");
@@ -243,19 +243,9 @@ public partial class whitebit : ccxt.whitebit
         callDynamically(client as WebSocketClient, "resolve", new object[] {orderbook, messageHash});
     }
 
-    public override void handleDelta(object bookside, object delta)
-    {
-        object price = this.safeFloat(delta, 0);
-        object amount = this.safeFloat(delta, 1);
-        (bookside as IOrderBookSide).store(price, amount);
-    }
-
     public override void handleDeltas(object bookside, object deltas)
     {
-        for (object i = 0; isLessThan(i, getArrayLength(deltas)); postFixIncrement(ref i))
-        {
-            this.handleDelta(bookside, getValue(deltas, i));
-        }
+        (bookside as IOrderBookSide).storeDeltas(deltas);
     }
 
     /**
@@ -22,6 +22,11 @@ public partial class Exchange
         return new ccxt.pro.CountedOrderBook(snapshot, depth);
     }
 
+    public ccxt.pro.ArrayCacheByTimestamp ohlcvCache(object limit = null)
+    {
+        return new ccxt.pro.ArrayCacheByTimestamp(limit);
+    }
+
     public virtual void onClose(WebSocketClient client, object error = null)
     {
         // var client = (WebSocketClient)client2;
@@ -9,6 +9,7 @@ using dict = IDictionary<string, object>;
 public interface IOrderBook : IDictionary<string, object>
 {
     IOrderBook limit();
+    IOrderBook applyDeltas(object asks, object bids, object nonce = null, object timestamp = null);
     void reset(object snapshot = null);
     IOrderBook Copy();
     public IOrderBook update(object snapshot);
@@ -136,6 +137,26 @@ public class OrderBook : CustomConcurrentDictionary<string, object>, IOrderBook
         }
     }
 
+    // merges the raw deltas of a whole message into both sides
+    public IOrderBook applyDeltas(object asks, object bids, object nonce = null, object timestamp = null)
+    {
+        lock (_syncRoot)
+        {
+            (this["asks"] as IOrderBookSide).storeDeltas(asks);
+            (this["bids"] as IOrderBookSide).storeDeltas(bids);
+            if (nonce != null)
+            {
+                this["nonce"] = nonce;
+            }
+            if (timestamp != null)
+            {
+                this["timestamp"] = timestamp;
+                this["datetime"] = Exchange.Iso8601(timestamp);
+            }
+            return this;
+        }
+    }
+
     public IOrderBook update(object snapshot)
     {
         lock (_syncRoot)
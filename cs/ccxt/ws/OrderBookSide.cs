@@ -21,6 +21,7 @@ public interface IOrderBookSide : IList<object>
 {
     void store(object price, object size);
     void storeArray(object delta);
+    void storeDeltas(object deltas);
     void limit();
     void store(object price, object size, object order_id);
     IOrderBookSide Copy();
@@ -203,6 +204,89 @@ public class OrderBookSide : SlimConcurrentList<object>, IOrderBookSide
         }
     }
 
+    // storeDeltas sorts and merges batches of at least this many deltas instead of storing them one by one
+    protected const int BULK_THRESHOLD = 16;
+
+    // the raw [price, size] deltas of a whole message, numeric or string
+    // a large batch is sorted once and merged with the stored levels in a single walk
+    public void storeDeltas(object deltas2)
+    {
+        lock (_syncRoot)
+        {
+            var deltas = (IList<object>)deltas2;
+            if (deltas.Count >= BULK_THRESHOLD)
+            {
+                this.mergeDeltas(deltas);
+                return;
+            }
+            for (var i = 0; i < deltas.Count; i++)
+            {
+                var delta = (IList<object>)deltas[i];
+                this.storeArray(new SlimConcurrentList<object> { parseDelta(delta[0]), parseDelta(delta[1]) });
+            }
+        }
+    }
+
+    private void mergeDeltas(IList<object> deltas)
+    {
+        // rows are sorted by index price, a later delta of the same price wins like when storing them one by one
+        var rows = new List<(decimal key, object price, object size, decimal amount, int order)>(deltas.Count);
+        for (var i = 0; i < deltas.Count; i++)
+        {
+            var delta = (IList<object>)deltas[i];
+            var price = parseDelta(delta[0]);
+            var size = parseDelta(delta[1]);
+            var key = Convert.ToDecimal(price);
+            rows.Add(((this.side) ? -key : key, price, size, Convert.ToDecimal(size), i));
+        }
+        rows.Sort((a, b) => (a.key != b.key) ? a.key.CompareTo(b.key) : a.order.CompareTo(b.order));
+        var levels = this.ToArray();
+        var index = this._index.ToArray();
+        var merged = new SlimConcurrentList<decimal>();
+        this.Clear();
+        var k = 0;
+        for (var j = 0; j < rows.Count; j++)
+        {
+            var row = rows[j];
+            if (j + 1 < rows.Count && rows[j + 1].key == row.key)
+            {
+                continue;
+            }
+            while (k < index.Length && index[k] < row.key)
+            {
+                merged.Add(index[k]);
+                this.Add(levels[k]);
+                k++;
+            }
+            if (k < index.Length && index[k] == row.key)
+            {
+                if (row.amount != 0)
+                {
+                    (levels[k] as IList<object>)[1] = row.amount;
+                    merged.Add(row.key);
+                    this.Add(levels[k]);
+                }
+                k++;
+            }
+            else if (row.amount != 0)
+            {
+                merged.Add(row.key);
+                this.Add(new SlimConcurrentList<object> { row.price, row.size });
+            }
+        }
+        for (; k < index.Length; k++)
+        {
+            merged.Add(index[k]);
+            this.Add(levels[k]);
+        }
+        this._index = merged;
+    }
+
+    protected static object parseDelta(object value)
+    {
+        return (value == null) ? null : Convert.ToDouble(value, System.Globalization.CultureInfo.InvariantCulture);
+    }
+
     public void limit()
     {
         lock (_syncRoot)
@@ -303,6 +387,20 @@ public class CountedOrderBookSide : OrderBookSide, IOrderBookSide
         }
     }
 
+    // the raw [price, size, count] deltas of a whole message, numeric or string
+    public void storeDeltas(object deltas2)
+    {
+        lock (_syncRoot)
+        {
+            var deltas = (IList<object>)deltas2;
+            for (var i = 0; i < deltas.Count; i++)
+            {
+                var delta = (IList<object>)deltas[i];
+                this.storeArray(new SlimConcurrentList<object> { parseDelta(delta[0]), parseDelta(delta[1]), delta[2] });
+            }
+        }
+    }
+
     public void storeArray(object deltaArra2)
     {
         lock (_syncRoot)
@@ -488,6 +586,20 @@ public class IndexedOrderBookSide : OrderBookSide, IOrderBookSide
         }
     }
 
+    // the raw [price, size, order_id] deltas of a whole message, the price can be null
+    public void storeDeltas(object deltas2)
+    {
+        lock (_syncRoot)
+        {
+            var deltas = (IList<object>)deltas2;
+            for (var i = 0; i < deltas.Count; i++)
+            {
+                var delta = (IList<object>)deltas[i];
+                this.storeArray(new SlimConcurrentList<object> { parseDelta(delta[0]), parseDelta(delta[1]), delta[2] });
+            }
+        }
+    }
+
     // public void limit() {
     //     if (this.Count > this._depth) {
     //         FirstChanceExceptionEventArgs ()
@@ -39,6 +39,14 @@ public partial class BaseTest
                 { "nonce", 69 },
                 { "symbol", null },
             };
+            object deltasOrderBookTarget = new Dictionary<string, object>() {
+                { "bids", new List<object>() {new List<object>() {10.5, 3}, new List<object>() {10, 10}, new List<object>() {9.1, 11}, new List<object>() {8.2, 12}, new List<object>() {7.3, 13}, new List<object>() {6.4, 14}, new List<object>() {3, 4}} },
+                { "asks", new List<object>() {new List<object>() {11.5, 2}, new List<object>() {12.2, 14}, new List<object>() {13.3, 13}, new List<object>() {14.4, 12}, new List<object>() {15.5, 11}, new List<object>() {16.6, 10}} },
+                { "timestamp", 1574827240000 },
+                { "datetime", "2019-11-27T04:00:40.000Z" },
+                { "nonce", 70 },
+                { "symbol", null },
+            };
             object limitedDeletedOrderBookTarget = new Dictionary<string, object>() {
                 { "bids", new List<object>() {new List<object>() {10, 10}, new List<object>() {9.1, 11}, new List<object>() {8.2, 12}, new List<object>() {7.3, 13}, new List<object>() {6.4, 14}} },
                 { "asks", new List<object>() {new List<object>() {11.1, 13}, new List<object>() {12.2, 14}, new List<object>() {13.3, 13}, new List<object>() {14.4, 12}} },
@@ -331,6 +339,23 @@ public partial class BaseTest
             // incrementalIndexedOrderBook.limit ();
             // Assert (equals (incrementalIndexedOrderBook, anotherStoredIncrementalIndexedOrderBookTarget));
             
+        // --------------------------------------------------------------------------------------------------------------------
+        
+            var deltasOrderBook = new OrderBook(orderBookInput);
+            deltasOrderBook.applyDeltas(new List<object>() {new List<object>() {"11.1", "0"}, new List<object>() {"11.5", "1"}, new List<object>() {"11.5", "2"}}, new List<object>() {new List<object>() {"10.5", "3"}, new List<object>() {"4.5", "0"}, new List<object>() {"3", "4"}}, 70, 1574827240000);
+            deltasOrderBook.limit();
+            Assert(equals(deltasOrderBook, deltasOrderBookTarget));
+            var countedDeltasOrderBook = new CountedOrderBook(countedOrderBookInput);
+            var countedDeltasBids = countedDeltasOrderBook.bids;
+            countedDeltasBids.storeDeltas(new List<object>() {new List<object>() {"5", "0", "6"}, new List<object>() {"1", "1", "6"}});
+            countedDeltasOrderBook.limit();
+            Assert(equals(countedDeltasOrderBook, storedCountedOrderbookTarget));
+            var indexedDeltasOrderBook = new IndexedOrderBook(indexedOrderBookInput);
+            var indexedDeltasAsks = indexedDeltasOrderBook.asks;
+            indexedDeltasAsks.storeDeltas(new List<object>() {new List<object>() {"13.5", "13", "1244"}});
+            indexedDeltasOrderBook.limit();
+            Assert(equals(indexedDeltasOrderBook, overwrite1244));
+            
         // --------------------------------------------------------------------------------------------------------------------
         
             var resetBook = new OrderBook(storeBid);
@@ -105,10 +105,45 @@ public partial class BaseTest
             });
             Assert(!isEqual(getValue(exchange2.markets, "BTC/USD"), null));
         }
+        public void helperTestInitIndependentInstances()
+        {
+            // instances of the same class do not share their settings
+            var first = new ccxt.binance();
+            object fetchMarkets = getValue(first.options, "fetchMarkets");
+            ((IList<object>)fetchMarkets).Add("sampleType");
+            ((IDictionary<string,object>)first.options)["defaultType"] = "sampleType";
+            ((IDictionary<string,object>)first.has)["sampleMethod"] = true;
+            ((IDictionary<string,object>)getValue(first.fees, "trading"))["taker"] = 1;
+            var second = new ccxt.binance();
+            Assert(!isTrue(second.inArray("sampleType", getValue(second.options, "fetchMarkets"))));
+            Assert(isEqual(getValue(second.options, "defaultType"), "spot"));
+            Assert(!isTrue((inOp(second.has, "sampleMethod"))));
+            Assert(!isEqual(getValue(getValue(second.fees, "trading"), "taker"), 1));
+            // instances built from one shared config do not share it either
+            object config = new Dictionary<string, object>() {
+                { "headers", new Dictionary<string, object>() {
+                    { "User-Agent", "sample" },
+                } },
+                { "options", new Dictionary<string, object>() {
+                    { "sampleOption", new Dictionary<string, object>() {
+                        { "value", 1 },
+                    } },
+                } },
+            };
+            var demo = new ccxt.okx(config);
+            demo.setSandboxMode(true);
+            ((IDictionary<string,object>)getValue(demo.options, "sampleOption"))["value"] = 2;
+            var live = new ccxt.okx(config);
+            Assert(!isTrue((inOp(live.headers, "x-simulated-trading"))));
+            Assert(isEqual(getValue(live.headers, "User-Agent"), "sample"));
+            Assert(isEqual(getValue(getValue(live.options, "sampleOption"), "value"), 1));
+            Assert(!isTrue((inOp(getValue(config, "headers"), "x-simulated-trading"))));
+        }
         public void testAfterConstructor()
         {
             helperTestInitThrottler();
             helperTestInitSandbox();
             helperTestInitMarket();
+            helperTestInitIndependentInstances();
         }
 }
\ No newline at end of file
@@ -0,0 +1,35 @@
+using ccxt;
+namespace Tests;
+
+// PLEASE DO NOT EDIT THIS FILE, IT IS GENERATED AND WILL BE OVERWRITTEN:
+// https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
+
+public partial class BaseTest
+{
+        public void testOrderBookChecksum()
+        {
+            var exchange = new ccxt.Exchange(new Dictionary<string, object>() {
+                { "id", "sampleexchange" },
+            });
+            object orderbook = new Dictionary<string, object>() {
+                { "bids", new List<object>() {new List<object>() {100.5, 1.25}, new List<object>() {100.4, 0.5}, new List<object>() {100.3, 3.5}} },
+                { "asks", new List<object>() {new List<object>() {100.6, 2.5}, new List<object>() {100.7, 0.75}, new List<object>() {100.8, 1.5}} },
+            };
+            // CASE 1: okx, 100.5:1.25:100.6:2.5:100.4:0.5:100.7:0.75
+            Assert(isEqual(exchange.orderBookChecksum("BTC/USDT", orderbook, "interleaved", 2), -1678454923));
+            object stored = getValue(exchange.orderbookChecksums, "BTC/USDT");
+            Assert(isEqual(getValue(getValue(getValue(stored, "bids"), 0), 2), "100.5"));
+            Assert(isEqual(getValue(getValue(getValue(stored, "asks"), 0), 3), "2.5"));
+            // CASE 2: a level below the top depth changes, the checksum stays
+            ((IList<object>)getValue(getValue(orderbook, "bids"), 2))[Convert.ToInt32(1)] = 9.5;
+            Assert(isEqual(exchange.orderBookChecksum("BTC/USDT", orderbook, "interleaved", 2), -1678454923));
+            // CASE 3: a level in the top depth changes, 100.5:2.25:100.6:2.5:100.4:0.5:100.7:0.75
+            ((IList<object>)getValue(getValue(orderbook, "bids"), 0))[Convert.ToInt32(1)] = 2.25;
+            Assert(isEqual(exchange.orderBookChecksum("BTC/USDT", orderbook, "interleaved", 2), 271053164));
+            ((IList<object>)getValue(getValue(orderbook, "bids"), 0))[Convert.ToInt32(1)] = 1.25;
+            // CASE 4: bitfinex, 100.5:1.25:100.6:-2.5:100.4:0.5:100.7:-0.75
+            Assert(isEqual(exchange.orderBookChecksum("BTC/USDT", orderbook, "signed", 2), -21409025));
+            // CASE 5: kraken, asks then bids, 10062500000001007750000001005125000000100450000000
+            Assert(isEqual(exchange.orderBookChecksum("BTC/USDT", orderbook, "stripped", 2, 0, 1, 8), 20302849));
+        }
+}
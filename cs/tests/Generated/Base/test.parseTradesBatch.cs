@@ -0,0 +1,220 @@
+using ccxt;
+namespace Tests;
+
+// PLEASE DO NOT EDIT THIS FILE, IT IS GENERATED AND WILL BE OVERWRITTEN:
+// https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
+
+public partial class BaseTest
+{
+        public object helperTradesMarket(object id, object symbol, object bs, object quote, object settle, object type, object contractSize)
+        {
+            object spot = (isEqual(type, "spot"));
+            return new Dictionary<string, object>() {
+                { "id", id },
+                { "symbol", symbol },
+                { "base", bs },
+                { "quote", quote },
+                { "settle", settle },
+                { "baseId", bs },
+                { "quoteId", quote },
+                { "settleId", settle },
+                { "type", type },
+                { "spot", spot },
+                { "margin", false },
+                { "swap", (isEqual(type, "swap")) },
+                { "future", false },
+                { "option", false },
+                { "active", true },
+                { "contract", !isTrue(spot) },
+                { "linear", ((bool) isTrue(spot)) ? null : (isEqual(settle, quote)) },
+                { "inverse", ((bool) isTrue(spot)) ? null : (isEqual(settle, bs)) },
+                { "contractSize", contractSize },
+                { "info", new Dictionary<string, object>() {} },
+            };
+        }
+        public void helperTestParseTradesBatch(Exchange exchange, object trades, object market)
+        {
+            // the batch parser returns what parseTrade returns for every trade
+            object parsed = exchange.parseTradesBatch(trades, market);
+            Assert(isEqual(getArrayLength(parsed), getArrayLength(trades)));
+            for (object i = 0; isLessThan(i, getArrayLength(trades)); postFixIncrement(ref i))
+            {
+                AssertDeepEqual(exchange, null, "testParseTradesBatch", getValue(parsed, i), exchange.parseTrade(getValue(trades, i), market));
+            }
+        }
+        public void testParseTradesBatchBinance()
+        {
+            var exchange = new ccxt.binance();
+            object spot = helperTradesMarket("BTCUSDT", "BTC/USDT", "BTC", "USDT", null, "spot", null);
+            object linear = helperTradesMarket("BTCUSDT", "BTC/USDT:USDT", "BTC", "USDT", "USDT", "swap", "1");
+            object inverse = helperTradesMarket("BTCUSD_PERP", "BTC/USD:BTC", "BTC", "USD", "BTC", "swap", "100");
+            exchange.setMarkets(new List<object>() {spot, linear, inverse});
+            // the last trade is from fetchMyTrades and goes through parseTrade
+            object spotTrades = new List<object>() {new Dictionary<string, object>() {
+            { "a", 26129 },
+            { "p", "0.01633102" },
+            { "q", "4.70443515" },
+            { "f", 27781 },
+            { "l", 27781 },
+            { "T", 1498793709153 },
+            { "m", true },
+            { "M", true },
+        }, new Dictionary<string, object>() {
+            { "a", 26130 },
+            { "p", "0.01633103" },
+            { "q", "0.1" },
+            { "f", 27782 },
+            { "l", 27783 },
+            { "T", 1498793709154 },
+            { "m", false },
+            { "M", true },
+        }, new Dictionary<string, object>() {
+            { "symbol", "BTCUSDT" },
+            { "id", 470227543 },
+            { "orderId", 4421170947 },
+            { "price", "0.53880000" },
+            { "qty", "10.00000000" },
+            { "quoteQty", "5.38800000" },
+            { "commission", "0.00538800" },
+            { "commissionAsset", "USDT" },
+            { "time", 1707545780522 },
+            { "isBuyer", false },
+            { "isMaker", false },
+            { "isBestMatch", true },
+        }};
+            helperTestParseTradesBatch(exchange, spotTrades, getValue(exchange.markets, "BTC/USDT"));
+            object contractTrades = new List<object>() {new Dictionary<string, object>() {
+            { "a", "269772814" },
+            { "p", "25864.1" },
+            { "q", "3" },
+            { "f", "662149354" },
+            { "l", "662149355" },
+            { "T", "1694209776022" },
+            { "m", false },
+        }, new Dictionary<string, object>() {
+            { "a", "269772815" },
+            { "p", "25864.2" },
+            { "q", "1" },
+            { "f", "662149356" },
+            { "l", "662149356" },
+            { "T", "1694209776023" },
+            { "m", true },
+        }};
+            helperTestParseTradesBatch(exchange, contractTrades, getValue(exchange.markets, "BTC/USDT:USDT"));
+            helperTestParseTradesBatch(exchange, contractTrades, getValue(exchange.markets, "BTC/USD:BTC"));
+        }
+        public void testParseTradesBatchOkx()
+        {
+            var exchange = new ccxt.okx();
+            object spot = helperTradesMarket("BTC-USDT", "BTC/USDT", "BTC", "USDT", null, "spot", null);
+            object inverse = helperTradesMarket("BTC-USD-SWAP", "BTC/USD:BTC", "BTC", "USD", "BTC", "swap", "100");
+            exchange.setMarkets(new List<object>() {spot, inverse});
+            // the fourth trade has an unknown instId, the last one is from fetchMyTrades and goes through parseTrade
+            object trades = new List<object>() {new Dictionary<string, object>() {
+            { "instId", "BTC-USDT" },
+            { "side", "buy" },
+            { "sz", "0.00001" },
+            { "px", "29963.2" },
+            { "tradeId", "242720720" },
+            { "ts", "1654161646974" },
+        }, new Dictionary<string, object>() {
+            { "instId", "BTC-USD-SWAP" },
+            { "side", "sell" },
+            { "sz", "2" },
+            { "px", "29963.3" },
+            { "tradeId", "242720721" },
+            { "ts", "1654161646975" },
+            { "count", "1" },
+            { "source", "0" },
+        }, new Dictionary<string, object>() {
+            { "instId", "BTC-USDT" },
+            { "side", "sell" },
+            { "sz", "0.5" },
+            { "px", "29963.1" },
+            { "tradeId", "242720722" },
+            { "ts", "1654161646976" },
+        }, new Dictionary<string, object>() {
+            { "instId", "ETH-USDC" },
+            { "side", "buy" },
+            { "sz", "1" },
+            { "px", "1800" },
+            { "tradeId", "242720723" },
+            { "ts", "1654161646977" },
+        }, new Dictionary<string, object>() {
+            { "side", "buy" },
+            { "fillSz", "0.00001" },
+            { "fillPx", "29963.2" },
+            { "fee", "-0.00000001" },
+            { "feeCcy", "BTC" },
+            { "ordId", "4414" },
+            { "instId", "BTC-USDT" },
+            { "instType", "SPOT" },
+            { "posSide", "net" },
+            { "tradeId", "242720724" },
+            { "ts", "1654161646978" },
+            { "execType", "T" },
+        }};
+            helperTestParseTradesBatch(exchange, trades, null);
+            helperTestParseTradesBatch(exchange, trades, getValue(exchange.markets, "BTC/USDT"));
+        }
+        public void testParseTradesBatchBybit()
+        {
+            var exchange = new ccxt.bybit();
+            object spot = helperTradesMarket("BTCUSDT", "BTC/USDT", "BTC", "USDT", null, "spot", null);
+            object linear = helperTradesMarket("BTCUSDT", "BTC/USDT:USDT", "BTC", "USDT", "USDT", "swap", "1");
+            object inverse = helperTradesMarket("BTCUSD", "BTC/USD:BTC", "BTC", "USD", "BTC", "swap", "1");
+            exchange.setMarkets(new List<object>() {spot, linear, inverse});
+            // the last trade is from fetchMyTrades and goes through parseTrade
+            object trades = new List<object>() {new Dictionary<string, object>() {
+            { "execId", "666042b4-50c6-58f3-bd9c-89b2088663ff" },
+            { "symbol", "BTCUSDT" },
+            { "price", "16619.5" },
+            { "size", "0.001" },
+            { "side", "Sell" },
+            { "time", "1669191277315" },
+            { "isBlockTrade", false },
+        }, new Dictionary<string, object>() {
+            { "execId", "666042b4-50c6-58f3-bd9c-89b2088663fe" },
+            { "symbol", "BTCUSDT" },
+            { "price", "16619.6" },
+            { "size", "0.002" },
+            { "side", "Buy" },
+            { "time", "1669191277316" },
+            { "isBlockTrade", false },
+            { "isRPITrade", false },
+            { "seq", "1" },
+        }, new Dictionary<string, object>() {
+            { "symbol", "BTCUSDT" },
+            { "orderType", "Market" },
+            { "orderId", "1" },
+            { "execFee", "0.01" },
+            { "feeCurrency", "USDT" },
+            { "execId", "2" },
+            { "execPrice", "16619.5" },
+            { "execQty", "0.001" },
+            { "execValue", "16.6195" },
+            { "execTime", "1669191277317" },
+            { "isMaker", false },
+            { "side", "Buy" },
+            { "createType", "CreateByUser" },
+        }};
+            helperTestParseTradesBatch(exchange, trades, null);
+            helperTestParseTradesBatch(exchange, trades, getValue(exchange.markets, "BTC/USDT:USDT"));
+            object inverseTrades = new List<object>() {new Dictionary<string, object>() {
+            { "execId", "666042b4-50c6-58f3-bd9c-89b2088663fd" },
+            { "symbol", "BTCUSD" },
+            { "price", "16619.5" },
+            { "size", "100" },
+            { "side", "Buy" },
+            { "time", "1669191277318" },
+            { "isBlockTrade", false },
+        }};
+            helperTestParseTradesBatch(exchange, inverseTrades, getValue(exchange.markets, "BTC/USD:BTC"));
+        }
+        public void testParseTradesBatch()
+        {
+            testParseTradesBatchBinance();
+            testParseTradesBatchOkx();
+            testParseTradesBatchBybit();
+        }
+}
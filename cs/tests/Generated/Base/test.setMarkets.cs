@@ -0,0 +1,130 @@
+using ccxt;
+namespace Tests;
+
+// PLEASE DO NOT EDIT THIS FILE, IT IS GENERATED AND WILL BE OVERWRITTEN:
+// https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
+
+public partial class BaseTest
+{
+        public object helperMarket(object id, object symbol, object bs, object quote, object settle, object type, object expiry)
+        {
+            object spot = (isEqual(type, "spot"));
+            return new Dictionary<string, object>() {
+                { "id", id },
+                { "symbol", symbol },
+                { "base", bs },
+                { "quote", quote },
+                { "settle", settle },
+                { "baseId", bs },
+                { "quoteId", quote },
+                { "settleId", settle },
+                { "type", type },
+                { "spot", spot },
+                { "margin", false },
+                { "swap", (isEqual(type, "swap")) },
+                { "future", (isEqual(type, "future")) },
+                { "option", false },
+                { "active", true },
+                { "contract", !isTrue(spot) },
+                { "linear", ((bool) isTrue(spot)) ? null : (isEqual(settle, quote)) },
+                { "inverse", ((bool) isTrue(spot)) ? null : (isEqual(settle, bs)) },
+                { "expiry", expiry },
+                { "info", new Dictionary<string, object>() {} },
+            };
+        }
+        public object helperSymbols(object markets)
+        {
+            object symbols = new List<object>() {};
+            for (object i = 0; isLessThan(i, getArrayLength(markets)); postFixIncrement(ref i))
+            {
+                ((IList<object>)symbols).Add(getValue(getValue(markets, i), "symbol"));
+            }
+            return symbols;
+        }
+        public void testSetMarkets()
+        {
+            var exchange = new ccxt.Exchange(new Dictionary<string, object>() {
+                { "id", "sampleexchange" },
+            });
+            object spot = helperMarket("BTCUSDT", "BTC/USDT", "BTC", "USDT", null, "spot", null);
+            object linear = helperMarket("BTCUSDT", "BTC/USDT:USDT", "BTC", "USDT", "USDT", "swap", null);
+            object inverse = helperMarket("BTCUSD_PERP", "BTC/USD:BTC", "BTC", "USD", "BTC", "swap", null);
+            object future = helperMarket("BTCUSD_240927", "BTC/USD:BTC-240927", "BTC", "USD", "BTC", "future", 1727424000000);
+            object eth = helperMarket("ETHUSDT", "ETH/USDT", "ETH", "USDT", null, "spot", null);
+            object ltc = helperMarket("LTCUSDT", "LTC/USDT", "LTC", "USDT", null, "spot", null);
+            exchange.setMarkets(new List<object>() {linear, inverse, future, spot, eth});
+            AssertDeepEqual(exchange, null, "testSetMarkets", exchange.symbols, new List<object>() {"BTC/USD:BTC", "BTC/USD:BTC-240927", "BTC/USDT", "BTC/USDT:USDT", "ETH/USDT"});
+            AssertDeepEqual(exchange, null, "testSetMarkets", exchange.ids, new List<object>() {"BTCUSDT", "BTCUSD_240927", "BTCUSD_PERP", "ETHUSDT"});
+            AssertDeepEqual(exchange, null, "testSetMarkets", exchange.codes, new List<object>() {"BTC", "ETH", "USD", "USDT"});
+            // spot markets come first in markets_by_id
+            Assert(isEqual(getValue(getValue(getValue(exchange.markets_by_id, "BTCUSDT"), 0), "symbol"), "BTC/USDT"));
+            Assert(isEqual(getValue(getValue(exchange.markets, "BTC/USDT:USDT"), "subType"), "linear"));
+            Assert(isEqual(getValue(getValue(exchange.markets, "BTC/USDT"), "subType"), null));
+            //
+            // filterMarkets
+            //
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets()), exchange.symbols);
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets("spot")), new List<object>() {"BTC/USDT", "ETH/USDT"});
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets(null, "inverse")), new List<object>() {"BTC/USD:BTC", "BTC/USD:BTC-240927"});
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets(null, null, "BTC", "USDT")), new List<object>() {"BTC/USDT", "BTC/USDT:USDT"});
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets("swap", null, null, null, "USDT")), new List<object>() {"BTC/USDT:USDT"});
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets(null, null, null, null, null, 1727424000000)), new List<object>() {"BTC/USD:BTC-240927"});
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets(null, null, null, null, null, null, "BTC/USD")), new List<object>() {"BTC/USD:BTC", "BTC/USD:BTC-240927"});
+            // the underlying of a spot market is not set
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets(null, null, null, null, null, null, "BTC/USDT")), new List<object>() {"BTC/USDT:USDT"});
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets("option")), new List<object>() {});
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets("spot", null, "LTC")), new List<object>() {});
+            //
+            // safeMarket
+            //
+            Assert(isEqual(getValue(exchange.safeMarket("ETHUSDT"), "symbol"), "ETH/USDT"));
+            Assert(isEqual(getValue(exchange.safeMarket("BTCUSDT", null, null, "swap"), "symbol"), "BTC/USDT:USDT"));
+            Assert(isEqual(getValue(exchange.safeMarket("BTCUSDT", null, null, "spot"), "symbol"), "BTC/USDT"));
+            Assert(isEqual(getValue(exchange.safeMarket("BTCUSDT", getValue(exchange.markets, "BTC/USDT:USDT")), "symbol"), "BTC/USDT:USDT"));
+            Assert(isEqual(getValue(exchange.safeMarket("LTC-USDT", null, "-"), "symbol"), "LTC/USDT"));
+            Assert(isEqual(getValue(exchange.safeMarket("LTCUSDT"), "symbol"), "LTCUSDT"));
+            // the market memoized for an id and a type is dropped when the markets are set again
+            object delisted = exchange.extend(linear, new Dictionary<string, object>() {
+                { "active", false },
+            });
+            exchange.setMarkets(new List<object>() {delisted, inverse, future, spot, eth});
+            Assert(!isTrue(getValue(exchange.safeMarket("BTCUSDT", null, null, "swap"), "active")));
+            Assert(getValue(exchange.safeMarket("BTCUSDT", null, null, "spot"), "active"));
+            // the index is dropped too
+            exchange.setMarkets(new List<object>() {linear, spot, ltc});
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets("spot")), new List<object>() {"BTC/USDT", "LTC/USDT"});
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(exchange.filterMarkets(null, "inverse")), new List<object>() {});
+            //
+            // incremental reload
+            //
+            var reloaded = new ccxt.Exchange(new Dictionary<string, object>() {
+                { "id", "sampleexchange" },
+                { "options", new Dictionary<string, object>() {
+                    { "incrementalReload", true },
+                } },
+            });
+            reloaded.applyMarkets(new List<object>() {linear, inverse, future, spot, eth});
+            Assert(getValue(reloaded.safeMarket("BTCUSDT", null, null, "swap"), "active"));
+            Assert(isEqual(getArrayLength(reloaded.filterMarkets("spot")), 2));
+            // eth is removed, ltc is added and the linear swap changes
+            object fetched = new List<object>() {delisted, inverse, future, spot, ltc};
+            reloaded.applyMarkets(fetched);
+            var fresh = new ccxt.Exchange(new Dictionary<string, object>() {
+                { "id", "sampleexchange" },
+            });
+            fresh.setMarkets(fetched);
+            AssertDeepEqual(exchange, null, "testSetMarkets", reloaded.symbols, fresh.symbols);
+            AssertDeepEqual(exchange, null, "testSetMarkets", reloaded.ids, fresh.ids);
+            // currencies are extended like on every reload
+            Assert(inOp(reloaded.currencies, "LTC"));
+            for (object i = 0; isLessThan(i, getArrayLength(fresh.symbols)); postFixIncrement(ref i))
+            {
+                object symbol = getValue(fresh.symbols, i);
+                AssertDeepEqual(exchange, null, "testSetMarkets", getValue(reloaded.markets, symbol), getValue(fresh.markets, symbol));
+            }
+            Assert(!isTrue((inOp(reloaded.markets, "ETH/USDT"))));
+            Assert(!isTrue((inOp(reloaded.markets_by_id, "ETHUSDT"))));
+            Assert(!isTrue(getValue(reloaded.safeMarket("BTCUSDT", null, null, "swap"), "active")));
+            AssertDeepEqual(exchange, null, "testSetMarkets", helperSymbols(reloaded.filterMarkets("spot")), new List<object>() {"BTC/USDT", "LTC/USDT"});
+        }
+}
@@ -22,6 +22,9 @@ public partial class BaseTest
             testOmit();
             testGroupBy();
             testFilterBy();
+            testSetMarkets();
+            testParseTradesBatch();
+            testOrderBookChecksum();
             testHandleMethods();
             testRemoveRepeatedElementsFromArray();
         }
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.cache import ArrayCacheBySymbolById  # noqa: E402
+
+# compares the order cache with the previous implementation that located
+# an updated order with deque.index and removed it with del deque[index]
+# simulates a market maker amending resting orders in a full ordersLimit cache
+
+
+class LegacyArrayCacheBySymbolById(ArrayCacheBySymbolById):
+    def __init__(self, max_size=None):
+        super(LegacyArrayCacheBySymbolById, self).__init__(max_size)
+        self._deque = collections.deque([], max_size)
+        self._index = collections.deque([], max_size)
+
+    def append(self, item):
+        by_id = self.hashmap.setdefault(item['symbol'], {})
+        if item['id'] in by_id:
+            reference = by_id[item['id']]
+            if reference != item:
+                reference.update(item)
+            item = reference
+            index = self._index.index(item['id'])
+            del self._deque[index]
+            del self._index[index]
+        else:
+            by_id[item['id']] = item
+        if len(self._deque) == self._deque.maxlen:
+            delete_item = self._deque.popleft()
+            self._index.popleft()
+            del self.hashmap[delete_item['symbol']][delete_item['id']]
+        self._deque.append(item)
+        self._index.append(item['id'])
+
+
+def generate_updates(resting, updates, seed=1):
+    rng = random.Random(seed)
+    symbols = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'XRP/USDT']
+    orders = [(rng.choice(symbols), str(i)) for i in range(resting)]
+    result = [{'symbol': symbol, 'id': order_id, 'filled': 0} for symbol, order_id in orders]
+    for i in range(updates):
+        symbol, order_id = rng.choice(orders)
+        result.append({'symbol': symbol, 'id': order_id, 'filled': i})
+    return result
+
+
+def run(cls, max_size, updates, rounds):
+    timings = []
+    for _ in range(rounds):
+        cache = cls(max_size)
+        copies = [dict(update) for update in updates]
+        started = time.perf_counter()
+        for update in copies:
+            cache.append(update)
+            cache.getLimit(update['symbol'], None)
+        timings.append(time.perf_counter() - started)
+    return cache, min(timings)
+
+
+def main(rounds=3):
+    for max_size in [100, 1000, 5000]:
+        updates = generate_updates(max_size, 20000)
+        legacy, legacy_time = run(LegacyArrayCacheBySymbolById, max_size, updates, rounds)
+        current, current_time = run(ArrayCacheBySymbolById, max_size, updates, rounds)
+        assert list(legacy) == list(current), 'caches diverged'
+        print('ordersLimit {:5}   legacy {:8.2f} us/update   current {:6.2f} us/update   speedup {:.1f}x'.format(
+            max_size,
+            legacy_time / len(updates) * 1e6,
+            current_time / len(updates) * 1e6,
+            legacy_time / current_time,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+# measures exchange instances per second
+# uncached drops the per class describe() and camelCase caches before every instance,
+# which is the work every constructor did before they were introduced
+
+
+def uncached(cls):
+    for klass in cls.__mro__:
+        for name in ('_describe_cache', '_camelcase_properties'):
+            if name in klass.__dict__:
+                delattr(klass, name)
+
+
+def run(cls, count, cached):
+    cls()
+    started = time.perf_counter()
+    for i in range(count):
+        if not cached:
+            uncached(cls)
+        cls({'apiKey': 'key' + str(i), 'secret': 'secret'})
+    return count / (time.perf_counter() - started)
+
+
+def main(count=200):
+    for module in [ccxt, ccxt.async_support]:
+        for exchange_id in ['binance', 'okx', 'bybit', 'kraken']:
+            cls = getattr(module, exchange_id)
+            before = run(cls, count, False)
+            after = run(cls, count, True)
+            print('{:36} uncached {:7.0f}/s   cached {:7.0f}/s   speedup {:.1f}x'.format(
+                cls.__module__,
+                before,
+                after,
+                after / before,
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+# measures filter_markets against a scan of self.markets on option heavy market tables
+# the option market of ts/src/test/static/markets is repeated for every underlying, expiry, strike and side,
+# the other markets of the file are kept as they are
+# the first filter_markets call builds the index, it is timed separately
+
+
+def synthetic_markets(exchange_id, bases, expiries, strikes):
+    with open(os.path.join(root, 'ts', 'src', 'test', 'static', 'markets', exchange_id + '.json')) as file:
+        markets = list(json.load(file).values())
+    option = next(market for market in markets if market['type'] == 'option')
+    result = [market for market in markets if market['type'] != 'option']
+    for base in bases:
+        for e in range(expiries):
+            expiry = option['expiry'] + e * 86400000
+            for k in range(strikes):
+                strike = 1000 * (k + 1)
+                for side in ['C', 'P']:
+                    market = dict(option)
+                    suffix = '-' + str(e) + '-' + str(strike) + '-' + side
+                    market['id'] = base + suffix
+                    market['symbol'] = base + '/' + option['quote'] + ':' + base + suffix
+                    market['base'] = base
+                    market['baseId'] = base
+                    market['settle'] = base
+                    market['expiry'] = expiry
+                    market['strike'] = strike
+                    market['optionType'] = 'call' if side == 'C' else 'put'
+                    result.append(market)
+    return result
+
+
+def scan(exchange, type=None, base=None, settle=None, expiry=None):
+    result = []
+    for market in exchange.markets.values():
+        if type is not None and market['type'] != type:
+            continue
+        if base is not None and market['base'] != base:
+            continue
+        if settle is not None and market['settle'] != settle:
+            continue
+        if expiry is not None and market['expiry'] != expiry:
+            continue
+        result.append(market)
+    return result
+
+
+def timed(function, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main(rounds=200):
+    for exchange_id, bases, expiries, strikes in [('deribit', ['BTC', 'ETH', 'SOL'], 20, 80), ('okx', ['BTC', 'ETH'], 15, 60)]:
+        exchange = getattr(ccxt, exchange_id)()
+        exchange.set_markets(synthetic_markets(exchange_id, bases, expiries, strikes))
+        expiry = exchange.markets[exchange.symbols[-1]]['expiry']
+        started = time.perf_counter()
+        exchange.filter_markets('option')
+        print('{:8} {:6} markets   index built in {:.1f} ms'.format(exchange_id, len(exchange.markets), (time.perf_counter() - started) * 1000))
+        queries = [
+            ('options of an underlying', {'type': 'option', 'base': bases[-1]}),
+            ('options of an expiry', {'type': 'option', 'base': bases[0], 'expiry': expiry}),
+            ('swaps settled in USDT', {'type': 'swap', 'settle': 'USDT'}),
+        ]
+        for name, query in queries:
+            assert sorted(market['symbol'] for market in scan(exchange, **query)) == [market['symbol'] for market in exchange.filter_markets(**query)]
+            before = timed(lambda: scan(exchange, **query), rounds)
+            after = timed(lambda: exchange.filter_markets(**query), rounds)
+            print('    {:26} scan {:8.1f} us   index {:8.1f} us   speedup {:.0f}x'.format(name, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt import ExchangeClosedByUser  # noqa: E402
+from ccxt.async_support.base.ws.future import Future  # noqa: E402
+
+# measures Future.race over the futures of a watch_multiple call, from creating the race to awaiting its result
+# Legacy is the asyncio.wait task based race that Future.race was before the done callbacks
+
+
+class Legacy(Future):
+
+    @classmethod
+    def race(cls, futures):
+        future = Future()
+        for f in futures:
+            f.is_race_future = True
+        task = asyncio.create_task(asyncio.wait(futures, return_when=asyncio.FIRST_COMPLETED))
+
+        def callback(done):
+            try:
+                complete, pending = done.result()
+                for i, f in enumerate(complete):
+                    try:
+                        f.result()
+                    except ExchangeClosedByUser as e:
+                        if len(pending) == 0 and i == len(complete) - 1:
+                            future.reject(e)
+                        continue
+                    except asyncio.CancelledError:
+                        continue
+                    except Exception as e:
+                        future.reject(e)
+                        return
+                futures_list = list(complete)
+                if all([f.cancelled() for f in futures_list]):
+                    future.reject(ExchangeClosedByUser('Connection closed by the user'))
+                    return
+                future.resolve(futures_list[0].result())
+            except asyncio.CancelledError as e:
+                future.reject(e)
+            except Exception as e:
+                future.reject(e)
+        task.add_done_callback(callback)
+        return future
+
+
+async def timed(race, size, rounds):
+    started = time.perf_counter()
+    for i in range(rounds):
+        futures = [Future() for _ in range(size)]
+        future = race(futures)
+        futures[i % size].resolve(i)
+        assert await future == i
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+async def main(rounds=5000):
+    for size in [1, 10, 100, 500]:
+        before = await timed(Legacy.race, size, rounds)
+        after = await timed(Future.race, size, rounds)
+        print('{:4} futures   legacy {:8.1f} us   callbacks {:8.1f} us   speedup {:.1f}x'.format(size, before, after, before / after))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
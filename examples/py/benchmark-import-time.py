@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+python = root + '/python'
+
+# measures `import ccxt` with python -X importtime in a fresh interpreter
+# the eager baseline resolves every exchange class, which is what importing ccxt used to do
+# the module count and cumulative import time of the package are taken from the importtime log
+
+scenarios = [
+    ('import ccxt', 'import ccxt'),
+    ('ccxt.binance()', 'import ccxt; ccxt.binance()'),
+    ('import ccxt.pro', 'import ccxt.pro'),
+    ('ccxt.pro.binance()', 'import ccxt.pro; ccxt.pro.binance()'),
+    ('eager ccxt', 'import ccxt; [getattr(ccxt, id) for id in ccxt.exchanges]'),
+    ('eager ccxt.pro', 'import ccxt.pro; [getattr(ccxt.pro, id) for id in ccxt.pro.exchanges]'),
+]
+
+
+def importtime(code):
+    env = dict(os.environ, PYTHONPATH=python)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=env, stderr=subprocess.PIPE, check=True)
+    total = 0
+    modules = 0
+    for line in process.stderr.decode().splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules += 1
+        if not name.startswith('  '):
+            # top level imports, nested ones are already included in their cumulative time
+            total += int(cumulative)
+    return total / 1e6, modules
+
+
+def main(rounds=3):
+    for name, code in scenarios:
+        timings = [importtime(code) for _ in range(rounds)]
+        seconds = min(timing[0] for timing in timings)
+        print('{:22} {:6.3f} s   {:5} modules'.format(name, seconds, timings[0][1]))
+
+
+if __name__ == '__main__':
+    main()
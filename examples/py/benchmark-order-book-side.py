@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import bisect
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.order_book_side import Asks, Bids  # noqa: E402
+
+# compares the current order book sides with the previous implementation
+# that located every price level through bisect + list.insert/del
+# on a deep book, one stream of deltas per kind of update
+# size updates go through the price index in O(1), inserted and deleted levels
+# still bisect and shift the list, like before
+
+
+class LegacyOrderBookSide(list):
+    side = None
+
+    def __init__(self, deltas=[]):
+        super(LegacyOrderBookSide, self).__init__()
+        self._index = []
+        for delta in deltas:
+            self.storeArray(list(delta))
+
+    def storeArray(self, delta):
+        price = delta[0]
+        size = delta[1]
+        index_price = -price if self.side else price
+        index = bisect.bisect_left(self._index, index_price)
+        if size:
+            if index < len(self._index) and self._index[index] == index_price:
+                self[index][1] = size
+            else:
+                self._index.insert(index, index_price)
+                self.insert(index, delta)
+        elif index < len(self._index) and self._index[index] == index_price:
+            del self._index[index]
+            del self[index]
+
+    def limit(self):
+        pass
+
+
+class LegacyAsks(LegacyOrderBookSide): side = False  # noqa
+class LegacyBids(LegacyOrderBookSide): side = True  # noqa
+
+
+def generate_deltas(depth, updates, start, tick, kind, seed=1):
+    # kind is 'update' (size of an existing level), 'insert' (new level inside the book) or 'remove'
+    # inserts and removals alternate so the book keeps its depth
+    rng = random.Random(seed)
+    prices = [round(start + i * tick, 2) for i in range(0, depth * 2, 2)]
+    snapshot = [[price, rng.uniform(0.1, 10)] for price in prices]
+    deltas = []
+    for _ in range(updates // 2):
+        price = rng.choice(prices)
+        if kind == 'update':
+            deltas.append([price, rng.uniform(0.1, 10)])
+            deltas.append([price, rng.uniform(0.1, 10)])
+        elif kind == 'insert':
+            # a price between two levels, removed again right away
+            between = round(price + tick, 2)
+            deltas.append([between, rng.uniform(0.1, 10)])
+            deltas.append([between, 0])
+        else:
+            deltas.append([price, 0])
+            deltas.append([price, rng.uniform(0.1, 10)])
+    return snapshot, deltas
+
+
+def run(cls, snapshot, deltas, rounds):
+    timings = []
+    for _ in range(rounds):
+        side = cls([list(level) for level in snapshot])
+        copies = [list(delta) for delta in deltas]
+        started = time.perf_counter()
+        for delta in copies:
+            side.storeArray(delta)
+        side.limit()
+        timings.append(time.perf_counter() - started)
+    return side, min(timings)
+
+
+def main(depths=[1000, 20000], updates=100000, rounds=5):
+    for depth in depths:
+        print('depth', depth, 'updates', updates, 'best of', rounds)
+        compare(depth, updates, rounds)
+
+
+def compare(depth, updates, rounds):
+    for name, legacy, current in [('asks', LegacyAsks, Asks), ('bids', LegacyBids, Bids)]:
+        for kind in ['update', 'insert', 'remove']:
+            snapshot, deltas = generate_deltas(depth, updates, 100.0, 0.01, kind)
+            legacy_side, legacy_time = run(legacy, snapshot, deltas, rounds)
+            current_side, current_time = run(current, snapshot, deltas, rounds)
+            assert list(legacy_side) == list(current_side), name + ' sides diverged'
+            print('{:5} {:7} legacy {:8.1f} ns/update   current {:8.1f} ns/update   speedup {:.2f}x'.format(
+                name,
+                kind,
+                legacy_time / len(deltas) * 1e9,
+                current_time / len(deltas) * 1e9,
+                legacy_time / current_time,
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+# measures parse_trades on a 1000 trade page of public trades
+# legacy parses every trade with parse_trade and extends it with params, like parse_trades did before parse_trades_batch
+# the markets come from ts/src/test/static/markets
+
+
+def legacy_parse_trades(exchange, trades, market=None, since=None, limit=None, params={}):
+    result = []
+    for i in range(0, len(trades)):
+        result.append(exchange.extend(exchange.parse_trade(trades[i], market), params))
+    result = exchange.sort_by_2(result, 'timestamp', 'id')
+    return exchange.filter_by_symbol_since_limit(result, market['symbol'], since, limit)
+
+
+def binance_trade(i):
+    return {'a': 2913537567 + i, 'p': '%.2f' % (73238 + random.random()), 'q': '%.5f' % random.random(), 'f': 3479463557 + i, 'l': 3479463557 + i, 'T': 1710327661939 + i, 'm': random.random() < 0.5, 'M': True}
+
+
+def okx_trade(i):
+    return {'instId': 'BTC-USDT', 'side': random.choice(['buy', 'sell']), 'sz': '%.5f' % random.random(), 'px': '%.1f' % (73238 + random.random()), 'tradeId': str(497859870 + i), 'ts': str(1710327658374 + i)}
+
+
+def bybit_trade(i):
+    return {'execId': '9afd1288-%d' % i, 'symbol': 'BTCUSDT', 'price': '%.2f' % (51444 + random.random()), 'size': '%.3f' % random.random(), 'side': random.choice(['Buy', 'Sell']), 'time': str(1707905515968 + i), 'isBlockTrade': False}
+
+
+def timed(function, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main(count=1000, rounds=20):
+    for exchange_id, symbol, trade in [('binance', 'BTC/USDT', binance_trade), ('okx', 'BTC/USDT', okx_trade), ('bybit', 'BTC/USDT:USDT', bybit_trade)]:
+        exchange = getattr(ccxt, exchange_id)()
+        with open(os.path.join(root, 'ts', 'src', 'test', 'static', 'markets', exchange_id + '.json')) as file:
+            exchange.set_markets(list(json.load(file).values()))
+        market = exchange.market(symbol)
+        trades = [trade(i) for i in range(count)]
+        assert legacy_parse_trades(exchange, trades, market) == exchange.parse_trades(trades, market)
+        before = timed(lambda: legacy_parse_trades(exchange, trades, market), rounds)
+        after = timed(lambda: exchange.parse_trades(trades, market), rounds)
+        print('{:8} {} trades   legacy {:6.1f} ms   batch {:6.1f} ms   speedup {:.1f}x'.format(exchange_id, count, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
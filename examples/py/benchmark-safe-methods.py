@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import timeit
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# measures the safe_* accessors on a plain dict like a parsed json response
+# Legacy is the key_exists based implementation every lookup went through before the plain dict fast path
+
+
+class Legacy(Exchange):
+
+    @staticmethod
+    def key_exists(dictionary, key):
+        if hasattr(dictionary, '__getitem__') and not isinstance(dictionary, str):
+            if isinstance(dictionary, list) and type(key) is not int:
+                return False
+            try:
+                value = dictionary[key]
+                return value is not None and value != ''
+            except LookupError:
+                return False
+        return False
+
+    @staticmethod
+    def safe_string(dictionary, key, default_value=None):
+        return str(dictionary[key]) if Legacy.key_exists(dictionary, key) else default_value
+
+    @staticmethod
+    def safe_integer(dictionary, key, default_value=None):
+        if not Legacy.key_exists(dictionary, key):
+            return default_value
+        value = dictionary[key]
+        try:
+            return int(float(value))
+        except ValueError:
+            return default_value
+        except TypeError:
+            return default_value
+
+    @staticmethod
+    def safe_value(dictionary, key, default_value=None):
+        return dictionary[key] if Legacy.key_exists(dictionary, key) else default_value
+
+
+trade = {'a': 2913537567, 'p': '73238.70000000', 'q': '0.00109000', 'f': 3479463557, 'l': 3479463557, 'T': 1710327661939, 'm': False, 'M': True, 'empty': ''}
+
+calls = [
+    ('safe_string present', 'safe_string', 'p'),
+    ('safe_string number', 'safe_string', 'a'),
+    ('safe_string missing', 'safe_string', 'symbol'),
+    ('safe_string empty', 'safe_string', 'empty'),
+    ('safe_integer int', 'safe_integer', 'T'),
+    ('safe_integer string', 'safe_integer', 'p'),
+    ('safe_value present', 'safe_value', 'm'),
+    ('safe_value missing', 'safe_value', 'symbol'),
+]
+
+
+def main(number=500000):
+    for name, method, key in calls:
+        legacy = getattr(Legacy, method)
+        current = getattr(Exchange, method)
+        before = timeit.timeit(lambda: legacy(trade, key), number=number) / number * 1e9
+        after = timeit.timeit(lambda: current(trade, key), number=number) / number * 1e9
+        print('{:22} legacy {:6.0f} ns   current {:6.0f} ns   speedup {:.1f}x'.format(name, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
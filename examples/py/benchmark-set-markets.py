@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+from ccxt.base.decimal_to_precision import DECIMAL_PLACES, TICK_SIZE  # noqa: E402
+
+# measures set_markets on market tables the size of a real exchange
+# the markets of ts/src/test/static/markets are repeated with new ids until there are enough of them
+# Legacy is the set_markets that deep_extended every market with the defaults and sorted every table
+
+
+class Legacy(ccxt.Exchange):
+    def set_markets(self, markets, currencies=None):
+        values = []
+        self.markets_by_id = {}
+        # handle marketId conflicts
+        # we insert spot markets first
+        marketValues = self.sort_by(self.to_array(markets), 'spot', True, True)
+        for i in range(0, len(marketValues)):
+            value = marketValues[i]
+            if value['id'] in self.markets_by_id:
+                marketsByIdArray = (self.markets_by_id[value['id']])
+                marketsByIdArray.append(value)
+                self.markets_by_id[value['id']] = marketsByIdArray
+            else:
+                self.markets_by_id[value['id']] = [value]
+            market = self.deep_extend(self.safe_market_structure(), {
+                'precision': self.precision,
+                'limits': self.limits,
+            }, self.fees['trading'], value)
+            if market['linear']:
+                market['subType'] = 'linear'
+            elif market['inverse']:
+                market['subType'] = 'inverse'
+            else:
+                market['subType'] = None
+            values.append(market)
+        self.markets = self.index_by(values, 'symbol')
+        marketsSortedBySymbol = self.keysort(self.markets)
+        marketsSortedById = self.keysort(self.markets_by_id)
+        self.symbols = list(marketsSortedBySymbol.keys())
+        self.ids = list(marketsSortedById.keys())
+        if currencies is not None:
+            # currencies is always None when called in constructor but not when called from loadMarkets
+            self.currencies = self.deep_extend(self.currencies, currencies)
+        else:
+            baseCurrencies = []
+            quoteCurrencies = []
+            for i in range(0, len(values)):
+                market = values[i]
+                defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
+                marketPrecision = self.safe_dict(market, 'precision', {})
+                if 'base' in market:
+                    currency = self.safe_currency_structure({
+                        'id': self.safe_string_2(market, 'baseId', 'base'),
+                        'numericId': self.safe_integer(market, 'baseNumericId'),
+                        'code': self.safe_string(market, 'base'),
+                        'precision': self.safe_value_2(marketPrecision, 'base', 'amount', defaultCurrencyPrecision),
+                    })
+                    baseCurrencies.append(currency)
+                if 'quote' in market:
+                    currency = self.safe_currency_structure({
+                        'id': self.safe_string_2(market, 'quoteId', 'quote'),
+                        'numericId': self.safe_integer(market, 'quoteNumericId'),
+                        'code': self.safe_string(market, 'quote'),
+                        'precision': self.safe_value_2(marketPrecision, 'quote', 'price', defaultCurrencyPrecision),
+                    })
+                    quoteCurrencies.append(currency)
+            baseCurrencies = self.sort_by(baseCurrencies, 'code', False, '')
+            quoteCurrencies = self.sort_by(quoteCurrencies, 'code', False, '')
+            self.baseCurrencies = self.index_by(baseCurrencies, 'code')
+            self.quoteCurrencies = self.index_by(quoteCurrencies, 'code')
+            allCurrencies = self.array_concat(baseCurrencies, quoteCurrencies)
+            groupedCurrencies = self.group_by(allCurrencies, 'code')
+            codes = list(groupedCurrencies.keys())
+            resultingCurrencies = []
+            for i in range(0, len(codes)):
+                code = codes[i]
+                groupedCurrenciesCode = self.safe_list(groupedCurrencies, code, [])
+                highestPrecisionCurrency = self.safe_value(groupedCurrenciesCode, 0)
+                for j in range(1, len(groupedCurrenciesCode)):
+                    currentCurrency = groupedCurrenciesCode[j]
+                    if self.precisionMode == TICK_SIZE:
+                        highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] < highestPrecisionCurrency['precision']) else highestPrecisionCurrency
+                    else:
+                        highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] > highestPrecisionCurrency['precision']) else highestPrecisionCurrency
+                resultingCurrencies.append(highestPrecisionCurrency)
+            sortedCurrencies = self.sort_by(resultingCurrencies, 'code')
+            self.currencies = self.deep_extend(self.currencies, self.index_by(sortedCurrencies, 'code'))
+        self.currencies_by_id = self.index_by(self.currencies, 'id')
+        currenciesSortedByCode = self.keysort(self.currencies)
+        self.codes = list(currenciesSortedByCode.keys())
+        return self.markets
+
+
+def synthetic_markets(exchange_id, count):
+    with open(os.path.join(root, 'ts', 'src', 'test', 'static', 'markets', exchange_id + '.json')) as file:
+        markets = list(json.load(file).values())
+    result = []
+    for i in range(count):
+        market = dict(markets[i % len(markets)])
+        suffix = str(i // len(markets))
+        market['id'] = market['id'] + suffix
+        market['symbol'] = market['symbol'] + suffix
+        market['base'] = market['base'] + suffix
+        market['baseId'] = market['baseId'] + suffix
+        result.append(market)
+    return result
+
+
+def run(exchange, markets, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        exchange.set_markets(markets)
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main(rounds=10):
+    for exchange_id, count in [('binance', 3000), ('okx', 1000), ('bybit', 3000)]:
+        markets = synthetic_markets(exchange_id, count)
+        config = {'id': exchange_id}
+        before = run(Legacy(config), markets, rounds)
+        after = run(ccxt.Exchange(config), markets, rounds)
+        print('{:10} {:5} markets   legacy {:7.1f} ms   current {:7.1f} ms   speedup {:.1f}x'.format(exchange_id, count, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
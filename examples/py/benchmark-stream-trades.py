@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt.pro  # noqa: E402
+
+# measures the trade updates per second a consumer receives from binance watch_trades_for_symbols
+# legacy loops over await watch_trades_for_symbols(), every update costs the futures, the race task and its callbacks
+# stream iterates stream_trades(), fed straight from client.resolve
+# the producer passes raw trade messages to handle_message and waits until the consumer received each one,
+# so the numbers measure the per update overhead of the consumer side
+# no connection is opened, the client is marked as connected and its send() does nothing
+
+
+def offline(exchange):
+    client = exchange.client
+
+    def connected_client(url):
+        result = client(url)
+        if not result.connected.done():
+            result.connected.resolve(url)
+
+            async def send(message):
+                pass
+            result.send = send
+        return result
+    exchange.client = connected_client
+    return exchange
+
+
+def trade_message(i, market_id):
+    return {'e': 'trade', 'E': 1710327661939 + i, 's': market_id, 't': 3479463557 + i, 'p': '73238.70000000', 'q': '0.00109000', 'T': 1710327661939 + i, 'm': i % 2 == 0, 'M': True}
+
+
+async def produce(exchange, market_ids, count, received):
+    client = None
+    while client is None:
+        await asyncio.sleep(0)
+        client = next(iter(exchange.clients.values()), None)
+    started = time.perf_counter()
+    for i in range(count):
+        exchange.handle_message(client, trade_message(i, market_ids[i % len(market_ids)]))
+        while received[0] <= i:
+            await asyncio.sleep(0)
+    return count / (time.perf_counter() - started)
+
+
+async def legacy(exchange, symbols, received, count):
+    while received[0] < count:
+        trades = await exchange.watch_trades_for_symbols(symbols)
+        received[0] += len(trades)
+
+
+async def stream(exchange, symbols, received, count):
+    async for trades in exchange.stream_trades(symbols):
+        received[0] += len(trades)
+        if received[0] >= count:
+            break
+
+
+async def run(consumer, symbols, count):
+    exchange = offline(ccxt.pro.binance({'newUpdates': True}))
+    with open(os.path.join(root, 'ts', 'src', 'test', 'static', 'markets', 'binance.json')) as file:
+        exchange.set_markets(list(json.load(file).values()))
+    market_ids = [exchange.market(symbol)['id'] for symbol in symbols]
+    received = [0]
+    rate, _ = await asyncio.gather(produce(exchange, market_ids, count, received), consumer(exchange, symbols, received, count))
+    assert received[0] == count
+    await exchange.close()
+    return rate
+
+
+async def main(count=20000):
+    for symbols in [['BTC/USDT'], ['BTC/USDT', 'ETH/USDT', 'ADA/USDT', 'LTC/USDT', 'XRP/USDT', 'DOGE/USDT', 'TRX/USDT', 'SOL/USDT']]:
+        before = await run(legacy, symbols, count)
+        after = await run(stream, symbols, count)
+        print('{} symbols   legacy {:7.0f} updates/s   stream {:7.0f} updates/s   speedup {:.1f}x'.format(len(symbols), before, after, after / before))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base import throttler  # noqa: E402
+from ccxt.async_support.base.throttler import Throttler  # noqa: E402
+
+# compares the throttler with the previous implementation that polled the
+# bucket every `delay` while it was empty
+# simulates many exchange instances (and ws clients) sending bursts of requests
+# counts how many times the throttlers woke up and how late requests were
+# released compared to what the token bucket allows
+
+
+class LegacyThrottler(Throttler):
+    async def looper(self):
+        last_timestamp = time.time() * 1000
+        while self.running:
+            future, cost = self.queue[0]
+            cost = self.config['cost'] if cost is None else cost
+            if self.config['tokens'] >= 0:
+                self.config['tokens'] -= cost
+                if not future.done():
+                    future.set_result(None)
+                self.queue.popleft()
+                # context switch
+                await asyncio.sleep(0)
+                if len(self.queue) == 0:
+                    self.running = False
+            else:
+                await asyncio.sleep(self.config['delay'])
+                now = time.time() * 1000
+                elapsed = now - last_timestamp
+                last_timestamp = now
+                self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+
+    def __call__(self, cost=None):
+        future = asyncio.Future()
+        self.queue.append((future, cost))
+        if not self.running:
+            self.running = True
+            asyncio.ensure_future(self.looper())
+        return future
+
+
+class CountingSleep:
+    def __init__(self, sleep):
+        self.sleep = sleep
+        self.wakeups = 0
+
+    async def __call__(self, delay, result=None):
+        if delay > 0:
+            self.wakeups += 1
+        return await self.sleep(delay, result)
+
+
+async def client(throttle, requests, rng, latencies):
+    for _ in range(requests):
+        started = time.perf_counter()
+        await throttle(1)
+        latencies.append(time.perf_counter() - started)
+        if rng.random() < 0.2:
+            # idle between bursts, scheduled with call_later so it is not counted as a throttler wakeup
+            idle = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_later(rng.uniform(0.01, 0.05), idle.set_result, None)
+            await idle
+
+
+async def run(cls, instances, requests, rate_limit):
+    counting = CountingSleep(asyncio.sleep)
+    throttler.asyncio.sleep = counting
+    latencies = []
+    try:
+        throttlers = [cls({'refillRate': 1 / rate_limit, 'capacity': 1, 'tokens': 0}) for _ in range(instances)]
+        rng = random.Random(1)
+        started = time.perf_counter()
+        await asyncio.gather(*[client(throttlers[i % instances], requests, rng, latencies) for i in range(instances * 2)])
+        elapsed = time.perf_counter() - started
+    finally:
+        throttler.asyncio.sleep = counting.sleep
+    latencies.sort()
+    return counting.wakeups, elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+
+def main():
+    for instances in [10, 50]:
+        for cls in [LegacyThrottler, Throttler]:
+            wakeups, elapsed, median, p99 = asyncio.run(run(cls, instances, 20, 5))
+            print('{:16} instances {:3}   wakeups/s {:8.0f}   median wait {:6.1f} ms   p99 wait {:6.1f} ms   total {:5.2f} s'.format(
+                cls.__name__,
+                instances,
+                wakeups / elapsed,
+                median * 1000,
+                p99 * 1000,
+                elapsed,
+            ))
+
+
+if __name__ == '__main__':
+    main()
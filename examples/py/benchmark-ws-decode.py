@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import json
+import os
+import sys
+import time
+import zlib
+from io import BytesIO
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.aiohttp_client import AiohttpClient, orjson  # noqa: E402
+from ccxt.async_support.base.ws.functions import gunzip_bytes, inflate  # noqa: E402
+
+# measures the decoding of a binary websocket frame into the message handed to handle_message
+# legacy decompresses through GzipFile, decodes the bytes to str and parses the str, like handle_text_or_binary_message did
+# the frames are shaped after the payloads of the exchanges that compress their streams
+
+
+def legacy_decode(data, compression):
+    if compression == 'gzip':
+        data = gzip.GzipFile('', 'rb', 9, BytesIO(data)).read().decode('utf-8')
+    elif compression == 'deflate':
+        data = inflate(data)
+    if isinstance(data, bytes):
+        data = data.decode()
+    if len(data) >= 2 and (data[0] == '{' or data[0] == '['):
+        return json.loads(data) if orjson is None else orjson.loads(data)
+    return data
+
+
+def current_decode(data, compression):
+    if compression == 'gzip':
+        data = gunzip_bytes(data)
+    elif compression == 'deflate':
+        data = inflate(data)
+    return AiohttpClient.decode_message(data)
+
+
+def deflate(data):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def frames():
+    htx_depth = {'ch': 'market.btcusdt.mbp.150', 'ts': 1710327661939, 'tick': {'seqNum': 100, 'prevSeqNum': 99, 'bids': [[73238.1 - i * 0.1, 0.0123 * i] for i in range(150)], 'asks': [[73238.2 + i * 0.1, 0.0123 * i] for i in range(150)]}}
+    bingx_trade = {'code': 0, 'dataType': 'BTC-USDT@trade', 'data': {'E': 1710327661939, 's': 'BTC-USDT', 't': '146523413', 'p': '73238.70', 'q': '0.00109', 'T': 1710327661938, 'm': True}}
+    coinex_deals = {'method': 'deals.update', 'params': ['BTCUSDT', [{'id': 3479463557 + i, 'time': 1710327661.939, 'price': '73238.70', 'amount': '0.00109', 'type': 'buy'} for i in range(100)]], 'id': None}
+    okcoin_ticker = {'table': 'spot/ticker', 'data': [{'instrument_id': 'BTC-USD', 'last': '73238.7', 'best_bid': '73238.6', 'best_ask': '73238.8', 'open_24h': '72000.1', 'high_24h': '74000.2', 'low_24h': '71000.3', 'base_volume_24h': '1234.5', 'timestamp': '2024-03-13T11:01:01.939Z'}]}
+    return [
+        ('htx depth gzip', 'gzip', gzip.compress(json.dumps(htx_depth).encode())),
+        ('bingx trade gzip', 'gzip', gzip.compress(json.dumps(bingx_trade).encode())),
+        ('bingx Ping gzip', 'gzip', gzip.compress(b'Ping')),
+        ('coinex deals gzip', 'gzip', gzip.compress(json.dumps(coinex_deals).encode())),
+        ('okcoin ticker deflate', 'deflate', deflate(json.dumps(okcoin_ticker).encode())),
+        ('plain binary json', None, json.dumps(bingx_trade).encode()),
+    ]
+
+
+def timed(function, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main(rounds=20000):
+    for name, compression, frame in frames():
+        assert legacy_decode(frame, compression) == current_decode(frame, compression)
+        before = timed(lambda: legacy_decode(frame, compression), rounds)
+        after = timed(lambda: current_decode(frame, compression), rounds)
+        print('{:22} {:6} bytes   legacy {:7.2f} us   current {:7.2f} us   speedup {:.1f}x'.format(name, len(frame), before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -133,12 +133,13 @@ type Exchange struct {
 	Twofa interface{}
 
 	//WS
-	Ohlcvs     interface{}
-	Trades     interface{}
-	Tickers    interface{}
-	Orders     interface{}
-	MyTrades   interface{}
-	Orderbooks interface{}
+	Ohlcvs             interface{}
+	Trades             interface{}
+	Tickers            interface{}
+	Orders             interface{}
+	MyTrades           interface{}
+	Orderbooks         interface{}
+	OrderbookChecksums interface{}
 
 	PaddingMode int
 
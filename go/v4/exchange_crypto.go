@@ -525,6 +525,14 @@ func Ecdsa(request interface{}, secret interface{}, curveFunc func() string, has
 	return result
 }
 
+func (this *Exchange) Crc32(str interface{}, signed2 ...interface{}) interface{} {
+	signed := false
+	if len(signed2) > 0 {
+		signed = IsTrue(signed2[0])
+	}
+	return Crc32(ToString(str), signed)
+}
+
 func Crc32(str string, signed2 ...bool) int64 {
 	signed := false
 	if len(signed2) > 0 {
@@ -1922,6 +1922,152 @@ func  (this *Exchange) FeaturesMapper(initialFeatures interface{}, marketType in
 func  (this *Exchange) OrderbookChecksumMessage(symbol interface{}) interface{}  {
     return Add(Add(symbol, " : "), "orderbook data checksum validation failed. You can reconnect by calling watchOrderBook again or you can mute the error by setting exchange.options[\"watchOrderBook\"][\"checksum\"] = false")
 }
+func  (this *Exchange) OrderBookChecksum(symbol interface{}, orderbook interface{}, format interface{}, depth interface{}, optionalArgs ...interface{}) interface{}  {
+    //
+    // crc32 of the top depth levels of the orderbook in the layout the exchange checksums
+    //
+    //     'interleaved' bid price:bid amount:ask price:ask amount:... (okx)
+    //     'signed'      same as interleaved with negative ask amounts (bitfinex)
+    //     'stripped'    asks then bids, decimals padded to priceLength/amountLength, no dot, no leading zeros (kraken)
+    //
+    // the strings of the levels that stay in the top depth are reused between updates
+    // and the previous checksum is returned when none of the top depth levels changed
+    //
+    keyIndex := GetArg(optionalArgs, 0, 0)
+    _ = keyIndex
+    priceLength := GetArg(optionalArgs, 1, nil)
+    _ = priceLength
+    amountLength := GetArg(optionalArgs, 2, nil)
+    _ = amountLength
+    var previous interface{} = this.SafeDict(this.OrderbookChecksums, symbol, map[string]interface{} {})
+    var previousBids interface{} = []interface{}{}
+    var previousAsks interface{} = []interface{}{}
+    var checksum interface{} = nil
+    var sameFormat interface{} = IsTrue(IsTrue((IsEqual(this.SafeString(previous, "format"), format))) && IsTrue((IsEqual(this.SafeInteger(previous, "depth"), depth)))) && IsTrue((IsEqual(this.SafeInteger(previous, "keyIndex"), keyIndex)))
+    var sameLengths interface{} = IsTrue((IsEqual(this.SafeInteger(previous, "priceLength"), priceLength))) && IsTrue((IsEqual(this.SafeInteger(previous, "amountLength"), amountLength)))
+    if IsTrue(IsTrue(sameFormat) && IsTrue(sameLengths)) {
+        previousBids = GetValue(previous, "bids")
+        previousAsks = GetValue(previous, "asks")
+        checksum = this.SafeInteger(previous, "checksum")
+    }
+    var bids interface{} = this.OrderBookChecksumLevels(GetValue(orderbook, "bids"), previousBids, format, depth, keyIndex, priceLength, amountLength, false)
+    var asks interface{} = this.OrderBookChecksumLevels(GetValue(orderbook, "asks"), previousAsks, format, depth, keyIndex, priceLength, amountLength, true)
+    if IsTrue(IsTrue(IsTrue((IsEqual(checksum, nil))) || IsTrue(GetValue(bids, "changed"))) || IsTrue(GetValue(asks, "changed"))) {
+        var payload interface{} = this.OrderBookChecksumPayload(GetValue(bids, "levels"), GetValue(asks, "levels"), format, depth)
+        checksum = this.Crc32(payload, !IsEqual(format, "stripped"))
+    }
+    AddElementToObject(this.OrderbookChecksums, symbol, map[string]interface{} {
+        "format": format,
+        "depth": depth,
+        "keyIndex": keyIndex,
+        "priceLength": priceLength,
+        "amountLength": amountLength,
+        "bids": GetValue(bids, "levels"),
+        "asks": GetValue(asks, "levels"),
+        "checksum": checksum,
+    })
+    return checksum
+}
+func  (this *Exchange) OrderBookChecksumLevels(bookside interface{}, previous interface{}, format interface{}, depth interface{}, keyIndex interface{}, priceLength interface{}, amountLength interface{}, isAsk interface{}) interface{}  {
+    // returns [ key, amount, keyString, amountString ] for the top depth levels of one side
+    var booksideLength interface{} =     GetArrayLength(bookside)
+    var previousLength interface{} =     GetArrayLength(previous)
+    var count interface{} = MathMin(depth, booksideLength)
+    var negate interface{} = IsTrue(isAsk) && IsTrue((IsEqual(format, "signed")))
+    var changed interface{} = (!IsEqual(count, previousLength))
+    var levels interface{} = []interface{}{}
+    var j interface{} = 0
+    for i := 0; IsLessThan(i, count); i++ {
+        var level interface{} = GetValue(bookside, i)
+        var key interface{} = GetValue(level, keyIndex)
+        var amount interface{} = GetValue(level, 1)
+        var keyString interface{} = nil
+        var amountString interface{} = nil
+        // a level added or removed above shifts the level by a few positions
+        for offset := 0; IsLessThan(offset, 4); offset++ {
+            var k interface{} = Add(j, offset)
+            if IsTrue(IsGreaterThanOrEqual(k, previousLength)) {
+                break
+            }
+            var entry interface{} = GetValue(previous, k)
+            if IsTrue(IsEqual(GetValue(entry, 0), key)) {
+                keyString = GetValue(entry, 2)
+                if IsTrue(IsEqual(GetValue(entry, 1), amount)) {
+                    amountString = GetValue(entry, 3)
+                }
+                if IsTrue(!IsEqual(k, i)) {
+                    changed = true
+                }
+                j = Add(k, 1)
+                break
+            }
+        }
+        if IsTrue(IsEqual(keyString, nil)) {
+            keyString = this.OrderBookChecksumString(key, format, priceLength, false)
+            changed = true
+        }
+        if IsTrue(IsEqual(amountString, nil)) {
+            amountString = this.OrderBookChecksumString(amount, format, amountLength, negate)
+            changed = true
+        }
+        AppendToArray(&levels,[]interface{}{key, amount, keyString, amountString})
+    }
+    return map[string]interface{} {
+        "levels": levels,
+        "changed": changed,
+    }
+}
+func  (this *Exchange) OrderBookChecksumString(value interface{}, format interface{}, optionalArgs ...interface{}) interface{}  {
+    length := GetArg(optionalArgs, 0, nil)
+    _ = length
+    negate := GetArg(optionalArgs, 1, false)
+    _ = negate
+    if IsTrue(negate) {
+        return this.NumberToString(OpNeg(value))
+    }
+    var stringNumber interface{} = this.NumberToString(value)
+    if IsTrue(!IsEqual(format, "stripped")) {
+        return stringNumber
+    }
+    var parts interface{} = Split(stringNumber, ".")
+    var integer interface{} = this.SafeString(parts, 0)
+    var decimals interface{} = this.SafeString(parts, 1, "")
+    var paddedDecimals interface{} = PadEnd(decimals, length, "0")
+    var joined interface{} = Add(integer, paddedDecimals)
+    var i interface{} = 0
+    for IsTrue(IsTrue((IsLessThan(i, GetLength(joined)))) && IsTrue((IsEqual(GetValue(joined, i), "0")))) {
+        i = Add(i, 1)
+    }
+    if IsTrue(IsGreaterThan(i, 0)) {
+        return Slice(joined, i, nil)
+    }
+    return joined
+}
+func  (this *Exchange) OrderBookChecksumPayload(bids interface{}, asks interface{}, format interface{}, depth interface{}) interface{}  {
+    var bidsLength interface{} =     GetArrayLength(bids)
+    var asksLength interface{} =     GetArrayLength(asks)
+    var payloadArray interface{} = []interface{}{}
+    if IsTrue(IsEqual(format, "stripped")) {
+        for i := 0; IsLessThan(i, asksLength); i++ {
+            AppendToArray(&payloadArray,Add(GetValue(GetValue(asks, i), 2), GetValue(GetValue(asks, i), 3)))
+        }
+        for i := 0; IsLessThan(i, bidsLength); i++ {
+            AppendToArray(&payloadArray,Add(GetValue(GetValue(bids, i), 2), GetValue(GetValue(bids, i), 3)))
+        }
+        return Join(payloadArray, "")
+    }
+    for i := 0; IsLessThan(i, depth); i++ {
+        if IsTrue(IsLessThan(i, bidsLength)) {
+            AppendToArray(&payloadArray,GetValue(GetValue(bids, i), 2))
+            AppendToArray(&payloadArray,GetValue(GetValue(bids, i), 3))
+        }
+        if IsTrue(IsLessThan(i, asksLength)) {
+            AppendToArray(&payloadArray,GetValue(GetValue(asks, i), 2))
+            AppendToArray(&payloadArray,GetValue(GetValue(asks, i), 3))
+        }
+    }
+    return Join(payloadArray, ":")
+}
 func  (this *Exchange) CreateNetworksByIdObject()  {
     // automatically generate network-id-to-code mappings
     var networkIdsToCodesGenerated interface{} = this.InvertFlatStringDictionary(this.SafeValue(this.Options, "networks", map[string]interface{} {})) // invert defined networks dictionary
@@ -331,6 +331,7 @@ package ccxt
 func (this *Exchange) initializeProperties(extendedProperties map[string]interface{}) {
 
 	this.TransformedApi = map[string]interface{}{}
+	this.OrderbookChecksums = map[string]interface{}{}
 	this.Version = SafeString(extendedProperties, "version", "").(string)
 	this.cacheLoaded = false
 	reqCred := SafeValue(extendedProperties, "requiredCredentials", map[string]interface{}{})
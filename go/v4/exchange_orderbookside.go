@@ -5,3 +5,6 @@ type OrderBookSide struct {
 
 func (c *OrderBookSide) StoreArray(array interface{}) {
 }
+
+func (c *OrderBookSide) StoreDeltas(deltas interface{}) {
+}
@@ -83,6 +83,7 @@ export default class Exchange {
     balance: {};
     liquidations: Dictionary<Liquidation>;
     orderbooks: Dictionary<Ob>;
+    orderbookChecksums: Dictionary<any>;
     tickers: Dictionary<Ticker>;
     fundingRates: Dictionary<FundingRate>;
     bidsasks: Dictionary<Ticker>;
@@ -178,6 +179,9 @@ export default class Exchange {
     quoteCurrencies: any;
     currencies_by_id: any;
     codes: any;
+    markets_by_id_type: any;
+    markets_index: any;
+    markets_change_callback: any;
     reloadingMarkets: boolean;
     marketsLoading: Promise<Dictionary<any>>;
     accounts: any;
@@ -313,7 +317,7 @@ export default class Exchange {
     constructor(userConfig?: ConstructorArgs);
     encodeURIComponent(...args: any[]): string;
     checkRequiredVersion(requiredVersion: any, error?: boolean): boolean;
-    throttle(cost?: any): any;
+    throttle(cost?: any, api?: any): any;
     initThrottler(): void;
     defineRestApiEndpoint(methodName: any, uppercaseMethod: any, lowercaseMethod: any, camelcaseMethod: any, path: any, paths: any, config?: {}): void;
     defineRestApi(api: any, methodName: any, paths?: any[]): void;
@@ -328,12 +332,14 @@ export default class Exchange {
     setProxyAgents(httpProxy: any, httpsProxy: any, socksProxy: any): any;
     loadHttpProxyAgent(): Promise<any>;
     getHttpAgentIfNeeded(url: any): any;
+    fetchSingleFlight(path: any, api?: any, method?: string, params?: {}, headers?: any, body?: any, config?: {}): Promise<any>;
     fetch(url: any, method?: string, headers?: any, body?: any): Promise<any>;
     parseJson(jsonString: any): any;
     getResponseHeaders(response: any): {};
     handleRestResponse(response: any, url: any, method?: string, requestHeaders?: any, requestBody?: any): any;
     onRestResponse(statusCode: any, statusText: any, url: any, method: any, responseHeaders: any, responseBody: any, requestHeaders: any, requestBody: any): any;
     onJsonResponse(responseBody: any): any;
+    onMarketsChange(added: any, removed: any, changed: any): void;
     loadMarketsHelper(reload?: boolean, params?: {}): Promise<Dictionary<any>>;
     loadMarkets(reload?: boolean, params?: {}): Promise<Dictionary<Market>>;
     fetchCurrencies(params?: {}): Promise<Currencies>;
@@ -350,6 +356,7 @@ export default class Exchange {
     orderBook(snapshot?: {}, depth?: number): WsOrderBook;
     indexedOrderBook(snapshot?: {}, depth?: number): IndexedOrderBook;
     countedOrderBook(snapshot?: {}, depth?: number): CountedOrderBook;
+    ohlcvCache(limit?: any): ArrayCacheByTimestamp;
     handleMessage(client: any, message: any): void;
     ping(client: Client): any;
     client(url: string): WsClient;
@@ -505,6 +512,13 @@ export default class Exchange {
     featuresGenerator(): void;
     featuresMapper(initialFeatures: any, marketType: Str, subType?: Str): any;
     orderbookChecksumMessage(symbol: Str): string;
+    orderBookChecksum(symbol: string, orderbook: any, format: string, depth: Int, keyIndex?: Int, priceLength?: Int, amountLength?: Int): Int;
+    orderBookChecksumLevels(bookside: any, previous: any, format: string, depth: Int, keyIndex: Int, priceLength: Int, amountLength: Int, isAsk: boolean): {
+        levels: any[];
+        changed: boolean;
+    };
+    orderBookChecksumString(value: any, format: string, length?: Int, negate?: boolean): string;
+    orderBookChecksumPayload(bids: any, asks: any, format: string, depth: Int): string;
     createNetworksByIdObject(): void;
     getDefaultOptions(): {
         defaultNetworkCodeReplacements: {
@@ -542,6 +556,17 @@ export default class Exchange {
     safeCurrencyStructure(currency: object): CurrencyInterface;
     safeMarketStructure(market?: Dict): MarketInterface;
     setMarkets(markets: any, currencies?: any): Dictionary<any>;
+    updateMarkets(markets: any, currencies?: any): Dictionary<any>;
+    applyMarkets(markets: any, currencies?: any): Dictionary<any>;
+    loadedMarketValue(market: Dict): any;
+    marketTemplate(): any;
+    extendMarket(template: Dict, value: Dict): any;
+    marketCurrency(market: Dict, key: string, defaultPrecision: any): any[];
+    setMarketCurrencies(currencies: any, baseCurrencies: any[], quoteCurrencies: any[]): void;
+    marketsCurrencyStructures(currencies: Dict): {};
+    filterMarkets(type?: Str, subType?: Str, base?: Str, quote?: Str, settle?: Str, expiry?: Int, underlying?: Str): Market[];
+    getMarketsIndex(): any;
+    marketIndexValue(market: Dict, field: string): Str;
     getDescribeForExtendedWsExchange(currentRestInstance: any, parentRestInstance: any, wsBaseDescribe: Dictionary<any>): any;
     safeBalance(balance: Dict): Balances;
     safeOrder(order: Dict, market?: Market): Order;
@@ -598,6 +623,9 @@ export default class Exchange {
     parsePositions(positions: any[], symbols?: string[], params?: {}): Position[];
     parseAccounts(accounts: any[], params?: {}): Account[];
     parseTrades(trades: any[], market?: Market, since?: Int, limit?: Int, params?: {}): Trade[];
+    parseTradesBatch(trades: any[], market?: Market): Trade[];
+    safeTradeWithoutFee(trade: Dict, contractSize?: Str, inverse?: boolean): Trade;
+    hasOnlyKeys(value: any, keys: Dict): boolean;
     parseTransactions(transactions: any[], currency?: Currency, since?: Int, limit?: Int, params?: {}): Transaction[];
     parseTransfers(transfers: any[], currency?: Currency, since?: Int, limit?: Int, params?: {}): TransferEntry[];
     parseLedger(data: any, currency?: Currency, since?: Int, limit?: Int, params?: {}): LedgerEntry[];
@@ -626,6 +654,8 @@ export default class Exchange {
     getSymbolsForMarketType(marketType?: Str, subType?: Str, symbolWithActiveStatus?: boolean, symbolWithUnknownStatus?: boolean): any[];
     filterByArray(objects: any, key: IndexType, values?: any, indexed?: boolean): any;
     fetch2(path: any, api?: any, method?: string, params?: {}, headers?: any, body?: any, config?: {}): Promise<any>;
+    isSingleFlightRequest(api: any, method: any): boolean;
+    sendRequest(path: any, api?: any, method?: string, params?: {}, headers?: any, body?: any, config?: {}, request?: any): Promise<any>;
     request(path: any, api?: any, method?: string, params?: {}, headers?: any, body?: any, config?: {}): Promise<any>;
     loadAccounts(reload?: boolean, params?: {}): Promise<any>;
     buildOHLCVC(trades: Trade[], timeframe?: string, since?: number, limit?: number): OHLCVC[];
@@ -13,6 +13,7 @@ declare class OrderBook implements CustomOrderBookProp {
     symbol: Str;
     constructor(snapshot?: {}, depth?: any);
     limit(): this;
+    applyDeltas(asks: any, bids: any, nonce?: any, timestamp?: any): this;
     update(snapshot: any): this;
     reset(snapshot?: {}): this;
 }
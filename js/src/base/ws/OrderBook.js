@@ -49,6 +49,19 @@ class OrderBook {
         this.bids.limit();
         return this;
     }
+    // merge the raw deltas of a whole message into both sides
+    applyDeltas(asks, bids, nonce = undefined, timestamp = undefined) {
+        this.asks.storeDeltas(asks);
+        this.bids.storeDeltas(bids);
+        if (nonce !== undefined) {
+            this.nonce = nonce;
+        }
+        if (timestamp !== undefined) {
+            this.timestamp = timestamp;
+            this.datetime = iso8601(timestamp);
+        }
+        return this;
+    }
     update(snapshot) {
         if ((snapshot.nonce !== undefined) &&
             (this.nonce !== undefined) &&
@@ -1,22 +1,26 @@
 interface IOrderBookSide<T> extends Array<T> {
     store(price: any, size: any): any;
     storeArray(array: any[]): any;
+    storeDeltas(deltas: any[]): any;
     limit(): any;
 }
 declare class OrderBookSide extends Array implements IOrderBookSide<any> {
     constructor(deltas?: any[], depth?: any);
     storeArray(delta: any): void;
     store(price: any, size: any): void;
+    storeDeltas(deltas: any): void;
     limit(): void;
 }
 declare class CountedOrderBookSide extends OrderBookSide {
     store(price: any, size: any): void;
     storeArray(delta: any): void;
+    storeDeltas(deltas: any): void;
 }
 declare class IndexedOrderBookSide extends Array implements IOrderBookSide<any> {
     constructor(deltas?: any[], depth?: number);
     store(price: any, size: any): void;
     storeArray(delta: any): void;
+    storeDeltas(deltas: any): void;
     limit(): void;
 }
 declare class Asks extends OrderBookSide {
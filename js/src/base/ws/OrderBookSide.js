@@ -31,6 +31,30 @@ function bisectLeft(array, x) {
 }
 const SIZE = 1024;
 const SEED = new Float64Array(new Array(SIZE).fill(Number.MAX_VALUE));
+// storeDeltas sorts and merges batches of at least this many deltas or level changes instead of storing them one by one
+const BULK_THRESHOLD = 16;
+/**
+ * the [ index price, price, size ] rows of raw [ price, size ] deltas sorted by index price,
+ * only the last delta of a price is kept, like storing them one by one
+ * @param deltas
+ * @param side
+ */
+function sortDeltas(deltas, side) {
+    const rows = [];
+    for (let i = 0; i < deltas.length; i++) {
+        const price = parseFloat(deltas[i][0]);
+        rows.push([side ? -price : price, price, parseFloat(deltas[i][1]), i]);
+    }
+    rows.sort((a, b) => (a[0] - b[0]) || (a[3] - b[3]));
+    const result = [];
+    for (let i = 0; i < rows.length; i++) {
+        if ((i + 1 < rows.length) && (rows[i + 1][0] === rows[i][0])) {
+            continue;
+        }
+        result.push(rows[i]);
+    }
+    return result;
+}
 class OrderBookSide extends Array {
     constructor(deltas = [], depth = undefined) {
         super();
@@ -86,6 +110,77 @@ class OrderBookSide extends Array {
     store(price, size) {
         this.storeArray([price, size]);
     }
+    // store the raw [ price, size ] deltas of a whole message, numeric or string
+    // a large batch is sorted once, size updates of known levels are written in place
+    // and the new and removed levels are merged with the stored ones in a single walk
+    storeDeltas(deltas) {
+        if (deltas.length < BULK_THRESHOLD) {
+            for (let i = 0; i < deltas.length; i++) {
+                const delta = deltas[i];
+                this.storeArray([parseFloat(delta[0]), parseFloat(delta[1])]);
+            }
+            return;
+        }
+        const rows = sortDeltas(deltas, this.side);
+        const changes = [];
+        for (let i = 0; i < rows.length; i++) {
+            const row = rows[i];
+            const index = bisectLeft(this.index, row[0]);
+            if (this.index[index] === row[0]) {
+                if (row[2]) {
+                    this[index][1] = row[2];
+                }
+                else {
+                    changes.push(row);
+                }
+            }
+            else if (row[2]) {
+                changes.push(row);
+            }
+        }
+        if (changes.length < BULK_THRESHOLD) {
+            for (let i = 0; i < changes.length; i++) {
+                this.storeArray([changes[i][1], changes[i][2]]);
+            }
+            return;
+        }
+        // changes of known levels are removals, the others are new levels
+        const length = this.length;
+        const levels = Array.from(this);
+        const index = this.index;
+        let capacity = index.length;
+        while (capacity - 1 < length + changes.length) {
+            capacity *= 2;
+        }
+        const merged = new Float64Array(capacity).fill(Number.MAX_VALUE);
+        let i = 0;
+        let n = 0;
+        for (let j = 0; j < changes.length; j++) {
+            const [key, price, size] = changes[j];
+            while (i < length && index[i] < key) {
+                merged[n] = index[i];
+                this[n] = levels[i];
+                n++;
+                i++;
+            }
+            if (i < length && index[i] === key) {
+                i++;
+            }
+            else {
+                merged[n] = key;
+                this[n] = [price, size];
+                n++;
+            }
+        }
+        while (i < length) {
+            merged[n] = index[i];
+            this[n] = levels[i];
+            n++;
+            i++;
+        }
+        this.index = merged;
+        this.length = n;
+    }
     // replace stored orders with new values
     limit() {
         if (this.length > this.depth) {
@@ -138,6 +233,13 @@ class CountedOrderBookSide extends OrderBookSide {
             this.length--;
         }
     }
+    // store the raw [ price, size, count ] deltas of a whole message, numeric or string
+    storeDeltas(deltas) {
+        for (let i = 0; i < deltas.length; i++) {
+            const delta = deltas[i];
+            this.storeArray([parseFloat(delta[0]), parseFloat(delta[1]), parseInt(delta[2])]);
+        }
+    }
 }
 // ----------------------------------------------------------------------------
 // stores vector arrays indexed by id (3rd value in a bidask delta array)
@@ -244,6 +346,14 @@ class IndexedOrderBookSide extends Array {
             this.hashmap.delete(id);
         }
     }
+    // store the raw [ price, size, id ] deltas of a whole message, the price can be undefined
+    storeDeltas(deltas) {
+        for (let i = 0; i < deltas.length; i++) {
+            const delta = deltas[i];
+            const price = (delta[0] === undefined) ? undefined : parseFloat(delta[0]);
+            this.storeArray([price, parseFloat(delta[1]), delta[2]]);
+        }
+    }
     // replace stored orders with new values
     limit() {
         if (this.length > this.depth) {
@@ -220,6 +220,7 @@ export default class binance extends Exchange {
      */
     fetchOHLCV(symbol: string, timeframe?: string, since?: Int, limit?: Int, params?: {}): Promise<OHLCV[]>;
     parseTrade(trade: Dict, market?: Market): Trade;
+    parseTradesBatch(trades: any[], market?: Market): Trade[];
     /**
      * @method
      * @name binance#fetchTrades
@@ -144,6 +144,7 @@ export default class bybit extends Exchange {
      */
     fetchFundingRateHistory(symbol?: Str, since?: Int, limit?: Int, params?: {}): Promise<FundingRateHistory[]>;
     parseTrade(trade: Dict, market?: Market): Trade;
+    parseTradesBatch(trades: any[], market?: Market): Trade[];
     /**
      * @method
      * @name bybit#fetchTrades
@@ -650,6 +650,19 @@ export default class gate extends Exchange {
                 'X-Gate-Channel-Id': 'ccxt',
             },
             'options': {
+                'rateLimiter': {
+                    'headers': {
+                        // requests left in the per endpoint window
+                        'x-gate-ratelimit-requests-remain': {
+                            'type': 'remaining',
+                            'limitHeader': 'x-gate-ratelimit-limit',
+                            'resetHeader': 'x-gate-ratelimit-reset-timestamp',
+                            'resetType': 'timestamp',
+                            'window': 10000,
+                            'scope': 'path',
+                        },
+                    },
+                },
                 'timeDifference': 0,
                 'adjustForTimeDifference': false,
                 'sandboxMode': false,
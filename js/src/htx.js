@@ -2132,7 +2132,7 @@ export default class htx extends Exchange {
         if (symbolOrMarketId in futureMarketIdsForSymbols) {
             return futureMarketIdsForSymbols[symbolOrMarketId];
         }
-        const futureMarkets = this.filterBy(this.markets, 'future', true);
+        const futureMarkets = this.filterMarkets('future');
         const futuresCharsMaps = {
             'this_week': 'CW',
             'next_week': 'NW',
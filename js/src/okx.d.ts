@@ -112,6 +112,7 @@ export default class okx extends Exchange {
      */
     fetchMarkPrices(symbols?: Strings, params?: {}): Promise<Tickers>;
     parseTrade(trade: Dict, market?: Market): Trade;
+    parseTradesBatch(trades: any[], market?: Market): Trade[];
     /**
      * @method
      * @name okx#fetchTrades
@@ -2283,6 +2283,44 @@ export default class okx extends Exchange {
             'fee': fee,
         }, market);
     }
+    parseTradesBatch(trades, market = undefined) {
+        // public trades, { "instId", "side", "sz", "px", "tradeId", "ts" }, are parsed in one loop
+        // that only reads their fields and resolves every instId once, other trades go through parseTrade
+        const publicTradeKeys = { 'instId': true, 'side': true, 'sz': true, 'px': true, 'tradeId': true, 'ts': true, 'count': true, 'source': true };
+        const markets = {};
+        const result = [];
+        for (let i = 0; i < trades.length; i++) {
+            const trade = trades[i];
+            const marketId = this.hasOnlyKeys(trade, publicTradeKeys) ? this.safeString(trade, 'instId') : undefined;
+            if (marketId === undefined) {
+                result.push(this.parseTrade(trade, market));
+            }
+            else {
+                if (!(marketId in markets)) {
+                    const tradeMarket = this.safeMarket(marketId, market, '-');
+                    markets[marketId] = [tradeMarket['symbol'], this.safeString(tradeMarket, 'contractSize'), this.safeBool(tradeMarket, 'inverse', false)];
+                }
+                const cached = markets[marketId];
+                const timestamp = this.safeInteger(trade, 'ts');
+                result.push(this.safeTradeWithoutFee({
+                    'info': trade,
+                    'timestamp': timestamp,
+                    'datetime': this.iso8601(timestamp),
+                    'symbol': cached[0],
+                    'id': this.safeString(trade, 'tradeId'),
+                    'order': undefined,
+                    'type': undefined,
+                    'takerOrMaker': undefined,
+                    'side': this.safeString(trade, 'side'),
+                    'price': this.safeString(trade, 'px'),
+                    'amount': this.safeString(trade, 'sz'),
+                    'cost': undefined,
+                    'fee': undefined,
+                }, cached[1], cached[2]));
+            }
+        }
+        return result;
+    }
     /**
      * @method
      * @name okx#fetchTrades
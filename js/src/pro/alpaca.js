@@ -7,7 +7,7 @@
 //  ---------------------------------------------------------------------------
 import alpacaRest from '../alpaca.js';
 import { ExchangeError, AuthenticationError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 //  ---------------------------------------------------------------------------
 export default class alpaca extends alpacaRest {
     describe() {
@@ -172,7 +172,7 @@ export default class alpaca extends alpacaRest {
         let stored = this.safeValue(this.ohlcvs, symbol);
         if (stored === undefined) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             this.ohlcvs[symbol] = stored;
         }
         const parsed = this.parseOHLCV(message);
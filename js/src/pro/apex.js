@@ -6,7 +6,7 @@
 
 //  ---------------------------------------------------------------------------
 import apexRest from '../apex.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
 import { ArgumentsRequired, AuthenticationError, ExchangeError } from '../base/errors.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 //  ---------------------------------------------------------------------------
@@ -500,7 +500,7 @@ export default class apex extends apexRest {
         }
         if (this.safeValue(ohlcvsByTimeframe, timeframe) === undefined) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            this.ohlcvs[symbol][timeframe] = new ArrayCacheByTimestamp(limit);
+            this.ohlcvs[symbol][timeframe] = this.ohlcvCache(limit);
         }
         const stored = this.ohlcvs[symbol][timeframe];
         for (let i = 0; i < data.length; i++) {
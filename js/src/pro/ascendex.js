@@ -7,7 +7,7 @@
 //  ---------------------------------------------------------------------------
 import ascendexRest from '../ascendex.js';
 import { AuthenticationError, NetworkError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 //  ---------------------------------------------------------------------------
 export default class ascendex extends ascendexRest {
@@ -143,7 +143,7 @@ export default class ascendex extends ascendexRest {
         let stored = this.safeValue(this.ohlcvs[symbol], timeframe);
         if (stored === undefined) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             this.ohlcvs[symbol][timeframe] = stored;
         }
         stored.append(parsed);
@@ -347,18 +347,8 @@ export default class ascendex extends ascendexRest {
             client.resolve(orderbook, messageHash);
         }
     }
-    handleDelta(bookside, delta) {
-        //
-        // ["40990.47","0.01619"],
-        //
-        const price = this.safeFloat(delta, 0);
-        const amount = this.safeFloat(delta, 1);
-        bookside.store(price, amount);
-    }
     handleDeltas(bookside, deltas) {
-        for (let i = 0; i < deltas.length; i++) {
-            this.handleDelta(bookside, deltas[i]);
-        }
+        bookside.storeDeltas(deltas);
     }
     handleOrderBookMessage(client, message, orderbook) {
         //
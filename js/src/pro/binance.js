@@ -8,7 +8,7 @@
 import binanceRest from '../binance.js';
 import { Precise } from '../base/Precise.js';
 import { ChecksumError, ArgumentsRequired, BadRequest, NotSupported } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import { rsa } from '../base/functions/rsa.js';
 import { eddsa } from '../base/functions/crypto.js';
@@ -864,15 +864,8 @@ export default class binance extends binanceRest {
             client.reject(e, messageHash);
         }
     }
-    handleDelta(bookside, delta) {
-        const price = this.safeFloat(delta, 0);
-        const amount = this.safeFloat(delta, 1);
-        bookside.store(price, amount);
-    }
     handleDeltas(bookside, deltas) {
-        for (let i = 0; i < deltas.length; i++) {
-            this.handleDelta(bookside, deltas[i]);
-        }
+        bookside.storeDeltas(deltas);
     }
     handleOrderBookMessage(client, message, orderbook) {
         const u = this.safeInteger(message, 'u');
@@ -1615,7 +1608,7 @@ export default class binance extends binanceRest {
         let stored = this.safeValue(this.ohlcvs[symbol], unifiedTimeframe);
         if (stored === undefined) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             this.ohlcvs[symbol][unifiedTimeframe] = stored;
         }
         stored.append(parsed);
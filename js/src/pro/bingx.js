@@ -7,7 +7,7 @@
 //  ---------------------------------------------------------------------------
 import bingxRest from '../bingx.js';
 import { BadRequest, NetworkError, NotSupported, ArgumentsRequired } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 //  ---------------------------------------------------------------------------
 export default class bingx extends bingxRest {
     describe() {
@@ -918,7 +918,7 @@ export default class bingx extends bingxRest {
             const subscriptionHash = dataType;
             const subscription = client.subscriptions[subscriptionHash];
             const limit = this.safeInteger(subscription, 'limit');
-            this.ohlcvs[symbol][unifiedTimeframe] = new ArrayCacheByTimestamp(limit);
+            this.ohlcvs[symbol][unifiedTimeframe] = this.ohlcvCache(limit);
         }
         const stored = this.ohlcvs[symbol][unifiedTimeframe];
         for (let i = 0; i < candles.length; i++) {
@@ -8,7 +8,7 @@
 import bitfinexRest from '../bitfinex.js';
 import { Precise } from '../base/Precise.js';
 import { ExchangeError, AuthenticationError, ChecksumError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 import { sha384 } from '../static_dependencies/noble-hashes/sha512.js';
 //  ---------------------------------------------------------------------------
 export default class bitfinex extends bitfinexRest {
@@ -177,7 +177,7 @@ export default class bitfinex extends bitfinexRest {
         let stored = this.safeValue(this.ohlcvs[symbol], timeframe);
         if (stored === undefined) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             this.ohlcvs[symbol][timeframe] = stored;
         }
         const ohlcvsLength = ohlcvs.length;
@@ -660,29 +660,11 @@ export default class bitfinex extends bitfinexRest {
         if (book === undefined) {
             return;
         }
-        const depth = 25; // covers the first 25 bids and asks
-        const stringArray = [];
-        const bids = book['bids'];
-        const asks = book['asks'];
         const prec = this.safeString(subscription, 'prec', 'P0');
         const isRaw = (prec === 'R0');
         const idToCheck = isRaw ? 2 : 0;
-        // pepperoni pizza from bitfinex
-        for (let i = 0; i < depth; i++) {
-            const bid = this.safeValue(bids, i);
-            const ask = this.safeValue(asks, i);
-            if (bid !== undefined) {
-                stringArray.push(this.numberToString(bids[i][idToCheck]));
-                stringArray.push(this.numberToString(bids[i][1]));
-            }
-            if (ask !== undefined) {
-                stringArray.push(this.numberToString(asks[i][idToCheck]));
-                const aski1 = asks[i][1];
-                stringArray.push(this.numberToString(-aski1));
-            }
-        }
-        const payload = stringArray.join(':');
-        const localChecksum = this.crc32(payload, true);
+        // pepperoni pizza from bitfinex, covers the first 25 bids and asks
+        const localChecksum = this.orderBookChecksum(symbol, book, 'signed', 25, idToCheck);
         const responseChecksum = this.safeInteger(message, 2);
         if (responseChecksum !== localChecksum) {
             delete client.subscriptions[messageHash];
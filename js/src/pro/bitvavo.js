@@ -7,7 +7,7 @@
 //  ---------------------------------------------------------------------------
 import bitvavoRest from '../bitvavo.js';
 import { AuthenticationError, ArgumentsRequired, ExchangeError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 //  ---------------------------------------------------------------------------
 export default class bitvavo extends bitvavoRest {
@@ -347,7 +347,7 @@ export default class bitvavo extends bitvavoRest {
         let stored = this.safeValue(this.ohlcvs[symbol], timeframe);
         if (stored === undefined) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             this.ohlcvs[symbol][timeframe] = stored;
         }
         for (let i = 0; i < candles.length; i++) {
@@ -397,15 +397,8 @@ export default class bitvavo extends bitvavoRest {
         const orderbook = await this.watch(url, messageHash, message, messageHash, subscription);
         return orderbook.limit();
     }
-    handleDelta(bookside, delta) {
-        const price = this.safeFloat(delta, 0);
-        const amount = this.safeFloat(delta, 1);
-        bookside.store(price, amount);
-    }
     handleDeltas(bookside, deltas) {
-        for (let i = 0; i < deltas.length; i++) {
-            this.handleDelta(bookside, deltas[i]);
-        }
+        bookside.storeDeltas(deltas);
     }
     handleOrderBookMessage(client, message, orderbook) {
         //
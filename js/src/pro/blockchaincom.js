@@ -7,7 +7,7 @@
 //  ---------------------------------------------------------------------------
 import blockchaincomRest from '../blockchaincom.js';
 import { NotSupported, AuthenticationError, ExchangeError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 //  ---------------------------------------------------------------------------
 export default class blockchaincom extends blockchaincomRest {
     describe() {
@@ -188,7 +188,7 @@ export default class blockchaincom extends blockchaincomRest {
             let stored = this.safeValue(this.ohlcvs[symbol], timeframe);
             if (stored === undefined) {
                 const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-                stored = new ArrayCacheByTimestamp(limit);
+                stored = this.ohlcvCache(limit);
                 this.ohlcvs[symbol][timeframe] = stored;
             }
             stored.append(ohlcv);
@@ -9,7 +9,7 @@ import cexRest from '../cex.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import { ArgumentsRequired, ExchangeError, BadRequest } from '../base/errors.js';
 import { Precise } from '../base/Precise.js';
-import { ArrayCacheBySymbolById, ArrayCacheByTimestamp, ArrayCache } from '../base/ws/Cache.js';
+import { ArrayCacheBySymbolById, ArrayCache } from '../base/ws/Cache.js';
 //  ---------------------------------------------------------------------------
 export default class cex extends cexRest {
     describe() {
@@ -1104,7 +1104,7 @@ export default class cex extends cexRest {
         const messageHash = 'ohlcv:' + symbol;
         const data = this.safeValue(message, 'data', []);
         const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-        const stored = new ArrayCacheByTimestamp(limit);
+        const stored = this.ohlcvCache(limit);
         const sorted = this.sortBy(data, 0);
         for (let i = 0; i < sorted.length; i++) {
             stored.append(this.parseOHLCV(sorted[i], market));
@@ -8,7 +8,7 @@
 import coinbaseinternationalRest from '../coinbaseinternational.js';
 import { AuthenticationError, ExchangeError, NotSupported } from '../base/errors.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
-import { ArrayCache, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache } from '../base/ws/Cache.js';
 //  ---------------------------------------------------------------------------
 export default class coinbaseinternational extends coinbaseinternationalRest {
     describe() {
@@ -486,7 +486,7 @@ export default class coinbaseinternational extends coinbaseinternationalRest {
         this.ohlcvs[symbol] = this.safeValue(this.ohlcvs, symbol, {});
         if (this.safeValue(this.ohlcvs[symbol], timeframe) === undefined) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            this.ohlcvs[symbol][timeframe] = new ArrayCacheByTimestamp(limit);
+            this.ohlcvs[symbol][timeframe] = this.ohlcvCache(limit);
         }
         const stored = this.ohlcvs[symbol][timeframe];
         const data = this.safeList(message, 'candles', []);
@@ -7,7 +7,7 @@
 //  ---------------------------------------------------------------------------
 import defxRest from '../defx.js';
 import { ArgumentsRequired, ExchangeError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 //  ---------------------------------------------------------------------------
 export default class defx extends defxRest {
     describe() {
@@ -210,7 +210,7 @@ export default class defx extends defxRest {
         }
         if (!(timeframe in this.ohlcvs[symbol])) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            const stored = new ArrayCacheByTimestamp(limit);
+            const stored = this.ohlcvCache(limit);
             this.ohlcvs[symbol][timeframe] = stored;
         }
         const ohlcv = this.ohlcvs[symbol][timeframe];
@@ -7,7 +7,7 @@
 //  ---------------------------------------------------------------------------
 import deribitRest from '../deribit.js';
 import { NotSupported, ExchangeError, ArgumentsRequired } from '../base/errors.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 //  ---------------------------------------------------------------------------
 export default class deribit extends deribitRest {
@@ -843,7 +843,7 @@ export default class deribit extends deribitRest {
         this.ohlcvs[symbol] = this.safeDict(this.ohlcvs, symbol, {});
         if (this.safeValue(this.ohlcvs[symbol], unifiedTimeframe) === undefined) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            this.ohlcvs[symbol][unifiedTimeframe] = new ArrayCacheByTimestamp(limit);
+            this.ohlcvs[symbol][unifiedTimeframe] = this.ohlcvCache(limit);
         }
         const stored = this.ohlcvs[symbol][unifiedTimeframe];
         const ohlcv = this.safeDict(params, 'data', {});
@@ -6,7 +6,7 @@
 
 //  ---------------------------------------------------------------------------
 import hashkeyRest from '../hashkey.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
 //  ---------------------------------------------------------------------------
 export default class hashkey extends hashkeyRest {
     describe() {
@@ -131,7 +131,7 @@ export default class hashkey extends hashkeyRest {
         const timeframe = this.findTimeframe(klineType);
         if (!(timeframe in this.ohlcvs[symbol])) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            this.ohlcvs[symbol][timeframe] = new ArrayCacheByTimestamp(limit);
+            this.ohlcvs[symbol][timeframe] = this.ohlcvCache(limit);
         }
         const data = this.safeList(message, 'data', []);
         const stored = this.ohlcvs[symbol][timeframe];
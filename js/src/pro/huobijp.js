@@ -7,7 +7,7 @@
 // ----------------------------------------------------------------------------
 import huobijpRest from '../huobijp.js';
 import { ExchangeError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache } from '../base/ws/Cache.js';
 // ----------------------------------------------------------------------------
 export default class huobijp extends huobijpRest {
     describe() {
@@ -252,7 +252,7 @@ export default class huobijp extends huobijpRest {
         let stored = this.safeValue(this.ohlcvs[symbol], timeframe);
         if (stored === undefined) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
             this.ohlcvs[symbol][timeframe] = stored;
         }
         const tick = this.safeValue(message, 'tick');
@@ -367,15 +367,8 @@ export default class huobijp extends huobijpRest {
         }
         return undefined;
     }
-    handleDelta(bookside, delta) {
-        const price = this.safeFloat(delta, 0);
-        const amount = this.safeFloat(delta, 1);
-        bookside.store(price, amount);
-    }
     handleDeltas(bookside, deltas) {
-        for (let i = 0; i < deltas.length; i++) {
-            this.handleDelta(bookside, deltas[i]);
-        }
+        bookside.storeDeltas(deltas);
     }
     handleOrderBookMessage(client, message, orderbook) {
         //
@@ -167,7 +167,6 @@ export default class kraken extends krakenRest {
     watchHeartbeat(params?: {}): Promise<any>;
     handleHeartbeat(client: Client, message: any): void;
     handleOrderBook(client: Client, message: any, subscription: any): void;
-    formatNumber(n: any, length: any): string;
     customHandleDeltas(bookside: any, deltas: any, timestamp?: any): any;
     handleSystemStatus(client: Client, message: any): any;
     authenticate(params?: {}): Promise<string>;
@@ -7,7 +7,7 @@
 //  ---------------------------------------------------------------------------
 import kucoinfuturesRest from '../kucoinfutures.js';
 import { ExchangeError, ArgumentsRequired } from '../base/errors.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 //  ---------------------------------------------------------------------------
 export default class kucoinfutures extends kucoinfuturesRest {
     describe() {
@@ -723,7 +723,7 @@ export default class kucoinfutures extends kucoinfuturesRest {
         this.ohlcvs[symbol] = this.safeDict(this.ohlcvs, symbol, {});
         if (!(timeframe in this.ohlcvs[symbol])) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            this.ohlcvs[symbol][timeframe] = new ArrayCacheByTimestamp(limit);
+            this.ohlcvs[symbol][timeframe] = this.ohlcvCache(limit);
         }
         const stored = this.ohlcvs[symbol][timeframe];
         stored.append(parsed);
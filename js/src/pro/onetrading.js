@@ -7,7 +7,7 @@
 //  ---------------------------------------------------------------------------
 import onetradingRest from '../onetrading.js';
 import { NotSupported, ExchangeError } from '../base/errors.js';
-import { ArrayCacheBySymbolById, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 import Precise from '../base/Precise.js';
 //  ---------------------------------------------------------------------------
 export default class onetrading extends onetradingRest {
@@ -1161,7 +1161,7 @@ export default class onetrading extends onetradingRest {
         let stored = this.safeValue(this.ohlcvs[symbol], timeframe);
         if (stored === undefined) {
             const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp(limit);
+            stored = this.ohlcvCache(limit);
         }
         stored.append(parsed);
         this.ohlcvs[symbol][timeframe] = stored;
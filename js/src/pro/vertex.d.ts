@@ -60,7 +60,6 @@ export default class vertex extends vertexRest {
     fetchOrderBookSnapshot(client: any, message: any, subscription: any): Promise<void>;
     handleOrderBook(client: Client, message: any): void;
     handleOrderBookMessage(client: Client, message: any, orderbook: any): any;
-    handleDelta(bookside: any, delta: any): void;
     handleDeltas(bookside: any, deltas: any): void;
     handleSubscriptionStatus(client: Client, message: any): any;
     /**
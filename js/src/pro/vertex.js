@@ -539,15 +539,8 @@ export default class vertex extends vertexRest {
         orderbook['datetime'] = this.iso8601(timestamp);
         return orderbook;
     }
-    handleDelta(bookside, delta) {
-        const price = this.safeFloat(delta, 0);
-        const amount = this.safeFloat(delta, 1);
-        bookside.store(price, amount);
-    }
     handleDeltas(bookside, deltas) {
-        for (let i = 0; i < deltas.length; i++) {
-            this.handleDelta(bookside, deltas[i]);
-        }
+        bookside.storeDeltas(deltas);
     }
     handleSubscriptionStatus(client, message) {
         //
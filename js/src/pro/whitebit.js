@@ -8,7 +8,7 @@
 import whitebitRest from '../whitebit.js';
 import { Precise } from '../base/Precise.js';
 import { ArgumentsRequired, AuthenticationError, BadRequest } from '../base/errors.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 //  ---------------------------------------------------------------------------
 export default class whitebit extends whitebitRest {
     describe() {
@@ -127,7 +127,7 @@ export default class whitebit extends whitebitRest {
             // let stored = this.ohlcvs[symbol]['unknown']; // we don't know the timeframe but we need to respect the type
             if (!('unknown' in this.ohlcvs[symbol])) {
                 const limit = this.safeInteger(this.options, 'OHLCVLimit', 1000);
-                const stored = new ArrayCacheByTimestamp(limit);
+                const stored = this.ohlcvCache(limit);
                 this.ohlcvs[symbol]['unknown'] = stored;
             }
             const ohlcv = this.ohlcvs[symbol]['unknown'];
@@ -232,15 +232,8 @@ export default class whitebit extends whitebitRest {
         const messageHash = 'orderbook' + ':' + symbol;
         client.resolve(orderbook, messageHash);
     }
-    handleDelta(bookside, delta) {
-        const price = this.safeFloat(delta, 0);
-        const amount = this.safeFloat(delta, 1);
-        bookside.store(price, amount);
-    }
     handleDeltas(bookside, deltas) {
-        for (let i = 0; i < deltas.length; i++) {
-            this.handleDelta(bookside, deltas[i]);
-        }
+        bookside.storeDeltas(deltas);
     }
     /**
      * @method
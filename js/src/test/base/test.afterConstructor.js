@@ -93,10 +93,44 @@ function helperTestInitMarket() {
     });
     assert(exchange2.markets['BTC/USD'] !== undefined);
 }
+function helperTestInitIndependentInstances() {
+    // instances of the same class do not share their settings
+    const first = new ccxt.binance();
+    const fetchMarkets = first.options['fetchMarkets'];
+    fetchMarkets.push('sampleType');
+    first.options['defaultType'] = 'sampleType';
+    first.has['sampleMethod'] = true;
+    first.fees['trading']['taker'] = 1;
+    const second = new ccxt.binance();
+    assert(!second.inArray('sampleType', second.options['fetchMarkets']));
+    assert(second.options['defaultType'] === 'spot');
+    assert(!('sampleMethod' in second.has));
+    assert(second.fees['trading']['taker'] !== 1);
+    // instances built from one shared config do not share it either
+    const config = {
+        'headers': {
+            'User-Agent': 'sample',
+        },
+        'options': {
+            'sampleOption': {
+                'value': 1,
+            },
+        },
+    };
+    const demo = new ccxt.okx(config);
+    demo.setSandboxMode(true);
+    demo.options['sampleOption']['value'] = 2;
+    const live = new ccxt.okx(config);
+    assert(!('x-simulated-trading' in live.headers));
+    assert(live.headers['User-Agent'] === 'sample');
+    assert(live.options['sampleOption']['value'] === 1);
+    assert(!('x-simulated-trading' in config['headers']));
+}
 function testAfterConstructor() {
     helperTestInitThrottler();
     helperTestInitSandbox();
     helperTestInitMarket();
+    helperTestInitIndependentInstances();
     // todo: other constructor things
 }
 export default testAfterConstructor;
@@ -0,0 +1,2 @@
+declare function testOrderBookChecksum(): void;
+export default testOrderBookChecksum;
@@ -0,0 +1,2 @@
+declare function testParseTradesBatch(): void;
+export default testParseTradesBatch;
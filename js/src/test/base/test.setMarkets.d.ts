@@ -0,0 +1,2 @@
+declare function testSetMarkets(): void;
+export default testSetMarkets;
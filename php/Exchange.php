@@ -167,6 +167,7 @@ class Exchange {
     public $quote_currencies = null;
     public $balance = array();
     public $orderbooks = array();
+    public $orderbookChecksums = array();
     public $fundingRates = array();
 
     public $tickers = array();
@@ -264,6 +265,9 @@ class Exchange {
 
     public $twofa = null;
     public $markets_by_id = null;
+    public $markets_by_id_type = null; // marketType => marketId => market, filled by safe_market
+    public $markets_index = null; // field => value => markets, built by filter_markets
+    public $markets_change_callback = null; // called with the added, removed and changed markets of an incremental reload
     public $currencies_by_id = null;
     public $minFundingAddressLength = 1; // used in check_address
     public $substituteCommonCurrencyCodes = true;
@@ -1362,7 +1366,7 @@ class Exchange {
         return MessagePack::pack($data);
     }
 
-    public function throttle($cost = null) {
+    public function throttle($cost = null, $api = null) {
         // TODO: use a token bucket here
         $now = $this->milliseconds();
         $elapsed = $now - $this->lastRestRequestTimestamp;
@@ -1413,6 +1417,11 @@ class Exchange {
         }
     }
 
+    public function fetch_single_flight($path, $api = 'public', $method = 'GET', $params = array(), $headers = null, $body = null, $config = array()) {
+        // identical requests are only shared by the python async client, here every caller sends its own
+        return $this->send_request($path, $api, $method, $params, $headers, $body, $config);
+    }
+
     public function fetch($url, $method = 'GET', $headers = null, $body = null) {
 
         // https://github.com/ccxt/ccxt/issues/5914
@@ -1624,7 +1633,13 @@ class Exchange {
             $currencies = $this->fetch_currencies();
         }
         $markets = $this->fetch_markets($params);
-        return $this->set_markets($markets, $currencies);
+        return $this->apply_markets($markets, $currencies);
+    }
+
+    public function on_markets_change($added, $removed, $changed) {
+        if ($this->markets_change_callback !== null) {
+            call_user_func($this->markets_change_callback, $added, $removed, $changed);
+        }
     }
 
     public function number($n) {
@@ -3536,6 +3551,146 @@ class Exchange {
         return $symbol . '  = false';
     }
 
+    public function order_book_checksum(string $symbol, $orderbook, string $format, ?int $depth, ?int $keyIndex = 0, ?int $priceLength = null, ?int $amountLength = null) {
+        //
+        // crc32 of the top $depth levels of the $orderbook in the layout the exchange checksums
+        //
+        //     'interleaved' bid price:bid amount:ask price:ask amount:... (okx)
+        //     'signed'      same as interleaved with negative ask amounts (bitfinex)
+        //     'stripped'    $asks then $bids, decimals padded to $priceLength/$amountLength, no dot, no leading zeros (kraken)
+        //
+        // the strings of the levels that stay in the top $depth are reused between updates
+        // and the $previous $checksum is returned when none of the top $depth levels changed
+        //
+        $previous = $this->safe_dict($this->orderbookChecksums, $symbol, array());
+        $previousBids = array();
+        $previousAsks = array();
+        $checksum = null;
+        $sameFormat = ($this->safe_string($previous, 'format') === $format) && ($this->safe_integer($previous, 'depth') === $depth) && ($this->safe_integer($previous, 'keyIndex') === $keyIndex);
+        $sameLengths = ($this->safe_integer($previous, 'priceLength') === $priceLength) && ($this->safe_integer($previous, 'amountLength') === $amountLength);
+        if ($sameFormat && $sameLengths) {
+            $previousBids = $previous['bids'];
+            $previousAsks = $previous['asks'];
+            $checksum = $this->safe_integer($previous, 'checksum');
+        }
+        $bids = $this->order_book_checksum_levels($orderbook['bids'], $previousBids, $format, $depth, $keyIndex, $priceLength, $amountLength, false);
+        $asks = $this->order_book_checksum_levels($orderbook['asks'], $previousAsks, $format, $depth, $keyIndex, $priceLength, $amountLength, true);
+        if (($checksum === null) || $bids['changed'] || $asks['changed']) {
+            $payload = $this->order_book_checksum_payload($bids['levels'], $asks['levels'], $format, $depth);
+            $checksum = $this->crc32($payload, $format !== 'stripped');
+        }
+        $this->orderbookChecksums[$symbol] = array(
+            'format' => $format,
+            'depth' => $depth,
+            'keyIndex' => $keyIndex,
+            'priceLength' => $priceLength,
+            'amountLength' => $amountLength,
+            'bids' => $bids['levels'],
+            'asks' => $asks['levels'],
+            'checksum' => $checksum,
+        );
+        return $checksum;
+    }
+
+    public function order_book_checksum_levels($bookside, $previous, string $format, ?int $depth, ?int $keyIndex, ?int $priceLength, ?int $amountLength, bool $isAsk) {
+        // returns [ $key, $amount, $keyString, $amountString ] for the top $depth $levels of one side
+        $booksideLength = count($bookside);
+        $previousLength = count($previous);
+        $count = min ($depth, $booksideLength);
+        $negate = $isAsk && ($format === 'signed');
+        $changed = ($count !== $previousLength);
+        $levels = array();
+        $j = 0;
+        for ($i = 0; $i < $count; $i++) {
+            $level = $bookside[$i];
+            $key = $level[$keyIndex];
+            $amount = $level[1];
+            $keyString = null;
+            $amountString = null;
+            // a $level added or removed above shifts the $level by a few positions
+            for ($offset = 0; $offset < 4; $offset++) {
+                $k = $j + $offset;
+                if ($k >= $previousLength) {
+                    break;
+                }
+                $entry = $previous[$k];
+                if ($entry[0] === $key) {
+                    $keyString = $entry[2];
+                    if ($entry[1] === $amount) {
+                        $amountString = $entry[3];
+                    }
+                    if ($k !== $i) {
+                        $changed = true;
+                    }
+                    $j = $k + 1;
+                    break;
+                }
+            }
+            if ($keyString === null) {
+                $keyString = $this->order_book_checksum_string($key, $format, $priceLength, false);
+                $changed = true;
+            }
+            if ($amountString === null) {
+                $amountString = $this->order_book_checksum_string($amount, $format, $amountLength, $negate);
+                $changed = true;
+            }
+            $levels[] = array( $key, $amount, $keyString, $amountString );
+        }
+        return array(
+            'levels' => $levels,
+            'changed' => $changed,
+        );
+    }
+
+    public function order_book_checksum_string($value, string $format, ?int $length = null, $negate = false) {
+        if ($negate) {
+            return $this->number_to_string(-$value);
+        }
+        $stringNumber = $this->number_to_string($value);
+        if ($format !== 'stripped') {
+            return $stringNumber;
+        }
+        $parts = explode('.', $stringNumber);
+        $integer = $this->safe_string($parts, 0);
+        $decimals = $this->safe_string($parts, 1, '');
+        $paddedDecimals = str_pad($decimals, $length, '0', STR_PAD_RIGHT);
+        $joined = $integer . $paddedDecimals;
+        $i = 0;
+        while (($i < strlen($joined)) && ($joined[$i] === '0')) {
+            $i += 1;
+        }
+        if ($i > 0) {
+            return mb_substr($joined, $i);
+        }
+        return $joined;
+    }
+
+    public function order_book_checksum_payload($bids, $asks, string $format, ?int $depth) {
+        $bidsLength = count($bids);
+        $asksLength = count($asks);
+        $payloadArray = array();
+        if ($format === 'stripped') {
+            for ($i = 0; $i < $asksLength; $i++) {
+                $payloadArray[] = $asks[$i][2] . $asks[$i][3];
+            }
+            for ($i = 0; $i < $bidsLength; $i++) {
+                $payloadArray[] = $bids[$i][2] . $bids[$i][3];
+            }
+            return implode('', $payloadArray);
+        }
+        for ($i = 0; $i < $depth; $i++) {
+            if ($i < $bidsLength) {
+                $payloadArray[] = $bids[$i][2];
+                $payloadArray[] = $bids[$i][3];
+            }
+            if ($i < $asksLength) {
+                $payloadArray[] = $asks[$i][2];
+                $payloadArray[] = $asks[$i][3];
+            }
+        }
+        return implode(':', $payloadArray);
+    }
+
     public function create_networks_by_id_object() {
         // automatically generate network-id-to-code mappings
         $networkIdsToCodesGenerated = $this->invert_flat_string_dictionary($this->safe_value($this->options, 'networks', array())); // invert defined networks dictionary
@@ -3805,96 +3960,372 @@ class Exchange {
     }
 
     public function set_markets($markets, $currencies = null) {
-        $values = array();
+        // one pass over the $markets builds the $markets, markets_by_id and the $currencies derived from them
+        // the defaults every $market is merged with are merged once
+        $this->markets = array();
         $this->markets_by_id = array();
-        // handle marketId conflicts
+        $this->markets_by_id_type = null;
+        $this->markets_index = null;
+        $template = $this->market_template();
+        $defaultCurrencyPrecision = ($this->precisionMode === DECIMAL_PLACES) ? 8 : $this->parse_number('1e-8');
+        $baseCurrencies = array();
+        $quoteCurrencies = array();
+        // handle $marketId conflicts
         // we insert spot $markets first
         $marketValues = $this->sort_by($this->to_array($markets), 'spot', true, true);
         for ($i = 0; $i < count($marketValues); $i++) {
             $value = $marketValues[$i];
-            if (is_array($this->markets_by_id) && array_key_exists($value['id'], $this->markets_by_id)) {
-                $marketsByIdArray = ($this->markets_by_id[$value['id']]);
+            $marketId = $value['id'];
+            if (is_array($this->markets_by_id) && array_key_exists($marketId, $this->markets_by_id)) {
+                $marketsByIdArray = ($this->markets_by_id[$marketId]);
                 $marketsByIdArray[] = $value;
-                $this->markets_by_id[$value['id']] = $marketsByIdArray;
+                $this->markets_by_id[$marketId] = $marketsByIdArray;
             } else {
-                $this->markets_by_id[$value['id']] = array( $value );
-            }
-            $market = $this->deep_extend($this->safe_market_structure(), array(
-                'precision' => $this->precision,
-                'limits' => $this->limits,
-            ), $this->fees['trading'], $value);
-            if ($market['linear']) {
-                $market['subType'] = 'linear';
-            } elseif ($market['inverse']) {
-                $market['subType'] = 'inverse';
+                $this->markets_by_id[$marketId] = array( $value );
+            }
+            $market = $this->extend_market($template, $value);
+            $symbol = $this->safe_string($market, 'symbol');
+            if ($symbol !== null) {
+                $this->markets[$symbol] = $market;
+            }
+            if ($currencies === null) {
+                if (is_array($market) && array_key_exists('base', $market)) {
+                    $baseCurrencies[] = $this->market_currency($market, 'base', $defaultCurrencyPrecision);
+                }
+                if (is_array($market) && array_key_exists('quote', $market)) {
+                    $quoteCurrencies[] = $this->market_currency($market, 'quote', $defaultCurrencyPrecision);
+                }
+            }
+        }
+        $this->symbols = is_array($this->keysort($this->markets)) ? array_keys($this->keysort($this->markets)) : array();
+        $this->ids = is_array($this->keysort($this->markets_by_id)) ? array_keys($this->keysort($this->markets_by_id)) : array();
+        $this->set_market_currencies($currencies, $baseCurrencies, $quoteCurrencies);
+        return $this->markets;
+    }
+
+    public function update_markets($markets, $currencies = null) {
+        // setMarkets for a reload that keeps the loaded $market objects
+        // $markets $fetched $unchanged keep their object, $changed ones are updated in place,
+        // $this->markets and $this->markets_by_id are updated instead of replaced
+        // onMarketsChange is called with the $added, $removed and $changed $markets
+        if ($this->is_empty($this->markets)) {
+            return $this->set_markets($markets, $currencies);
+        }
+        $marketsById = array();
+        $fetched = array();
+        $unchanged = array();
+        $template = $this->market_template();
+        $defaultCurrencyPrecision = ($this->precisionMode === DECIMAL_PLACES) ? 8 : $this->parse_number('1e-8');
+        $baseCurrencies = array();
+        $quoteCurrencies = array();
+        $marketValues = $this->sort_by($this->to_array($markets), 'spot', true, true);
+        for ($i = 0; $i < count($marketValues); $i++) {
+            $value = $marketValues[$i];
+            $marketId = $value['id'];
+            if (is_array($marketsById) && array_key_exists($marketId, $marketsById)) {
+                $marketsByIdArray = $marketsById[$marketId];
+                $marketsByIdArray[] = $value;
+                $marketsById[$marketId] = $marketsByIdArray;
             } else {
-                $market['subType'] = null;
+                $marketsById[$marketId] = array( $value );
+            }
+            $market = null;
+            $symbol = $this->safe_string($value, 'symbol');
+            if (($symbol !== null) && (is_array($this->markets) && array_key_exists($symbol, $this->markets)) && !(is_array($fetched) && array_key_exists($symbol, $fetched))) {
+                $loaded = $this->markets[$symbol];
+                if ($this->json($this->loaded_market_value($loaded)) === $this->json($value)) {
+                    $market = $loaded;
+                    $unchanged[$symbol] = true;
+                }
+            }
+            if ($market === null) {
+                $market = $this->extend_market($template, $value);
+            }
+            $marketSymbol = $this->safe_string($market, 'symbol');
+            if ($marketSymbol !== null) {
+                $fetched[$marketSymbol] = $market;
+            }
+            if ($currencies === null) {
+                if (is_array($market) && array_key_exists('base', $market)) {
+                    $baseCurrencies[] = $this->market_currency($market, 'base', $defaultCurrencyPrecision);
+                }
+                if (is_array($market) && array_key_exists('quote', $market)) {
+                    $quoteCurrencies[] = $this->market_currency($market, 'quote', $defaultCurrencyPrecision);
+                }
+            }
+        }
+        $added = array();
+        $removed = array();
+        $changed = array();
+        $fetchedSymbols = is_array($fetched) ? array_keys($fetched) : array();
+        for ($i = 0; $i < count($fetchedSymbols); $i++) {
+            $symbol = $fetchedSymbols[$i];
+            $market = $fetched[$symbol];
+            if (!(is_array($this->markets) && array_key_exists($symbol, $this->markets))) {
+                $this->markets[$symbol] = $market;
+                $added[] = $market;
+            } elseif (!(is_array($unchanged) && array_key_exists($symbol, $unchanged))) {
+                $loaded = $this->markets[$symbol];
+                $loadedKeys = is_array($loaded) ? array_keys($loaded) : array();
+                for ($j = 0; $j < count($loadedKeys); $j++) {
+                    $key = $loadedKeys[$j];
+                    if (!(is_array($market) && array_key_exists($key, $market))) {
+                        unset($loaded[$key]);
+                    }
+                }
+                $marketKeys = is_array($market) ? array_keys($market) : array();
+                for ($j = 0; $j < count($marketKeys); $j++) {
+                    $key = $marketKeys[$j];
+                    $loaded[$key] = $market[$key];
+                }
+                $this->markets[$symbol] = $loaded;
+                $changed[] = $loaded;
+            }
+        }
+        $loadedSymbols = is_array($this->markets) ? array_keys($this->markets) : array();
+        for ($i = 0; $i < count($loadedSymbols); $i++) {
+            $symbol = $loadedSymbols[$i];
+            if (!(is_array($fetched) && array_key_exists($symbol, $fetched))) {
+                $removed[] = $this->markets[$symbol];
+                unset($this->markets[$symbol]);
+            }
+        }
+        $loadedIds = is_array($this->markets_by_id) ? array_keys($this->markets_by_id) : array();
+        for ($i = 0; $i < count($loadedIds); $i++) {
+            unset($this->markets_by_id[$loadedIds[$i]]);
+        }
+        $fetchedIds = is_array($marketsById) ? array_keys($marketsById) : array();
+        for ($i = 0; $i < count($fetchedIds); $i++) {
+            $marketId = $fetchedIds[$i];
+            $this->markets_by_id[$marketId] = $marketsById[$marketId];
+        }
+        $this->markets_by_id_type = null;
+        $this->markets_index = null;
+        $this->symbols = is_array($this->keysort($this->markets)) ? array_keys($this->keysort($this->markets)) : array();
+        $this->ids = is_array($this->keysort($this->markets_by_id)) ? array_keys($this->keysort($this->markets_by_id)) : array();
+        $this->set_market_currencies($currencies, $baseCurrencies, $quoteCurrencies);
+        if ((count($added) > 0) || (count($removed) > 0) || (count($changed) > 0)) {
+            $this->on_markets_change($added, $removed, $changed);
+        }
+        return $this->markets;
+    }
+
+    public function apply_markets($markets, $currencies = null) {
+        // options['incrementalReload'] = true reloads the $markets with updateMarkets
+        if (!$this->is_empty($this->markets) && $this->safe_bool($this->options, 'incrementalReload', false)) {
+            return $this->update_markets($markets, $currencies);
+        }
+        return $this->set_markets($markets, $currencies);
+    }
+
+    public function loaded_market_value(array $market) {
+        // the fetched $market a loaded $market was built from
+        $values = $this->safe_list($this->markets_by_id, $market['id'], array());
+        $result = null;
+        for ($i = 0; $i < count($values); $i++) {
+            if ($this->safe_string($values[$i], 'symbol') === $market['symbol']) {
+                $result = $values[$i];
             }
-            $values[] = $market;
         }
-        $this->markets = $this->index_by($values, 'symbol');
-        $marketsSortedBySymbol = $this->keysort($this->markets);
-        $marketsSortedById = $this->keysort($this->markets_by_id);
-        $this->symbols = is_array($marketsSortedBySymbol) ? array_keys($marketsSortedBySymbol) : array();
-        $this->ids = is_array($marketsSortedById) ? array_keys($marketsSortedById) : array();
+        return $result;
+    }
+
+    public function market_template() {
+        // the defaults every market is merged with
+        return $this->deep_extend($this->safe_market_structure(), array(
+            'precision' => $this->precision,
+            'limits' => $this->limits,
+        ), $this->fees['trading']);
+    }
+
+    public function extend_market(array $template, array $value) {
+        $market = $this->deep_extend($template, $value);
+        if ($market['linear']) {
+            $market['subType'] = 'linear';
+        } elseif ($market['inverse']) {
+            $market['subType'] = 'inverse';
+        } else {
+            $market['subType'] = null;
+        }
+        return $market;
+    }
+
+    public function market_currency(array $market, string $key, $defaultPrecision) {
+        // [ code, id, numericId, precision ] of the base or the quote currency of a $market
+        $marketPrecision = $this->safe_dict($market, 'precision', array());
+        $precisionKey = ($key === 'base') ? 'amount' : 'price';
+        return array(
+            $this->safe_string($market, $key),
+            $this->safe_string_2($market, $key . 'Id', $key),
+            $this->safe_integer($market, $key . 'NumericId'),
+            $this->safe_value_2($marketPrecision, $key, $precisionKey, $defaultPrecision),
+        );
+    }
+
+    public function set_market_currencies($currencies, array $baseCurrencies, array $quoteCurrencies) {
         if ($currencies !== null) {
             // $currencies is always null when called in constructor but not when called from loadMarkets
             $this->currencies = $this->deep_extend($this->currencies, $currencies);
         } else {
-            $baseCurrencies = array();
-            $quoteCurrencies = array();
-            for ($i = 0; $i < count($values); $i++) {
-                $market = $values[$i];
-                $defaultCurrencyPrecision = ($this->precisionMode === DECIMAL_PLACES) ? 8 : $this->parse_number('1e-8');
-                $marketPrecision = $this->safe_dict($market, 'precision', array());
-                if (is_array($market) && array_key_exists('base', $market)) {
-                    $currency = $this->safe_currency_structure(array(
-                        'id' => $this->safe_string_2($market, 'baseId', 'base'),
-                        'numericId' => $this->safe_integer($market, 'baseNumericId'),
-                        'code' => $this->safe_string($market, 'base'),
-                        'precision' => $this->safe_value_2($marketPrecision, 'base', 'amount', $defaultCurrencyPrecision),
-                    ));
-                    $baseCurrencies[] = $currency;
+            // the last base and quote $currency of each $code, and its most precise $currency
+            // quote $currencies compete for the highest precision after all base $currencies of the same $code
+            $lastBase = array();
+            $lastQuote = array();
+            $best = array();
+            $lowestIsHighestPrecision = ($this->precisionMode === TICK_SIZE);
+            $numBase = count($baseCurrencies);
+            $allCurrencies = $this->array_concat($baseCurrencies, $quoteCurrencies);
+            for ($i = 0; $i < count($allCurrencies); $i++) {
+                $currency = $allCurrencies[$i];
+                $code = $currency[0];
+                if ($code !== null) {
+                    if ($i < $numBase) {
+                        $lastBase[$code] = $currency;
+                    } else {
+                        $lastQuote[$code] = $currency;
+                    }
+                    if (!(is_array($best) && array_key_exists($code, $best))) {
+                        $best[$code] = $currency;
+                    } elseif ($lowestIsHighestPrecision) {
+                        if ($currency[3] < $best[$code][3]) {
+                            $best[$code] = $currency;
+                        }
+                    } elseif ($currency[3] > $best[$code][3]) {
+                        $best[$code] = $currency;
+                    }
                 }
-                if (is_array($market) && array_key_exists('quote', $market)) {
-                    $currency = $this->safe_currency_structure(array(
-                        'id' => $this->safe_string_2($market, 'quoteId', 'quote'),
-                        'numericId' => $this->safe_integer($market, 'quoteNumericId'),
-                        'code' => $this->safe_string($market, 'quote'),
-                        'precision' => $this->safe_value_2($marketPrecision, 'quote', 'price', $defaultCurrencyPrecision),
-                    ));
-                    $quoteCurrencies[] = $currency;
+            }
+            $this->baseCurrencies = $this->markets_currency_structures($lastBase);
+            $this->quoteCurrencies = $this->markets_currency_structures($lastQuote);
+            $this->currencies = $this->deep_extend($this->currencies, $this->markets_currency_structures($best));
+        }
+        $this->codes = is_array($this->keysort($this->currencies)) ? array_keys($this->keysort($this->currencies)) : array();
+        $this->currencies_by_id = array();
+        for ($i = 0; $i < count($this->codes); $i++) {
+            $currency = $this->currencies[$this->codes[$i]];
+            $currencyId = $this->safe_value($currency, 'id');
+            if ($currencyId !== null) {
+                $this->currencies_by_id[$currencyId] = $currency;
+            }
+        }
+    }
+
+    public function markets_currency_structures(array $currencies) {
+        // $code => $currency structure sorted by $code, for $code => [ $code, id, numericId, precision ]
+        $result = array();
+        $codes = is_array($this->keysort($currencies)) ? array_keys($this->keysort($currencies)) : array();
+        for ($i = 0; $i < count($codes); $i++) {
+            $code = $codes[$i];
+            $currency = $currencies[$code];
+            $result[$code] = $this->safe_currency_structure(array(
+                'id' => $currency[1],
+                'numericId' => $currency[2],
+                'code' => $code,
+                'precision' => $currency[3],
+            ));
+        }
+        return $result;
+    }
+
+    public function filter_markets(?string $type = null, ?string $subType = null, ?string $base = null, ?string $quote = null, ?string $settle = null, ?float $expiry = null, ?string $underlying = null) {
+        /**
+         * markets matching all of the given $fields, sorted by symbol
+         * @param {string} [$type] 'spot', 'margin', 'swap', 'future' or 'option'
+         * @param {string} [$subType] 'linear' or 'inverse'
+         * @param {string} [$base] unified $base currency code
+         * @param {string} [$quote] unified $quote currency code
+         * @param {string} [$settle] unified $settle currency code
+         * @param {int} [$expiry] $expiry timestamp in ms
+         * @param {string} [$underlying] $base/$quote of the derivatives, like BTC/USD for BTC/USD:BTC-240927-60000-C
+         * @return {array[]} a list of ~@link https://docs.ccxt.com/#/?id=$market-structure $market structures~
+         */
+        $criteria = array(
+            'type' => $type,
+            'subType' => $subType,
+            'base' => $base,
+            'quote' => $quote,
+            'settle' => $settle,
+            'expiry' => $this->number_to_string($expiry),
+            'underlying' => $underlying,
+        );
+        $index = $this->get_markets_index();
+        $fields = is_array($criteria) ? array_keys($criteria) : array();
+        $selected = array();
+        $candidates = null;
+        for ($i = 0; $i < count($fields); $i++) {
+            $field = $fields[$i];
+            $value = $criteria[$field];
+            if ($value !== null) {
+                $marketsByValue = $this->safe_list($index[$field], $value, array());
+                if (($candidates === null) || (count($marketsByValue) < count($candidates))) {
+                    $candidates = $marketsByValue;
                 }
+                $selected[] = $field;
             }
-            $baseCurrencies = $this->sort_by($baseCurrencies, 'code', false, '');
-            $quoteCurrencies = $this->sort_by($quoteCurrencies, 'code', false, '');
-            $this->baseCurrencies = $this->index_by($baseCurrencies, 'code');
-            $this->quoteCurrencies = $this->index_by($quoteCurrencies, 'code');
-            $allCurrencies = $this->array_concat($baseCurrencies, $quoteCurrencies);
-            $groupedCurrencies = $this->group_by($allCurrencies, 'code');
-            $codes = is_array($groupedCurrencies) ? array_keys($groupedCurrencies) : array();
-            $resultingCurrencies = array();
-            for ($i = 0; $i < count($codes); $i++) {
-                $code = $codes[$i];
-                $groupedCurrenciesCode = $this->safe_list($groupedCurrencies, $code, array());
-                $highestPrecisionCurrency = $this->safe_value($groupedCurrenciesCode, 0);
-                for ($j = 1; $j < count($groupedCurrenciesCode); $j++) {
-                    $currentCurrency = $groupedCurrenciesCode[$j];
-                    if ($this->precisionMode === TICK_SIZE) {
-                        $highestPrecisionCurrency = ($currentCurrency['precision'] < $highestPrecisionCurrency['precision']) ? $currentCurrency : $highestPrecisionCurrency;
-                    } else {
-                        $highestPrecisionCurrency = ($currentCurrency['precision'] > $highestPrecisionCurrency['precision']) ? $currentCurrency : $highestPrecisionCurrency;
+        }
+        $result = array();
+        if ($candidates === null) {
+            $symbols = ($this->symbols === null) ? array() : $this->symbols;
+            for ($i = 0; $i < count($symbols); $i++) {
+                $result[] = $this->markets[$symbols[$i]];
+            }
+            return $result;
+        }
+        // the markets of the most selective $field that match all other $fields
+        for ($i = 0; $i < count($candidates); $i++) {
+            $market = $candidates[$i];
+            $matches = true;
+            for ($j = 0; $j < count($selected); $j++) {
+                $field = $selected[$j];
+                if ($this->market_index_value($market, $field) !== $criteria[$field]) {
+                    $matches = false;
+                    break;
+                }
+            }
+            if ($matches) {
+                $result[] = $market;
+            }
+        }
+        return $result;
+    }
+
+    public function get_markets_index() {
+        // $field => $value => markets sorted by symbol, built on the first query
+        // setMarkets and updateMarkets drop it
+        if ($this->markets_index === null) {
+            $fields = array( 'type', 'subType', 'base', 'quote', 'settle', 'expiry', 'underlying' );
+            $index = array();
+            for ($i = 0; $i < count($fields); $i++) {
+                $index[$fields[$i]] = array();
+            }
+            $symbols = ($this->symbols === null) ? array() : $this->symbols;
+            for ($i = 0; $i < count($symbols); $i++) {
+                $market = $this->markets[$symbols[$i]];
+                for ($j = 0; $j < count($fields); $j++) {
+                    $field = $fields[$j];
+                    $value = $this->market_index_value($market, $field);
+                    if ($value !== null) {
+                        if (is_array($index[$field]) && array_key_exists($value, $index[$field])) {
+                            $index[$field][$value][] = $market;
+                        } else {
+                            $index[$field][$value] = array( $market );
+                        }
                     }
                 }
-                $resultingCurrencies[] = $highestPrecisionCurrency;
             }
-            $sortedCurrencies = $this->sort_by($resultingCurrencies, 'code');
-            $this->currencies = $this->deep_extend($this->currencies, $this->index_by($sortedCurrencies, 'code'));
+            $this->markets_index = $index;
         }
-        $this->currencies_by_id = $this->index_by($this->currencies, 'id');
-        $currenciesSortedByCode = $this->keysort($this->currencies);
-        $this->codes = is_array($currenciesSortedByCode) ? array_keys($currenciesSortedByCode) : array();
-        return $this->markets;
+        return $this->markets_index;
+    }
+
+    public function market_index_value(array $market, string $field) {
+        if ($field === 'underlying') {
+            if ($market['spot'] || ($market['base'] === null) || ($market['quote'] === null)) {
+                return null;
+            }
+            return $market['base'] . '/' . $market['quote'];
+        }
+        return $this->safe_string($market, $field);
     }
 
     public function get_describe_for_extended_ws_exchange(mixed $currentRestInstance, mixed $parentRestInstance, array $wsBaseDescribe) {
@@ -5140,16 +5571,68 @@ class Exchange {
 
     public function parse_trades(array $trades, ?array $market = null, ?int $since = null, ?int $limit = null, $params = array ()) {
         $trades = $this->to_array($trades);
-        $result = array();
-        for ($i = 0; $i < count($trades); $i++) {
-            $trade = $this->extend($this->parse_trade($trades[$i], $market), $params);
-            $result[] = $trade;
+        $result = $this->parse_trades_batch($trades, $market);
+        if (!$this->is_empty($params)) {
+            for ($i = 0; $i < count($result); $i++) {
+                $result[$i] = $this->extend($result[$i], $params);
+            }
         }
         $result = $this->sort_by_2($result, 'timestamp', 'id');
         $symbol = ($market !== null) ? $market['symbol'] : null;
         return $this->filter_by_symbol_since_limit($result, $symbol, $since, $limit);
     }
 
+    public function parse_trades_batch(array $trades, ?array $market = null) {
+        // parseTrade for every $trade, exchanges override it with loops over the $trades of their most common responses
+        $result = array();
+        for ($i = 0; $i < count($trades); $i++) {
+            $result[] = $this->parse_trade($trades[$i], $market);
+        }
+        return $result;
+    }
+
+    public function safe_trade_without_fee(array $trade, ?string $contractSize = null, $inverse = false) {
+        // safeTrade for a $trade without a fee, with string or null $price, $amount and $cost
+        // $contractSize and $inverse are the safeString and safeBool of the market, looked up once per batch
+        $price = $trade['price'];
+        $amount = $trade['amount'];
+        $cost = $trade['cost'];
+        if ($cost === null) {
+            // contract trading
+            $multiplyPrice = $price;
+            if ($contractSize !== null) {
+                if ($inverse) {
+                    $multiplyPrice = Precise::string_div('1', $price);
+                }
+                $multiplyPrice = Precise::string_mul($multiplyPrice, $contractSize);
+            }
+            $cost = Precise::string_mul($multiplyPrice, $amount);
+        }
+        $trade['fee'] = array(
+            'cost' => null,
+            'currency' => null,
+        );
+        $trade['fees'] = array();
+        $trade['amount'] = $this->parse_number($amount);
+        $trade['price'] = $this->parse_number($price);
+        $trade['cost'] = $this->parse_number($cost);
+        return $trade;
+    }
+
+    public function has_only_keys($value, array $keys) {
+        // true if $value is a dictionary and every key of it is a key of $keys
+        if (($value !== null) && (gettype($value) === 'array') && (gettype($value) !== 'array' || array_keys($value) !== array_keys(array_keys($value)))) {
+            $valueKeys = is_array($value) ? array_keys($value) : array();
+            for ($i = 0; $i < count($valueKeys); $i++) {
+                if (!(is_array($keys) && array_key_exists($valueKeys[$i], $keys))) {
+                    return false;
+                }
+            }
+            return true;
+        }
+        return false;
+    }
+
     public function parse_transactions(array $transactions, ?array $currency = null, ?int $since = null, ?int $limit = null, $params = array ()) {
         $transactions = $this->to_array($transactions);
         $result = array();
@@ -5355,12 +5838,45 @@ class Exchange {
     }
 
     public function fetch2($path, mixed $api = 'public', $method = 'GET', $params = array (), mixed $headers = null, mixed $body = null, $config = array ()) {
+        if ($this->is_single_flight_request($api, $method)) {
+            return $this->fetch_single_flight($path, $api, $method, $params, $headers, $body, $config);
+        }
+        return $this->send_request($path, $api, $method, $params, $headers, $body, $config);
+    }
+
+    public function is_single_flight_request($api, $method) {
+        // options['singleFlight'] shares identical public GET requests between concurrent callers
+        // sections named private are signed and never shared
+        $singleFlight = $this->safe_value($this->options, 'singleFlight');
+        if (($method !== 'GET') || !$singleFlight) {
+            return false;
+        }
+        $parts = $api;
+        if (gettype($api) !== 'array' || array_keys($api) !== array_keys(array_keys($api))) {
+            $parts = array( $api );
+        }
+        $isPublic = false;
+        for ($i = 0; $i < count($parts); $i++) {
+            $part = strtolower($parts[$i]);
+            if (mb_strpos($part, 'private') !== false) {
+                return false;
+            }
+            if (mb_strpos($part, 'public') !== false) {
+                $isPublic = true;
+            }
+        }
+        return $isPublic;
+    }
+
+    public function send_request($path, mixed $api = 'public', $method = 'GET', $params = array (), mixed $headers = null, mixed $body = null, $config = array (), mixed $request = null) {
         if ($this->enableRateLimit) {
             $cost = $this->calculate_rate_limiter_cost($api, $method, $path, $params, $config);
-            $this->throttle($cost);
+            $this->throttle($cost, $api);
         }
         $this->lastRestRequestTimestamp = $this->milliseconds();
-        $request = $this->sign($path, $api, $method, $params, $headers, $body);
+        if ($request === null) {
+            $request = $this->sign($path, $api, $method, $params, $headers, $body);
+        }
         $this->last_request_headers = $request['headers'];
         $this->last_request_body = $request['body'];
         $this->last_request_url = $request['url'];
@@ -5583,45 +6099,56 @@ class Exchange {
     }
 
     public function safe_market(?string $marketId = null, ?array $market = null, ?string $delimiter = null, ?string $marketType = null) {
+        if (($marketId === null) && ($market !== null)) {
+            return $market;
+        }
+        if (($marketId !== null) && ($this->markets_by_id !== null) && (is_array($this->markets_by_id) && array_key_exists($marketId, $this->markets_by_id))) {
+            // known $market ids are returned before the structure for unknown ones is built
+            $markets = $this->markets_by_id[$marketId];
+            $numMarkets = count($markets);
+            if ($numMarkets === 1) {
+                return $markets[0];
+            }
+            if ($marketType === null) {
+                if ($market === null) {
+                    throw new ArgumentsRequired($this->id . ' safeMarket() requires a fourth argument for ' . $marketId . ' to disambiguate between different $markets with the same $market id');
+                } else {
+                    $marketType = $market['type'];
+                }
+            }
+            // the $market of a type is memoized for $market ids shared by $markets of different types
+            if ($this->markets_by_id_type === null) {
+                $this->markets_by_id_type = array();
+            }
+            if (!(is_array($this->markets_by_id_type) && array_key_exists($marketType, $this->markets_by_id_type))) {
+                $this->markets_by_id_type[$marketType] = array();
+            }
+            if (is_array($this->markets_by_id_type[$marketType]) && array_key_exists($marketId, $this->markets_by_id_type[$marketType])) {
+                return $this->markets_by_id_type[$marketType][$marketId];
+            }
+            for ($i = 0; $i < count($markets); $i++) {
+                $currentMarket = $markets[$i];
+                if ($currentMarket[$marketType]) {
+                    $this->markets_by_id_type[$marketType][$marketId] = $currentMarket;
+                    return $currentMarket;
+                }
+            }
+        }
         $result = $this->safe_market_structure(array(
             'symbol' => $marketId,
             'marketId' => $marketId,
         ));
-        if ($marketId !== null) {
-            if (($this->markets_by_id !== null) && (is_array($this->markets_by_id) && array_key_exists($marketId, $this->markets_by_id))) {
-                $markets = $this->markets_by_id[$marketId];
-                $numMarkets = count($markets);
-                if ($numMarkets === 1) {
-                    return $markets[0];
-                } else {
-                    if ($marketType === null) {
-                        if ($market === null) {
-                            throw new ArgumentsRequired($this->id . ' safeMarket() requires a fourth argument for ' . $marketId . ' to disambiguate between different $markets with the same $market id');
-                        } else {
-                            $marketType = $market['type'];
-                        }
-                    }
-                    for ($i = 0; $i < count($markets); $i++) {
-                        $currentMarket = $markets[$i];
-                        if ($currentMarket[$marketType]) {
-                            return $currentMarket;
-                        }
-                    }
-                }
-            } elseif ($delimiter !== null && $delimiter !== '') {
-                $parts = explode($delimiter, $marketId);
-                $partsLength = count($parts);
-                if ($partsLength === 2) {
-                    $result['baseId'] = $this->safe_string($parts, 0);
-                    $result['quoteId'] = $this->safe_string($parts, 1);
-                    $result['base'] = $this->safe_currency_code($result['baseId']);
-                    $result['quote'] = $this->safe_currency_code($result['quoteId']);
-                    $result['symbol'] = $result['base'] . '/' . $result['quote'];
-                    return $result;
-                } else {
-                    return $result;
-                }
+        if (($marketId !== null) && ($delimiter !== null) && ($delimiter !== '') && !(($this->markets_by_id !== null) && (is_array($this->markets_by_id) && array_key_exists($marketId, $this->markets_by_id)))) {
+            $parts = explode($delimiter, $marketId);
+            $partsLength = count($parts);
+            if ($partsLength === 2) {
+                $result['baseId'] = $this->safe_string($parts, 0);
+                $result['quoteId'] = $this->safe_string($parts, 1);
+                $result['base'] = $this->safe_currency_code($result['baseId']);
+                $result['quote'] = $this->safe_currency_code($result['quoteId']);
+                $result['symbol'] = $result['base'] . '/' . $result['quote'];
             }
+            return $result;
         }
         if ($market !== null) {
             return $market;
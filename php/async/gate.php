@@ -655,6 +655,19 @@ class gate extends Exchange {
                 'X-Gate-Channel-Id' => 'ccxt',
             ),
             'options' => array(
+                'rateLimiter' => array(
+                    'headers' => array(
+                        // requests left in the per endpoint window
+                        'x-gate-ratelimit-requests-remain' => array(
+                            'type' => 'remaining',
+                            'limitHeader' => 'x-gate-ratelimit-limit',
+                            'resetHeader' => 'x-gate-ratelimit-reset-timestamp',
+                            'resetType' => 'timestamp',
+                            'window' => 10000,
+                            'scope' => 'path',
+                        ),
+                    ),
+                ),
                 'timeDifference' => 0, // the difference between system clock and exchange clock
                 'adjustForTimeDifference' => false, // controls the adjustment logic upon instantiation
                 'sandboxMode' => false,
@@ -2321,6 +2321,44 @@ class okx extends Exchange {
         ), $market);
     }
 
+    public function parse_trades_batch(array $trades, ?array $market = null): array {
+        // public $trades, array( "instId", "side", "sz", "px", "tradeId", "ts" ), are parsed in one loop
+        // that only reads their fields and resolves every instId once, other $trades go through parseTrade
+        $publicTradeKeys = array( 'instId' => true, 'side' => true, 'sz' => true, 'px' => true, 'tradeId' => true, 'ts' => true, 'count' => true, 'source' => true );
+        $markets = array();
+        $result = array();
+        for ($i = 0; $i < count($trades); $i++) {
+            $trade = $trades[$i];
+            $marketId = $this->has_only_keys($trade, $publicTradeKeys) ? $this->safe_string($trade, 'instId') : null;
+            if ($marketId === null) {
+                $result[] = $this->parse_trade($trade, $market);
+            } else {
+                if (!(is_array($markets) && array_key_exists($marketId, $markets))) {
+                    $tradeMarket = $this->safe_market($marketId, $market, '-');
+                    $markets[$marketId] = array( $tradeMarket['symbol'], $this->safe_string($tradeMarket, 'contractSize'), $this->safe_bool($tradeMarket, 'inverse', false) );
+                }
+                $cached = $markets[$marketId];
+                $timestamp = $this->safe_integer($trade, 'ts');
+                $result[] = $this->safe_trade_without_fee(array(
+                    'info' => $trade,
+                    'timestamp' => $timestamp,
+                    'datetime' => $this->iso8601($timestamp),
+                    'symbol' => $cached[0],
+                    'id' => $this->safe_string($trade, 'tradeId'),
+                    'order' => null,
+                    'type' => null,
+                    'takerOrMaker' => null,
+                    'side' => $this->safe_string($trade, 'side'),
+                    'price' => $this->safe_string($trade, 'px'),
+                    'amount' => $this->safe_string($trade, 'sz'),
+                    'cost' => null,
+                    'fee' => null,
+                ), $cached[1], $cached[2]);
+            }
+        }
+        return $result;
+    }
+
     public function fetch_trades(string $symbol, ?int $since = null, ?int $limit = null, $params = array ()): PromiseInterface {
         return Async\async(function () use ($symbol, $since, $limit, $params) {
             /**
@@ -1257,6 +1257,20 @@ class binance extends Exchange {
             // exchange-specific options
             'options' => array(
                 'sandboxMode' => false,
+                'rateLimiter' => array(
+                    'headers' => array(
+                        // IP weight used in the current minute, the limits differ by api host
+                        'x-mbx-used-weight-1m' => array(
+                            'window' => 60000,
+                            'limit' => array(
+                                'api' => 6000,
+                                'fapi' => 2400,
+                                'dapi' => 2400,
+                                'papi' => 6000,
+                            ),
+                        ),
+                    ),
+                ),
                 'fetchMargins' => true,
                 'fetchMarkets' => array(
                     'spot', // allows CORS in browsers
@@ -4900,6 +4914,48 @@ class binance extends Exchange {
         ), $market);
     }
 
+    public function parse_trades_batch(array $trades, ?array $market = null): array {
+        // aggregate $trades of the public endpoints, array( "a", "p", "q", "f", "l", "T", "m", "M" ), are parsed in one loop
+        // that only reads their fields, other $trades and option markets go through parseTrade
+        if (($market === null) || $market['option']) {
+            return parent::parse_trades_batch($trades, $market);
+        }
+        $aggregateTradeKeys = array( 'a' => true, 'p' => true, 'q' => true, 'f' => true, 'l' => true, 'T' => true, 'm' => true, 'M' => true );
+        $symbol = $market['symbol'];
+        $contractSize = $this->safe_string($market, 'contractSize');
+        $inverse = $this->safe_bool($market, 'inverse', false);
+        $result = array();
+        for ($i = 0; $i < count($trades); $i++) {
+            $trade = $trades[$i];
+            if ($this->has_only_keys($trade, $aggregateTradeKeys)) {
+                $timestamp = $this->safe_integer($trade, 'T');
+                $buyerMaker = $this->safe_bool($trade, 'm');
+                $side = null;
+                if ($buyerMaker !== null) {
+                    $side = $buyerMaker ? 'sell' : 'buy'; // this is reversed intentionally
+                }
+                $result[] = $this->safe_trade_without_fee(array(
+                    'info' => $trade,
+                    'timestamp' => $timestamp,
+                    'datetime' => $this->iso8601($timestamp),
+                    'symbol' => $symbol,
+                    'id' => $this->safe_string($trade, 'a'),
+                    'order' => null,
+                    'type' => null,
+                    'side' => $side,
+                    'takerOrMaker' => null,
+                    'price' => $this->safe_string($trade, 'p'),
+                    'amount' => $this->safe_string($trade, 'q'),
+                    'cost' => null,
+                    'fee' => null,
+                ), $contractSize, $inverse);
+            } else {
+                $result[] = $this->parse_trade($trade, $market);
+            }
+        }
+        return $result;
+    }
+
     public function fetch_trades(string $symbol, ?int $since = null, ?int $limit = null, $params = array ()): array {
         /**
          * get the list of most recent trades for a particular $symbol
@@ -9456,25 +9512,22 @@ class binance extends Exchange {
             //         ...
             //     }
             //
-            $symbols = is_array($this->markets) ? array_keys($this->markets) : array();
+            $markets = $this->filter_markets(null, 'linear');
             $result = array();
             $feeTier = $this->safe_integer($response, 'feeTier');
             $feeTiers = $this->fees['linear']['trading']['tiers'];
             $maker = $feeTiers['maker'][$feeTier][1];
             $taker = $feeTiers['taker'][$feeTier][1];
-            for ($i = 0; $i < count($symbols); $i++) {
-                $symbol = $symbols[$i];
-                $market = $this->markets[$symbol];
-                if ($market['linear']) {
-                    $result[$symbol] = array(
-                        'info' => array(
-                            'feeTier' => $feeTier,
-                        ),
-                        'symbol' => $symbol,
-                        'maker' => $maker,
-                        'taker' => $taker,
-                    );
-                }
+            for ($i = 0; $i < count($markets); $i++) {
+                $symbol = $markets[$i]['symbol'];
+                $result[$symbol] = array(
+                    'info' => array(
+                        'feeTier' => $feeTier,
+                    ),
+                    'symbol' => $symbol,
+                    'maker' => $maker,
+                    'taker' => $taker,
+                );
             }
             return $result;
         } elseif ($isInverse) {
@@ -9487,25 +9540,22 @@ class binance extends Exchange {
             //         "updateTime" => 0
             //     }
             //
-            $symbols = is_array($this->markets) ? array_keys($this->markets) : array();
+            $markets = $this->filter_markets(null, 'inverse');
             $result = array();
             $feeTier = $this->safe_integer($response, 'feeTier');
             $feeTiers = $this->fees['inverse']['trading']['tiers'];
             $maker = $feeTiers['maker'][$feeTier][1];
             $taker = $feeTiers['taker'][$feeTier][1];
-            for ($i = 0; $i < count($symbols); $i++) {
-                $symbol = $symbols[$i];
-                $market = $this->markets[$symbol];
-                if ($market['inverse']) {
-                    $result[$symbol] = array(
-                        'info' => array(
-                            'feeTier' => $feeTier,
-                        ),
-                        'symbol' => $symbol,
-                        'maker' => $maker,
-                        'taker' => $taker,
-                    );
-                }
+            for ($i = 0; $i < count($markets); $i++) {
+                $symbol = $markets[$i]['symbol'];
+                $result[$symbol] = array(
+                    'info' => array(
+                        'feeTier' => $feeTier,
+                    ),
+                    'symbol' => $symbol,
+                    'maker' => $maker,
+                    'taker' => $taker,
+                );
             }
             return $result;
         }
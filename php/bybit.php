@@ -1016,6 +1016,19 @@ class bybit extends Exchange {
             ),
             'precisionMode' => TICK_SIZE,
             'options' => array(
+                'rateLimiter' => array(
+                    'headers' => array(
+                        // requests left in the per endpoint window
+                        'x-bapi-limit-status' => array(
+                            'type' => 'remaining',
+                            'limitHeader' => 'x-bapi-limit',
+                            'resetHeader' => 'x-bapi-limit-reset-timestamp',
+                            'resetType' => 'timestamp',
+                            'window' => 1000,
+                            'scope' => 'path',
+                        ),
+                    ),
+                ),
                 'usePrivateInstrumentsInfo' => false,
                 'enableDemoTrading' => false,
                 'fetchMarkets' => array( 'spot', 'linear', 'inverse', 'option' ),
@@ -3109,6 +3122,45 @@ class bybit extends Exchange {
         ), $market);
     }
 
+    public function parse_trades_batch(array $trades, ?array $market = null): array {
+        // public $trades, array( "execId", "symbol", "price", "size", "side", "time", "isBlockTrade" ), are parsed in one loop
+        // that only reads their fields and resolves every symbol once, other $trades go through parseTrade
+        $publicTradeKeys = array( 'execId' => true, 'symbol' => true, 'price' => true, 'size' => true, 'side' => true, 'time' => true, 'isBlockTrade' => true, 'isRPITrade' => true, 'seq' => true, 'mP' => true, 'iP' => true, 'mIv' => true, 'iv' => true );
+        $marketType = ($market === null) ? 'spot' : $market['type'];
+        $markets = array();
+        $result = array();
+        for ($i = 0; $i < count($trades); $i++) {
+            $trade = $trades[$i];
+            $marketId = $this->has_only_keys($trade, $publicTradeKeys) ? $this->safe_string($trade, 'symbol') : null;
+            if ($marketId === null) {
+                $result[] = $this->parse_trade($trade, $market);
+            } else {
+                if (!(is_array($markets) && array_key_exists($marketId, $markets))) {
+                    $tradeMarket = $this->safe_market($marketId, $market, null, $marketType);
+                    $markets[$marketId] = array( $tradeMarket['symbol'], $this->safe_string($tradeMarket, 'contractSize'), $this->safe_bool($tradeMarket, 'inverse', false) );
+                }
+                $cached = $markets[$marketId];
+                $timestamp = $this->safe_integer($trade, 'time');
+                $result[] = $this->safe_trade_without_fee(array(
+                    'id' => $this->safe_string($trade, 'execId'),
+                    'info' => $trade,
+                    'timestamp' => $timestamp,
+                    'datetime' => $this->iso8601($timestamp),
+                    'symbol' => $cached[0],
+                    'order' => null,
+                    'type' => null,
+                    'side' => $this->safe_string_lower($trade, 'side'),
+                    'takerOrMaker' => null,
+                    'price' => $this->safe_string($trade, 'price'),
+                    'amount' => $this->safe_string($trade, 'size'),
+                    'cost' => null,
+                    'fee' => null,
+                ), $cached[1], $cached[2]);
+            }
+        }
+        return $result;
+    }
+
     public function fetch_trades(string $symbol, ?int $since = null, ?int $limit = null, $params = array ()): array {
         /**
          * get the list of most recent $trades for a particular $symbol
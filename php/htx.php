@@ -2118,7 +2118,7 @@ class htx extends Exchange {
         if (is_array($futureMarketIdsForSymbols) && array_key_exists($symbolOrMarketId, $futureMarketIdsForSymbols)) {
             return $futureMarketIdsForSymbols[$symbolOrMarketId];
         }
-        $futureMarkets = $this->filter_by($this->markets, 'future', true);
+        $futureMarkets = $this->filter_markets('future');
         $futuresCharsMaps = array(
             'this_week' => 'CW',
             'next_week' => 'NW',
@@ -633,6 +633,18 @@ class kucoin extends Exchange {
                 'FUD' => 'FTX Users\' Debt',
             ),
             'options' => array(
+                'rateLimiter' => array(
+                    'headers' => array(
+                        // weight left in the resource pool of the api host
+                        'gw-ratelimit-remaining' => array(
+                            'type' => 'remaining',
+                            'limitHeader' => 'gw-ratelimit-limit',
+                            'resetHeader' => 'gw-ratelimit-reset',
+                            'resetType' => 'delta',
+                            'window' => 30000,
+                        ),
+                    ),
+                ),
                 'hf' => null, // would be auto set to `true/false` after first load
                 'version' => 'v1',
                 'symbolSeparator' => '-',
@@ -48,6 +48,10 @@ trait ClientTrait {
         return new CountedOrderBook($snapshot, $depth);
     }
 
+    public function ohlcv_cache($limit = null) {
+        return new ArrayCacheByTimestamp($limit);
+    }
+
     public function client($url) : Client {
         if (!array_key_exists($url, $this->clients)) {
             $on_message = array($this, 'handle_message');
@@ -59,6 +59,24 @@ class OrderBook extends \ArrayObject implements \JsonSerializable {
         $this['datetime'] = \ccxt\Exchange::iso8601($this['timestamp']);
     }
 
+    public function apply_deltas($asks, $bids, $nonce = null, $timestamp = null) {
+        return $this->applyDeltas($asks, $bids, $nonce, $timestamp);
+    }
+
+    public function applyDeltas($asks, $bids, $nonce = null, $timestamp = null) {
+        // merges the raw deltas of a whole message into both sides
+        $this['asks']->storeDeltas($asks);
+        $this['bids']->storeDeltas($bids);
+        if ($nonce !== null) {
+            $this['nonce'] = $nonce;
+        }
+        if ($timestamp !== null) {
+            $this['timestamp'] = $timestamp;
+            $this['datetime'] = \ccxt\Exchange::iso8601($timestamp);
+        }
+        return $this;
+    }
+
     public function update($snapshot) {
         $nonce = @$snapshot['nonce'];
         if ($nonce !== null && $this['nonce'] !== null && $nonce < $this['nonce']) {
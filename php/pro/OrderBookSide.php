@@ -15,6 +15,31 @@ function bisectLeft($arr, $x) {
 
 const tmp = array();
 
+// storeDeltas sorts and merges batches of at least this many deltas instead of storing them one by one
+const BULK_THRESHOLD = 16;
+
+function sortDeltas($deltas, $side) {
+    // the [index price, price, size] rows of raw [price, size] deltas sorted by index price
+    // only the last delta of a price is kept, like storing them one by one
+    $rows = array();
+    foreach ($deltas as $i => $delta) {
+        $price = floatval($delta[0]);
+        $rows[] = array($side ? -$price : $price, $price, floatval($delta[1]), $i);
+    }
+    usort($rows, function ($a, $b) {
+        return ($a[0] <=> $b[0]) ?: ($a[3] <=> $b[3]);
+    });
+    $result = array();
+    $count = count($rows);
+    for ($i = 0; $i < $count; $i++) {
+        if ($i + 1 < $count && $rows[$i + 1][0] === $rows[$i][0]) {
+            continue;
+        }
+        $result[] = $rows[$i];
+    }
+    return $result;
+}
+
 class OrderBookSide extends \ArrayObject implements \JsonSerializable {
     public $index;
     public $depth;
@@ -64,6 +89,54 @@ class OrderBookSide extends \ArrayObject implements \JsonSerializable {
         $this->storeArray(array($price, $size));
     }
 
+    public function store_deltas($deltas) {
+        return $this->storeDeltas($deltas);
+    }
+
+    public function storeDeltas($deltas) {
+        // the raw [price, size] deltas of a whole message, numeric or string
+        // a large batch is sorted once and merged with the stored levels in a single walk
+        if (count($deltas) < BULK_THRESHOLD) {
+            foreach ($deltas as $delta) {
+                $this->storeArray(array(floatval($delta[0]), floatval($delta[1])));
+            }
+            return;
+        }
+        $rows = sortDeltas($deltas, static::$side);
+        $levels = $this->exchangeArray(tmp);
+        $index = $this->index;
+        $length = count($index);
+        $merged_index = array();
+        $merged = array();
+        $i = 0;
+        foreach ($rows as $row) {
+            list($key, $price, $size) = $row;
+            while ($i < $length && $index[$i] < $key) {
+                $merged_index[] = $index[$i];
+                $merged[] = $levels[$i];
+                $i++;
+            }
+            if ($i < $length && $index[$i] === $key) {
+                if ($size) {
+                    $level = $levels[$i];
+                    $level[1] = $size;
+                    $merged_index[] = $key;
+                    $merged[] = $level;
+                }
+                $i++;
+            } elseif ($size) {
+                $merged_index[] = $key;
+                $merged[] = array($price, $size);
+            }
+        }
+        for (; $i < $length; $i++) {
+            $merged_index[] = $index[$i];
+            $merged[] = $levels[$i];
+        }
+        $this->index = $merged_index;
+        $this->exchangeArray($merged);
+    }
+
     public function limit() {
         $difference = count($this) - $this->depth;
         if ($difference > 0) {
@@ -148,6 +221,13 @@ class CountedOrderBookSide extends OrderBookSide {
             $this->exchangeArray($tmp);
         }
     }
+
+    public function storeDeltas($deltas) {
+        // the raw [price, size, count] deltas of a whole message, numeric or string
+        foreach ($deltas as $delta) {
+            $this->storeArray(array(floatval($delta[0]), floatval($delta[1]), intval($delta[2])));
+        }
+    }
 }
 
 // ----------------------------------------------------------------------------
@@ -221,6 +301,14 @@ class IndexedOrderBookSide extends OrderBookSide {
             unset($this->hashmap[$id]);
         }
     }
+
+    public function storeDeltas($deltas) {
+        // the raw [price, size, id] deltas of a whole message, the price can be null
+        foreach ($deltas as $delta) {
+            $price = ($delta[0] === null) ? null : floatval($delta[0]);
+            $this->storeArray(array($price, floatval($delta[1]), $delta[2]));
+        }
+    }
 }
 
 // ----------------------------------------------------------------------------
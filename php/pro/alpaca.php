@@ -186,7 +186,7 @@ class alpaca extends \ccxt\async\alpaca {
         $stored = $this->safe_value($this->ohlcvs, $symbol);
         if ($stored === null) {
             $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-            $stored = new ArrayCacheByTimestamp ($limit);
+            $stored = $this->ohlcv_cache($limit);
             $this->ohlcvs[$symbol] = $stored;
         }
         $parsed = $this->parse_ohlcv($message);
@@ -896,16 +896,8 @@ class binance extends \ccxt\async\binance {
         }) ();
     }
 
-    public function handle_delta($bookside, $delta) {
-        $price = $this->safe_float($delta, 0);
-        $amount = $this->safe_float($delta, 1);
-        $bookside->store ($price, $amount);
-    }
-
     public function handle_deltas($bookside, $deltas) {
-        for ($i = 0; $i < count($deltas); $i++) {
-            $this->handle_delta($bookside, $deltas[$i]);
-        }
+        $bookside->storeDeltas ($deltas);
     }
 
     public function handle_order_book_message(Client $client, $message, $orderbook) {
@@ -1674,7 +1666,7 @@ class binance extends \ccxt\async\binance {
         $stored = $this->safe_value($this->ohlcvs[$symbol], $unifiedTimeframe);
         if ($stored === null) {
             $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-            $stored = new ArrayCacheByTimestamp ($limit);
+            $stored = $this->ohlcv_cache($limit);
             $this->ohlcvs[$symbol][$unifiedTimeframe] = $stored;
         }
         $stored->append ($parsed);
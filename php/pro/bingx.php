@@ -936,7 +936,7 @@ class bingx extends \ccxt\async\bingx {
             $subscriptionHash = $dataType;
             $subscription = $client->subscriptions[$subscriptionHash];
             $limit = $this->safe_integer($subscription, 'limit');
-            $this->ohlcvs[$symbol][$unifiedTimeframe] = new ArrayCacheByTimestamp ($limit);
+            $this->ohlcvs[$symbol][$unifiedTimeframe] = $this->ohlcv_cache($limit);
         }
         $stored = $this->ohlcvs[$symbol][$unifiedTimeframe];
         for ($i = 0; $i < count($candles); $i++) {
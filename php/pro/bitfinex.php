@@ -187,7 +187,7 @@ class bitfinex extends \ccxt\async\bitfinex {
         $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
         if ($stored === null) {
             $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-            $stored = new ArrayCacheByTimestamp ($limit);
+            $stored = $this->ohlcv_cache($limit);
             $this->ohlcvs[$symbol][$timeframe] = $stored;
         }
         $ohlcvsLength = count($ohlcvs);
@@ -675,29 +675,11 @@ class bitfinex extends \ccxt\async\bitfinex {
         if ($book === null) {
             return;
         }
-        $depth = 25; // covers the first 25 $bids and $asks
-        $stringArray = array();
-        $bids = $book['bids'];
-        $asks = $book['asks'];
         $prec = $this->safe_string($subscription, 'prec', 'P0');
         $isRaw = ($prec === 'R0');
         $idToCheck = $isRaw ? 2 : 0;
-        // pepperoni pizza from bitfinex
-        for ($i = 0; $i < $depth; $i++) {
-            $bid = $this->safe_value($bids, $i);
-            $ask = $this->safe_value($asks, $i);
-            if ($bid !== null) {
-                $stringArray[] = $this->number_to_string($bids[$i][$idToCheck]);
-                $stringArray[] = $this->number_to_string($bids[$i][1]);
-            }
-            if ($ask !== null) {
-                $stringArray[] = $this->number_to_string($asks[$i][$idToCheck]);
-                $aski1 = $asks[$i][1];
-                $stringArray[] = $this->number_to_string(-$aski1);
-            }
-        }
-        $payload = implode(':', $stringArray);
-        $localChecksum = $this->crc32($payload, true);
+        // pepperoni pizza from bitfinex, covers the first 25 bids and asks
+        $localChecksum = $this->order_book_checksum($symbol, $book, 'signed', 25, $idToCheck);
         $responseChecksum = $this->safe_integer($message, 2);
         if ($responseChecksum !== $localChecksum) {
             unset($client->subscriptions[$messageHash]);
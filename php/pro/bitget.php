@@ -521,7 +521,7 @@ class bitget extends \ccxt\async\bitget {
         $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
         if ($stored === null) {
             $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-            $stored = new ArrayCacheByTimestamp ($limit);
+            $stored = $this->ohlcv_cache($limit);
             $this->ohlcvs[$symbol][$timeframe] = $stored;
         }
         $data = $this->safe_value($message, 'data', array());
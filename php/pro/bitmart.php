@@ -1254,7 +1254,7 @@ class bitmart extends \ccxt\async\bitmart {
                 $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
                 if ($stored === null) {
                     $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-                    $stored = new ArrayCacheByTimestamp ($limit);
+                    $stored = $this->ohlcv_cache($limit);
                     $this->ohlcvs[$symbol][$timeframe] = $stored;
                 }
                 $stored->append ($parsed);
@@ -1270,7 +1270,7 @@ class bitmart extends \ccxt\async\bitmart {
             $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
             if ($stored === null) {
                 $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-                $stored = new ArrayCacheByTimestamp ($limit);
+                $stored = $this->ohlcv_cache($limit);
                 $this->ohlcvs[$symbol][$timeframe] = $stored;
             }
             for ($i = 0; $i < count($items); $i++) {
@@ -1312,16 +1312,8 @@ class bitmart extends \ccxt\async\bitmart {
         }) ();
     }
 
-    public function handle_delta($bookside, $delta) {
-        $price = $this->safe_float($delta, 0);
-        $amount = $this->safe_float($delta, 1);
-        $bookside->store ($price, $amount);
-    }
-
     public function handle_deltas($bookside, $deltas) {
-        for ($i = 0; $i < count($deltas); $i++) {
-            $this->handle_delta($bookside, $deltas[$i]);
-        }
+        $bookside->storeDeltas ($deltas);
     }
 
     public function handle_order_book_message(Client $client, $message, $orderbook) {
@@ -1527,7 +1527,7 @@ class bitmex extends \ccxt\async\bitmex {
             $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
             if ($stored === null) {
                 $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-                $stored = new ArrayCacheByTimestamp ($limit);
+                $stored = $this->ohlcv_cache($limit);
                 $this->ohlcvs[$symbol][$timeframe] = $stored;
             }
             $stored->append ($result);
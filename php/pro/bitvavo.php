@@ -373,7 +373,7 @@ class bitvavo extends \ccxt\async\bitvavo {
         $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
         if ($stored === null) {
             $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-            $stored = new ArrayCacheByTimestamp ($limit);
+            $stored = $this->ohlcv_cache($limit);
             $this->ohlcvs[$symbol][$timeframe] = $stored;
         }
         for ($i = 0; $i < count($candles); $i++) {
@@ -425,16 +425,8 @@ class bitvavo extends \ccxt\async\bitvavo {
         }) ();
     }
 
-    public function handle_delta($bookside, $delta) {
-        $price = $this->safe_float($delta, 0);
-        $amount = $this->safe_float($delta, 1);
-        $bookside->store ($price, $amount);
-    }
-
     public function handle_deltas($bookside, $deltas) {
-        for ($i = 0; $i < count($deltas); $i++) {
-            $this->handle_delta($bookside, $deltas[$i]);
-        }
+        $bookside->storeDeltas ($deltas);
     }
 
     public function handle_order_book_message(Client $client, $message, $orderbook) {
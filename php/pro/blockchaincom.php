@@ -201,7 +201,7 @@ class blockchaincom extends \ccxt\async\blockchaincom {
             $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
             if ($stored === null) {
                 $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-                $stored = new ArrayCacheByTimestamp ($limit);
+                $stored = $this->ohlcv_cache($limit);
                 $this->ohlcvs[$symbol][$timeframe] = $stored;
             }
             $stored->append ($ohlcv);
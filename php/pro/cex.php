@@ -1159,7 +1159,7 @@ class cex extends \ccxt\async\cex {
         $messageHash = 'ohlcv:' . $symbol;
         $data = $this->safe_value($message, 'data', array());
         $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-        $stored = new ArrayCacheByTimestamp ($limit);
+        $stored = $this->ohlcv_cache($limit);
         $sorted = $this->sort_by($data, 0);
         for ($i = 0; $i < count($sorted); $i++) {
             $stored->append ($this->parse_ohlcv($sorted[$i], $market));
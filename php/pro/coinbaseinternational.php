@@ -515,7 +515,7 @@ class coinbaseinternational extends \ccxt\async\coinbaseinternational {
         $this->ohlcvs[$symbol] = $this->safe_value($this->ohlcvs, $symbol, array());
         if ($this->safe_value($this->ohlcvs[$symbol], $timeframe) === null) {
             $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-            $this->ohlcvs[$symbol][$timeframe] = new ArrayCacheByTimestamp ($limit);
+            $this->ohlcvs[$symbol][$timeframe] = $this->ohlcv_cache($limit);
         }
         $stored = $this->ohlcvs[$symbol][$timeframe];
         $data = $this->safe_list($message, 'candles', array());
@@ -813,7 +813,7 @@ class cryptocom extends \ccxt\async\cryptocom {
         $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
         if ($stored === null) {
             $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-            $stored = new ArrayCacheByTimestamp ($limit);
+            $stored = $this->ohlcv_cache($limit);
             $this->ohlcvs[$symbol][$timeframe] = $stored;
         }
         $data = $this->safe_value($message, 'data');
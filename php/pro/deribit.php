@@ -893,7 +893,7 @@ class deribit extends \ccxt\async\deribit {
         $this->ohlcvs[$symbol] = $this->safe_dict($this->ohlcvs, $symbol, array());
         if ($this->safe_value($this->ohlcvs[$symbol], $unifiedTimeframe) === null) {
             $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-            $this->ohlcvs[$symbol][$unifiedTimeframe] = new ArrayCacheByTimestamp ($limit);
+            $this->ohlcvs[$symbol][$unifiedTimeframe] = $this->ohlcv_cache($limit);
         }
         $stored = $this->ohlcvs[$symbol][$unifiedTimeframe];
         $ohlcv = $this->safe_dict($params, 'data', array());
@@ -946,7 +946,7 @@ class gate extends \ccxt\async\gate {
             $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
             if ($stored === null) {
                 $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-                $stored = new ArrayCacheByTimestamp ($limit);
+                $stored = $this->ohlcv_cache($limit);
                 $this->ohlcvs[$symbol][$timeframeId] = $stored;
             }
             $stored->append ($parsed);
@@ -144,7 +144,7 @@ class hashkey extends \ccxt\async\hashkey {
         $timeframe = $this->find_timeframe($klineType);
         if (!(is_array($this->ohlcvs[$symbol]) && array_key_exists($timeframe, $this->ohlcvs[$symbol]))) {
             $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-            $this->ohlcvs[$symbol][$timeframe] = new ArrayCacheByTimestamp ($limit);
+            $this->ohlcvs[$symbol][$timeframe] = $this->ohlcv_cache($limit);
         }
         $data = $this->safe_list($message, 'data', array());
         $stored = $this->ohlcvs[$symbol][$timeframe];
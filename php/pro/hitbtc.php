@@ -797,7 +797,7 @@ class hitbtc extends \ccxt\async\hitbtc {
             $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
             if ($stored === null) {
                 $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-                $stored = new ArrayCacheByTimestamp ($limit);
+                $stored = $this->ohlcv_cache($limit);
                 $this->ohlcvs[$symbol][$timeframe] = $stored;
             }
             $ohlcvs = $this->parse_ws_ohlcvs($data[$marketId], $market);
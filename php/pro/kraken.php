@@ -457,7 +457,7 @@ class kraken extends \ccxt\async\kraken {
             $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
             if ($stored === null) {
                 $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-                $stored = new ArrayCacheByTimestamp ($limit);
+                $stored = $this->ohlcv_cache($limit);
                 $this->ohlcvs[$symbol][$timeframe] = $stored;
             }
             $stored->append ($result);
@@ -880,19 +880,10 @@ class kraken extends \ccxt\async\kraken {
                 $amountParts = explode('.', $amountString);
                 $priceLength = strlen($priceParts[1]) - 0;
                 $amountLength = strlen($amountParts[1]) - 0;
-                $payloadArray = array();
+                $localChecksum = null;
                 if ($c !== null) {
-                    for ($i = 0; $i < 10; $i++) {
-                        $formatted = $this->format_number($storedAsks[$i][0], $priceLength) . $this->format_number($storedAsks[$i][1], $amountLength);
-                        $payloadArray[] = $formatted;
-                    }
-                    for ($i = 0; $i < 10; $i++) {
-                        $formatted = $this->format_number($storedBids[$i][0], $priceLength) . $this->format_number($storedBids[$i][1], $amountLength);
-                        $payloadArray[] = $formatted;
-                    }
+                    $localChecksum = $this->order_book_checksum($symbol, $orderbook, 'stripped', 10, 0, $priceLength, $amountLength);
                 }
-                $payload = implode('', $payloadArray);
-                $localChecksum = $this->crc32($payload, false);
                 if ($localChecksum !== $c) {
                     $error = new ChecksumError ($this->id . ' ' . $this->orderbook_checksum_message($symbol));
                     unset($client->subscriptions[$messageHash]);
@@ -908,24 +899,6 @@ class kraken extends \ccxt\async\kraken {
         }
     }
 
-    public function format_number($n, $length) {
-        $stringNumber = $this->number_to_string($n);
-        $parts = explode('.', $stringNumber);
-        $integer = $this->safe_string($parts, 0);
-        $decimals = $this->safe_string($parts, 1, '');
-        $paddedDecimals = str_pad($decimals, $length, '0', STR_PAD_RIGHT);
-        $joined = $integer . $paddedDecimals;
-        $i = 0;
-        while ($joined[$i] === '0') {
-            $i += 1;
-        }
-        if ($i > 0) {
-            return mb_substr($joined, $i);
-        } else {
-            return $joined;
-        }
-    }
-
     public function custom_handle_deltas($bookside, $deltas, $timestamp = null) {
         for ($j = 0; $j < count($deltas); $j++) {
             $delta = $deltas[$j];
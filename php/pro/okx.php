@@ -1125,7 +1125,7 @@ class okx extends \ccxt\async\okx {
             $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
             if ($stored === null) {
                 $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-                $stored = new ArrayCacheByTimestamp ($limit);
+                $stored = $this->ohlcv_cache($limit);
                 $this->ohlcvs[$symbol][$timeframe] = $stored;
             }
             $stored->append ($parsed);
@@ -1304,24 +1304,8 @@ class okx extends \ccxt\async\okx {
         }) ();
     }
 
-    public function handle_delta($bookside, $delta) {
-        //
-        //     array(
-        //         "31685", // $price
-        //         "0.78069158", // $amount
-        //         "0", // liquidated orders
-        //         "17" // orders
-        //     )
-        //
-        $price = $this->safe_float($delta, 0);
-        $amount = $this->safe_float($delta, 1);
-        $bookside->store ($price, $amount);
-    }
-
     public function handle_deltas($bookside, $deltas) {
-        for ($i = 0; $i < count($deltas); $i++) {
-            $this->handle_delta($bookside, $deltas[$i]);
-        }
+        $bookside->storeDeltas ($deltas);
     }
 
     public function handle_order_book_message(Client $client, $message, $orderbook, $messageHash, $market = null) {
@@ -1357,22 +1341,8 @@ class okx extends \ccxt\async\okx {
         if ($checksum) {
             $prevSeqId = $this->safe_integer($message, 'prevSeqId');
             $nonce = $orderbook['nonce'];
-            $asksLength = count($storedAsks);
-            $bidsLength = count($storedBids);
-            $payloadArray = array();
-            for ($i = 0; $i < 25; $i++) {
-                if ($i < $bidsLength) {
-                    $payloadArray[] = $this->number_to_string($storedBids[$i][0]);
-                    $payloadArray[] = $this->number_to_string($storedBids[$i][1]);
-                }
-                if ($i < $asksLength) {
-                    $payloadArray[] = $this->number_to_string($storedAsks[$i][0]);
-                    $payloadArray[] = $this->number_to_string($storedAsks[$i][1]);
-                }
-            }
-            $payload = implode(':', $payloadArray);
             $responseChecksum = $this->safe_integer($message, 'checksum');
-            $localChecksum = $this->crc32($payload, true);
+            $localChecksum = $this->order_book_checksum($symbol, $orderbook, 'interleaved', 25);
             $error = null;
             if ($prevSeqId !== -1 && $nonce !== $prevSeqId) {
                 $error = new InvalidNonce ($this->id . ' watchOrderBook received invalid nonce');
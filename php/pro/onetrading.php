@@ -1195,7 +1195,7 @@ class onetrading extends \ccxt\async\onetrading {
         $stored = $this->safe_value($this->ohlcvs[$symbol], $timeframe);
         if ($stored === null) {
             $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-            $stored = new ArrayCacheByTimestamp ($limit);
+            $stored = $this->ohlcv_cache($limit);
         }
         $stored->append ($parsed);
         $this->ohlcvs[$symbol][$timeframe] = $stored;
@@ -306,7 +306,7 @@ class oxfun extends \ccxt\async\oxfun {
         }
         if (!(is_array($this->ohlcvs[$symbol]) && array_key_exists($timeframe, $this->ohlcvs[$symbol]))) {
             $limit = $this->safe_integer($this->options, 'OHLCVLimit', 1000);
-            $this->ohlcvs[$symbol][$timeframe] = new ArrayCacheByTimestamp ($limit);
+            $this->ohlcvs[$symbol][$timeframe] = $this->ohlcv_cache($limit);
         }
         $candle = $this->safe_list($data, 'candle', array());
         $parsed = $this->parse_ws_ohlcv($candle, $market);
@@ -42,6 +42,14 @@ function test_ws_order_book() {
         'nonce' => 69,
         'symbol' => null,
     );
+    $deltas_order_book_target = array(
+        'bids' => [[10.5, 3], [10, 10], [9.1, 11], [8.2, 12], [7.3, 13], [6.4, 14], [3, 4]],
+        'asks' => [[11.5, 2], [12.2, 14], [13.3, 13], [14.4, 12], [15.5, 11], [16.6, 10]],
+        'timestamp' => 1574827240000,
+        'datetime' => '2019-11-27T04:00:40.000Z',
+        'nonce' => 70,
+        'symbol' => null,
+    );
     $limited_deleted_order_book_target = array(
         'bids' => [[10, 10], [9.1, 11], [8.2, 12], [7.3, 13], [6.4, 14]],
         'asks' => [[11.1, 13], [12.2, 14], [13.3, 13], [14.4, 12]],
@@ -324,6 +332,21 @@ function test_ws_order_book() {
     // incrementalIndexedOrderBook.limit ();
     // assert (equals (incrementalIndexedOrderBook, anotherStoredIncrementalIndexedOrderBookTarget));
     // --------------------------------------------------------------------------------------------------------------------
+    $deltas_order_book = new OrderBook($order_book_input);
+    $deltas_order_book->apply_deltas([['11.1', '0'], ['11.5', '1'], ['11.5', '2']], [['10.5', '3'], ['4.5', '0'], ['3', '4']], 70, 1574827240000);
+    $deltas_order_book->limit();
+    assert(equals($deltas_order_book, $deltas_order_book_target));
+    $counted_deltas_order_book = new CountedOrderBook($counted_order_book_input);
+    $counted_deltas_bids = $counted_deltas_order_book['bids'];
+    $counted_deltas_bids->store_deltas([['5', '0', '6'], ['1', '1', '6']]);
+    $counted_deltas_order_book->limit();
+    assert(equals($counted_deltas_order_book, $stored_counted_orderbook_target));
+    $indexed_deltas_order_book = new IndexedOrderBook($indexed_order_book_input);
+    $indexed_deltas_asks = $indexed_deltas_order_book['asks'];
+    $indexed_deltas_asks->store_deltas([['13.5', '13', '1244']]);
+    $indexed_deltas_order_book->limit();
+    assert(equals($indexed_deltas_order_book, $overwrite1244));
+    // --------------------------------------------------------------------------------------------------------------------
     $reset_book = new OrderBook($store_bid);
     $reset_book->limit();
     $reset_book->reset($order_book_input);
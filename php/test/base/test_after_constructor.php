@@ -108,8 +108,44 @@ function helper_test_init_market() {
 }
 
 
+function helper_test_init_independent_instances() {
+    // instances of the same class do not share their settings
+    $first = new \ccxt\binance();
+    $fetch_markets = $first->options['fetchMarkets'];
+    $fetch_markets[] = 'sampleType';
+    $first->options['defaultType'] = 'sampleType';
+    $first->has['sampleMethod'] = true;
+    $first->fees['trading']['taker'] = 1;
+    $second = new \ccxt\binance();
+    assert(!$second->in_array('sampleType', $second->options['fetchMarkets']));
+    assert($second->options['defaultType'] === 'spot');
+    assert(!(is_array($second->has) && array_key_exists('sampleMethod', $second->has)));
+    assert($second->fees['trading']['taker'] !== 1);
+    // instances built from one shared config do not share it either
+    $config = array(
+        'headers' => array(
+            'User-Agent' => 'sample',
+        ),
+        'options' => array(
+            'sampleOption' => array(
+                'value' => 1,
+            ),
+        ),
+    );
+    $demo = new \ccxt\okx($config);
+    $demo->set_sandbox_mode(true);
+    $demo->options['sampleOption']['value'] = 2;
+    $live = new \ccxt\okx($config);
+    assert(!(is_array($live->headers) && array_key_exists('x-simulated-trading', $live->headers)));
+    assert($live->headers['User-Agent'] === 'sample');
+    assert($live->options['sampleOption']['value'] === 1);
+    assert(!(is_array($config['headers']) && array_key_exists('x-simulated-trading', $config['headers'])));
+}
+
+
 function test_after_constructor() {
     helper_test_init_throttler();
     helper_test_init_sandbox();
     helper_test_init_market();
+    helper_test_init_independent_instances();
 }
@@ -0,0 +1,225 @@
+<?php
+namespace ccxt;
+
+// ----------------------------------------------------------------------------
+
+// PLEASE DO NOT EDIT THIS FILE, IT IS GENERATED AND WILL BE OVERWRITTEN:
+// https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
+
+// -----------------------------------------------------------------------------
+include_once PATH_TO_CCXT . '/test/exchange/base/test_shared_methods.php';
+
+function helper_trades_market($id, $symbol, $base, $quote, $settle, $type, $contract_size) {
+    $spot = ($type === 'spot');
+    return array(
+        'id' => $id,
+        'symbol' => $symbol,
+        'base' => $base,
+        'quote' => $quote,
+        'settle' => $settle,
+        'baseId' => $base,
+        'quoteId' => $quote,
+        'settleId' => $settle,
+        'type' => $type,
+        'spot' => $spot,
+        'margin' => false,
+        'swap' => ($type === 'swap'),
+        'future' => false,
+        'option' => false,
+        'active' => true,
+        'contract' => !$spot,
+        'linear' => $spot ? null : ($settle === $quote),
+        'inverse' => $spot ? null : ($settle === $base),
+        'contractSize' => $contract_size,
+        'info' => array(),
+    );
+}
+
+
+function helper_test_parse_trades_batch($exchange, $trades, $market) {
+    // the batch parser returns what parseTrade returns for every trade
+    $parsed = $exchange->parse_trades_batch($trades, $market);
+    assert(count($parsed) === count($trades));
+    for ($i = 0; $i < count($trades); $i++) {
+        assert_deep_equal($exchange, null, 'testParseTradesBatch', $parsed[$i], $exchange->parse_trade($trades[$i], $market));
+    }
+}
+
+
+function test_parse_trades_batch_binance() {
+    $exchange = new \ccxt\binance();
+    $spot = helper_trades_market('BTCUSDT', 'BTC/USDT', 'BTC', 'USDT', null, 'spot', null);
+    $linear = helper_trades_market('BTCUSDT', 'BTC/USDT:USDT', 'BTC', 'USDT', 'USDT', 'swap', '1');
+    $inverse = helper_trades_market('BTCUSD_PERP', 'BTC/USD:BTC', 'BTC', 'USD', 'BTC', 'swap', '100');
+    $exchange->set_markets([$spot, $linear, $inverse]);
+    // the last trade is from fetchMyTrades and goes through parseTrade
+    $spot_trades = [array(
+    'a' => 26129,
+    'p' => '0.01633102',
+    'q' => '4.70443515',
+    'f' => 27781,
+    'l' => 27781,
+    'T' => 1498793709153,
+    'm' => true,
+    'M' => true,
+), array(
+    'a' => 26130,
+    'p' => '0.01633103',
+    'q' => '0.1',
+    'f' => 27782,
+    'l' => 27783,
+    'T' => 1498793709154,
+    'm' => false,
+    'M' => true,
+), array(
+    'symbol' => 'BTCUSDT',
+    'id' => 470227543,
+    'orderId' => 4421170947,
+    'price' => '0.53880000',
+    'qty' => '10.00000000',
+    'quoteQty' => '5.38800000',
+    'commission' => '0.00538800',
+    'commissionAsset' => 'USDT',
+    'time' => 1707545780522,
+    'isBuyer' => false,
+    'isMaker' => false,
+    'isBestMatch' => true,
+)];
+    helper_test_parse_trades_batch($exchange, $spot_trades, $exchange->markets['BTC/USDT']);
+    $contract_trades = [array(
+    'a' => '269772814',
+    'p' => '25864.1',
+    'q' => '3',
+    'f' => '662149354',
+    'l' => '662149355',
+    'T' => '1694209776022',
+    'm' => false,
+), array(
+    'a' => '269772815',
+    'p' => '25864.2',
+    'q' => '1',
+    'f' => '662149356',
+    'l' => '662149356',
+    'T' => '1694209776023',
+    'm' => true,
+)];
+    helper_test_parse_trades_batch($exchange, $contract_trades, $exchange->markets['BTC/USDT:USDT']);
+    helper_test_parse_trades_batch($exchange, $contract_trades, $exchange->markets['BTC/USD:BTC']);
+}
+
+
+function test_parse_trades_batch_okx() {
+    $exchange = new \ccxt\okx();
+    $spot = helper_trades_market('BTC-USDT', 'BTC/USDT', 'BTC', 'USDT', null, 'spot', null);
+    $inverse = helper_trades_market('BTC-USD-SWAP', 'BTC/USD:BTC', 'BTC', 'USD', 'BTC', 'swap', '100');
+    $exchange->set_markets([$spot, $inverse]);
+    // the fourth trade has an unknown instId, the last one is from fetchMyTrades and goes through parseTrade
+    $trades = [array(
+    'instId' => 'BTC-USDT',
+    'side' => 'buy',
+    'sz' => '0.00001',
+    'px' => '29963.2',
+    'tradeId' => '242720720',
+    'ts' => '1654161646974',
+), array(
+    'instId' => 'BTC-USD-SWAP',
+    'side' => 'sell',
+    'sz' => '2',
+    'px' => '29963.3',
+    'tradeId' => '242720721',
+    'ts' => '1654161646975',
+    'count' => '1',
+    'source' => '0',
+), array(
+    'instId' => 'BTC-USDT',
+    'side' => 'sell',
+    'sz' => '0.5',
+    'px' => '29963.1',
+    'tradeId' => '242720722',
+    'ts' => '1654161646976',
+), array(
+    'instId' => 'ETH-USDC',
+    'side' => 'buy',
+    'sz' => '1',
+    'px' => '1800',
+    'tradeId' => '242720723',
+    'ts' => '1654161646977',
+), array(
+    'side' => 'buy',
+    'fillSz' => '0.00001',
+    'fillPx' => '29963.2',
+    'fee' => '-0.00000001',
+    'feeCcy' => 'BTC',
+    'ordId' => '4414',
+    'instId' => 'BTC-USDT',
+    'instType' => 'SPOT',
+    'posSide' => 'net',
+    'tradeId' => '242720724',
+    'ts' => '1654161646978',
+    'execType' => 'T',
+)];
+    helper_test_parse_trades_batch($exchange, $trades, null);
+    helper_test_parse_trades_batch($exchange, $trades, $exchange->markets['BTC/USDT']);
+}
+
+
+function test_parse_trades_batch_bybit() {
+    $exchange = new \ccxt\bybit();
+    $spot = helper_trades_market('BTCUSDT', 'BTC/USDT', 'BTC', 'USDT', null, 'spot', null);
+    $linear = helper_trades_market('BTCUSDT', 'BTC/USDT:USDT', 'BTC', 'USDT', 'USDT', 'swap', '1');
+    $inverse = helper_trades_market('BTCUSD', 'BTC/USD:BTC', 'BTC', 'USD', 'BTC', 'swap', '1');
+    $exchange->set_markets([$spot, $linear, $inverse]);
+    // the last trade is from fetchMyTrades and goes through parseTrade
+    $trades = [array(
+    'execId' => '666042b4-50c6-58f3-bd9c-89b2088663ff',
+    'symbol' => 'BTCUSDT',
+    'price' => '16619.5',
+    'size' => '0.001',
+    'side' => 'Sell',
+    'time' => '1669191277315',
+    'isBlockTrade' => false,
+), array(
+    'execId' => '666042b4-50c6-58f3-bd9c-89b2088663fe',
+    'symbol' => 'BTCUSDT',
+    'price' => '16619.6',
+    'size' => '0.002',
+    'side' => 'Buy',
+    'time' => '1669191277316',
+    'isBlockTrade' => false,
+    'isRPITrade' => false,
+    'seq' => '1',
+), array(
+    'symbol' => 'BTCUSDT',
+    'orderType' => 'Market',
+    'orderId' => '1',
+    'execFee' => '0.01',
+    'feeCurrency' => 'USDT',
+    'execId' => '2',
+    'execPrice' => '16619.5',
+    'execQty' => '0.001',
+    'execValue' => '16.6195',
+    'execTime' => '1669191277317',
+    'isMaker' => false,
+    'side' => 'Buy',
+    'createType' => 'CreateByUser',
+)];
+    helper_test_parse_trades_batch($exchange, $trades, null);
+    helper_test_parse_trades_batch($exchange, $trades, $exchange->markets['BTC/USDT:USDT']);
+    $inverse_trades = [array(
+    'execId' => '666042b4-50c6-58f3-bd9c-89b2088663fd',
+    'symbol' => 'BTCUSD',
+    'price' => '16619.5',
+    'size' => '100',
+    'side' => 'Buy',
+    'time' => '1669191277318',
+    'isBlockTrade' => false,
+)];
+    helper_test_parse_trades_batch($exchange, $inverse_trades, $exchange->markets['BTC/USD:BTC']);
+}
+
+
+function test_parse_trades_batch() {
+    test_parse_trades_batch_binance();
+    test_parse_trades_batch_okx();
+    test_parse_trades_batch_bybit();
+}
@@ -0,0 +1,131 @@
+<?php
+namespace ccxt;
+
+// ----------------------------------------------------------------------------
+
+// PLEASE DO NOT EDIT THIS FILE, IT IS GENERATED AND WILL BE OVERWRITTEN:
+// https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
+
+// -----------------------------------------------------------------------------
+include_once PATH_TO_CCXT . '/test/exchange/base/test_shared_methods.php';
+
+function helper_market($id, $symbol, $base, $quote, $settle, $type, $expiry) {
+    $spot = ($type === 'spot');
+    return array(
+        'id' => $id,
+        'symbol' => $symbol,
+        'base' => $base,
+        'quote' => $quote,
+        'settle' => $settle,
+        'baseId' => $base,
+        'quoteId' => $quote,
+        'settleId' => $settle,
+        'type' => $type,
+        'spot' => $spot,
+        'margin' => false,
+        'swap' => ($type === 'swap'),
+        'future' => ($type === 'future'),
+        'option' => false,
+        'active' => true,
+        'contract' => !$spot,
+        'linear' => $spot ? null : ($settle === $quote),
+        'inverse' => $spot ? null : ($settle === $base),
+        'expiry' => $expiry,
+        'info' => array(),
+    );
+}
+
+
+function helper_symbols($markets) {
+    $symbols = [];
+    for ($i = 0; $i < count($markets); $i++) {
+        $symbols[] = $markets[$i]['symbol'];
+    }
+    return $symbols;
+}
+
+
+function test_set_markets() {
+    $exchange = new \ccxt\Exchange(array(
+        'id' => 'sampleexchange',
+    ));
+    $spot = helper_market('BTCUSDT', 'BTC/USDT', 'BTC', 'USDT', null, 'spot', null);
+    $linear = helper_market('BTCUSDT', 'BTC/USDT:USDT', 'BTC', 'USDT', 'USDT', 'swap', null);
+    $inverse = helper_market('BTCUSD_PERP', 'BTC/USD:BTC', 'BTC', 'USD', 'BTC', 'swap', null);
+    $future = helper_market('BTCUSD_240927', 'BTC/USD:BTC-240927', 'BTC', 'USD', 'BTC', 'future', 1727424000000);
+    $eth = helper_market('ETHUSDT', 'ETH/USDT', 'ETH', 'USDT', null, 'spot', null);
+    $ltc = helper_market('LTCUSDT', 'LTC/USDT', 'LTC', 'USDT', null, 'spot', null);
+    $exchange->set_markets([$linear, $inverse, $future, $spot, $eth]);
+    assert_deep_equal($exchange, null, 'testSetMarkets', $exchange->symbols, ['BTC/USD:BTC', 'BTC/USD:BTC-240927', 'BTC/USDT', 'BTC/USDT:USDT', 'ETH/USDT']);
+    assert_deep_equal($exchange, null, 'testSetMarkets', $exchange->ids, ['BTCUSDT', 'BTCUSD_240927', 'BTCUSD_PERP', 'ETHUSDT']);
+    assert_deep_equal($exchange, null, 'testSetMarkets', $exchange->codes, ['BTC', 'ETH', 'USD', 'USDT']);
+    // spot markets come first in markets_by_id
+    assert($exchange->markets_by_id['BTCUSDT'][0]['symbol'] === 'BTC/USDT');
+    assert($exchange->markets['BTC/USDT:USDT']['subType'] === 'linear');
+    assert($exchange->markets['BTC/USDT']['subType'] === null);
+    //
+    // filterMarkets
+    //
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets()), $exchange->symbols);
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets('spot')), ['BTC/USDT', 'ETH/USDT']);
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets(null, 'inverse')), ['BTC/USD:BTC', 'BTC/USD:BTC-240927']);
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets(null, null, 'BTC', 'USDT')), ['BTC/USDT', 'BTC/USDT:USDT']);
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets('swap', null, null, null, 'USDT')), ['BTC/USDT:USDT']);
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets(null, null, null, null, null, 1727424000000)), ['BTC/USD:BTC-240927']);
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets(null, null, null, null, null, null, 'BTC/USD')), ['BTC/USD:BTC', 'BTC/USD:BTC-240927']);
+    // the underlying of a spot market is not set
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets(null, null, null, null, null, null, 'BTC/USDT')), ['BTC/USDT:USDT']);
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets('option')), []);
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets('spot', null, 'LTC')), []);
+    //
+    // safeMarket
+    //
+    assert($exchange->safe_market('ETHUSDT')['symbol'] === 'ETH/USDT');
+    assert($exchange->safe_market('BTCUSDT', null, null, 'swap')['symbol'] === 'BTC/USDT:USDT');
+    assert($exchange->safe_market('BTCUSDT', null, null, 'spot')['symbol'] === 'BTC/USDT');
+    assert($exchange->safe_market('BTCUSDT', $exchange->markets['BTC/USDT:USDT'])['symbol'] === 'BTC/USDT:USDT');
+    assert($exchange->safe_market('LTC-USDT', null, '-')['symbol'] === 'LTC/USDT');
+    assert($exchange->safe_market('LTCUSDT')['symbol'] === 'LTCUSDT');
+    // the market memoized for an id and a type is dropped when the markets are set again
+    $delisted = $exchange->extend($linear, array(
+        'active' => false,
+    ));
+    $exchange->set_markets([$delisted, $inverse, $future, $spot, $eth]);
+    assert(!$exchange->safe_market('BTCUSDT', null, null, 'swap')['active']);
+    assert($exchange->safe_market('BTCUSDT', null, null, 'spot')['active']);
+    // the index is dropped too
+    $exchange->set_markets([$linear, $spot, $ltc]);
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets('spot')), ['BTC/USDT', 'LTC/USDT']);
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($exchange->filter_markets(null, 'inverse')), []);
+    //
+    // incremental reload
+    //
+    $reloaded = new \ccxt\Exchange(array(
+        'id' => 'sampleexchange',
+        'options' => array(
+            'incrementalReload' => true,
+        ),
+    ));
+    $reloaded->apply_markets([$linear, $inverse, $future, $spot, $eth]);
+    assert($reloaded->safe_market('BTCUSDT', null, null, 'swap')['active']);
+    assert(count($reloaded->filter_markets('spot')) === 2);
+    // eth is removed, ltc is added and the linear swap changes
+    $fetched = [$delisted, $inverse, $future, $spot, $ltc];
+    $reloaded->apply_markets($fetched);
+    $fresh = new \ccxt\Exchange(array(
+        'id' => 'sampleexchange',
+    ));
+    $fresh->set_markets($fetched);
+    assert_deep_equal($exchange, null, 'testSetMarkets', $reloaded->symbols, $fresh->symbols);
+    assert_deep_equal($exchange, null, 'testSetMarkets', $reloaded->ids, $fresh->ids);
+    // currencies are extended like on every reload
+    assert(is_array($reloaded->currencies) && array_key_exists('LTC', $reloaded->currencies));
+    for ($i = 0; $i < count($fresh->symbols); $i++) {
+        $symbol = $fresh->symbols[$i];
+        assert_deep_equal($exchange, null, 'testSetMarkets', $reloaded->markets[$symbol], $fresh->markets[$symbol]);
+    }
+    assert(!(is_array($reloaded->markets) && array_key_exists('ETH/USDT', $reloaded->markets)));
+    assert(!(is_array($reloaded->markets_by_id) && array_key_exists('ETHUSDT', $reloaded->markets_by_id)));
+    assert(!$reloaded->safe_market('BTCUSDT', null, null, 'swap')['active']);
+    assert_deep_equal($exchange, null, 'testSetMarkets', helper_symbols($reloaded->filter_markets('spot')), ['BTC/USDT', 'LTC/USDT']);
+}
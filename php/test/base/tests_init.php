@@ -19,6 +19,9 @@ include_once __DIR__ . '/test_sum.php';
 include_once __DIR__ . '/test_omit.php';
 include_once __DIR__ . '/test_group_by.php';
 include_once __DIR__ . '/test_filter_by.php';
+include_once __DIR__ . '/test_set_markets.php';
+include_once __DIR__ . '/test_parse_trades_batch.php';
+include_once __DIR__ . '/test_order_book_checksum.php';
 include_once __DIR__ . '/test_after_constructor.php';
 include_once __DIR__ . '/test_handle_methods.php';
 include_once __DIR__ . '/test_remove_repeated_elements_from_array.php';
@@ -38,6 +41,9 @@ function base_tests_init() {
     test_omit();
     test_group_by();
     test_filter_by();
+    test_set_markets();
+    test_parse_trades_batch();
+    test_order_book_checksum();
     test_handle_methods();
     test_remove_repeated_elements_from_array();
 }
@@ -20,23 +20,28 @@ from ccxt.base.types import Int, Str, Num, Strings
 
 # -----------------------------------------------------------------------------
 
-from ccxt.async_support.base.throttler import Throttler
+from ccxt.async_support.base.throttler import Throttler, ProcessThrottler, shared_throttler
+from ccxt.async_support.base.httpx_session import HttpxSession
 
 # -----------------------------------------------------------------------------
 
-from ccxt.base.errors import BaseError, BadSymbol, BadRequest, BadResponse, ExchangeError, ExchangeNotAvailable, RequestTimeout, NotSupported, NullResponse, InvalidAddress, RateLimitExceeded, OperationFailed
+from ccxt.base.errors import BaseError, BadSymbol, BadRequest, BadResponse, ExchangeError, ExchangeNotAvailable, RequestTimeout, NotSupported, NullResponse, InvalidAddress, RateLimitExceeded, DDoSProtection, OperationFailed
 from ccxt.base.types import ConstructorArgs, OrderType, OrderSide, OrderRequest, CancellationRequest
 
 # -----------------------------------------------------------------------------
 
 from ccxt.base.exchange import Exchange as BaseExchange, ArgumentsRequired
+from ccxt.base.markets_cache import changed_options, options_snapshot
 
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.ws.functions import inflate, inflate64, gunzip
 from ccxt.async_support.base.ws.fast_client import FastClient
 from ccxt.async_support.base.ws.future import Future
+from ccxt.async_support.base.ws.message_queue import MessageQueue
+from ccxt.async_support.base.ws.update_stream import UpdateStream, current_update_stream
 from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook
+from ccxt.async_support.base.ws.cache import ArrayCacheByTimestamp, ArrayCacheByTimestampColumnar
 
 
 # -----------------------------------------------------------------------------
@@ -66,6 +71,13 @@ class Exchange(BaseExchange):
     newUpdates = True
     clients = {}
     timeout_on_exit = 250  # needed for: https://github.com/ccxt/ccxt/pull/23470
+    # http transport, 'aiohttp' or 'httpx' (http/2, requires httpx[http2])
+    transport = 'aiohttp'
+    connectionLimit = 100  # 0 for no limit
+    connectionLimitPerHost = 0  # 0 for no limit
+    keepAliveTimeout = 15000  # ms an idle connection stays in the pool
+    dnsCacheTtl = 10000  # ms, aiohttp only
+    prewarmConnections = 0  # connections opened to each api host after the markets are fetched
 
     def __init__(self, config: ConstructorArgs = {}):
         if 'asyncio_loop' in config:
@@ -75,18 +87,159 @@ class Exchange(BaseExchange):
         self.own_session = 'session' not in config
         self.cafile = config.get('cafile', certifi.where())
         self.throttler = None
+        # shared and process buckets by key, see host_throttler
+        self.throttlers = {}
+        self.rate_limiter_backend = 'local'
         super(Exchange, self).__init__(config)
         self.markets_loading = None
         self.reloading_markets = False
+        # the last rate limit state reported by the exchange, by api host or endpoint
+        self.rate_limit_status = {}
+        self.rate_limit_resume = {}
+        self.prewarming = None
+        self.markets_revalidating = None
+        self.requests_in_flight = {}
+        self.response_cache = {}
 
     def get_event_loop(self):
         return self.asyncio_loop
 
     def init_throttler(self, cost=None):
-        self.throttler = Throttler(self.tokenBucket, self.asyncio_loop)
-
-    async def throttle(self, cost=None):
-        return await self.throttler(cost)
+        # options['rateLimiter']['backend']:
+        #   'local' - one bucket per instance (default)
+        #   'shared' - one bucket per key for all instances of this process that run on the same event loop
+        #   'process' - one bucket per key for all processes of this machine
+        rateLimiter = self.safe_dict(self.options, 'rateLimiter', {})
+        backend = self.safe_string(rateLimiter, 'backend', 'local')
+        if backend not in ['local', 'shared', 'process']:
+            raise NotSupported(self.id + ' rateLimiter backend ' + backend + ' is not supported, use local, shared or process')
+        self.rate_limiter_backend = backend
+        if backend == 'local':
+            self.throttler = Throttler(self.tokenBucket, self.asyncio_loop)
+        elif backend == 'process':
+            self.throttler = self.host_throttler(self.api_host(None))
+        else:
+            # the shared buckets belong to the event loop that sends the request, host_throttler looks them up then
+            self.throttler = None
+
+    def host_throttler(self, host):
+        # the shared and process buckets of an api host, hosts like binance api, fapi and dapi have separate limits
+        # the key defaults to host:apiKey, options['rateLimiter']['key'] puts every host in one bucket
+        # a shared bucket is shared by the instances that run on the running event loop, it is looked up on every call
+        # a process bucket keeps its state in a file, the instance keeps one per key and releases it on close
+        if self.rate_limiter_backend == 'local':
+            return self.throttler
+        key = self.safe_string(self.safe_dict(self.options, 'rateLimiter'), 'key')
+        if key is None:
+            key = host + ':' + (self.apiKey or '')
+        if self.rate_limiter_backend == 'shared':
+            return shared_throttler(key, self.tokenBucket)
+        throttler = self.throttlers.get(key)
+        if throttler is None:
+            throttler = ProcessThrottler(self.tokenBucket, None, key)
+            self.throttlers[key] = throttler
+        return throttler
+
+    def api_host(self, api):
+        # the host the requests of an api are sent to, read from urls['api'] without signing a request
+        url = self.urls.get('api') if isinstance(self.urls, dict) else None
+        for part in (api if isinstance(api, list) else [api]):
+            if isinstance(url, dict) and part in url:
+                url = url[part]
+        if isinstance(url, dict):
+            url = next((value for value in url.values() if isinstance(value, str)), None)
+        if isinstance(url, str) and url.startswith('http'):
+            return yarl.URL(self.implode_hostname(url)).host
+        return self.hostname or self.id
+
+    def sync_rate_limit(self, url, headers):
+        # feeds the rate limit state reported in the response headers back into the throttler
+        # options['rateLimiter']['headers'] = {header: rule}, a rule has
+        #   'type': 'used' (default) or 'remaining', what the header counts
+        #   'limit': a number, or {subdomain: number}, or 'limitHeader': the header carrying it
+        #   'window': the length of the exchange window in ms
+        #   'resetHeader' with 'resetType' 'timestamp' or 'delta': when the window ends, in ms
+        #   'scope': 'host' (default) if the limit covers the whole api host, 'path' if it is per endpoint
+        # the rules only apply with options['rateLimiter']['sync'] or ['adaptive'] set to True
+        rateLimiter = self.safe_dict(self.options, 'rateLimiter')
+        adaptive = self.safe_bool(rateLimiter, 'adaptive', False)
+        if not adaptive and not self.safe_bool(rateLimiter, 'sync', False):
+            return
+        rules = self.safe_dict(rateLimiter, 'headers')
+        if not rules:
+            return
+        received = dict((name.lower(), value) for name, value in headers.items())
+        parsed = None
+        for name in rules:
+            value = self.safe_number(received, name)
+            if value is None:
+                continue
+            rule = rules[name]
+            parsed = parsed or yarl.URL(url)
+            limit = self.safe_value(rule, 'limit')
+            if isinstance(limit, dict):
+                limit = self.safe_number(limit, parsed.host.split('.')[0])
+            elif 'limitHeader' in rule:
+                limit = self.safe_number(received, rule['limitHeader'])
+            if not limit:
+                continue
+            used = limit - value if (rule.get('type') == 'remaining') else value
+            now = self.milliseconds()
+            reset = None
+            if 'resetHeader' in rule:
+                reset = self.safe_number(received, rule['resetHeader'])
+                if reset is not None and rule.get('resetType') == 'timestamp':
+                    reset = max(reset - now, 0)
+            window = rule['window']
+            group = parsed.host
+            if rule.get('scope') == 'path':
+                group += parsed.path
+            self.rate_limit_status[group] = {
+                'header': name,
+                'used': used,
+                'limit': limit,
+                'remaining': limit - used,
+                'saturation': used / limit,
+                'reset': reset,
+                'timestamp': now,
+            }
+            if rule.get('scope') == 'path':
+                # an exhausted endpoint waits for its own window without holding back the others
+                if adaptive and used >= limit:
+                    self.rate_limit_resume[group] = now + (window if reset is None else reset)
+            else:
+                self.host_throttler(parsed.host).sync(used, limit, window, reset, adaptive)
+
+    def is_adaptive_rate_limit(self):
+        return self.enableRateLimit and self.safe_bool(self.safe_dict(self.options, 'rateLimiter'), 'adaptive', False)
+
+    async def wait_rate_limit(self, url):
+        # adaptive rate limiting, before a request is sent:
+        # an endpoint that exhausted its own window waits for the reset reported by the exchange
+        # a host that is backing off after a rejection waits until its bucket is refilled, retries go through here too
+        parsed = yarl.URL(url)
+        if self.rate_limit_resume:
+            resume = self.rate_limit_resume.pop(parsed.host + parsed.path, None)
+            if resume is not None:
+                delay = resume - self.milliseconds()
+                if delay > 0:
+                    await self.sleep(delay)
+        throttler = self.host_throttler(parsed.host)
+        if throttler.backoffs:
+            await throttler(0)
+
+    def update_rate_limit_backoff(self, url, error=None):
+        # RateLimitExceeded and DDoSProtection back off exponentially while the exchange keeps rejecting requests, a response resets it
+        throttler = self.host_throttler(yarl.URL(url).host)
+        if error is None:
+            throttler.reset_backoff()
+        elif isinstance(error, (RateLimitExceeded, DDoSProtection)):
+            throttler.backoff(self.safe_number(self.options['rateLimiter'], 'backoffDelay', 1000))
+
+    async def throttle(self, cost=None, api=None):
+        if self.rate_limiter_backend == 'local':
+            return await self.throttler(cost)
+        return await self.host_throttler(self.api_host(api))(cost)
 
     def get_session(self):
         return self.session
@@ -109,7 +262,8 @@ class Exchange(BaseExchange):
                 self.asyncio_loop = asyncio.get_running_loop()
             else:
                 self.asyncio_loop = asyncio.get_event_loop()
-            self.throttler.loop = self.asyncio_loop
+            if self.rate_limiter_backend == 'local':
+                self.throttler.loop = self.asyncio_loop
 
         if self.ssl_context is None:
             # Create our SSL context object with our CA cert file
@@ -120,11 +274,67 @@ class Exchange(BaseExchange):
                     self.ssl_context.load_verify_locations(cafile=os_default_paths.cafile)
 
         if self.own_session and self.session is None:
-            # Pass this SSL context to aiohttp and create a TCPConnector
-            self.tcp_connector = aiohttp.TCPConnector(ssl=self.ssl_context, loop=self.asyncio_loop, enable_cleanup_closed=True)
-            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=self.tcp_connector, trust_env=self.aiohttp_trust_env)
+            if self.transport == 'httpx':
+                self.session = HttpxSession(self.ssl_context, self.connectionLimit, self.connectionLimitPerHost, self.keepAliveTimeout / 1000, self.aiohttp_trust_env)
+            elif self.transport == 'aiohttp':
+                # Pass this SSL context to aiohttp and create a TCPConnector
+                self.tcp_connector = aiohttp.TCPConnector(
+                    ssl=self.ssl_context,
+                    loop=self.asyncio_loop,
+                    enable_cleanup_closed=True,
+                    limit=self.connectionLimit,
+                    limit_per_host=self.connectionLimitPerHost,
+                    keepalive_timeout=self.keepAliveTimeout / 1000,
+                    ttl_dns_cache=self.dnsCacheTtl / 1000 if self.dnsCacheTtl else None,
+                    use_dns_cache=bool(self.dnsCacheTtl),
+                )
+                self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=self.tcp_connector, trust_env=self.aiohttp_trust_env)
+            else:
+                raise NotSupported(self.id + ' transport ' + str(self.transport) + ' is not supported, use aiohttp or httpx')
+
+    def api_hosts(self):
+        hosts = []
+        api = self.urls.get('api') if isinstance(self.urls, dict) else None
+        urls = [api] if isinstance(api, str) else list(self.to_array(api or {}))
+        while urls:
+            url = urls.pop()
+            if isinstance(url, dict):
+                urls.extend(url.values())
+            elif isinstance(url, str) and url.startswith('http'):
+                origin = str(yarl.URL(self.implode_hostname(url)).origin())
+                if origin not in hosts:
+                    hosts.append(origin)
+        return hosts
+
+    async def prewarm_connections(self):
+        # opens connections to the api hosts ahead of the first signed request
+        # the responses are discarded, the connections stay in the keep-alive pool
+        # each request takes the default cost from the bucket of its host, like any other request,
+        # so it starts once the markets are fetched and does not hold back load_markets
+        self.open()
+
+        async def connect(url):
+            try:
+                if self.enableRateLimit:
+                    await self.host_throttler(yarl.URL(url).host)()
+                async with self.session.head(url, timeout=self.timeout / 1000):
+                    pass
+            except Exception:
+                pass
+
+        await asyncio.gather(*[connect(url) for url in self.api_hosts() for _ in range(self.prewarmConnections)])
 
     async def close(self):
+        if self.prewarming is not None:
+            # the prewarm requests must not outlive the session they use
+            self.prewarming.cancel()
+            await asyncio.wait([self.prewarming])
+            self.prewarming = None
+        if self.markets_revalidating is not None:
+            # neither must the background revalidation of cached markets
+            self.markets_revalidating.cancel()
+            await asyncio.wait([self.markets_revalidating])
+            self.markets_revalidating = None
         await self.ws_close()
         if self.session is not None:
             if self.own_session:
@@ -132,6 +342,9 @@ class Exchange(BaseExchange):
             self.session = None
         await self.close_connector()
         await self.close_proxy_sessions()
+        for throttler in self.throttlers.values():
+            if isinstance(throttler, ProcessThrottler):
+                throttler.close()
         await self.sleep(self.timeout_on_exit)
 
     async def close_connector(self):
@@ -148,8 +361,68 @@ class Exchange(BaseExchange):
                 await self.socks_proxy_sessions[url].close()
             self.socks_proxy_sessions = None
 
+    async def fetch_single_flight(self, path, api='public', method='GET', params={}, headers=None, body=None, config={}):
+        # options['singleFlight'] = True or {'ttl': ms, 'size': responses}
+        # identical public GET requests (same url, headers and body) in flight at the same time share one http call
+        # the request is signed up front, before it is throttled, the callers sharing it take the rate limiter cost once
+        # with a ttl a successful response is also reused until it expires, the cache keeps at most size (1000) responses
+        # every caller gets its own copy of the response, an error is raised to every caller
+        settings = self.safe_dict(self.options, 'singleFlight', {})
+        ttl = self.safe_integer(settings, 'ttl', 0)
+        request = self.sign(path, api, method, params, headers, body)
+        key = request['method'] + ' ' + request['url'] + ' ' + (self.json(request['headers']) if request['headers'] else '') + ' ' + (request['body'] or '')
+        if ttl:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                if cached[0] > self.milliseconds():
+                    return self.copy_response(cached[1])
+                del self.response_cache[key]
+        flight = self.requests_in_flight.get(key)
+        if flight is None:
+            # [request, callers waiting for it]
+            flight = [asyncio.ensure_future(self.send_request(path, api, method, params, headers, body, config, request)), 0]
+            self.requests_in_flight[key] = flight
+            flight[0].add_done_callback(lambda future: self.on_single_flight_done(key, future, ttl, settings))
+        flight[1] += 1
+        try:
+            # a cancelled caller does not cancel the request for the others
+            response = await asyncio.shield(flight[0])
+        finally:
+            flight[1] -= 1
+        if flight[1] or ttl:
+            return self.copy_response(response)
+        # the last caller takes the response itself, no one else reads it anymore
+        return response
+
+    def on_single_flight_done(self, key, future, ttl, settings):
+        del self.requests_in_flight[key]
+        if future.cancelled() or future.exception() is not None or not ttl:
+            return
+        now = self.milliseconds()
+        cache = self.response_cache
+        size = max(self.safe_integer(settings, 'size', 1000), 1)
+        if len(cache) >= size:
+            # expired responses go first, then the oldest ones
+            for expired in [k for k, v in cache.items() if v[0] <= now]:
+                del cache[expired]
+            while len(cache) >= size:
+                del cache[next(iter(cache))]
+        cache.pop(key, None)
+        cache[key] = (now + ttl, future.result())
+
+    @staticmethod
+    def copy_response(response):
+        if isinstance(response, dict):
+            return {key: Exchange.copy_response(value) for key, value in response.items()}
+        if isinstance(response, list):
+            return [Exchange.copy_response(value) for value in response]
+        return response
+
     async def fetch(self, url, method='GET', headers=None, body=None):
         """Perform a HTTP request and return decoded JSON data"""
+        adaptive = self.is_adaptive_rate_limit()
+        if adaptive:
+            await self.wait_rate_limit(url)
 
         # ##### PROXY & HEADERS #####
         request_headers = self.prepare_request_headers(headers)
@@ -229,6 +502,8 @@ class Exchange(BaseExchange):
                         headers[header] = raw_headers[header]
                 http_status_code = response.status
                 http_status_text = response.reason
+                if self.enableRateLimit:
+                    self.sync_rate_limit(url, headers)
                 http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, http_response, request_headers, request_body)
                 json_response = self.parse_json(http_response)
                 if self.enableLastHttpResponse:
@@ -257,8 +532,15 @@ class Exchange(BaseExchange):
             details = ' '.join([self.id, method, url])
             raise ExchangeError(details) from e
 
-        self.handle_errors(http_status_code, http_status_text, url, method, headers, http_response, json_response, request_headers, request_body)
-        self.handle_http_status_code(http_status_code, http_status_text, url, method, http_response)
+        try:
+            self.handle_errors(http_status_code, http_status_text, url, method, headers, http_response, json_response, request_headers, request_body)
+            self.handle_http_status_code(http_status_code, http_status_text, url, method, http_response)
+        except Exception as e:
+            if adaptive:
+                self.update_rate_limit_backoff(url, e)
+            raise
+        if adaptive:
+            self.update_rate_limit_backoff(url)
         if json_response is not None:
             return json_response
         if self.is_text_response(headers):
@@ -273,13 +555,38 @@ class Exchange(BaseExchange):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            age = self.restore_markets_cache()
+            if age is not None:
+                if age > self.safe_integer(self.markets_cache_settings(), 'ttl', 3600000):
+                    # serve the cached tables and refresh them in the background
+                    self.markets_revalidating = asyncio.ensure_future(self.revalidate_markets(params))
+                return self.markets
+        snapshot = self.markets_cache_snapshot()
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = await self.fetch_currencies()
         markets = await self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        result = self.set_fetched_markets(markets, currencies, snapshot)
+        if self.prewarmConnections and self.own_session and self.prewarming is None:
+            self.prewarming = asyncio.ensure_future(self.prewarm_connections())
+        return result
+
+    async def revalidate_markets(self, params={}):
+        try:
+            snapshot = self.markets_cache_snapshot()
+            currencies = None
+            if self.has['fetchCurrencies'] is True:
+                currencies = await self.fetch_currencies()
+            markets = await self.fetch_markets(params)
+            self.set_fetched_markets(markets, currencies, snapshot)
+        except Exception as e:
+            # the cached markets stay in use, the next load retries
+            self.logger.warning('%s could not revalidate the cached markets: %s', self.id, e)
 
     async def load_markets(self, reload=False, params={}):
+        store = self.attach_markets_store()
+        if store is not None:
+            return await self.load_shared_markets(store, reload, params)
         if (reload and not self.reloading_markets) or not self.markets_loading:
             self.reloading_markets = True
             coroutine = self.load_markets_helper(reload, params)
@@ -298,6 +605,32 @@ class Exchange(BaseExchange):
         self.reloading_markets = False
         return result
 
+    async def load_shared_markets(self, store, reload=False, params={}):
+        # same as load_markets, with the loading future kept on the store shared by the attached instances
+        if not reload and store.tables is not None:
+            return self.markets
+        loop = asyncio.get_running_loop()
+        if (reload and not store.reloading) or not store.loading or store.loading.get_loop() is not loop:
+            store.reloading = reload
+            store.loading = asyncio.ensure_future(self.load_shared_markets_helper(store, reload, params))
+        loading = store.loading
+        try:
+            await asyncio.shield(loading)
+        except (asyncio.CancelledError, Exception) as e:
+            # a cancelled caller leaves the load running for the other instances
+            if store.loading is loading and loading.done():
+                store.reloading = False
+                store.loading = None
+            raise e
+        if store.loading is loading:
+            store.reloading = False
+        return self.markets
+
+    async def load_shared_markets_helper(self, store, reload, params):
+        snapshot = options_snapshot(self.options)
+        await self.load_markets_helper(reload, params)
+        store.publish(self, changed_options(self.options, snapshot))
+
     async def load_fees(self, reload=False):
         if not reload:
             if self.loaded_fees != Exchange.loaded_fees:
@@ -371,6 +704,12 @@ class Exchange(BaseExchange):
     def counted_order_book(self, snapshot={}, depth=None):
         return CountedOrderBook(snapshot, depth)
 
+    def ohlcv_cache(self, limit=None):
+        # options['watchOHLCV']['columnar'] keeps candles in numpy columns (requires numpy)
+        if self.handle_option('watchOHLCV', 'columnar', False):
+            return ArrayCacheByTimestampColumnar(limit)
+        return ArrayCacheByTimestamp(limit)
+
     def client(self, url):
         self.clients = self.clients or {}
         if url not in self.clients:
@@ -415,6 +754,9 @@ class Exchange(BaseExchange):
         self.open()
         backoff_delay = 0
         client = self.client(url)
+        stream = current_update_stream.get()
+        if stream is not None:
+            stream.attach(client, message_hashes)
 
         future = Future.race([client.future(message_hash) for message_hash in message_hashes])
 
@@ -454,6 +796,9 @@ class Exchange(BaseExchange):
         self.open()
         backoff_delay = 0
         client = self.client(url)
+        stream = current_update_stream.get()
+        if stream is not None:
+            stream.attach(client, [message_hash])
         if subscribe_hash is None and message_hash in client.futures:
             return client.futures[message_hash]
         future = client.future(message_hash)
@@ -487,6 +832,63 @@ class Exchange(BaseExchange):
 
         return future
 
+    async def stream_updates(self, method, *args, transform=None):
+        # async for update in exchange.stream_updates('watch_ticker', 'BTC/USDT')
+        # calls the watch_* method once to subscribe, then yields every value its message hashes are resolved with,
+        # transformed like the method transforms them, without a future or a race task per update
+        # the iteration ends with the error that rejects the subscription or resets the connection
+        ws_options = self.safe_value(self.options, 'ws', {})
+        stream = UpdateStream(MessageQueue(self.safe_string(ws_options, 'streamQueuePolicy', 'drop'), self.safe_integer(ws_options, 'streamQueueSize', 1000)))
+        token = current_update_stream.set(stream)
+        try:
+            try:
+                await getattr(self, method)(*args)
+            finally:
+                current_update_stream.reset(token)
+            async for value in stream:
+                yield value if transform is None else transform(value)
+        finally:
+            stream.detach()
+
+    async def stream_trades(self, symbols: List[str], params={}):
+        # yields the lists of trades that arrived since the previous one, across all symbols
+        last_trades = {}
+
+        def new_trades(trades):
+            # caches are appended in place, the trades after the last one yielded from the same cache are new
+            last = last_trades.get(id(trades))
+            result = []
+            for trade in reversed(trades):
+                if trade is last:
+                    break
+                result.append(trade)
+            if result:
+                last_trades[id(trades)] = result[0]
+            result.reverse()
+            return result
+
+        if self.has['watchTradesForSymbols']:
+            updates = self.stream_updates('watch_trades_for_symbols', symbols, None, None, params, transform=new_trades)
+        elif len(symbols) == 1:
+            updates = self.stream_updates('watch_trades', symbols[0], None, None, params, transform=new_trades)
+        else:
+            raise NotSupported(self.id + ' stream_trades() supports a single symbol, watchTradesForSymbols is not supported yet')
+        try:
+            async for trades in updates:
+                if trades:
+                    yield trades
+        finally:
+            await updates.aclose()
+
+    async def stream_order_book(self, symbol: str, limit: Int = None, params={}):
+        # yields the order book after every update, like watch_order_book resolves it
+        updates = self.stream_updates('watch_order_book', symbol, limit, params, transform=lambda orderbook: orderbook.limit())
+        try:
+            async for orderbook in updates:
+                yield orderbook
+        finally:
+            await updates.aclose()
+
     def on_connected(self, client, message=None):
         # for user hooks
         # print('Connected to', client.url)
@@ -873,11 +1275,17 @@ class Exchange(BaseExchange):
         return self.markets
 
     async def fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
+        if self.is_single_flight_request(api, method):
+            return await self.fetch_single_flight(path, api, method, params, headers, body, config)
+        return await self.send_request(path, api, method, params, headers, body, config)
+
+    async def send_request(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}, request: Any = None):
         if self.enableRateLimit:
             cost = self.calculate_rate_limiter_cost(api, method, path, params, config)
-            await self.throttle(cost)
+            await self.throttle(cost, api)
         self.lastRestRequestTimestamp = self.milliseconds()
-        request = self.sign(path, api, method, params, headers, body)
+        if request is None:
+            request = self.sign(path, api, method, params, headers, body)
         self.last_request_headers = request['headers']
         self.last_request_body = request['body']
         self.last_request_url = request['url']
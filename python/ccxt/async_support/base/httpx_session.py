@@ -0,0 +1,102 @@
+import asyncio
+import aiohttp
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class HttpxResponse:
+    # the part of aiohttp.ClientResponse used by Exchange.fetch
+    def __init__(self, response):
+        self.response = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.headers = response.headers
+        self.content = response.content
+
+    async def text(self, errors='strict'):
+        return self.response.content.decode(self.response.encoding or 'utf-8', errors=errors)
+
+
+class HttpxRequest:
+    def __init__(self, client, semaphore, method, url, data, headers, timeout):
+        self.client = client
+        self.semaphore = semaphore
+        self.method = method
+        self.url = url
+        self.data = data
+        self.headers = headers
+        self.timeout = timeout
+
+    async def __aenter__(self):
+        # errors are raised as their aiohttp counterparts, so fetch handles both transports alike
+        try:
+            if self.semaphore is None:
+                response = await self.client.request(self.method, str(self.url), content=self.data, headers=self.headers, timeout=self.timeout)
+            else:
+                async with self.semaphore:
+                    response = await self.client.request(self.method, str(self.url), content=self.data, headers=self.headers, timeout=self.timeout)
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except (httpx.ConnectError, httpx.RemoteProtocolError) as e:
+            raise aiohttp.ClientConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise aiohttp.ClientError(str(e)) from e
+        return HttpxResponse(response)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class HttpxSession:
+    # aiohttp.ClientSession interface over an httpx client with http/2 enabled
+    # concurrent requests to the same host are multiplexed over one tls connection
+    # httpx has no per host connection limit, limit_per_host caps the requests in flight to each host instead,
+    # which is what it amounts to for aiohttp, where every request in flight holds its own connection
+    def __init__(self, ssl_context, limit, limit_per_host, keepalive_timeout, trust_env):
+        if httpx is None:
+            raise ImportError('the httpx transport requires httpx with http/2 support, install it with `pip install httpx[http2]`')
+        limits = httpx.Limits(
+            max_connections=limit or None,
+            max_keepalive_connections=limit or None,
+            keepalive_expiry=keepalive_timeout,
+        )
+        self.client = httpx.AsyncClient(http2=True, verify=ssl_context, limits=limits, trust_env=trust_env)
+        self.limit_per_host = limit_per_host
+        self.semaphores = {}
+
+    def semaphore(self, url):
+        if not self.limit_per_host:
+            return None
+        host = httpx.URL(str(url)).host
+        if host not in self.semaphores:
+            self.semaphores[host] = asyncio.Semaphore(self.limit_per_host)
+        return self.semaphores[host]
+
+    def request(self, method, url, data=None, headers=None, timeout=None, proxy=None):
+        if proxy is not None:
+            raise aiohttp.ClientError('the httpx transport does not support per request proxies')
+        return HttpxRequest(self.client, self.semaphore(url), method, url, data, headers, timeout)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request('PATCH', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+    async def close(self):
+        await self.client.aclose()
@@ -1,6 +1,17 @@
 import asyncio
 import collections
+import hashlib
+import mmap
+import os
+import struct
+import weakref
 from time import time
+from ccxt.base.private_directory import private_directory
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 
 class Throttler:
@@ -13,31 +24,77 @@ class Throttler:
             'tokens': 0,
             'maxCapacity': 2000,
             'capacity': 1.0,
+            'adaptiveRatio': 2.0,
+            'maxBackoff': 60000,
         }
         self.config.update(config)
         self.queue = collections.deque()
         self.running = False
+        self.last_timestamp = time() * 1000
+        self.base_refill_rate = self.config['refillRate']
+        self.backoffs = 0
 
     async def looper(self):
-        last_timestamp = time() * 1000
-        while self.running:
-            future, cost = self.queue[0]
-            cost = self.config['cost'] if cost is None else cost
-            if self.config['tokens'] >= 0:
-                self.config['tokens'] -= cost
-                if not future.done():
+        try:
+            while self.running:
+                wait = 0
+                # release every queued request the current budget covers, cancelled requests are dropped without a charge
+                while self.queue:
+                    future, cost = self.queue[0]
+                    if future.done():
+                        self.queue.popleft()
+                        continue
+                    wait = self.acquire(self.config['cost'] if cost is None else cost)
+                    if wait > 0:
+                        break
+                    self.queue.popleft()
                     future.set_result(None)
-                self.queue.popleft()
-                # context switch
-                await asyncio.sleep(0)
                 if len(self.queue) == 0:
-                    self.running = False
-            else:
-                await asyncio.sleep(self.config['delay'])
-                now = time() * 1000
-                elapsed = now - last_timestamp
-                last_timestamp = now
-                self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+                    break
+                # sleep once, until the bucket is back to zero, instead of polling every delay
+                await asyncio.sleep(wait)
+        finally:
+            # a looper cancelled with its event loop leaves the queue to the looper of the next call
+            self.running = False
+
+    def acquire(self, cost):
+        # takes the cost if the bucket is not empty, otherwise returns the seconds until it is
+        self.refill()
+        if self.config['tokens'] >= 0:
+            self.config['tokens'] -= cost
+            return 0
+        return max(-self.config['tokens'] / self.config['refillRate'] / 1000, self.config['delay'])
+
+    def refill(self):
+        now = time() * 1000
+        elapsed = now - self.last_timestamp
+        self.last_timestamp = now
+        self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+
+    def sync(self, used, limit, window, reset=None, adaptive=False):
+        # the exchange reports `used` out of `limit` for a window of `window` ms that ends in `reset` ms
+        # the bucket is calibrated to that limit, so what is left is spread over the rest of the window
+        # windows without a reset time are assumed to be aligned to the clock, like binance minutes
+        if reset is None:
+            reset = window - (time() * 1000) % window
+        self.refill()
+        remaining = (limit - used) / limit * window * self.base_refill_rate
+        if adaptive and reset > 0:
+            # pace the rest of the window at the rate the exchange still allows, within adaptiveRatio of the configured rate
+            ratio = self.config['adaptiveRatio']
+            self.config['refillRate'] = min(max(remaining / reset, self.base_refill_rate / ratio), self.base_refill_rate * ratio)
+        self.config['tokens'] = min(self.config['tokens'], remaining - reset * self.config['refillRate'])
+
+    def backoff(self, delay):
+        # empties the bucket for `delay` ms, doubled for every consecutive call until reset_backoff()
+        self.refill()
+        wait = min(delay * 2 ** self.backoffs, self.config['maxBackoff'])
+        self.backoffs += 1
+        self.config['tokens'] = min(self.config['tokens'], -wait * self.config['refillRate'])
+        return wait
+
+    def reset_backoff(self):
+        self.backoffs = 0
 
     def __call__(self, cost=None):
         future = asyncio.Future()
@@ -48,3 +105,82 @@ class Throttler:
             self.running = True
             asyncio.ensure_future(self.looper(), loop=self.loop)
         return future
+
+
+# event loop -> {key: Throttler}
+shared_throttlers = weakref.WeakKeyDictionary()
+
+
+def shared_throttler(key, config, loop=None):
+    # one bucket for every exchange instance of this process that uses the same key on the same event loop
+    # a bucket releases its requests with futures of the loop it runs on, so every loop has buckets of its own
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    throttlers = shared_throttlers.setdefault(loop, {})
+    if key not in throttlers:
+        throttlers[key] = Throttler(config, loop)
+    return throttlers[key]
+
+
+class ProcessThrottler(Throttler):
+    # bucket state (tokens, last refill timestamp) lives in a small memory-mapped file
+    # every process that opens the same key shares it, updates are serialized with flock
+    # queued requests are still released by the looper of each process
+    # the file is opened on the first request and released by close(), a closed throttler reopens it when used again
+    state = struct.Struct('dd')
+
+    def __init__(self, config, loop=None, key='ccxt', directory=None):
+        if fcntl is None:
+            raise RuntimeError('ProcessThrottler requires fcntl, it is not available on this platform')
+        super(ProcessThrottler, self).__init__(config, loop)
+        self.name = 'ccxt-throttler-' + hashlib.sha1(key.encode()).hexdigest()[:16]
+        self.directory = directory
+        self.path = None
+        self.fd = None
+        self.memory = None
+
+    def open(self):
+        # the state file is kept in a directory private to the current user, see private_directory
+        self.path = os.path.join(self.directory or private_directory('throttler'), self.name)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size < self.state.size:
+                    os.ftruncate(fd, self.state.size)
+                    os.pwrite(fd, self.state.pack(self.config['tokens'], self.last_timestamp), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            self.memory = mmap.mmap(fd, self.state.size)
+        except BaseException:
+            os.close(fd)
+            raise
+        self.fd = fd
+
+    def locked(self, method, *args):
+        if self.fd is None:
+            self.open()
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            self.config['tokens'], self.last_timestamp = self.state.unpack_from(self.memory)
+            result = method(*args)
+            self.state.pack_into(self.memory, 0, self.config['tokens'], self.last_timestamp)
+            return result
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def acquire(self, cost):
+        return self.locked(super(ProcessThrottler, self).acquire, cost)
+
+    def sync(self, used, limit, window, reset=None, adaptive=False):
+        return self.locked(super(ProcessThrottler, self).sync, used, limit, window, reset, adaptive)
+
+    def backoff(self, delay):
+        return self.locked(super(ProcessThrottler, self).backoff, delay)
+
+    def close(self):
+        if self.fd is not None:
+            self.memory.close()
+            os.close(self.fd)
+            self.memory = None
+            self.fd = None
@@ -6,15 +6,32 @@ try:
 except ImportError:
     pass
 
+simdjson = None
+try:
+    import simdjson as simdjson
+except ImportError:
+    pass
+
 import json
 from asyncio import sleep, ensure_future
 from aiohttp import WSMsgType
-from .functions import milliseconds, iso8601, is_json_encoded_object
+from .functions import milliseconds, iso8601, is_json_encoded_object, is_json_encoded_bytes
 from ccxt.async_support.base.ws.client import Client
-from ccxt.async_support.base.ws.functions import gunzip, inflate
+from ccxt.async_support.base.ws.functions import gunzip_bytes, inflate
 from ccxt import NetworkError, RequestTimeout, ExchangeClosedByUser
 
 
+def json_loads(data):
+    # orjson parses bytes and memoryviews as they are, simdjson and json take bytes
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    if simdjson is not None:
+        return simdjson.loads(data)
+    return json.loads(data)
+
+
 class AiohttpClient(Client):
 
     proxy = None
@@ -29,18 +46,27 @@ class AiohttpClient(Client):
     def handle_text_or_binary_message(self, data):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'message', data)
-        if isinstance(data, bytes):
-            data = data.decode()
-        # decoded = json.loads(data) if is_json_encoded_object(data) else data
-        decode = None
-        if is_json_encoded_object(data):
-            if orjson is None:
-                decode = json.loads(data)
-            else:
-                decode = orjson.loads(data)
-        else:
-            decode = data
-        self.on_message_callback(self, decode)
+        self.on_message_callback(self, self.decode_message(data))
+
+    @staticmethod
+    def decode_message(data):
+        # binary frames go to the json parser without a str copy,
+        # payloads that are not json objects are still handed to the exchange as str, like 'Ping'
+        if isinstance(data, str):
+            return json_loads(data) if is_json_encoded_object(data) else data
+        if is_json_encoded_bytes(data):
+            return json_loads(data)
+        return str(data, 'utf-8')
+
+    def decode_frame(self, message):
+        # decompresses and parses a text or binary frame, it does not touch the event loop
+        data = message.data
+        if message.type == WSMsgType.BINARY:
+            if self.gunzip:
+                data = gunzip_bytes(data)
+            elif self.inflate:
+                data = inflate(data)
+        return self.decode_message(data)
 
     def handle_message(self, message):
         # self.log(iso8601(milliseconds()), message)
@@ -49,7 +75,7 @@ class AiohttpClient(Client):
         elif message.type == WSMsgType.BINARY:
             data = message.data
             if self.gunzip:
-                data = gunzip(data)
+                data = gunzip_bytes(data)
             elif self.inflate:
                 data = inflate(data)
             self.handle_text_or_binary_message(data)
@@ -1,4 +1,10 @@
 import collections
+from itertools import islice
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class Delegate:
@@ -11,6 +17,163 @@ class Delegate:
         return getattr(deque, self.name)
 
 
+class KeyedDeque:
+    # deque interface over an insertion-ordered hashmap
+    # an entry can be found and moved to the end by its key in O(1)
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self._items = collections.OrderedDict()
+
+    def push(self, key, item):
+        # appends the item, an existing entry with the same key is moved to the end
+        self._items.pop(key, None)
+        self._items[key] = item
+
+    def popleft(self):
+        return self._items.popitem(last=False)[1]
+
+    def pop(self):
+        return self._items.popitem()[1]
+
+    def clear(self):
+        self._items.clear()
+
+    def _key_at(self, index):
+        length = len(self._items)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError('deque index out of range')
+        # walk from the nearest end
+        if index < length // 2:
+            return next(islice(self._items, index, None))
+        return next(islice(reversed(self._items), length - 1 - index, None))
+
+    def __getitem__(self, index):
+        return self._items[self._key_at(index)]
+
+    def __setitem__(self, index, item):
+        self._items[self._key_at(index)] = item
+
+    def __delitem__(self, index):
+        del self._items[self._key_at(index)]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __reversed__(self):
+        return reversed(self._items.values())
+
+    def __contains__(self, item):
+        return item in self._items.values()
+
+
+class OHLCVColumns:
+    # deque interface over a float64 column block (timestamp, open, high, low, close, volume)
+    # rows are written at the end of a buffer twice the capacity, once the end is reached
+    # the live window is moved back to the start, so it is always one contiguous slice
+    width = 6
+
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self._capacity = maxlen if maxlen is not None else 1024
+        self._buffer = numpy.empty((self.width, self._capacity * 2))
+        self._start = 0
+        self._end = 0
+        # absolute position of buffer column 0, row positions survive compaction
+        self._offset = 0
+
+    def view(self):
+        return self._buffer[:, self._start:self._end]
+
+    def position(self, index):
+        return self._start + index + self._offset
+
+    def write(self, position, item):
+        column = position - self._offset
+        for i in range(min(len(item), self.width)):
+            value = item[i]
+            self._buffer[i, column] = numpy.nan if value is None else value
+
+    def append(self, item):
+        if self._end == self._buffer.shape[1]:
+            self._compact()
+        self._buffer[:, self._end] = numpy.nan
+        self._end += 1
+        position = self._end - 1 + self._offset
+        self.write(position, item)
+        return position
+
+    def _compact(self):
+        length = self._end - self._start
+        if self.maxlen is None and length * 2 > self._buffer.shape[1] // 2:
+            # unbounded caches grow instead of sliding
+            self._capacity *= 2
+            buffer = numpy.empty((self.width, self._capacity * 2))
+        else:
+            buffer = self._buffer
+        buffer[:, :length] = self._buffer[:, self._start:self._end]
+        self._buffer = buffer
+        self._offset += self._start
+        self._start = 0
+        self._end = length
+
+    def _row(self, column):
+        # a new list on every access, None is stored as nan
+        row = [None if value != value else value for value in self._buffer[:, column].tolist()]
+        if row[0] is not None:
+            row[0] = int(row[0])
+        return row
+
+    def popleft(self):
+        if self._start == self._end:
+            raise IndexError('pop from an empty deque')
+        self._start += 1
+        return self._row(self._start - 1)
+
+    def pop(self):
+        if self._start == self._end:
+            raise IndexError('pop from an empty deque')
+        self._end -= 1
+        return self._row(self._end)
+
+    def clear(self):
+        self._offset += self._end
+        self._start = 0
+        self._end = 0
+
+    def __getitem__(self, index):
+        length = self._end - self._start
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError('deque index out of range')
+        return self._row(self._start + index)
+
+    def __setitem__(self, index, item):
+        self.write(self.position(index if index >= 0 else index + len(self)), item)
+
+    def __delitem__(self, index):
+        raise TypeError('candles can only be removed from the ends')
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __iter__(self):
+        for column in range(self._start, self._end):
+            yield self._row(column)
+
+    def __reversed__(self):
+        for column in range(self._end - 1, self._start - 1, -1):
+            yield self._row(column)
+
+    def __contains__(self, item):
+        return item in list(self)
+
+
 class BaseCache(list):
     # implicitly called magic methods don't invoke __getattribute__
     # https://docs.python.org/3/reference/datamodel.html#special-method-lookup
@@ -40,11 +203,10 @@ class BaseCache(list):
         return list(self) + other
 
     def __getitem__(self, item):
-        # deque doesn't support slicing
+        # deque doesn't support slicing, positional access is O(n) in the middle anyway
         deque = super(list, self).__getattribute__('_deque')
         if isinstance(item, slice):
-            start, stop, step = item.indices(len(deque))
-            return [deque[i] for i in range(start, stop, step)]
+            return list(deque)[item]
         else:
             return deque[item]
 
@@ -129,12 +291,82 @@ class ArrayCacheByTimestamp(BaseCache):
         self._new_updates = len(self._size_tracker)
 
 
+class ArrayCacheByTimestampColumnar(BaseCache):
+    # same semantics as ArrayCacheByTimestamp, but candles live in numpy columns
+    # iteration and indexing still produce [timestamp, open, high, low, close, volume] lists
+    # unlike ArrayCacheByTimestamp those lists are copies built on access, so the same candle
+    # read twice is two different lists and changing a returned list does not change the cache
+    # the column properties are views, valid until the next candle is appended
+    def __init__(self, max_size=None):
+        if numpy is None:
+            raise ImportError('ArrayCacheByTimestampColumnar requires numpy')
+        super(ArrayCacheByTimestampColumnar, self).__init__(max_size)
+        self.hashmap = {}
+        self._deque = OHLCVColumns(max_size)
+        self._size_tracker = set()
+        self._new_updates = 0
+        self._clear_updates = False
+
+    def getLimit(self, symbol, limit):
+        self._clear_updates = True
+        if limit is None:
+            return self._new_updates
+        return min(self._new_updates, limit)
+
+    def append(self, item):
+        timestamp = item[0]
+        if timestamp in self.hashmap:
+            # the open candle is updated in place
+            self._deque.write(self.hashmap[timestamp], item)
+        else:
+            if len(self._deque) == self._deque.maxlen:
+                del self.hashmap[self._deque.popleft()[0]]
+            self.hashmap[timestamp] = self._deque.append(item)
+        if self._clear_updates:
+            self._clear_updates = False
+            self._size_tracker.clear()
+        self._size_tracker.add(timestamp)
+        self._new_updates = len(self._size_tracker)
+
+    def clear(self):
+        self._deque.clear()
+        self.hashmap.clear()
+
+    @property
+    def columns(self):
+        return self._deque.view()
+
+    @property
+    def timestamps(self):
+        return self._deque.view()[0]
+
+    @property
+    def opens(self):
+        return self._deque.view()[1]
+
+    @property
+    def highs(self):
+        return self._deque.view()[2]
+
+    @property
+    def lows(self):
+        return self._deque.view()[3]
+
+    @property
+    def closes(self):
+        return self._deque.view()[4]
+
+    @property
+    def volumes(self):
+        return self._deque.view()[5]
+
+
 class ArrayCacheBySymbolById(ArrayCache):
     def __init__(self, max_size=None):
         super(ArrayCacheBySymbolById, self).__init__(max_size)
         self._nested_new_updates_by_symbol = True
         self.hashmap = {}
-        self._index = collections.deque([], max_size)
+        self._deque = KeyedDeque(max_size)
 
     def append(self, item):
         by_id = self.hashmap.setdefault(item['symbol'], {})
@@ -143,17 +375,13 @@ class ArrayCacheBySymbolById(ArrayCache):
             if reference != item:
                 reference.update(item)
             item = reference
-            index = self._index.index(item['id'])
-            del self._deque[index]
-            del self._index[index]
+            self._deque.push((item['symbol'], item['id']), item)
         else:
             by_id[item['id']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
-            del self.hashmap[delete_item['symbol']][delete_item['id']]
-        self._deque.append(item)
-        self._index.append(item['id'])
+            if len(self._deque) == self._deque.maxlen:
+                delete_item = self._deque.popleft()
+                del self.hashmap[delete_item['symbol']][delete_item['id']]
+            self._deque.push((item['symbol'], item['id']), item)
         if self._clear_all_updates:
             self._clear_all_updates = False
             self._clear_updates_by_symbol.clear()
@@ -176,7 +404,7 @@ class ArrayCacheBySymbolBySide(ArrayCache):
         super(ArrayCacheBySymbolBySide, self).__init__(max_size)
         self._nested_new_updates_by_symbol = True
         self.hashmap = {}
-        self._index = collections.deque([], max_size)
+        self._deque = KeyedDeque(max_size)
 
     def append(self, item):
         by_side = self.hashmap.setdefault(item['symbol'], {})
@@ -185,17 +413,13 @@ class ArrayCacheBySymbolBySide(ArrayCache):
             if reference != item:
                 reference.update(item)
             item = reference
-            index = self._index.index(item['symbol'] + item['side'])
-            del self._deque[index]
-            del self._index[index]
+            self._deque.push((item['symbol'], item['side']), item)
         else:
             by_side[item['side']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
-            del self.hashmap[delete_item['symbol']][delete_item['side']]
-        self._deque.append(item)
-        self._index.append(item['symbol'] + item['side'])
+            if len(self._deque) == self._deque.maxlen:
+                delete_item = self._deque.popleft()
+                del self.hashmap[delete_item['symbol']][delete_item['side']]
+            self._deque.push((item['symbol'], item['side']), item)
         if self._clear_all_updates:
             self._clear_all_updates = False
             self._clear_updates_by_symbol.clear()
@@ -4,7 +4,7 @@ from asyncio import sleep, ensure_future, wait_for, TimeoutError
 from .functions import milliseconds, iso8601, deep_extend
 from ccxt import NetworkError, RequestTimeout, NotSupported
 from ccxt.async_support.base.ws.future import Future
-from collections import deque
+from ccxt.async_support.base.ws.message_queue import MessageQueue
 
 class Client(object):
 
@@ -16,6 +16,14 @@ class Client(object):
     rejections = {}
     message_queue = {}
     useMessageQueue = False
+    messageQueuePolicy = 'drop'  # see MessageQueue
+    messageQueueSize = 10
+    # policies by message hash or by the part of it before the first ':', like {'orderbook': 'conflate'}
+    # a policy is a string or {'policy': 'block', 'maxSize': 100}, the matching hashes are queued even without useMessageQueue
+    messageQueuePolicies = {}
+    blocked = None  # message hashes and update streams whose full queues keep the socket from being read
+    update_streams = {}  # message hash: the UpdateStreams its resolved values are pushed to
+    reading_paused = False
     on_message_callback = None
     on_error_callback = None
     on_close_callback = None
@@ -47,6 +55,8 @@ class Client(object):
             'futures': {},
             'subscriptions': {},
             'rejections': {},
+            'message_queue': {},
+            'update_streams': {},
             'on_message_callback': on_message_callback,
             'on_error_callback': on_error_callback,
             'on_close_callback': on_close_callback,
@@ -62,6 +72,7 @@ class Client(object):
                 setattr(self, key, settings[key])
         # connection-related Future
         self.connected = Future()
+        self.blocked = set()
 
     def future(self, message_hash):
         if message_hash not in self.futures or self.futures[message_hash].cancelled():
@@ -70,37 +81,87 @@ class Client(object):
         if message_hash in self.rejections:
             future.reject(self.rejections[message_hash])
             del self.rejections[message_hash]
-            del self.message_queue[message_hash]
+            self.message_queue.pop(message_hash, None)
+            self.unblock(message_hash)
             return future
-        if self.useMessageQueue and message_hash in self.message_queue:
+        if message_hash in self.message_queue:
             queue = self.message_queue[message_hash]
             if len(queue):
                 future.resolve(queue.popleft())
                 del self.futures[message_hash]
+                if (message_hash in self.blocked) and queue.drained():
+                    self.unblock(message_hash)
         return future
 
     def resolve(self, result, message_hash):
         if self.verbose and message_hash is None:
             self.log(iso8601(milliseconds()), 'resolve received None messageHash')
 
-        if self.useMessageQueue:
-            if message_hash not in self.message_queue:
-                self.message_queue[message_hash] = deque(maxlen=10)
-            queue = self.message_queue[message_hash]
+        queue = self.message_queue.get(message_hash)
+        if (queue is None) and (self.useMessageQueue or self.messageQueuePolicies):
+            queue = self.create_message_queue(message_hash)
+        if queue is not None:
             queue.append(result)
             if message_hash in self.futures:
                 future = self.futures[message_hash]
                 future.resolve(queue.popleft())
                 del self.futures[message_hash]
+            elif queue.full():
+                self.block(message_hash)
         else:
             if message_hash in self.futures:
                 future = self.futures[message_hash]
                 future.resolve(result)
                 del self.futures[message_hash]
+        streams = self.update_streams.get(message_hash)
+        if streams is not None:
+            for stream in streams:
+                stream.push(self, result)
         return result
 
+    def create_message_queue(self, message_hash):
+        policy = self.messageQueuePolicies.get(message_hash)
+        if (policy is None) and isinstance(message_hash, str):
+            policy = self.messageQueuePolicies.get(message_hash.split(':', 1)[0])
+        if policy is None:
+            if not self.useMessageQueue:
+                return None
+            policy = self.messageQueuePolicy
+        if isinstance(policy, dict):
+            queue = MessageQueue(policy.get('policy', self.messageQueuePolicy), policy.get('maxSize', self.messageQueueSize))
+        else:
+            queue = MessageQueue(policy, self.messageQueueSize)
+        self.message_queue[message_hash] = queue
+        return queue
+
+    def block(self, message_hash):
+        self.blocked.add(message_hash)
+        if not self.reading_paused:
+            self.reading_paused = True
+            if self.verbose:
+                self.log(iso8601(milliseconds()), 'pause reading', message_hash)
+            self.pause_reading()
+
+    def unblock(self, message_hash):
+        self.blocked.discard(message_hash)
+        if self.reading_paused and not self.blocked:
+            self.reading_paused = False
+            if self.verbose:
+                self.log(iso8601(milliseconds()), 'resume reading', message_hash)
+            self.resume_reading()
+
+    def message_queue_stats(self):
+        # queue depth, drops and consumer lag per message hash, and the frames received but not handled yet
+        return {
+            'readingPaused': self.reading_paused,
+            'pendingFrames': self.pending_frames(),
+            'queues': dict((message_hash, queue.stats()) for message_hash, queue in self.message_queue.items()),
+        }
+
     def reject(self, result, message_hash=None):
         if message_hash:
+            for stream in self.update_streams.get(message_hash, []):
+                stream.fail(result)
             if message_hash in self.futures:
                 future = self.futures[message_hash]
                 future.reject(result)
@@ -111,6 +172,9 @@ class Client(object):
             message_hashes = list(self.futures.keys())
             for message_hash in message_hashes:
                 self.reject(result, message_hash)
+            for streams in self.update_streams.values():
+                for stream in streams:
+                    stream.fail(result)
         return result
 
     async def receive_loop(self):
@@ -186,6 +250,8 @@ class Client(object):
 
     def reset(self, error):
         self.message_queue = {}
+        self.blocked = set()
+        self.reading_paused = False
         self.reject(error)
 
     async def ping_loop(self):
@@ -198,6 +264,15 @@ class Client(object):
     def handle_message(self, message):
         raise NotSupported('handle_message() not implemented')
 
+    def pause_reading(self):
+        pass
+
+    def resume_reading(self):
+        pass
+
+    def pending_frames(self):
+        return 0
+
     def closed(self):
         raise NotSupported('closed() not implemented')
 
@@ -3,12 +3,17 @@
 import asyncio
 import socket
 import collections
+from concurrent.futures import ThreadPoolExecutor
+from aiohttp import WSMsgType
 from ccxt.async_support.base.ws.aiohttp_client import AiohttpClient
+from ccxt.async_support.base.ws.functions import milliseconds, iso8601
 from ccxt.base.errors import NetworkError
 
 
 class FastClient(AiohttpClient):
     transport = None
+    decodeWorkers = 0  # threads that decompress and parse frames off the event loop, 0 decodes on the loop
+    decoder = None
 
     def __init__(self, url, on_message_callback, on_error_callback, on_close_callback, on_connected_callback, config={}):
         super(FastClient, self).__init__(url, on_message_callback, on_error_callback, on_close_callback, on_connected_callback, config)
@@ -16,6 +21,8 @@ class FastClient(AiohttpClient):
         # https://github.com/aio-libs/aiohttp/blob/1d296d549050aa335ef542421b8b7dad788246d5/aiohttp/streams.py#L534
         self.stack = collections.deque()
         self.callback_scheduled = False
+        # frames handed to the decoder, dispatched from the left in the order they were received
+        self.decoding = collections.deque()
 
     def receive_loop(self):
         def handler():
@@ -82,6 +89,8 @@ class FastClient(AiohttpClient):
         new_size = max(current_size, 2097152)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, new_size)
 
+        if self.decodeWorkers:
+            self.decoder = ThreadPoolExecutor(max_workers=self.decodeWorkers, thread_name_prefix='ccxt-decode')
         ws_reader = connection.protocol._payload_parser
         ws_reader.parse_frame = wrapper(ws_reader.parse_frame)
         ws_reader.queue.feed_data = feed_data
@@ -90,8 +99,61 @@ class FastClient(AiohttpClient):
         # return a future so super class won't complain
         return asyncio.sleep(0)
 
+    def handle_message(self, message):
+        if self.decoder is None:
+            return super(FastClient, self).handle_message(message)
+        if (message.type == WSMsgType.TEXT) or (message.type == WSMsgType.BINARY):
+            decoding = self.decoder.submit(self.decode_frame, message)
+            self.decoding.append((message, decoding))
+            decoding.add_done_callback(self.on_decoded)
+        elif self.decoding:
+            # pings and closes wait for the frames received before them
+            self.decoding.append((message, None))
+        else:
+            super(FastClient, self).handle_message(message)
+
+    def on_decoded(self, decoding):
+        # runs in a decoder thread
+        try:
+            self.asyncio_loop.call_soon_threadsafe(self.dispatch_decoded)
+        except RuntimeError:
+            pass  # the event loop is closed
+
+    def dispatch_decoded(self):
+        # frames decoded out of order wait for the ones received before them
+        while self.decoding:
+            message, decoding = self.decoding[0]
+            if (decoding is not None) and not decoding.done():
+                return
+            self.decoding.popleft()
+            try:
+                if decoding is None:
+                    super(FastClient, self).handle_message(message)
+                else:
+                    if self.verbose:
+                        self.log(iso8601(milliseconds()), 'message', message.data)
+                    self.on_message_callback(self, decoding.result())
+            except Exception as error:
+                self.reject(error)
+
+    def pause_reading(self):
+        # the kernel buffer fills up and the tcp window closes, the exchange stops sending instead of self.stack growing
+        if self.transport and not self.transport.is_closing():
+            self.transport.pause_reading()
+
+    def resume_reading(self):
+        if self.transport and not self.transport.is_closing():
+            self.transport.resume_reading()
+
+    def pending_frames(self):
+        return len(self.stack) + len(self.decoding)
+
     def reset(self, error):
         super(FastClient, self).reset(error)
         self.stack.clear()
+        self.decoding.clear()
+        if self.decoder:
+            self.decoder.shutdown(wait=False)
+            self.decoder = None
         if self.transport:
             self.transport.abort()
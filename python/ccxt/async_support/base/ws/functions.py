@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from zlib import decompress, MAX_WBITS
+from zlib import decompress, decompressobj, MAX_WBITS
 from base64 import b64decode
-from gzip import GzipFile
-from io import BytesIO
 import time
 import datetime
 
@@ -16,8 +14,18 @@ def inflate64(data):
     return inflate(b64decode(data))
 
 
+def gunzip_bytes(data):
+    # decompresses straight to bytes, concatenated members are read one after another like GzipFile reads them
+    result = b''
+    while data:
+        decompressor = decompressobj(16 + MAX_WBITS)
+        result += decompressor.decompress(data)
+        data = decompressor.unused_data
+    return result
+
+
 def gunzip(data):
-    return GzipFile('', 'rb', 9, BytesIO(data)).read().decode('utf-8')
+    return gunzip_bytes(data).decode('utf-8')
 
 
 #  Tmp : added methods below to avoid circular imports between exchange.py and aiohttp.py
@@ -46,6 +54,11 @@ def is_json_encoded_object(input):
             ((input[0] == '{') or (input[0] == '[')))
 
 
+def is_json_encoded_bytes(input):
+    # same check as is_json_encoded_object for bytes, bytearray and memoryview frames, 123 and 91 are { and [
+    return (len(input) >= 2) and ((input[0] == 123) or (input[0] == 91))
+
+
 def deep_extend(*args):
     result = None
     for arg in args:
@@ -26,21 +26,36 @@ class Future(asyncio.Future):
 
     @classmethod
     def race(cls, futures):
+        # done callbacks on the futures instead of an asyncio.wait task,
+        # the outcome is settled one loop iteration after the first future is done,
+        # so futures that are done together, like the ones a closing client rejects, are settled together
         future = Future()
-        for f in futures:
-            f.is_race_future = True
-        coro = asyncio.wait(futures, return_when=asyncio.FIRST_COMPLETED)
-        task = asyncio.create_task(coro)
+        if not futures:
+            future.reject(ValueError('Set of Tasks/Futures is empty.'))
+            return future
+        scheduled = []
+
+        def detach(_=None):
+            for f in futures:
+                f.remove_done_callback(on_done)
+
+        def on_done(_):
+            if not scheduled:
+                scheduled.append(True)
+                future.get_loop().call_soon(settle)
 
-        def callback(done):
+        def settle():
+            if future.done():
+                return
+            complete = [f for f in futures if f.done()]
+            pending = len(complete) < len(futures)
             try:
-                complete, pending = done.result()
                 # check for exceptions
                 for i, f in enumerate(complete):
                     try:
                         f.result()
                     except ExchangeClosedByUser as e:
-                        if len(pending) == 0 and i == len(complete) - 1:
+                        if not pending and i == len(complete) - 1:
                             future.reject(e)
                         # wait for all the sub promises to be reject before rejecting future
                         continue
@@ -49,15 +64,17 @@ class Future(asyncio.Future):
                     except Exception as e:
                         future.reject(e)
                         return
-                # no exceptions return first result
-                futures_list = list(complete)
 
-                are_all_canceled = all([f.cancelled() for f in futures_list])
+                are_all_canceled = all([f.cancelled() for f in complete])
+                if pending and not are_all_canceled and all([f.cancelled() or isinstance(f.exception(), ExchangeClosedByUser) for f in complete]):
+                    # only futures closed by the user are done so far, settle again when the next one is done
+                    scheduled.clear()
+                    return
                 if are_all_canceled:
                     future.reject(ExchangeClosedByUser('Connection closed by the user'))
                     return
 
-                first = futures_list[0]
+                first = complete[0]
 
                 first_result = first.result()
                 future.resolve(first_result)
@@ -65,5 +82,9 @@ class Future(asyncio.Future):
                 future.reject(e)
             except Exception as e:
                 future.reject(e)
-        task.add_done_callback(callback)
+
+        for f in futures:
+            f.is_race_future = True
+            f.add_done_callback(on_done)
+        future.add_done_callback(detach)
         return future
@@ -0,0 +1,71 @@
+import collections
+from .functions import milliseconds
+
+
+class MessageQueue:
+    # messages resolved for a message hash while no future was waiting for them
+    #   drop      keeps the latest max_size messages and counts the older ones it drops
+    #   conflate  keeps only the latest message, for order books and tickers where a newer state supersedes the older ones
+    #   block     keeps every message, the client stops reading from the socket while max_size or more are queued
+    policies = ('drop', 'conflate', 'block')
+
+    def __init__(self, policy='drop', max_size=10):
+        if policy not in self.policies:
+            raise ValueError('unknown message queue policy ' + str(policy))
+        self.policy = policy
+        self.max_size = max_size
+        self.messages = collections.deque()
+        self.timestamps = collections.deque()
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.high_water = 0
+
+    def __len__(self):
+        return len(self.messages)
+
+    def append(self, message):
+        self.received += 1
+        if self.policy == 'conflate':
+            self.conflated += len(self.messages)
+            self.messages.clear()
+            self.timestamps.clear()
+        elif self.policy == 'drop':
+            while len(self.messages) >= self.max_size:
+                self.messages.popleft()
+                self.timestamps.popleft()
+                self.dropped += 1
+        self.messages.append(message)
+        self.timestamps.append(milliseconds())
+        if len(self.messages) > self.high_water:
+            self.high_water = len(self.messages)
+
+    def popleft(self):
+        self.timestamps.popleft()
+        self.delivered += 1
+        return self.messages.popleft()
+
+    def full(self):
+        return (self.policy == 'block') and (len(self.messages) >= self.max_size)
+
+    def drained(self):
+        # a blocked queue lets the socket be read again once it is half empty
+        return len(self.messages) <= self.max_size // 2
+
+    def lag(self):
+        # how long the oldest queued message has been waiting for its consumer, in ms
+        return milliseconds() - self.timestamps[0] if self.timestamps else 0
+
+    def stats(self):
+        return {
+            'policy': self.policy,
+            'maxSize': self.max_size,
+            'depth': len(self.messages),
+            'highWater': self.high_water,
+            'received': self.received,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'conflated': self.conflated,
+            'lag': self.lag(),
+        }
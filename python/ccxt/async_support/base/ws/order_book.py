@@ -33,11 +33,9 @@ class OrderBook(dict):
         return self
 
     def reset(self, snapshot={}):
-        self['asks']._index.clear()
         self['asks'].clear()
         for ask in snapshot.get('asks', []):
             self['asks'].storeArray(ask)
-        self['bids']._index.clear()
         self['bids'].clear()
         for bid in snapshot.get('bids', []):
             self['bids'].storeArray(bid)
@@ -46,6 +44,20 @@ class OrderBook(dict):
         self['datetime'] = Exchange.iso8601(self['timestamp'])
         self['symbol'] = snapshot.get('symbol')
 
+    def applyDeltas(self, asks, bids, nonce=None, timestamp=None):
+        return self.apply_deltas(asks, bids, nonce, timestamp)
+
+    def apply_deltas(self, asks, bids, nonce=None, timestamp=None):
+        # merges the raw [price, size] deltas of a whole message into both sides
+        self['asks'].store_deltas(asks)
+        self['bids'].store_deltas(bids)
+        if nonce is not None:
+            self['nonce'] = nonce
+        if timestamp is not None:
+            self['timestamp'] = timestamp
+            self['datetime'] = Exchange.iso8601(timestamp)
+        return self
+
     def update(self, snapshot):
         nonce = snapshot.get('nonce')
         if nonce is not None and self['nonce'] is not None and nonce < self['nonce']:
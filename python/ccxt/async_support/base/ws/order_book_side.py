@@ -2,6 +2,7 @@
 
 import sys
 import bisect
+from operator import itemgetter
 
 """Author: Carlo Revelli"""
 """Fast bisect bindings"""
@@ -9,15 +10,36 @@ import bisect
 """Performs a binary search when inserting keys in sorted order"""
 
 
+def safe_float(delta, index):
+    # Exchange.safe_float for a raw delta, a missing, empty or invalid value is None and removes the level
+    if len(delta) > index:
+        value = delta[index]
+        if value is not None and value != '':
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                pass
+    return None
+
+
+def safe_integer(delta, index):
+    value = safe_float(delta, index)
+    return None if value is None else int(value)
+
+
 class OrderBookSide(list):
     side = None  # set to True for bids and False for asks
+    _bulk_threshold = 16  # store_many inserts this many new levels with one sort instead of bisecting each
 
     def __init__(self, deltas=[], depth=None):
         super(OrderBookSide, self).__init__()
         self._depth = depth or sys.maxsize
         self._n = sys.maxsize
-        # parallel to self
+        # parallel to self, the sorted index keys of the levels
+        # the side itself is updated on every call, json encoders and other C readers of the list storage see every level
         self._index = []
+        # price -> stored level, updates of existing levels skip the bisect entirely
+        self._levels = {}
         for delta in deltas:
             self.storeArray(list(delta))
 
@@ -25,31 +47,105 @@ class OrderBookSide(list):
         return self.storeArray(delta)
 
     def storeArray(self, delta):
+        # size updates of known levels are O(1), new and removed levels are O(log n) plus a shift of the list
         price = delta[0]
         size = delta[1]
-        index_price = -price if self.side else price
-        index = bisect.bisect_left(self._index, index_price)
+        levels = self._levels
+        level = levels.get(price)
         if size:
-            if index < len(self._index) and self._index[index] == index_price:
-                self[index][1] = size
-            else:
-                self._index.insert(index, index_price)
-                self.insert(index, delta)
-        elif index < len(self._index) and self._index[index] == index_price:
+            if level is not None:
+                level[1] = size
+                return
+            key = -price if self.side else price
+            index = bisect.bisect_left(self._index, key)
+            self._index.insert(index, key)
+            list.insert(self, index, delta)
+            levels[price] = delta
+        elif level is not None:
+            index = bisect.bisect_left(self._index, -price if self.side else price)
             del self._index[index]
-            del self[index]
+            list.__delitem__(self, index)
+            del levels[price]
 
     def store(self, price, size):
         self.storeArray([price, size])
 
+    def store_many(self, prices, sizes):
+        # applies a whole batch with the same result as storing the levels one by one
+        levels = self._levels
+        additions = {}
+        removals = set()
+        for price, size in zip(prices, sizes):
+            if price in additions:
+                additions[price] = size
+                continue
+            level = levels.get(price)
+            if level is None:
+                additions[price] = size
+            elif size:
+                level[1] = size
+                if removals:
+                    removals.discard(price)
+            else:
+                removals.add(price)
+        for price in removals:
+            self._delete_level(price)
+        inserts = [[price, size] for price, size in additions.items() if size]
+        if len(inserts) < self._bulk_threshold:
+            for delta in inserts:
+                self._insert_level(delta[0], delta)
+            return
+        # append the new levels and let one sort merge them with the sorted runs
+        side = self.side
+        keys = self._index
+        deltas = list.copy(self)
+        for delta in inserts:
+            price = delta[0]
+            levels[price] = delta
+            keys.append(-price if side else price)
+            deltas.append(delta)
+        keys.sort()
+        deltas.sort(key=itemgetter(0), reverse=bool(side))
+        list.__setitem__(self, slice(None), deltas)
+
+    def storeDeltas(self, deltas):
+        return self.store_deltas(deltas)
+
+    def store_deltas(self, deltas):
+        # raw [price, size, ...] deltas as received from the exchange, numeric or string
+        self.store_many([safe_float(delta, 0) for delta in deltas], [safe_float(delta, 1) for delta in deltas])
+
+    def _insert_level(self, price, delta):
+        self._insert(-price if self.side else price, delta)
+        self._levels[price] = delta
+
+    def _delete_level(self, price):
+        self._remove(-price if self.side else price)
+        del self._levels[price]
+
+    def _insert(self, key, delta):
+        index = bisect.bisect_left(self._index, key)
+        self._index.insert(index, key)
+        list.insert(self, index, delta)
+
+    def _remove(self, key):
+        index = bisect.bisect_left(self._index, key)
+        del self._index[index]
+        return list.pop(self, index)
+
     def limit(self):
-        difference = len(self) - self._depth
+        difference = list.__len__(self) - self._depth
         for _ in range(difference):
-            self.remove_index(self.pop())
             self._index.pop()
+            self.remove_index(list.pop(self))
 
     def remove_index(self, order):
-        pass
+        self._levels.pop(order[0], None)
+
+    def clear(self):
+        super(OrderBookSide, self).clear()
+        self._index.clear()
+        self._levels.clear()
 
     def __len__(self):
         length = super(OrderBookSide, self).__len__()
@@ -84,85 +180,80 @@ class CountedOrderBookSide(OrderBookSide):
         price = delta[0]
         size = delta[1]
         count = delta[2]
-        index_price = -price if self.side else price
-        index = bisect.bisect_left(self._index, index_price)
+        level = self._levels.get(price)
         if size and count:
-            if index < len(self._index) and self._index[index] == index_price:
-                self[index][1] = size
-                self[index][2] = count
+            if level is not None:
+                level[1] = size
+                level[2] = count
             else:
-                self._index.insert(index, index_price)
-                self.insert(index, delta)
-        elif index < len(self._index) and self._index[index] == index_price:
-            del self._index[index]
-            del self[index]
+                self._insert_level(price, delta)
+        elif level is not None:
+            self._delete_level(price)
 
     def store(self, price, size, count):
         self.storeArray([price, size, count])
 
+    def store_many(self, prices, sizes, counts):
+        for delta in zip(prices, sizes, counts):
+            self.storeArray(list(delta))
+
+    def store_deltas(self, deltas):
+        # raw [price, size, count] deltas, numeric or string
+        for delta in deltas:
+            self.storeArray([safe_float(delta, 0), safe_float(delta, 1), safe_integer(delta, 2)])
+
 # -----------------------------------------------------------------------------
 # indexed by order ids (3rd value in a bidask delta)
+# _levels maps order ids to their stored levels, the index keys are (price, order id)
 
 
 class IndexedOrderBookSide(OrderBookSide):
     def __init__(self, deltas=[], depth=None):
-        self._hashmap = {}
         super(IndexedOrderBookSide, self).__init__(deltas, depth)
 
     def storeArray(self, delta):
         price = delta[0]
-        if price is not None:
-            index_price = -price if self.side else price
-        else:
-            index_price = None
         size = delta[1]
         order_id = delta[2]
+        level = self._levels.get(order_id)
         if size:
-            if order_id in self._hashmap:
-                old_price = self._hashmap[order_id]
-                index_price = index_price or old_price
+            if level is not None:
+                old_price = level[0]
                 # in case the price is not defined
-                delta[0] = abs(index_price)
-                # matches if price is not defined or if price matches
-                if index_price == old_price:
-                    # just overwrite the old index
-                    index = bisect.bisect_left(self._index, index_price)
-                    while self[index][2] != order_id:
-                        index += 1
-                    self._index[index] = index_price
-                    self[index] = delta
+                price = price or old_price
+                delta[0] = price
+                old_key = (-old_price if self.side else old_price, order_id)
+                if price == old_price:
+                    # just overwrite the old level
+                    list.__setitem__(self, bisect.bisect_left(self._index, old_key), delta)
+                    self._levels[order_id] = delta
                     return
                 else:
                     # remove old price level
-                    old_index = bisect.bisect_left(self._index, old_price)
-                    while self[old_index][2] != order_id:
-                        old_index += 1
-                    del self._index[old_index]
-                    del self[old_index]
+                    self._remove(old_key)
             # insert new price level
-            self._hashmap[order_id] = index_price
-            index = bisect.bisect_left(self._index, index_price)
-            while index < len (self._index) and self._index[index] == index_price and self[index][2] < order_id:
-                index += 1
-            self._index.insert(index, index_price)
-            self.insert(index, delta)
-        elif order_id in self._hashmap:
-            old_price = self._hashmap[order_id]
-            index = bisect.bisect_left(self._index, old_price)
-            while self[index][2] != order_id:
-                index += 1
-            del self._index[index]
-            del self[index]
-            del self._hashmap[order_id]
+            self._insert((-price if self.side else price, order_id), delta)
+            self._levels[order_id] = delta
+        elif level is not None:
+            old_price = level[0]
+            self._remove((-old_price if self.side else old_price, order_id))
+            del self._levels[order_id]
 
     def remove_index(self, order):
-        order_id = order[2]
-        if order_id in self._hashmap:
-            del self._hashmap[order_id]
+        self._levels.pop(order[2], None)
 
     def store(self, price, size, order_id):
         self.storeArray([price, size, order_id])
 
+    def store_many(self, prices, sizes, order_ids):
+        for delta in zip(prices, sizes, order_ids):
+            self.storeArray(list(delta))
+
+    def store_deltas(self, deltas):
+        # raw [price, size, order_id] deltas, the price can be None for a known order id
+        for delta in deltas:
+            self.storeArray([safe_float(delta, 0), safe_float(delta, 1), delta[2]])
+
 # -----------------------------------------------------------------------------
 # a more elegant syntax is possible here, but native inheritance is portable
 
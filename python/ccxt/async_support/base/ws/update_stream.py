@@ -0,0 +1,83 @@
+import asyncio
+import contextvars
+
+# the stream that watch() and watch_multiple() attach their client and message hashes to, set by Exchange.stream_updates
+current_update_stream = contextvars.ContextVar('current_update_stream', default=None)
+
+
+class UpdateStream:
+    # async iterator over the values clients resolve for a set of message hashes
+    # client.resolve pushes the values into a MessageQueue, no future is created while values are queued
+    # a value that is the same object as the last queued one is not queued again,
+    # caches and order books are updated in place so the queued reference already holds the newer updates
+
+    def __init__(self, queue):
+        self.queue = queue
+        # the task that runs the watch_* method, created with the stream by Exchange.stream_updates
+        self.task = asyncio.current_task()
+        self.clients = {}  # client: message hashes
+        self.waiter = None
+        self.error = None
+        self.coalesced = 0
+
+    def attach(self, client, message_hashes):
+        # the last watch call of a watch_* method is its subscription, earlier ones like authentication are dropped
+        # tasks spawned by the method inherit the stream with their context, their watch calls are not the subscription
+        if asyncio.current_task() is not self.task:
+            return
+        self.detach()
+        self.clients[client] = list(message_hashes)
+        for message_hash in message_hashes:
+            client.update_streams.setdefault(message_hash, []).append(self)
+
+    def detach(self):
+        for client, message_hashes in self.clients.items():
+            for message_hash in message_hashes:
+                streams = client.update_streams.get(message_hash)
+                if streams and self in streams:
+                    streams.remove(self)
+                    if not streams:
+                        del client.update_streams[message_hash]
+            client.unblock(self)
+        self.clients = {}
+
+    def push(self, client, value):
+        messages = self.queue.messages
+        if messages and messages[-1] is value:
+            self.coalesced += 1
+            return
+        self.queue.append(value)
+        if self.queue.full():
+            client.block(self)
+        self.wake()
+
+    def fail(self, error):
+        self.error = error
+        self.wake()
+
+    def wake(self):
+        waiter = self.waiter
+        if waiter is not None:
+            self.waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def stats(self):
+        return dict(self.queue.stats(), coalesced=self.coalesced)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        # queued values are delivered before an error is raised
+        while not len(self.queue):
+            if self.error is not None:
+                raise self.error
+            self.waiter = asyncio.get_running_loop().create_future()
+            await self.waiter
+        value = self.queue.popleft()
+        if self.queue.drained():
+            for client in self.clients:
+                if self in client.blocked:
+                    client.unblock(self)
+        return value
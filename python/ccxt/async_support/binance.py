@@ -1287,6 +1287,20 @@ class binance(Exchange, ImplicitAPI):
             # exchange-specific options
             'options': {
                 'sandboxMode': False,
+                'rateLimiter': {
+                    'headers': {
+                        # IP weight used in the current minute, the limits differ by api host
+                        'x-mbx-used-weight-1m': {
+                            'window': 60000,
+                            'limit': {
+                                'api': 6000,
+                                'fapi': 2400,
+                                'dapi': 2400,
+                                'papi': 6000,
+                            },
+                        },
+                    },
+                },
                 'fetchMargins': True,
                 'fetchMarkets': [
                     'spot',  # allows CORS in browsers
@@ -4795,6 +4809,43 @@ class binance(Exchange, ImplicitAPI):
             'fee': fee,
         }, market)
 
+    def parse_trades_batch(self, trades: List[Any], market: Market = None):
+        # aggregate trades of the public endpoints, {"a", "p", "q", "f", "l", "T", "m", "M"}, are parsed in one loop
+        # that only reads their fields, other trades and option markets go through parseTrade
+        if (market is None) or market['option']:
+            return super(binance, self).parse_trades_batch(trades, market)
+        aggregateTradeKeys: dict = {'a': True, 'p': True, 'q': True, 'f': True, 'l': True, 'T': True, 'm': True, 'M': True}
+        symbol = market['symbol']
+        contractSize = self.safe_string(market, 'contractSize')
+        inverse = self.safe_bool(market, 'inverse', False)
+        result = []
+        for i in range(0, len(trades)):
+            trade = trades[i]
+            if self.has_only_keys(trade, aggregateTradeKeys):
+                timestamp = self.safe_integer(trade, 'T')
+                buyerMaker = self.safe_bool(trade, 'm')
+                side = None
+                if buyerMaker is not None:
+                    side = 'sell' if buyerMaker else 'buy'  # self is reversed intentionally
+                result.append(self.safe_trade_without_fee({
+                    'info': trade,
+                    'timestamp': timestamp,
+                    'datetime': self.iso8601(timestamp),
+                    'symbol': symbol,
+                    'id': self.safe_string(trade, 'a'),
+                    'order': None,
+                    'type': None,
+                    'side': side,
+                    'takerOrMaker': None,
+                    'price': self.safe_string(trade, 'p'),
+                    'amount': self.safe_string(trade, 'q'),
+                    'cost': None,
+                    'fee': None,
+                }, contractSize, inverse))
+            else:
+                result.append(self.parse_trade(trade, market))
+        return result
+
     async def fetch_trades(self, symbol: str, since: Int = None, limit: Int = None, params={}) -> List[Trade]:
         """
         get the list of most recent trades for a particular symbol
@@ -9035,24 +9086,22 @@ class binance(Exchange, ImplicitAPI):
             #         ...
             #     }
             #
-            symbols = list(self.markets.keys())
+            markets = self.filter_markets(None, 'linear')
             result: dict = {}
             feeTier = self.safe_integer(response, 'feeTier')
             feeTiers = self.fees['linear']['trading']['tiers']
             maker = feeTiers['maker'][feeTier][1]
             taker = feeTiers['taker'][feeTier][1]
-            for i in range(0, len(symbols)):
-                symbol = symbols[i]
-                market = self.markets[symbol]
-                if market['linear']:
-                    result[symbol] = {
-                        'info': {
-                            'feeTier': feeTier,
-                        },
-                        'symbol': symbol,
-                        'maker': maker,
-                        'taker': taker,
-                    }
+            for i in range(0, len(markets)):
+                symbol = markets[i]['symbol']
+                result[symbol] = {
+                    'info': {
+                        'feeTier': feeTier,
+                    },
+                    'symbol': symbol,
+                    'maker': maker,
+                    'taker': taker,
+                }
             return result
         elif isInverse:
             #
@@ -9064,24 +9113,22 @@ class binance(Exchange, ImplicitAPI):
             #         "updateTime": 0
             #     }
             #
-            symbols = list(self.markets.keys())
+            markets = self.filter_markets(None, 'inverse')
             result: dict = {}
             feeTier = self.safe_integer(response, 'feeTier')
             feeTiers = self.fees['inverse']['trading']['tiers']
             maker = feeTiers['maker'][feeTier][1]
             taker = feeTiers['taker'][feeTier][1]
-            for i in range(0, len(symbols)):
-                symbol = symbols[i]
-                market = self.markets[symbol]
-                if market['inverse']:
-                    result[symbol] = {
-                        'info': {
-                            'feeTier': feeTier,
-                        },
-                        'symbol': symbol,
-                        'maker': maker,
-                        'taker': taker,
-                    }
+            for i in range(0, len(markets)):
+                symbol = markets[i]['symbol']
+                result[symbol] = {
+                    'info': {
+                        'feeTier': feeTier,
+                    },
+                    'symbol': symbol,
+                    'maker': maker,
+                    'taker': taker,
+                }
             return result
         return None
 
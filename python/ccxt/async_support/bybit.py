@@ -1038,6 +1038,19 @@ class bybit(Exchange, ImplicitAPI):
             },
             'precisionMode': TICK_SIZE,
             'options': {
+                'rateLimiter': {
+                    'headers': {
+                        # requests left in the per endpoint window
+                        'x-bapi-limit-status': {
+                            'type': 'remaining',
+                            'limitHeader': 'x-bapi-limit',
+                            'resetHeader': 'x-bapi-limit-reset-timestamp',
+                            'resetType': 'timestamp',
+                            'window': 1000,
+                            'scope': 'path',
+                        },
+                    },
+                },
                 'usePrivateInstrumentsInfo': False,
                 'enableDemoTrading': False,
                 'fetchMarkets': ['spot', 'linear', 'inverse', 'option'],
@@ -3009,6 +3022,41 @@ class bybit(Exchange, ImplicitAPI):
             'fee': fee,
         }, market)
 
+    def parse_trades_batch(self, trades: List[Any], market: Market = None):
+        # public trades, {"execId", "symbol", "price", "size", "side", "time", "isBlockTrade"}, are parsed in one loop
+        # that only reads their fields and resolves every symbol once, other trades go through parseTrade
+        publicTradeKeys: dict = {'execId': True, 'symbol': True, 'price': True, 'size': True, 'side': True, 'time': True, 'isBlockTrade': True, 'isRPITrade': True, 'seq': True, 'mP': True, 'iP': True, 'mIv': True, 'iv': True}
+        marketType = 'spot' if (market is None) else market['type']
+        markets: dict = {}
+        result = []
+        for i in range(0, len(trades)):
+            trade = trades[i]
+            marketId = self.safe_string(trade, 'symbol') if self.has_only_keys(trade, publicTradeKeys) else None
+            if marketId is None:
+                result.append(self.parse_trade(trade, market))
+            else:
+                if not (marketId in markets):
+                    tradeMarket = self.safe_market(marketId, market, None, marketType)
+                    markets[marketId] = [tradeMarket['symbol'], self.safe_string(tradeMarket, 'contractSize'), self.safe_bool(tradeMarket, 'inverse', False)]
+                cached = markets[marketId]
+                timestamp = self.safe_integer(trade, 'time')
+                result.append(self.safe_trade_without_fee({
+                    'id': self.safe_string(trade, 'execId'),
+                    'info': trade,
+                    'timestamp': timestamp,
+                    'datetime': self.iso8601(timestamp),
+                    'symbol': cached[0],
+                    'order': None,
+                    'type': None,
+                    'side': self.safe_string_lower(trade, 'side'),
+                    'takerOrMaker': None,
+                    'price': self.safe_string(trade, 'price'),
+                    'amount': self.safe_string(trade, 'size'),
+                    'cost': None,
+                    'fee': None,
+                }, cached[1], cached[2]))
+        return result
+
     async def fetch_trades(self, symbol: str, since: Int = None, limit: Int = None, params={}) -> List[Trade]:
         """
         get the list of most recent trades for a particular symbol
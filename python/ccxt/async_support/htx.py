@@ -2097,7 +2097,7 @@ class htx(Exchange, ImplicitAPI):
         futureMarketIdsForSymbols = self.safe_dict(self.options, 'futureMarketIdsForSymbols', {})
         if symbolOrMarketId in futureMarketIdsForSymbols:
             return futureMarketIdsForSymbols[symbolOrMarketId]
-        futureMarkets = self.filter_by(self.markets, 'future', True)
+        futureMarkets = self.filter_markets('future')
         futuresCharsMaps: dict = {
             'this_week': 'CW',
             'next_week': 'NW',
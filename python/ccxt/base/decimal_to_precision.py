@@ -169,6 +169,13 @@ def number_to_string(x):
     # avoids scientific notation for too large and too small numbers
     if x is None:
         return None
+    if type(x) is float:
+        formatted = repr(x)
+        # the shortest repr is what Decimal(str(x)) would print unless it is in exponent form, inf or nan
+        if 'e' not in formatted and 'n' not in formatted:
+            return formatted.rstrip('0').rstrip('.')
+    elif type(x) is int:
+        return str(x)
     d = decimal.Decimal(str(x))
     formatted = '{:f}'.format(d)
     return formatted.rstrip('0').rstrip('.') if '.' in formatted else formatted
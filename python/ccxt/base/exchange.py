@@ -33,6 +33,8 @@ from ccxt.base.decimal_to_precision import decimal_to_precision
 from ccxt.base.decimal_to_precision import DECIMAL_PLACES, TICK_SIZE, NO_PADDING, TRUNCATE, ROUND, ROUND_UP, ROUND_DOWN, SIGNIFICANT_DIGITS
 from ccxt.base.decimal_to_precision import number_to_string
 from ccxt.base.precise import Precise
+from ccxt.base.markets_cache import MARKETS_CACHE_SCHEMA, MarketsCache, changed_options, markets_fingerprint, options_snapshot
+from ccxt.base.markets_store import MarketsStore
 from ccxt.base.types import ConstructorArgs, BalanceAccount, Currency, IndexType, OrderSide, OrderType, Trade, OrderRequest, Market, MarketType, Str, Num, Strings, CancellationRequest, Bool
 
 # -----------------------------------------------------------------------------
@@ -47,7 +49,6 @@ from cryptography.hazmat.primitives.serialization import load_pem_private_key
 # -----------------------------------------------------------------------------
 
 # ecdsa signing
-from ccxt.static_dependencies import ecdsa
 from ccxt.static_dependencies import keccak
 
 # eddsa signing
@@ -56,17 +57,9 @@ try:
 except ImportError:
     eddsa = None
 
-# eth signing
-from ccxt.static_dependencies.ethereum import abi
-from ccxt.static_dependencies.ethereum import account
-from ccxt.static_dependencies.msgpack import packb
-
-# starknet
-from ccxt.static_dependencies.starknet.ccxt_utils import get_private_key_from_eth_signature
-from ccxt.static_dependencies.starknet.hash.address import compute_address
-from ccxt.static_dependencies.starknet.hash.selector import get_selector_from_name
-from ccxt.static_dependencies.starknet.hash.utils import message_signature, private_to_stark_key
-from ccxt.static_dependencies.starknet.utils.typed_data import TypedData as TypedDataDataclass
+# ecdsa, eth (abi, account, msgpack) and starknet signing dependencies are imported
+# by the methods that use them, most exchanges never need them and they are slow to import
+
 try:
     import apexpro.zklink_sdk as zklink_sdk
 except ImportError:
@@ -246,6 +239,16 @@ class Exchange(object):
     twofa = None
     markets_by_id = None
     currencies_by_id = None
+    user_config = None  # the config passed to the constructor, the markets caches are keyed on it
+    markets_cache_digest = None
+    markets_cache_options = None  # the options that loading the markets set, saved with the cached tables
+    markets_store = None
+    # called with the added, removed and changed markets by an incremental reload
+    markets_change_callback = None
+    # marketType: marketId: market, for market ids shared by markets of different types
+    markets_by_id_type = None
+    # field: value: markets, built by filter_markets when first queried
+    markets_index = None
 
     precision = None
     exceptions = None
@@ -298,6 +301,7 @@ class Exchange(object):
     balance = None
     liquidations = None
     orderbooks = None
+    orderbookChecksums = None
     orders = None
     triggerOrders = None
     myLiquidations = None
@@ -383,6 +387,7 @@ class Exchange(object):
         self.headers = dict() if self.headers is None else self.headers
         self.balance = dict() if self.balance is None else self.balance
         self.orderbooks = dict() if self.orderbooks is None else self.orderbooks
+        self.orderbookChecksums = dict() if self.orderbookChecksums is None else self.orderbookChecksums
         self.fundingRates = dict() if self.fundingRates is None else self.fundingRates
         self.tickers = dict() if self.tickers is None else self.tickers
         self.bidsasks = dict() if self.bidsasks is None else self.bidsasks
@@ -403,12 +408,15 @@ class Exchange(object):
 
         self.origin = self.uuid()
         self.userAgent = default_user_agent()
+        self.user_config = config
 
-        settings = self.deep_extend(self.describe(), config)
+        settings = self.describe_settings(config)
 
         for key in settings:
             if hasattr(self, key) and isinstance(getattr(self, key), dict):
-                setattr(self, key, self.deep_extend(getattr(self, key), settings[key]))
+                current = getattr(self, key)
+                # settings are already a copy for this instance, empty defaults need no merge
+                setattr(self, key, self.deep_extend(current, settings[key]) if current else settings[key])
             else:
                 setattr(self, key, settings[key])
 
@@ -418,28 +426,87 @@ class Exchange(object):
             self.set_sandbox_mode(True)
 
         # convert all properties from underscore notation foo_bar to camelcase notation fooBar
+        # methods are aliased on the class once, properties are copied for every instance
         cls = type(self)
-        for name in dir(self):
-            if name[0] != '_' and name[-1] != '_' and '_' in name:
-                parts = name.split('_')
-                # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
-                exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
-                camelcase = parts[0] + ''.join(exceptions.get(i, self.capitalize(i)) for i in parts[1:])
-                attr = getattr(self, name)
-                if isinstance(attr, types.MethodType):
+        properties = cls.__dict__.get('_camelcase_properties')
+        if properties is None:
+            properties = {}
+            for name in dir(self):
+                camelcase = self.camelcase_name(name)
+                if camelcase is None:
+                    continue
+                if isinstance(getattr(self, name), types.MethodType):
                     setattr(cls, camelcase, getattr(cls, name))
                 else:
-                    if hasattr(self, camelcase):
-                        if attr is not None:
-                            setattr(self, camelcase, attr)
-                    else:
-                        setattr(self, camelcase, attr)
+                    properties[name] = camelcase
+            cls._camelcase_properties = properties
+        names = list(properties)
+        names.extend(name for name in self.__dict__ if name not in properties)
+        for name in names:
+            camelcase = properties.get(name) or self.camelcase_name(name)
+            if camelcase is None:
+                continue
+            attr = getattr(self, name)
+            if hasattr(self, camelcase):
+                if attr is not None:
+                    setattr(self, camelcase, attr)
+            else:
+                setattr(self, camelcase, attr)
 
         if not self.session and self.synchronous:
             self.session = Session()
             self.session.trust_env = self.requests_trust_env
         self.logger = self.logger if self.logger else logging.getLogger(__name__)
 
+    @staticmethod
+    def camelcase_name(name):
+        if name[0] != '_' and name[-1] != '_' and '_' in name:
+            parts = name.split('_')
+            # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
+            exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
+            return parts[0] + ''.join(exceptions.get(i, Exchange.capitalize(i)) for i in parts[1:])
+        return None
+
+    def describe_settings(self, config):
+        # describe() deep-merges the whole class hierarchy, it is computed once per class
+        # every instance gets its own deep copy of it, nested dicts and lists included
+        # bound methods of the describing instance (like streaming ping) are bound to self instead
+        cls = type(self)
+
+        def unbind(value):
+            # kept as staticmethod so that the cache does not hold on to the describing instance
+            if isinstance(value, dict):
+                return dict((key, unbind(item)) for key, item in value.items())
+            if isinstance(value, types.MethodType) and value.__self__ is self:
+                return staticmethod(value.__func__)
+            return value
+
+        def instantiate(value):
+            if isinstance(value, dict):
+                return dict((key, instantiate(item)) for key, item in value.items())
+            if isinstance(value, list):
+                return [instantiate(item) for item in value]
+            if isinstance(value, staticmethod):
+                return types.MethodType(value.__func__, self)
+            return value
+
+        described = cls.__dict__.get('_describe_cache')
+        if described is None:
+            described = unbind(self.describe())
+            cls._describe_cache = described
+
+        # constructor config values are copied too, instances never share the caller's dicts and lists
+        settings = {}
+        for key, value in described.items():
+            if key in config:
+                settings[key] = self.deep_extend(instantiate(value), instantiate(config[key]))
+            else:
+                settings[key] = instantiate(value)
+        for key in config:
+            if key not in settings:
+                settings[key] = instantiate(config[key])
+        return settings
+
     def __del__(self):
         if self.session:
             try:
@@ -457,7 +524,7 @@ class Exchange(object):
         # stub in sync
         pass
 
-    def throttle(self, cost=None):
+    def throttle(self, cost=None, api=None):
         now = float(self.milliseconds())
         elapsed = now - self.lastRestRequestTimestamp
         cost = 1 if cost is None else cost
@@ -504,6 +571,10 @@ class Exchange(object):
                 return orjson.loads(response_body)
             return json.loads(response_body)
 
+    def fetch_single_flight(self, path, api='public', method='GET', params={}, headers=None, body=None, config={}):
+        # there are no concurrent callers to share a request with, the async client shares them
+        return self.send_request(path, api, method, params, headers, body, config)
+
     def fetch(self, url, method='GET', headers=None, body=None):
         """Perform a HTTP request and return decoded JSON data"""
 
@@ -646,6 +717,9 @@ class Exchange(object):
 
     @staticmethod
     def key_exists(dictionary, key):
+        if type(dictionary) is dict:
+            value = dictionary.get(key)
+            return value is not None and value != ''
         if hasattr(dictionary, '__getitem__') and not isinstance(dictionary, str):
             if isinstance(dictionary, list) and type(key) is not int:
                 return False
@@ -666,8 +740,16 @@ class Exchange(object):
             value = default_value
         return value
 
+    # the safe_* methods below look plain dicts up directly, other containers go through key_exists
+    # None and empty strings are missing values in both paths
+
     @staticmethod
     def safe_string(dictionary, key, default_value=None):
+        if type(dictionary) is dict:
+            value = dictionary.get(key)
+            if type(value) is str:
+                return value if value != '' else default_value
+            return str(value) if value is not None and value != '' else default_value
         return str(dictionary[key]) if Exchange.key_exists(dictionary, key) else default_value
 
     @staticmethod
@@ -686,9 +768,20 @@ class Exchange(object):
 
     @staticmethod
     def safe_integer(dictionary, key, default_value=None):
-        if not Exchange.key_exists(dictionary, key):
+        if type(dictionary) is dict:
+            value = dictionary.get(key)
+            if value is None or value == '':
+                return default_value
+            # ints and digit strings within the exact range of a float are their own int(float(value))
+            if type(value) is int:
+                if -9007199254740992 <= value <= 9007199254740992:
+                    return value
+            elif type(value) is str and len(value) < 16 and value.isdigit() and value.isascii():
+                return int(value)
+        elif not Exchange.key_exists(dictionary, key):
             return default_value
-        value = dictionary[key]
+        else:
+            value = dictionary[key]
         try:
             # needed to avoid breaking on "100.0"
             # https://stackoverflow.com/questions/1094717/convert-a-string-to-integer-with-decimal-in-python#1094721
@@ -718,6 +811,9 @@ class Exchange(object):
 
     @staticmethod
     def safe_value(dictionary, key, default_value=None):
+        if type(dictionary) is dict:
+            value = dictionary.get(key)
+            return value if value is not None and value != '' else default_value
         return dictionary[key] if Exchange.key_exists(dictionary, key) else default_value
 
     # we're not using safe_floats with a list argument as we're trying to save some cycles here
@@ -920,6 +1016,8 @@ class Exchange(object):
 
     @staticmethod
     def deep_extend(*args):
+        if len(args) == 2 and isinstance(args[0], dict) and isinstance(args[1], dict):
+            return Exchange.deep_extend_dict(args[0], args[1])
         result = None
         for arg in args:
             if isinstance(arg, dict):
@@ -931,6 +1029,22 @@ class Exchange(object):
                 result = arg
         return result
 
+    @staticmethod
+    def deep_extend_dict(base, extension):
+        # deep_extend(base, extension) for two dicts, nested dicts are copied and merged like deep_extend does
+        # without a recursive call for every scalar value, set_markets extends every market this way
+        result = dict(base)
+        for key, value in base.items():
+            if isinstance(value, dict) and key not in extension:
+                result[key] = Exchange.deep_extend_dict(value, {})
+        for key, value in extension.items():
+            if isinstance(value, dict):
+                current = base.get(key)
+                result[key] = Exchange.deep_extend_dict(current if isinstance(current, dict) else {}, value)
+            else:
+                result[key] = value
+        return result
+
     @staticmethod
     def filter_by(array, key, value=None):
         array = Exchange.to_array(array)
@@ -1313,15 +1427,21 @@ class Exchange(object):
 
     @staticmethod
     def eth_abi_encode(types, args):
+        from ccxt.static_dependencies.ethereum import abi
         return abi.encode(types, args)
 
     @staticmethod
     def eth_encode_structured_data(domain, messageTypes, message):
+        from ccxt.static_dependencies.ethereum import account
         encodedData = account.messages.encode_typed_data(domain, messageTypes, message)
         return Exchange.binary_concat(b"\x19\x01", encodedData.header, encodedData.body)
 
     @staticmethod
     def retrieve_stark_account (signature, accountClassHash, accountProxyClassHash):
+        from ccxt.static_dependencies.starknet.ccxt_utils import get_private_key_from_eth_signature
+        from ccxt.static_dependencies.starknet.hash.address import compute_address
+        from ccxt.static_dependencies.starknet.hash.selector import get_selector_from_name
+        from ccxt.static_dependencies.starknet.hash.utils import private_to_stark_key
         privateKey = get_private_key_from_eth_signature(signature)
         publicKey = private_to_stark_key(privateKey)
         calldata = [
@@ -1361,6 +1481,7 @@ class Exchange(object):
             }, messageTypes),
             'message': messageData,
         }
+        from ccxt.static_dependencies.starknet.utils.typed_data import TypedData as TypedDataDataclass
         typedDataClass = TypedDataDataclass.from_dict(request)
         msgHash = typedDataClass.message_hash(int(address, 16))
         return msgHash
@@ -1368,11 +1489,13 @@ class Exchange(object):
     @staticmethod
     def starknet_sign (hash, pri):
         # // TODO: unify to ecdsa
+        from ccxt.static_dependencies.starknet.hash.utils import message_signature
         r, s = message_signature(hash, pri)
         return Exchange.json([hex(r), hex(s)])
 
     @staticmethod
     def packb(o):
+        from ccxt.static_dependencies.msgpack import packb
         return packb(o)
 
     @staticmethod
@@ -1386,6 +1509,7 @@ class Exchange(object):
     @staticmethod
     def ecdsa(request, secret, algorithm='p256', hash=None, fixed_length=False):
         # your welcome - frosty00
+        from ccxt.static_dependencies import ecdsa
         algorithms = {
             'p192': [ecdsa.NIST192p, 'sha256'],
             'p224': [ecdsa.NIST224p, 'sha256'],
@@ -1506,16 +1630,127 @@ class Exchange(object):
         return len(parts[1]) if len(parts) > 1 else 0
 
     def load_markets(self, reload=False, params={}):
+        store = self.attach_markets_store()
+        if store is None:
+            return self.load_markets_helper(reload, params)
+        version = store.version
+        with store.lock:
+            # a thread that waited for another one to load the shared markets does not load them again
+            if store.tables is None or (reload and store.version == version):
+                snapshot = options_snapshot(self.options)
+                self.load_markets_helper(reload, params)
+                store.publish(self, changed_options(self.options, snapshot))
+        return self.markets
+
+    def attach_markets_store(self):
+        # options['sharedMarkets'] = True shares the loaded markets with the other instances of this exchange
+        # that have the same options and sandbox mode, the markets are loaded once and held in memory once
+        if self.markets_store is None:
+            if not self.safe_bool(self.options, 'sharedMarkets', False) or self.markets:
+                return None
+            self.markets_store = MarketsStore.attach(self.markets_cache_key(), self)
+        return self.markets_store
+
+    def on_markets_change(self, added, removed, changed):
+        if self.markets_change_callback is not None:
+            self.markets_change_callback(added, removed, changed)
+
+    def load_markets_helper(self, reload=False, params={}):
         if not reload:
             if self.markets:
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            age = self.restore_markets_cache()
+            if age is not None and age <= self.safe_integer(self.markets_cache_settings(), 'ttl', 3600000):
+                return self.markets
+        snapshot = self.markets_cache_snapshot()
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = self.fetch_currencies()
         markets = self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        return self.set_fetched_markets(markets, currencies, snapshot)
+
+    def markets_cache_settings(self):
+        # options['marketsCache'] = True or {
+        #     'path': directory, defaults to a directory private to the current user under <tmp>
+        #     'ttl': ms, the cache is used without refetching markets (1 hour)
+        #     'staleTtl': ms, an older cache is not used at all (1 day)
+        # }
+        settings = self.safe_value(self.options, 'marketsCache')
+        if not settings:
+            return None
+        return settings if isinstance(settings, dict) else {}
+
+    def markets_cache_key(self):
+        # the markets depend on the config the instance was created with, not on the options that loading them sets
+        # credentials are not part of the key, only whether there are any
+        config = self.omit(self.user_config or {}, list(self.requiredCredentials.keys()))
+        options = self.omit(self.safe_dict(config, 'options', {}), ['marketsCache', 'sharedMarkets'])
+        config = self.extend(config, {'options': options, 'authenticated': bool(self.apiKey)})
+        return markets_fingerprint(self.id, config, self.isSandboxModeEnabled, __version__)
+
+    def markets_cache_snapshot(self):
+        # taken before fetching the markets, set_fetched_markets saves the options that changed since with the tables
+        if self.markets_cache_settings() is None:
+            return None
+        return options_snapshot(self.options)
+
+    def restore_markets_cache(self):
+        # loads the tables and options saved by set_fetched_markets, returns their age in ms
+        settings = self.markets_cache_settings()
+        if settings is None:
+            return None
+        entry = MarketsCache(self.safe_string(settings, 'path')).read(self.markets_cache_key())
+        if entry is None:
+            return None
+        age, digest, tables, options = entry
+        if age > self.safe_integer(settings, 'staleTtl', 86400000):
+            return None
+        self.options = self.deep_extend(self.options, options)
+        self.markets_cache_options = options
+        self.markets = tables['markets']
+        self.markets_by_id = tables['markets_by_id']
+        self.markets_by_id_type = None
+        self.markets_index = None
+        self.symbols = sorted(self.markets)
+        self.ids = sorted(self.markets_by_id)
+        self.currencies = tables['currencies']
+        self.baseCurrencies = tables['baseCurrencies']
+        self.quoteCurrencies = tables['quoteCurrencies']
+        self.codes = sorted(self.currencies)
+        self.currencies_by_id = {}
+        for code in self.codes:
+            currency = self.currencies[code]
+            currencyId = currency.get('id')
+            if currencyId is not None:
+                self.currencies_by_id[currencyId] = currency
+        self.markets_cache_digest = digest
+        return age
+
+    def set_fetched_markets(self, markets, currencies=None, snapshot=None):
+        # set_markets, with the resulting tables and the options changed since snapshot saved to the markets cache if it is enabled
+        # markets identical to the cached ones are not indexed again
+        settings = self.markets_cache_settings()
+        if settings is None:
+            return self.apply_markets(markets, currencies)
+        cache = MarketsCache(self.safe_string(settings, 'path'))
+        key = self.markets_cache_key()
+        digest = cache.digest(markets, currencies)
+        if self.markets and digest == self.markets_cache_digest:
+            cache.touch(key)
+            return self.markets
+        result = self.apply_markets(markets, currencies)
+        tables = dict((name, getattr(self, name)) for name in MARKETS_CACHE_SCHEMA)
+        # a revalidation keeps the restored options that the fetch set to the same values again
+        options = self.extend(self.markets_cache_options or {}, changed_options(self.options, snapshot) if snapshot is not None else {})
+        try:
+            cache.write(key, digest, tables, options)
+            self.markets_cache_digest = digest
+            self.markets_cache_options = options
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning('%s could not write the markets cache: %s', self.id, e)
+        return result
 
     def fetch_markets(self, params={}):
         # markets are returned as a list
@@ -1580,6 +1815,7 @@ class Exchange(object):
             raise NotSupported(self.id + ' Eddsa functionality requires python-axolotl-curve25519, install with `pip install python-axolotl-curve25519==0.4.1.post2`: https://github.com/tgalal/python-axolotl-curve25519')
 
     def privateKeyToAddress(self, privateKey):
+        from ccxt.static_dependencies import ecdsa
         private_key_bytes = base64.b16decode(Exchange.encode(privateKey), True)
         public_key_bytes = ecdsa.SigningKey.from_string(private_key_bytes, curve=ecdsa.SECP256k1).verifying_key.to_string()
         public_key_hash = keccak.SHA3(public_key_bytes)
@@ -2929,6 +3165,122 @@ class Exchange(object):
     def orderbook_checksum_message(self, symbol: Str):
         return symbol + '  = False'
 
+    def order_book_checksum(self, symbol: str, orderbook, format: str, depth: Int, keyIndex: Int = 0, priceLength: Int = None, amountLength: Int = None):
+        #
+        # crc32 of the top depth levels of the orderbook in the layout the exchange checksums
+        #
+        #     'interleaved' bid price:bid amount:ask price:ask amount:... (okx)
+        #     'signed'      same as interleaved with negative ask amounts (bitfinex)
+        #     'stripped'    asks then bids, decimals padded to priceLength/amountLength, no dot, no leading zeros (kraken)
+        #
+        # the strings of the levels that stay in the top depth are reused between updates
+        # and the previous checksum is returned when none of the top depth levels changed
+        #
+        previous = self.safe_dict(self.orderbookChecksums, symbol, {})
+        previousBids = []
+        previousAsks = []
+        checksum = None
+        sameFormat = (self.safe_string(previous, 'format') == format) and (self.safe_integer(previous, 'depth') == depth) and (self.safe_integer(previous, 'keyIndex') == keyIndex)
+        sameLengths = (self.safe_integer(previous, 'priceLength') == priceLength) and (self.safe_integer(previous, 'amountLength') == amountLength)
+        if sameFormat and sameLengths:
+            previousBids = previous['bids']
+            previousAsks = previous['asks']
+            checksum = self.safe_integer(previous, 'checksum')
+        bids = self.order_book_checksum_levels(orderbook['bids'], previousBids, format, depth, keyIndex, priceLength, amountLength, False)
+        asks = self.order_book_checksum_levels(orderbook['asks'], previousAsks, format, depth, keyIndex, priceLength, amountLength, True)
+        if (checksum is None) or bids['changed'] or asks['changed']:
+            payload = self.order_book_checksum_payload(bids['levels'], asks['levels'], format, depth)
+            checksum = self.crc32(payload, format != 'stripped')
+        self.orderbookChecksums[symbol] = {
+            'format': format,
+            'depth': depth,
+            'keyIndex': keyIndex,
+            'priceLength': priceLength,
+            'amountLength': amountLength,
+            'bids': bids['levels'],
+            'asks': asks['levels'],
+            'checksum': checksum,
+        }
+        return checksum
+
+    def order_book_checksum_levels(self, bookside, previous, format: str, depth: Int, keyIndex: Int, priceLength: Int, amountLength: Int, isAsk: bool):
+        # returns [ key, amount, keyString, amountString ] for the top depth levels of one side
+        booksideLength = len(bookside)
+        previousLength = len(previous)
+        count = min(depth, booksideLength)
+        negate = isAsk and (format == 'signed')
+        changed = (count != previousLength)
+        levels = []
+        j = 0
+        for i in range(0, count):
+            level = bookside[i]
+            key = level[keyIndex]
+            amount = level[1]
+            keyString = None
+            amountString = None
+            # a level added or removed above shifts the level by a few positions
+            for offset in range(0, 4):
+                k = j + offset
+                if k >= previousLength:
+                    break
+                entry = previous[k]
+                if entry[0] == key:
+                    keyString = entry[2]
+                    if entry[1] == amount:
+                        amountString = entry[3]
+                    if k != i:
+                        changed = True
+                    j = k + 1
+                    break
+            if keyString is None:
+                keyString = self.order_book_checksum_string(key, format, priceLength, False)
+                changed = True
+            if amountString is None:
+                amountString = self.order_book_checksum_string(amount, format, amountLength, negate)
+                changed = True
+            levels.append([key, amount, keyString, amountString])
+        return {
+            'levels': levels,
+            'changed': changed,
+        }
+
+    def order_book_checksum_string(self, value, format: str, length: Int = None, negate=False):
+        if negate:
+            return self.number_to_string(-value)
+        stringNumber = self.number_to_string(value)
+        if format != 'stripped':
+            return stringNumber
+        parts = stringNumber.split('.')
+        integer = self.safe_string(parts, 0)
+        decimals = self.safe_string(parts, 1, '')
+        paddedDecimals = decimals.ljust(length, '0')
+        joined = integer + paddedDecimals
+        i = 0
+        while((i < len(joined)) and (joined[i] == '0')):
+            i += 1
+        if i > 0:
+            return joined[i:]
+        return joined
+
+    def order_book_checksum_payload(self, bids, asks, format: str, depth: Int):
+        bidsLength = len(bids)
+        asksLength = len(asks)
+        payloadArray = []
+        if format == 'stripped':
+            for i in range(0, asksLength):
+                payloadArray.append(asks[i][2] + asks[i][3])
+            for i in range(0, bidsLength):
+                payloadArray.append(bids[i][2] + bids[i][3])
+            return ''.join(payloadArray)
+        for i in range(0, depth):
+            if i < bidsLength:
+                payloadArray.append(bids[i][2])
+                payloadArray.append(bids[i][3])
+            if i < asksLength:
+                payloadArray.append(asks[i][2])
+                payloadArray.append(asks[i][3])
+        return ':'.join(payloadArray)
+
     def create_networks_by_id_object(self):
         # automatically generate network-id-to-code mappings
         networkIdsToCodesGenerated = self.invert_flat_string_dictionary(self.safe_value(self.options, 'networks', {}))  # invert defined networks dictionary
@@ -3163,86 +3515,305 @@ class Exchange(object):
         return cleanStructure
 
     def set_markets(self, markets, currencies=None):
-        values = []
+        # one pass over the markets builds the markets, markets_by_id and the currencies derived from them
+        # the defaults every market is merged with are merged once
+        self.markets = {}
         self.markets_by_id = {}
+        self.markets_by_id_type = None
+        self.markets_index = None
+        template = self.market_template()
+        defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
+        baseCurrencies = []
+        quoteCurrencies = []
         # handle marketId conflicts
         # we insert spot markets first
         marketValues = self.sort_by(self.to_array(markets), 'spot', True, True)
         for i in range(0, len(marketValues)):
             value = marketValues[i]
-            if value['id'] in self.markets_by_id:
-                marketsByIdArray = (self.markets_by_id[value['id']])
+            marketId = value['id']
+            if marketId in self.markets_by_id:
+                marketsByIdArray = (self.markets_by_id[marketId])
                 marketsByIdArray.append(value)
-                self.markets_by_id[value['id']] = marketsByIdArray
+                self.markets_by_id[marketId] = marketsByIdArray
             else:
-                self.markets_by_id[value['id']] = [value]
-            market = self.deep_extend(self.safe_market_structure(), {
-                'precision': self.precision,
-                'limits': self.limits,
-            }, self.fees['trading'], value)
-            if market['linear']:
-                market['subType'] = 'linear'
-            elif market['inverse']:
-                market['subType'] = 'inverse'
+                self.markets_by_id[marketId] = [value]
+            market = self.extend_market(template, value)
+            symbol = self.safe_string(market, 'symbol')
+            if symbol is not None:
+                self.markets[symbol] = market
+            if currencies is None:
+                if 'base' in market:
+                    baseCurrencies.append(self.market_currency(market, 'base', defaultCurrencyPrecision))
+                if 'quote' in market:
+                    quoteCurrencies.append(self.market_currency(market, 'quote', defaultCurrencyPrecision))
+        self.symbols = list(self.keysort(self.markets).keys())
+        self.ids = list(self.keysort(self.markets_by_id).keys())
+        self.set_market_currencies(currencies, baseCurrencies, quoteCurrencies)
+        return self.markets
+
+    def update_markets(self, markets, currencies=None):
+        # setMarkets for a reload that keeps the loaded market objects
+        # markets fetched unchanged keep their object, changed ones are updated in place,
+        # self.markets and self.markets_by_id are updated instead of replaced
+        # onMarketsChange is called with the added, removed and changed markets
+        if self.is_empty(self.markets):
+            return self.set_markets(markets, currencies)
+        marketsById = {}
+        fetched = {}
+        unchanged = {}
+        template = self.market_template()
+        defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
+        baseCurrencies = []
+        quoteCurrencies = []
+        marketValues = self.sort_by(self.to_array(markets), 'spot', True, True)
+        for i in range(0, len(marketValues)):
+            value = marketValues[i]
+            marketId = value['id']
+            if marketId in marketsById:
+                marketsByIdArray = marketsById[marketId]
+                marketsByIdArray.append(value)
+                marketsById[marketId] = marketsByIdArray
             else:
-                market['subType'] = None
-            values.append(market)
-        self.markets = self.index_by(values, 'symbol')
-        marketsSortedBySymbol = self.keysort(self.markets)
-        marketsSortedById = self.keysort(self.markets_by_id)
-        self.symbols = list(marketsSortedBySymbol.keys())
-        self.ids = list(marketsSortedById.keys())
+                marketsById[marketId] = [value]
+            market = None
+            symbol = self.safe_string(value, 'symbol')
+            if (symbol is not None) and (symbol in self.markets) and not (symbol in fetched):
+                loaded = self.markets[symbol]
+                if self.json(self.loaded_market_value(loaded)) == self.json(value):
+                    market = loaded
+                    unchanged[symbol] = True
+            if market is None:
+                market = self.extend_market(template, value)
+            marketSymbol = self.safe_string(market, 'symbol')
+            if marketSymbol is not None:
+                fetched[marketSymbol] = market
+            if currencies is None:
+                if 'base' in market:
+                    baseCurrencies.append(self.market_currency(market, 'base', defaultCurrencyPrecision))
+                if 'quote' in market:
+                    quoteCurrencies.append(self.market_currency(market, 'quote', defaultCurrencyPrecision))
+        added = []
+        removed = []
+        changed = []
+        fetchedSymbols = list(fetched.keys())
+        for i in range(0, len(fetchedSymbols)):
+            symbol = fetchedSymbols[i]
+            market = fetched[symbol]
+            if not (symbol in self.markets):
+                self.markets[symbol] = market
+                added.append(market)
+            elif not (symbol in unchanged):
+                loaded = self.markets[symbol]
+                loadedKeys = list(loaded.keys())
+                for j in range(0, len(loadedKeys)):
+                    key = loadedKeys[j]
+                    if not (key in market):
+                        del loaded[key]
+                marketKeys = list(market.keys())
+                for j in range(0, len(marketKeys)):
+                    key = marketKeys[j]
+                    loaded[key] = market[key]
+                self.markets[symbol] = loaded
+                changed.append(loaded)
+        loadedSymbols = list(self.markets.keys())
+        for i in range(0, len(loadedSymbols)):
+            symbol = loadedSymbols[i]
+            if not (symbol in fetched):
+                removed.append(self.markets[symbol])
+                del self.markets[symbol]
+        loadedIds = list(self.markets_by_id.keys())
+        for i in range(0, len(loadedIds)):
+            del self.markets_by_id[loadedIds[i]]
+        fetchedIds = list(marketsById.keys())
+        for i in range(0, len(fetchedIds)):
+            marketId = fetchedIds[i]
+            self.markets_by_id[marketId] = marketsById[marketId]
+        self.markets_by_id_type = None
+        self.markets_index = None
+        self.symbols = list(self.keysort(self.markets).keys())
+        self.ids = list(self.keysort(self.markets_by_id).keys())
+        self.set_market_currencies(currencies, baseCurrencies, quoteCurrencies)
+        if (len(added) > 0) or (len(removed) > 0) or (len(changed) > 0):
+            self.on_markets_change(added, removed, changed)
+        return self.markets
+
+    def apply_markets(self, markets, currencies=None):
+        # options['incrementalReload'] = True reloads the markets with updateMarkets
+        if not self.is_empty(self.markets) and self.safe_bool(self.options, 'incrementalReload', False):
+            return self.update_markets(markets, currencies)
+        return self.set_markets(markets, currencies)
+
+    def loaded_market_value(self, market: dict):
+        # the fetched market a loaded market was built from
+        values = self.safe_list(self.markets_by_id, market['id'], [])
+        result = None
+        for i in range(0, len(values)):
+            if self.safe_string(values[i], 'symbol') == market['symbol']:
+                result = values[i]
+        return result
+
+    def market_template(self):
+        # the defaults every market is merged with
+        return self.deep_extend(self.safe_market_structure(), {
+            'precision': self.precision,
+            'limits': self.limits,
+        }, self.fees['trading'])
+
+    def extend_market(self, template: dict, value: dict):
+        market = self.deep_extend(template, value)
+        if market['linear']:
+            market['subType'] = 'linear'
+        elif market['inverse']:
+            market['subType'] = 'inverse'
+        else:
+            market['subType'] = None
+        return market
+
+    def market_currency(self, market: dict, key: str, defaultPrecision):
+        # [code, id, numericId, precision] of the base or the quote currency of a market
+        marketPrecision = self.safe_dict(market, 'precision', {})
+        precisionKey = 'amount' if (key == 'base') else 'price'
+        return [
+            self.safe_string(market, key),
+            self.safe_string_2(market, key + 'Id', key),
+            self.safe_integer(market, key + 'NumericId'),
+            self.safe_value_2(marketPrecision, key, precisionKey, defaultPrecision),
+        ]
+
+    def set_market_currencies(self, currencies, baseCurrencies: List[Any], quoteCurrencies: List[Any]):
         if currencies is not None:
             # currencies is always None when called in constructor but not when called from loadMarkets
             self.currencies = self.deep_extend(self.currencies, currencies)
         else:
-            baseCurrencies = []
-            quoteCurrencies = []
-            for i in range(0, len(values)):
-                market = values[i]
-                defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
-                marketPrecision = self.safe_dict(market, 'precision', {})
-                if 'base' in market:
-                    currency = self.safe_currency_structure({
-                        'id': self.safe_string_2(market, 'baseId', 'base'),
-                        'numericId': self.safe_integer(market, 'baseNumericId'),
-                        'code': self.safe_string(market, 'base'),
-                        'precision': self.safe_value_2(marketPrecision, 'base', 'amount', defaultCurrencyPrecision),
-                    })
-                    baseCurrencies.append(currency)
-                if 'quote' in market:
-                    currency = self.safe_currency_structure({
-                        'id': self.safe_string_2(market, 'quoteId', 'quote'),
-                        'numericId': self.safe_integer(market, 'quoteNumericId'),
-                        'code': self.safe_string(market, 'quote'),
-                        'precision': self.safe_value_2(marketPrecision, 'quote', 'price', defaultCurrencyPrecision),
-                    })
-                    quoteCurrencies.append(currency)
-            baseCurrencies = self.sort_by(baseCurrencies, 'code', False, '')
-            quoteCurrencies = self.sort_by(quoteCurrencies, 'code', False, '')
-            self.baseCurrencies = self.index_by(baseCurrencies, 'code')
-            self.quoteCurrencies = self.index_by(quoteCurrencies, 'code')
+            # the last base and quote currency of each code, and its most precise currency
+            # quote currencies compete for the highest precision after all base currencies of the same code
+            lastBase = {}
+            lastQuote = {}
+            best = {}
+            lowestIsHighestPrecision = (self.precisionMode == TICK_SIZE)
+            numBase = len(baseCurrencies)
             allCurrencies = self.array_concat(baseCurrencies, quoteCurrencies)
-            groupedCurrencies = self.group_by(allCurrencies, 'code')
-            codes = list(groupedCurrencies.keys())
-            resultingCurrencies = []
-            for i in range(0, len(codes)):
-                code = codes[i]
-                groupedCurrenciesCode = self.safe_list(groupedCurrencies, code, [])
-                highestPrecisionCurrency = self.safe_value(groupedCurrenciesCode, 0)
-                for j in range(1, len(groupedCurrenciesCode)):
-                    currentCurrency = groupedCurrenciesCode[j]
-                    if self.precisionMode == TICK_SIZE:
-                        highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] < highestPrecisionCurrency['precision']) else highestPrecisionCurrency
+            for i in range(0, len(allCurrencies)):
+                currency = allCurrencies[i]
+                code = currency[0]
+                if code is not None:
+                    if i < numBase:
+                        lastBase[code] = currency
                     else:
-                        highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] > highestPrecisionCurrency['precision']) else highestPrecisionCurrency
-                resultingCurrencies.append(highestPrecisionCurrency)
-            sortedCurrencies = self.sort_by(resultingCurrencies, 'code')
-            self.currencies = self.deep_extend(self.currencies, self.index_by(sortedCurrencies, 'code'))
-        self.currencies_by_id = self.index_by(self.currencies, 'id')
-        currenciesSortedByCode = self.keysort(self.currencies)
-        self.codes = list(currenciesSortedByCode.keys())
-        return self.markets
+                        lastQuote[code] = currency
+                    if not (code in best):
+                        best[code] = currency
+                    elif lowestIsHighestPrecision:
+                        if currency[3] < best[code][3]:
+                            best[code] = currency
+                    elif currency[3] > best[code][3]:
+                        best[code] = currency
+            self.baseCurrencies = self.markets_currency_structures(lastBase)
+            self.quoteCurrencies = self.markets_currency_structures(lastQuote)
+            self.currencies = self.deep_extend(self.currencies, self.markets_currency_structures(best))
+        self.codes = list(self.keysort(self.currencies).keys())
+        self.currencies_by_id = {}
+        for i in range(0, len(self.codes)):
+            currency = self.currencies[self.codes[i]]
+            currencyId = self.safe_value(currency, 'id')
+            if currencyId is not None:
+                self.currencies_by_id[currencyId] = currency
+
+    def markets_currency_structures(self, currencies: dict):
+        # code: currency structure sorted by code, for code: [code, id, numericId, precision]
+        result = {}
+        codes = list(self.keysort(currencies).keys())
+        for i in range(0, len(codes)):
+            code = codes[i]
+            currency = currencies[code]
+            result[code] = self.safe_currency_structure({
+                'id': currency[1],
+                'numericId': currency[2],
+                'code': code,
+                'precision': currency[3],
+            })
+        return result
+
+    def filter_markets(self, type: Str = None, subType: Str = None, base: Str = None, quote: Str = None, settle: Str = None, expiry: Int = None, underlying: Str = None):
+        """
+        markets matching all of the given fields, sorted by symbol
+        :param str [type]: 'spot', 'margin', 'swap', 'future' or 'option'
+        :param str [subType]: 'linear' or 'inverse'
+        :param str [base]: unified base currency code
+        :param str [quote]: unified quote currency code
+        :param str [settle]: unified settle currency code
+        :param int [expiry]: expiry timestamp in ms
+        :param str [underlying]: base/quote of the derivatives, like BTC/USD for BTC/USD:BTC-240927-60000-C
+        :returns dict[]: a list of `market structures <https://docs.ccxt.com/#/?id=market-structure>`
+        """
+        criteria = {
+            'type': type,
+            'subType': subType,
+            'base': base,
+            'quote': quote,
+            'settle': settle,
+            'expiry': self.number_to_string(expiry),
+            'underlying': underlying,
+        }
+        index = self.get_markets_index()
+        fields = list(criteria.keys())
+        selected = []
+        candidates = None
+        for i in range(0, len(fields)):
+            field = fields[i]
+            value = criteria[field]
+            if value is not None:
+                marketsByValue = self.safe_list(index[field], value, [])
+                if (candidates is None) or (len(marketsByValue) < len(candidates)):
+                    candidates = marketsByValue
+                selected.append(field)
+        result = []
+        if candidates is None:
+            symbols = [] if (self.symbols is None) else self.symbols
+            for i in range(0, len(symbols)):
+                result.append(self.markets[symbols[i]])
+            return result
+        # the markets of the most selective field that match all other fields
+        for i in range(0, len(candidates)):
+            market = candidates[i]
+            matches = True
+            for j in range(0, len(selected)):
+                field = selected[j]
+                if self.market_index_value(market, field) != criteria[field]:
+                    matches = False
+                    break
+            if matches:
+                result.append(market)
+        return result
+
+    def get_markets_index(self):
+        # field: value: markets sorted by symbol, built on the first query
+        # setMarkets and updateMarkets drop it
+        if self.markets_index is None:
+            fields = ['type', 'subType', 'base', 'quote', 'settle', 'expiry', 'underlying']
+            index = {}
+            for i in range(0, len(fields)):
+                index[fields[i]] = {}
+            symbols = [] if (self.symbols is None) else self.symbols
+            for i in range(0, len(symbols)):
+                market = self.markets[symbols[i]]
+                for j in range(0, len(fields)):
+                    field = fields[j]
+                    value = self.market_index_value(market, field)
+                    if value is not None:
+                        if value in index[field]:
+                            index[field][value].append(market)
+                        else:
+                            index[field][value] = [market]
+            self.markets_index = index
+        return self.markets_index
+
+    def market_index_value(self, market: dict, field: str):
+        if field == 'underlying':
+            if market['spot'] or (market['base'] is None) or (market['quote'] is None):
+                return None
+            return market['base'] + '/' + market['quote']
+        return self.safe_string(market, field)
 
     def get_describe_for_extended_ws_exchange(self, currentRestInstance: Any, parentRestInstance: Any, wsBaseDescribe: dict):
         extendedRestDescribe = self.deep_extend(parentRestInstance.describe(), currentRestInstance.describe())
@@ -4268,14 +4839,55 @@ class Exchange(object):
 
     def parse_trades(self, trades: List[Any], market: Market = None, since: Int = None, limit: Int = None, params={}):
         trades = self.to_array(trades)
-        result = []
-        for i in range(0, len(trades)):
-            trade = self.extend(self.parse_trade(trades[i], market), params)
-            result.append(trade)
+        result = self.parse_trades_batch(trades, market)
+        if not self.is_empty(params):
+            for i in range(0, len(result)):
+                result[i] = self.extend(result[i], params)
         result = self.sort_by_2(result, 'timestamp', 'id')
         symbol = market['symbol'] if (market is not None) else None
         return self.filter_by_symbol_since_limit(result, symbol, since, limit)
 
+    def parse_trades_batch(self, trades: List[Any], market: Market = None):
+        # parseTrade for every trade, exchanges override it with loops over the trades of their most common responses
+        result = []
+        for i in range(0, len(trades)):
+            result.append(self.parse_trade(trades[i], market))
+        return result
+
+    def safe_trade_without_fee(self, trade: dict, contractSize: Str = None, inverse=False):
+        # safeTrade for a trade without a fee, with string or None price, amount and cost
+        # contractSize and inverse are the safeString and safeBool of the market, looked up once per batch
+        price = trade['price']
+        amount = trade['amount']
+        cost = trade['cost']
+        if cost is None:
+            # contract trading
+            multiplyPrice = price
+            if contractSize is not None:
+                if inverse:
+                    multiplyPrice = Precise.string_div('1', price)
+                multiplyPrice = Precise.string_mul(multiplyPrice, contractSize)
+            cost = Precise.string_mul(multiplyPrice, amount)
+        trade['fee'] = {
+            'cost': None,
+            'currency': None,
+        }
+        trade['fees'] = []
+        trade['amount'] = self.parse_number(amount)
+        trade['price'] = self.parse_number(price)
+        trade['cost'] = self.parse_number(cost)
+        return trade
+
+    def has_only_keys(self, value, keys: dict):
+        # True if value is a dictionary and every key of it is a key of keys
+        if (value is not None) and (isinstance(value, dict)) and not isinstance(value, list):
+            valueKeys = list(value.keys())
+            for i in range(0, len(valueKeys)):
+                if not (valueKeys[i] in keys):
+                    return False
+            return True
+        return False
+
     def parse_transactions(self, transactions: List[Any], currency: Currency = None, since: Int = None, limit: Int = None, params={}):
         transactions = self.to_array(transactions)
         result = []
@@ -4436,11 +5048,35 @@ class Exchange(object):
         return results
 
     def fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
+        if self.is_single_flight_request(api, method):
+            return self.fetch_single_flight(path, api, method, params, headers, body, config)
+        return self.send_request(path, api, method, params, headers, body, config)
+
+    def is_single_flight_request(self, api, method):
+        # options['singleFlight'] shares identical public GET requests between concurrent callers
+        # sections named private are signed and never shared
+        singleFlight = self.safe_value(self.options, 'singleFlight')
+        if (method != 'GET') or not singleFlight:
+            return False
+        parts = api
+        if not isinstance(api, list):
+            parts = [api]
+        isPublic = False
+        for i in range(0, len(parts)):
+            part = parts[i].lower()
+            if part.find('private') >= 0:
+                return False
+            if part.find('public') >= 0:
+                isPublic = True
+        return isPublic
+
+    def send_request(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}, request: Any = None):
         if self.enableRateLimit:
             cost = self.calculate_rate_limiter_cost(api, method, path, params, config)
-            self.throttle(cost)
+            self.throttle(cost, api)
         self.lastRestRequestTimestamp = self.milliseconds()
-        request = self.sign(path, api, method, params, headers, body)
+        if request is None:
+            request = self.sign(path, api, method, params, headers, body)
         self.last_request_headers = request['headers']
         self.last_request_body = request['body']
         self.last_request_url = request['url']
@@ -4621,38 +5257,45 @@ class Exchange(object):
         })
 
     def safe_market(self, marketId: Str = None, market: Market = None, delimiter: Str = None, marketType: Str = None):
+        if (marketId is None) and (market is not None):
+            return market
+        if (marketId is not None) and (self.markets_by_id is not None) and (marketId in self.markets_by_id):
+            # known market ids are returned before the structure for unknown ones is built
+            markets = self.markets_by_id[marketId]
+            numMarkets = len(markets)
+            if numMarkets == 1:
+                return markets[0]
+            if marketType is None:
+                if market is None:
+                    raise ArgumentsRequired(self.id + ' safeMarket() requires a fourth argument for ' + marketId + ' to disambiguate between different markets with the same market id')
+                else:
+                    marketType = market['type']
+            # the market of a type is memoized for market ids shared by markets of different types
+            if self.markets_by_id_type is None:
+                self.markets_by_id_type = {}
+            if not (marketType in self.markets_by_id_type):
+                self.markets_by_id_type[marketType] = {}
+            if marketId in self.markets_by_id_type[marketType]:
+                return self.markets_by_id_type[marketType][marketId]
+            for i in range(0, len(markets)):
+                currentMarket = markets[i]
+                if currentMarket[marketType]:
+                    self.markets_by_id_type[marketType][marketId] = currentMarket
+                    return currentMarket
         result = self.safe_market_structure({
             'symbol': marketId,
             'marketId': marketId,
         })
-        if marketId is not None:
-            if (self.markets_by_id is not None) and (marketId in self.markets_by_id):
-                markets = self.markets_by_id[marketId]
-                numMarkets = len(markets)
-                if numMarkets == 1:
-                    return markets[0]
-                else:
-                    if marketType is None:
-                        if market is None:
-                            raise ArgumentsRequired(self.id + ' safeMarket() requires a fourth argument for ' + marketId + ' to disambiguate between different markets with the same market id')
-                        else:
-                            marketType = market['type']
-                    for i in range(0, len(markets)):
-                        currentMarket = markets[i]
-                        if currentMarket[marketType]:
-                            return currentMarket
-            elif delimiter is not None and delimiter != '':
-                parts = marketId.split(delimiter)
-                partsLength = len(parts)
-                if partsLength == 2:
-                    result['baseId'] = self.safe_string(parts, 0)
-                    result['quoteId'] = self.safe_string(parts, 1)
-                    result['base'] = self.safe_currency_code(result['baseId'])
-                    result['quote'] = self.safe_currency_code(result['quoteId'])
-                    result['symbol'] = result['base'] + '/' + result['quote']
-                    return result
-                else:
-                    return result
+        if (marketId is not None) and (delimiter is not None) and (delimiter != '') and not ((self.markets_by_id is not None) and (marketId in self.markets_by_id)):
+            parts = marketId.split(delimiter)
+            partsLength = len(parts)
+            if partsLength == 2:
+                result['baseId'] = self.safe_string(parts, 0)
+                result['quoteId'] = self.safe_string(parts, 1)
+                result['base'] = self.safe_currency_code(result['baseId'])
+                result['quote'] = self.safe_currency_code(result['quoteId'])
+                result['symbol'] = result['base'] + '/' + result['quote']
+            return result
         if market is not None:
             return market
         return result
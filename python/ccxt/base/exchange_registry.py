@@ -0,0 +1,39 @@
+import importlib
+import sys
+import types
+
+__all__ = [
+    'register_exchanges',
+]
+
+
+class ExchangeRegistry(types.ModuleType):
+    # a package that imports its exchange modules on first access, ccxt.binance imports ccxt/binance.py
+    # the import system sets a submodule as an attribute of its package once it is loaded
+    # that attribute is replaced with the exchange class, so ccxt.binance stays the class
+    # even when ccxt/binance.py was imported by another module, like ccxt/binanceusdm.py
+
+    def __getattr__(self, name):
+        if name in self.__dict__.get('_exchange_ids', ()):
+            importlib.import_module(self.__name__ + '.' + name)
+            return self.__dict__[name]
+        raise AttributeError('module ' + repr(self.__name__) + ' has no attribute ' + repr(name))
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and name in self.__dict__.get('_exchange_ids', ()):
+            value = getattr(value, name)
+        super(ExchangeRegistry, self).__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | self.__dict__.get('_exchange_ids', set()))
+
+
+def register_exchanges(module_name, exchanges):
+    module = sys.modules[module_name]
+    module.__class__ = ExchangeRegistry
+    module._exchange_ids = frozenset(exchanges)
+    # exchange modules imported before the registry was installed
+    for exchange_id in exchanges:
+        submodule = sys.modules.get(module_name + '.' + exchange_id)
+        if submodule is not None:
+            setattr(module, exchange_id, submodule)
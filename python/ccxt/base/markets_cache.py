@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from ccxt.base.private_directory import private_directory
+
+__all__ = [
+    'MarketsCache',
+    'markets_fingerprint',
+]
+
+# the markets tables that set_markets builds
+MARKETS_CACHE_KEYS = [
+    'markets',
+    'markets_by_id',
+    'symbols',
+    'ids',
+    'currencies',
+    'currencies_by_id',
+    'codes',
+    'baseCurrencies',
+    'quoteCurrencies',
+]
+
+# the tables a cache file holds and their types, the others are rebuilt from these on restore
+MARKETS_CACHE_SCHEMA = {
+    'markets': dict,
+    'markets_by_id': dict,
+    'currencies': dict,
+    'baseCurrencies': dict,
+    'quoteCurrencies': dict,
+}
+
+FORMAT = 'ccxt-markets-2'
+
+
+def markets_fingerprint(exchange_id, config, sandbox, version):
+    # identifies the markets an exchange instance loads, instances with equal fingerprints load the same tables
+    # objects that are not json are keyed by their name, reprs with addresses differ between processes
+    fingerprint = json.dumps([config, sandbox, version], sort_keys=True, default=lambda value: getattr(value, '__name__', type(value).__name__))
+    return exchange_id + '-' + hashlib.sha1(fingerprint.encode()).hexdigest()[:16]
+
+
+def options_snapshot(options):
+    # the json of every top-level option, to find the options that loading the markets sets
+    return dict((key, json.dumps(value, sort_keys=True, default=repr)) for key, value in options.items())
+
+
+def changed_options(options, snapshot):
+    return dict((key, value) for key, value in options.items() if snapshot.get(key) != json.dumps(value, sort_keys=True, default=repr))
+
+
+class MarketsCache:
+    # a json file per exchange id, constructor config, sandbox mode and ccxt version, laid out as
+    #   {"format": FORMAT, "digest": sha1 of the raw markets and currencies, "tables": {...}, "options": {...}}
+    # tables are the MARKETS_CACHE_SCHEMA tables, options are the ones that fetching the markets set, like network ids
+    # the digest works as an etag: a revalidation that fetched the same data only touches the file
+    # the files are data only and live in a directory private to the current user, a file that does not match the schema is ignored
+    # files are replaced atomically, readers never see a partial write
+
+    def __init__(self, directory=None):
+        self.directory = directory
+
+    def path(self, fingerprint):
+        # raises OSError if the directory can not be created or is not private
+        if self.directory is None:
+            directory = private_directory('markets')
+        else:
+            directory = self.directory
+            os.makedirs(directory, 0o700, exist_ok=True)
+        return os.path.join(directory, fingerprint + '.json')
+
+    @staticmethod
+    def digest(markets, currencies):
+        return hashlib.sha1(json.dumps([markets, currencies], default=repr).encode()).hexdigest()
+
+    @staticmethod
+    def valid(entry):
+        if not isinstance(entry, dict) or entry.get('format') != FORMAT:
+            return False
+        if not isinstance(entry.get('digest'), str) or not isinstance(entry.get('options'), dict):
+            return False
+        tables = entry.get('tables')
+        return isinstance(tables, dict) and all(isinstance(tables.get(key), kind) for key, kind in MARKETS_CACHE_SCHEMA.items())
+
+    def read(self, fingerprint):
+        # returns (age in ms, digest, tables, options) or None if there is no usable file
+        try:
+            with open(self.path(fingerprint), 'rb') as file:
+                age = (time.time() - os.fstat(file.fileno()).st_mtime) * 1000
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not self.valid(entry):
+            return None
+        return age, entry['digest'], entry['tables'], entry['options']
+
+    def write(self, fingerprint, digest, tables, options):
+        # raises TypeError if the tables or options are not json
+        data = json.dumps({
+            'format': FORMAT,
+            'digest': digest,
+            'tables': dict((key, tables[key]) for key in MARKETS_CACHE_SCHEMA),
+            'options': options,
+        }).encode()
+        path = self.path(fingerprint)
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def touch(self, fingerprint):
+        try:
+            os.utime(self.path(fingerprint))
+        except OSError:
+            pass
@@ -0,0 +1,61 @@
+import threading
+import weakref
+
+from ccxt.base.markets_cache import MARKETS_CACHE_KEYS
+
+__all__ = [
+    'MarketsStore',
+]
+
+
+class MarketsStore:
+    # the tables built by set_markets, shared by every attached exchange instance with the same fingerprint
+    # the tables are shared by reference and replaced as a whole on reload, they are never updated in place
+    # publish() assigns the new tables to all attached instances, so they switch together
+    # the options that loading the markets set, like network ids, are copied to every attached instance with the tables
+    # loading holds the asyncio future of the load in progress, lock serializes loads of sync instances
+
+    stores = weakref.WeakValueDictionary()
+    stores_lock = threading.Lock()
+
+    def __init__(self, key):
+        self.key = key
+        self.tables = None
+        self.options = {}
+        self.version = 0
+        self.instances = weakref.WeakSet()
+        self.loading = None
+        self.reloading = False
+        self.lock = threading.Lock()
+
+    @classmethod
+    def attach(cls, key, exchange):
+        with cls.stores_lock:
+            store = cls.stores.get(key)
+            if store is None:
+                store = cls(key)
+                cls.stores[key] = store
+            store.instances.add(exchange)
+        if store.tables is not None:
+            store.assign(exchange, store.tables, store.options)
+        return store
+
+    @staticmethod
+    def assign(exchange, tables, options):
+        for key in MARKETS_CACHE_KEYS:
+            setattr(exchange, key, tables[key])
+        exchange.markets_by_id_type = None
+        exchange.markets_index = None
+        if options:
+            exchange.options = exchange.deep_extend(exchange.options, options)
+
+    def publish(self, exchange, options):
+        # makes the tables just loaded by exchange the tables of every attached instance
+        # options are the ones that changed while exchange loaded them, they add up over reloads
+        tables = dict((key, getattr(exchange, key)) for key in MARKETS_CACHE_KEYS)
+        self.tables = tables
+        self.options.update(options)
+        self.version += 1
+        for instance in list(self.instances):
+            if instance is not exchange:
+                self.assign(instance, tables, self.options)
@@ -0,0 +1,34 @@
+import os
+import stat
+import tempfile
+
+__all__ = [
+    'private_directory',
+]
+
+
+def check_private(path):
+    # the directory must belong to the current user and be closed to everyone else
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or (info.st_mode & 0o077):
+        raise PermissionError(path + ' is not a directory private to the current user')
+
+
+def private_directory(name):
+    # a directory under the temporary directory that only the current user can read and write
+    # files that other local users could plant there are loaded or mapped, so the shared temporary directory is never used directly
+    # raises PermissionError if the directory exists but belongs to another user or is open to other users
+    if not hasattr(os, 'getuid'):
+        # windows gives every user its own temporary directory
+        path = os.path.join(tempfile.gettempdir(), 'ccxt', name)
+        os.makedirs(path, exist_ok=True)
+        return path
+    parent = os.path.join(tempfile.gettempdir(), 'ccxt-' + str(os.getuid()))
+    path = os.path.join(parent, name)
+    for directory in (parent, path):
+        try:
+            os.mkdir(directory, 0o700)
+        except FileExistsError:
+            pass
+        check_private(directory)
+    return path
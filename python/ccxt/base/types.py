@@ -603,3 +603,9 @@ class ConstructorArgs(TypedDict, total=False):
     hostname: str
     urls: Dict[str, Any]
     headers: Dict[str, Any]
+    transport: str
+    connectionLimit: int
+    connectionLimitPerHost: int
+    keepAliveTimeout: Num
+    dnsCacheTtl: Num
+    prewarmConnections: int
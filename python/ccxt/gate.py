@@ -664,6 +664,19 @@ class gate(Exchange, ImplicitAPI):
                 'X-Gate-Channel-Id': 'ccxt',
             },
             'options': {
+                'rateLimiter': {
+                    'headers': {
+                        # requests left in the per endpoint window
+                        'x-gate-ratelimit-requests-remain': {
+                            'type': 'remaining',
+                            'limitHeader': 'x-gate-ratelimit-limit',
+                            'resetHeader': 'x-gate-ratelimit-reset-timestamp',
+                            'resetType': 'timestamp',
+                            'window': 10000,
+                            'scope': 'path',
+                        },
+                    },
+                },
                 'timeDifference': 0,  # the difference between system clock and exchange clock
                 'adjustForTimeDifference': False,  # controls the adjustment logic upon instantiation
                 'sandboxMode': False,
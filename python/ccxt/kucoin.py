@@ -655,6 +655,18 @@ class kucoin(Exchange, ImplicitAPI):
                 'FUD': 'FTX Users\' Debt',
             },
             'options': {
+                'rateLimiter': {
+                    'headers': {
+                        # weight left in the resource pool of the api host
+                        'gw-ratelimit-remaining': {
+                            'type': 'remaining',
+                            'limitHeader': 'gw-ratelimit-limit',
+                            'resetHeader': 'gw-ratelimit-reset',
+                            'resetType': 'delta',
+                            'window': 30000,
+                        },
+                    },
+                },
                 'hf': None,  # would be auto set to `true/false` after first load
                 'version': 'v1',
                 'symbolSeparator': '-',
@@ -2264,6 +2264,40 @@ class okx(Exchange, ImplicitAPI):
             'fee': fee,
         }, market)
 
+    def parse_trades_batch(self, trades: List[Any], market: Market = None):
+        # public trades, {"instId", "side", "sz", "px", "tradeId", "ts"}, are parsed in one loop
+        # that only reads their fields and resolves every instId once, other trades go through parseTrade
+        publicTradeKeys: dict = {'instId': True, 'side': True, 'sz': True, 'px': True, 'tradeId': True, 'ts': True, 'count': True, 'source': True}
+        markets: dict = {}
+        result = []
+        for i in range(0, len(trades)):
+            trade = trades[i]
+            marketId = self.safe_string(trade, 'instId') if self.has_only_keys(trade, publicTradeKeys) else None
+            if marketId is None:
+                result.append(self.parse_trade(trade, market))
+            else:
+                if not (marketId in markets):
+                    tradeMarket = self.safe_market(marketId, market, '-')
+                    markets[marketId] = [tradeMarket['symbol'], self.safe_string(tradeMarket, 'contractSize'), self.safe_bool(tradeMarket, 'inverse', False)]
+                cached = markets[marketId]
+                timestamp = self.safe_integer(trade, 'ts')
+                result.append(self.safe_trade_without_fee({
+                    'info': trade,
+                    'timestamp': timestamp,
+                    'datetime': self.iso8601(timestamp),
+                    'symbol': cached[0],
+                    'id': self.safe_string(trade, 'tradeId'),
+                    'order': None,
+                    'type': None,
+                    'takerOrMaker': None,
+                    'side': self.safe_string(trade, 'side'),
+                    'price': self.safe_string(trade, 'px'),
+                    'amount': self.safe_string(trade, 'sz'),
+                    'cost': None,
+                    'fee': None,
+                }, cached[1], cached[2]))
+        return result
+
     def fetch_trades(self, symbol: str, since: Int = None, limit: Int = None, params={}) -> List[Trade]:
         """
         get the list of most recent trades for a particular symbol
@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById
 import hashlib
 from ccxt.base.types import Any, Balances, Int, Order, OrderBook, Str, Trade
 from ccxt.async_support.base.ws.client import Client
@@ -145,7 +145,7 @@ class ascendex(ccxt.async_support.ascendex):
         stored = self.safe_value(self.ohlcvs[symbol], timeframe)
         if stored is None:
             limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-            stored = ArrayCacheByTimestamp(limit)
+            stored = self.ohlcv_cache(limit)
             self.ohlcvs[symbol][timeframe] = stored
         stored.append(parsed)
         client.resolve(stored, messageHash)
@@ -337,17 +337,8 @@ class ascendex(ccxt.async_support.ascendex):
             self.handle_order_book_message(client, message, orderbook)
             client.resolve(orderbook, messageHash)
 
-    def handle_delta(self, bookside, delta):
-        #
-        # ["40990.47","0.01619"],
-        #
-        price = self.safe_float(delta, 0)
-        amount = self.safe_float(delta, 1)
-        bookside.store(price, amount)
-
     def handle_deltas(self, bookside, deltas):
-        for i in range(0, len(deltas)):
-            self.handle_delta(bookside, deltas[i])
+        bookside.storeDeltas(deltas)
 
     def handle_order_book_message(self, client: Client, message, orderbook):
         #
@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById
 from ccxt.base.types import Any, Balances, Int, Order, OrderBook, Str, Strings, Ticker, Tickers, Trade
 from ccxt.async_support.base.ws.client import Client
 from typing import List
@@ -864,7 +864,7 @@ class bingx(ccxt.async_support.bingx):
             subscriptionHash = dataType
             subscription = client.subscriptions[subscriptionHash]
             limit = self.safe_integer(subscription, 'limit')
-            self.ohlcvs[symbol][unifiedTimeframe] = ArrayCacheByTimestamp(limit)
+            self.ohlcvs[symbol][unifiedTimeframe] = self.ohlcv_cache(limit)
         stored = self.ohlcvs[symbol][unifiedTimeframe]
         for i in range(0, len(candles)):
             candle = candles[i]
@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById
 import hashlib
 from ccxt.base.types import Any, Balances, Int, Order, OrderBook, Str, Ticker, Trade
 from ccxt.async_support.base.ws.client import Client
@@ -176,7 +176,7 @@ class bitfinex(ccxt.async_support.bitfinex):
         stored = self.safe_value(self.ohlcvs[symbol], timeframe)
         if stored is None:
             limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-            stored = ArrayCacheByTimestamp(limit)
+            stored = self.ohlcv_cache(limit)
             self.ohlcvs[symbol][timeframe] = stored
         ohlcvsLength = len(ohlcvs)
         for i in range(0, ohlcvsLength):
@@ -620,26 +620,11 @@ class bitfinex(ccxt.async_support.bitfinex):
         book = self.safe_value(self.orderbooks, symbol)
         if book is None:
             return
-        depth = 25  # covers the first 25 bids and asks
-        stringArray = []
-        bids = book['bids']
-        asks = book['asks']
         prec = self.safe_string(subscription, 'prec', 'P0')
         isRaw = (prec == 'R0')
         idToCheck = 2 if isRaw else 0
-        # pepperoni pizza from bitfinex
-        for i in range(0, depth):
-            bid = self.safe_value(bids, i)
-            ask = self.safe_value(asks, i)
-            if bid is not None:
-                stringArray.append(self.number_to_string(bids[i][idToCheck]))
-                stringArray.append(self.number_to_string(bids[i][1]))
-            if ask is not None:
-                stringArray.append(self.number_to_string(asks[i][idToCheck]))
-                aski1 = asks[i][1]
-                stringArray.append(self.number_to_string(-aski1))
-        payload = ':'.join(stringArray)
-        localChecksum = self.crc32(payload, True)
+        # pepperoni pizza from bitfinex, covers the first 25 bids and asks
+        localChecksum = self.order_book_checksum(symbol, book, 'signed', 25, idToCheck)
         responseChecksum = self.safe_integer(message, 2)
         if responseChecksum != localChecksum:
             del client.subscriptions[messageHash]
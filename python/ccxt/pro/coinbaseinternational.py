@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache
 import hashlib
 from ccxt.base.types import Any, Int, Market, OrderBook, Strings, Ticker, Tickers, FundingRate, FundingRates, Trade
 from ccxt.async_support.base.ws.client import Client
@@ -477,7 +477,7 @@ class coinbaseinternational(ccxt.async_support.coinbaseinternational):
         self.ohlcvs[symbol] = self.safe_value(self.ohlcvs, symbol, {})
         if self.safe_value(self.ohlcvs[symbol], timeframe) is None:
             limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-            self.ohlcvs[symbol][timeframe] = ArrayCacheByTimestamp(limit)
+            self.ohlcvs[symbol][timeframe] = self.ohlcv_cache(limit)
         stored = self.ohlcvs[symbol][timeframe]
         data = self.safe_list(message, 'candles', [])
         for i in range(0, len(data)):
@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById
 from ccxt.base.types import Any, Balances, Int, Num, Order, OrderBook, OrderSide, OrderType, Str, Strings, Ticker, Tickers, Trade
 from ccxt.async_support.base.ws.client import Client
 from typing import List
@@ -442,7 +442,7 @@ class kraken(ccxt.async_support.kraken):
             stored = self.safe_value(self.ohlcvs[symbol], timeframe)
             if stored is None:
                 limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-                stored = ArrayCacheByTimestamp(limit)
+                stored = self.ohlcv_cache(limit)
                 self.ohlcvs[symbol][timeframe] = stored
             stored.append(result)
             client.resolve(stored, messageHash)
@@ -811,16 +811,9 @@ class kraken(ccxt.async_support.kraken):
                 amountParts = amountString.split('.')
                 priceLength = len(priceParts[1]) - 0
                 amountLength = len(amountParts[1]) - 0
-                payloadArray = []
+                localChecksum = None
                 if c is not None:
-                    for i in range(0, 10):
-                        formatted = self.format_number(storedAsks[i][0], priceLength) + self.format_number(storedAsks[i][1], amountLength)
-                        payloadArray.append(formatted)
-                    for i in range(0, 10):
-                        formatted = self.format_number(storedBids[i][0], priceLength) + self.format_number(storedBids[i][1], amountLength)
-                        payloadArray.append(formatted)
-                payload = ''.join(payloadArray)
-                localChecksum = self.crc32(payload, False)
+                    localChecksum = self.order_book_checksum(symbol, orderbook, 'stripped', 10, 0, priceLength, amountLength)
                 if localChecksum != c:
                     error = ChecksumError(self.id + ' ' + self.orderbook_checksum_message(symbol))
                     del client.subscriptions[messageHash]
@@ -832,21 +825,6 @@ class kraken(ccxt.async_support.kraken):
             orderbook['datetime'] = self.iso8601(timestamp)
             client.resolve(orderbook, messageHash)
 
-    def format_number(self, n, length):
-        stringNumber = self.number_to_string(n)
-        parts = stringNumber.split('.')
-        integer = self.safe_string(parts, 0)
-        decimals = self.safe_string(parts, 1, '')
-        paddedDecimals = decimals.ljust(length, '0')
-        joined = integer + paddedDecimals
-        i = 0
-        while(joined[i] == '0'):
-            i += 1
-        if i > 0:
-            return joined[i:]
-        else:
-            return joined
-
     def custom_handle_deltas(self, bookside, deltas, timestamp=None):
         for j in range(0, len(deltas)):
             delta = deltas[j]
@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide
 import hashlib
 from ccxt.base.types import Any, Balances, Int, Liquidation, Num, Order, OrderBook, OrderSide, OrderType, Position, Str, Strings, Ticker, Tickers, FundingRate, FundingRates, Trade
 from ccxt.async_support.base.ws.client import Client
@@ -1016,7 +1016,7 @@ class okx(ccxt.async_support.okx):
             stored = self.safe_value(self.ohlcvs[symbol], timeframe)
             if stored is None:
                 limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-                stored = ArrayCacheByTimestamp(limit)
+                stored = self.ohlcv_cache(limit)
                 self.ohlcvs[symbol][timeframe] = stored
             stored.append(parsed)
             messageHash = channel + ':' + market['id']
@@ -1172,22 +1172,8 @@ class okx(ccxt.async_support.okx):
         """
         return await self.un_watch_order_book_for_symbols([symbol], params)
 
-    def handle_delta(self, bookside, delta):
-        #
-        #     [
-        #         "31685",  # price
-        #         "0.78069158",  # amount
-        #         "0",  # liquidated orders
-        #         "17"  # orders
-        #     ]
-        #
-        price = self.safe_float(delta, 0)
-        amount = self.safe_float(delta, 1)
-        bookside.store(price, amount)
-
     def handle_deltas(self, bookside, deltas):
-        for i in range(0, len(deltas)):
-            self.handle_delta(bookside, deltas[i])
+        bookside.storeDeltas(deltas)
 
     def handle_order_book_message(self, client: Client, message, orderbook, messageHash, market=None):
         #
@@ -1222,19 +1208,8 @@ class okx(ccxt.async_support.okx):
         if checksum:
             prevSeqId = self.safe_integer(message, 'prevSeqId')
             nonce = orderbook['nonce']
-            asksLength = len(storedAsks)
-            bidsLength = len(storedBids)
-            payloadArray = []
-            for i in range(0, 25):
-                if i < bidsLength:
-                    payloadArray.append(self.number_to_string(storedBids[i][0]))
-                    payloadArray.append(self.number_to_string(storedBids[i][1]))
-                if i < asksLength:
-                    payloadArray.append(self.number_to_string(storedAsks[i][0]))
-                    payloadArray.append(self.number_to_string(storedAsks[i][1]))
-            payload = ':'.join(payloadArray)
             responseChecksum = self.safe_integer(message, 'checksum')
-            localChecksum = self.crc32(payload, True)
+            localChecksum = self.order_book_checksum(symbol, orderbook, 'interleaved', 25)
             error = None
             if prevSeqId != -1 and nonce != prevSeqId:
                 error = InvalidNonce(self.id + ' watchOrderBook received invalid nonce')
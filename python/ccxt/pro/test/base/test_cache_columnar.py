@@ -0,0 +1,48 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.cache import ArrayCacheByTimestamp, ArrayCacheByTimestampColumnar, numpy  # noqa: E402
+
+
+def test_ws_cache_columnar():
+    if numpy is None:
+        return
+    columnar = ArrayCacheByTimestampColumnar(3)
+    reference = ArrayCacheByTimestamp(3)
+    candles = [
+        [1, 1.0, 2.0, 0.5, 1.5, 10.0],
+        [2, 1.5, 2.5, 1.0, 2.0, 20.0],
+        [2, 1.5, 3.0, 1.0, 2.5, 25.0],
+        [3, 2.5, 3.0, 2.0, 2.0, None],
+        [4, 2.0, 2.0, 1.0, 1.0, 5.0],
+        [5, 1.0, 1.0, 1.0, 1.0, 1.0],
+        [6, 1.0, 1.0, 1.0, 1.0, 1.0],
+        [6, 1.0, 4.0, 1.0, 4.0, 2.0],
+    ]
+    for candle in candles:
+        columnar.append(list(candle))
+        reference.append(list(candle))
+        assert columnar == reference
+        assert len(columnar) == len(reference)
+        assert columnar[-1] == reference[-1]
+        assert columnar[1:] == reference[1:]
+    assert columnar.getLimit(None, None) == reference.getLimit(None, None)
+    assert columnar.timestamps.tolist() == [4, 5, 6]
+    assert columnar.closes.tolist() == [1.0, 1.0, 4.0]
+    # the columns are views of the live buffer
+    closes = columnar.closes
+    columnar.append([6, 1.0, 4.0, 1.0, 3.0, 2.0])
+    assert closes[-1] == 3.0
+    assert columnar.getLimit(None, None) == 1
+    assert sorted(columnar.hashmap) == [4, 5, 6]
+    # rows are copies, the stored candle only changes through append
+    row = columnar[-1]
+    assert row is not columnar[-1]
+    row[4] = 100.0
+    assert columnar[-1][4] == 3.0
+    # a missing timestamp reads back as None like the other missing values
+    columnar.append([None, 1.0, 1.0, 1.0, 1.0, None])
+    assert columnar[-1] == [None, 1.0, 1.0, 1.0, 1.0, None]
@@ -0,0 +1,25 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.cache import ArrayCacheBySymbolById  # noqa: E402
+
+
+def test_ws_cache_keyed():
+    cache = ArrayCacheBySymbolById(3)
+    cache.append({'symbol': 'BTC/USDT', 'id': '1', 'filled': 0})
+    cache.append({'symbol': 'ETH/USDT', 'id': '1', 'filled': 0})
+    cache.append({'symbol': 'BTC/USDT', 'id': '2', 'filled': 0})
+    # the same id on another symbol is a different order
+    cache.append({'symbol': 'BTC/USDT', 'id': '1', 'filled': 1})
+    assert [(order['symbol'], order['id']) for order in cache] == [('ETH/USDT', '1'), ('BTC/USDT', '2'), ('BTC/USDT', '1')]
+    assert cache[-1]['filled'] == 1
+    assert cache[1]['id'] == '2'
+    assert [order['id'] for order in cache[1:]] == ['2', '1']
+    assert len(cache) == 3
+    # the oldest order is evicted once the cache is full
+    cache.append({'symbol': 'SOL/USDT', 'id': '3', 'filled': 0})
+    assert [(order['symbol'], order['id']) for order in cache] == [('BTC/USDT', '2'), ('BTC/USDT', '1'), ('SOL/USDT', '3')]
+    assert '1' not in cache.hashmap['ETH/USDT']
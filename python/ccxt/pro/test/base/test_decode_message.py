@@ -0,0 +1,38 @@
+import gzip
+import json
+import os
+import sys
+import zlib
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.aiohttp_client import AiohttpClient
+from ccxt.async_support.base.ws.functions import gunzip, gunzip_bytes, inflate
+
+
+def deflate(data):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def test_ws_decode_message():
+    message = {'ch': 'market.btcusdt.trade.detail', 'ts': 1710327661939, 'tick': {'data': [{'price': 73238.7, 'amount': 0.00109, 'direction': 'buy'}]}}
+    encoded = json.dumps(message).encode()
+    # text and binary frames decode to the same objects
+    assert AiohttpClient.decode_message(encoded.decode()) == message
+    assert AiohttpClient.decode_message(encoded) == message
+    assert AiohttpClient.decode_message(bytearray(encoded)) == message
+    assert AiohttpClient.decode_message(memoryview(encoded)) == message
+    assert AiohttpClient.decode_message(b'[1,2]') == [1, 2]
+    # payloads that are not json objects stay str
+    assert AiohttpClient.decode_message('Ping') == 'Ping'
+    assert AiohttpClient.decode_message(b'Ping') == 'Ping'
+    assert AiohttpClient.decode_message(b'{') == '{'
+    assert AiohttpClient.decode_message(b'') == ''
+    # compressed frames
+    assert gunzip_bytes(gzip.compress(encoded)) == encoded
+    assert gunzip(gzip.compress(b'Ping')) == 'Ping'
+    assert gunzip_bytes(gzip.compress(b'{"a":') + gzip.compress(b'1}')) == b'{"a":1}'
+    assert AiohttpClient.decode_message(gunzip_bytes(gzip.compress(encoded))) == message
+    assert AiohttpClient.decode_message(inflate(deflate(encoded))) == message
@@ -0,0 +1,41 @@
+import asyncio
+import gzip
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from aiohttp import WSMessage, WSMsgType
+from ccxt.async_support.base.ws.fast_client import FastClient
+
+
+async def test_ws_decode_workers():
+    received = []
+    closes = []
+    client = FastClient('wss://example.com', lambda client, message: received.append(message), None, lambda client, code: closes.append((code, len(received))), None, {
+        'gunzip': True,
+        'decodeWorkers': 4,
+        'asyncio_loop': asyncio.get_running_loop(),
+    })
+    client.decoder = ThreadPoolExecutor(max_workers=client.decodeWorkers)
+    client.closed = lambda: True
+    # large and small frames decode in parallel and are dispatched in the order they arrived
+    for i in range(50):
+        size = 2000 if i % 3 == 0 else 1
+        client.handle_message(WSMessage(WSMsgType.BINARY, gzip.compress(json.dumps({'i': i, 'data': list(range(size))}).encode()), None))
+    client.handle_message(WSMessage(WSMsgType.BINARY, gzip.compress(b'Ping'), None))
+    client.handle_message(WSMessage(WSMsgType.TEXT, '{"i":50}', None))
+    client.handle_message(WSMessage(WSMsgType.CLOSE, 1000, None))
+    assert received == []
+    for _ in range(100):
+        if closes:
+            break
+        await asyncio.sleep(0.01)
+    assert [message['i'] for message in received if isinstance(message, dict)] == list(range(51))
+    assert received[50] == 'Ping'
+    # the close is handled after the frames received before it
+    assert closes == [(1000, 52)]
+    assert client.decoder is None
@@ -178,6 +178,63 @@ async def test_closed_by_user():
     except Exception as e:
         assert False, f"Received Exception {e}"
 
+async def test_race_closed_by_user_waits_for_all():
+    print("test_race_closed_by_user_waits_for_all")
+    future1 = Future()
+    future2 = Future()
+    race_future = Future.race([future1, future2])
+    future1.reject(ExchangeClosedByUser())
+    await asyncio.sleep(0.01)
+    assert not race_future.done(), "Expected the race to wait for future2"
+    future2.reject(ExchangeClosedByUser())
+    try:
+        await race_future
+        assert False, "Expected an ExchangeClosedByUser"
+    except ExchangeClosedByUser:
+        assert future1.done() and future2.done()
+
+async def test_race_all_cancelled():
+    print("test_race_all_cancelled")
+    future1 = Future()
+    future2 = Future()
+    race_future = Future.race([future1, future2])
+    future1.cancel()
+    future2.cancel()
+    try:
+        await race_future
+        assert False, "Expected an ExchangeClosedByUser"
+    except ExchangeClosedByUser as e:
+        assert str(e) == "Connection closed by the user", f"Expected 'Connection closed by the user', got '{str(e)}'"
+
+async def test_race_reject_on_first_exception():
+    print("test_race_reject_on_first_exception")
+    future1 = Future()
+    future2 = Future()
+    future3 = Future()
+    race_future = Future.race([future1, future2, future3])
+    # a future closed by the user does not hold back another exception
+    future1.reject(ExchangeClosedByUser())
+    future2.reject(Exception("Error in future2"))
+    try:
+        await race_future
+        assert False, "Expected an exception but none was raised"
+    except Exception as e:
+        assert str(e) == "Error in future2", f"Expected 'Error in future2', got '{str(e)}'"
+    assert not future3.done(), "Expected future3 to be pending"
+
+async def test_race_cancel_detaches_callbacks():
+    print("test_race_cancel_detaches_callbacks")
+    future1 = Future()
+    future2 = Future()
+    race_future = Future.race([future1, future2])
+    assert future1._callbacks and future2._callbacks, "Expected the race callbacks on the futures"
+    race_future.cancel()
+    await asyncio.sleep(0)
+    assert not future1._callbacks and not future2._callbacks, "Expected the race callbacks to be removed"
+    future1.resolve("late")
+    await asyncio.sleep(0)
+    assert race_future.cancelled()
+
 async def test_reject_with_non_exception():
     print("test_reject_with_non_exception")
     future = Future()
@@ -202,5 +259,9 @@ async def test_ws_future():
     await test_race_with_wait_for_completion()
     await test_race_with_precompleted_future()
     await test_closed_by_user()
+    await test_race_closed_by_user_waits_for_all()
+    await test_race_all_cancelled()
+    await test_race_reject_on_first_exception()
+    await test_race_cancel_detaches_callbacks()
     await test_reject_with_non_exception()
 
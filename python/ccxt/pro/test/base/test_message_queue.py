@@ -0,0 +1,57 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.client import Client
+
+
+class ReadingClient(Client):
+
+    def __init__(self, config):
+        super(ReadingClient, self).__init__('wss://example.com', None, None, None, None, config)
+        self.reading = []
+
+    def pause_reading(self):
+        self.reading.append('pause')
+
+    def resume_reading(self):
+        self.reading.append('resume')
+
+
+async def test_ws_message_queue():
+    # without policies nothing is queued, like before
+    client = ReadingClient({})
+    client.resolve(1, 'trade:BTC/USDT')
+    assert client.message_queue == {}
+    # the default policy drops the oldest messages and counts them
+    client = ReadingClient({'useMessageQueue': True, 'messageQueueSize': 3})
+    for i in range(5):
+        client.resolve(i, 'trade:BTC/USDT')
+    assert client.future('trade:BTC/USDT').result() == 2
+    stats = client.message_queue_stats()['queues']['trade:BTC/USDT']
+    assert stats['depth'] == 2
+    assert stats['dropped'] == 2
+    assert stats['received'] == 5
+    assert stats['delivered'] == 1
+    assert stats['highWater'] == 3
+    assert stats['lag'] >= 0
+    # policies by message hash prefix, conflation keeps the latest state
+    client = ReadingClient({'messageQueuePolicies': {'orderbook': 'conflate', 'trade:ETH/USDT': {'policy': 'block', 'maxSize': 4}}})
+    for i in range(5):
+        client.resolve(i, 'orderbook:BTC/USDT')
+        client.resolve(i, 'ticker:BTC/USDT')
+    assert 'ticker:BTC/USDT' not in client.message_queue
+    assert client.future('orderbook:BTC/USDT').result() == 4
+    assert client.message_queue_stats()['queues']['orderbook:BTC/USDT']['conflated'] == 4
+    # a full blocking queue pauses reading until its consumer drained half of it, without dropping anything
+    for i in range(6):
+        client.resolve(i, 'trade:ETH/USDT')
+    assert client.reading == ['pause']
+    assert client.message_queue_stats()['readingPaused']
+    results = [client.future('trade:ETH/USDT').result() for i in range(4)]
+    assert client.reading == ['pause', 'resume']
+    assert not client.reading_paused
+    assert results == [0, 1, 2, 3]
+    assert client.message_queue_stats()['queues']['trade:ETH/USDT']['dropped'] == 0
@@ -0,0 +1,86 @@
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.order_book import OrderBook, CountedOrderBook, IndexedOrderBook  # noqa: E402
+from ccxt.async_support.base.ws.order_book_side import Asks, Bids  # noqa: E402
+
+
+def random_deltas(rng, count):
+    return [[str(rng.randrange(900, 1100) / 10), str(rng.choice([0, 0, 1, 2.5, 10]))] for _ in range(count)]
+
+
+def test_store_deltas_matches_store():
+    rng = random.Random(42)
+    for cls in [Asks, Bids]:
+        for batch in [1, 5, 200]:
+            one_by_one = cls()
+            bulk = cls()
+            for _ in range(50):
+                deltas = random_deltas(rng, batch)
+                for delta in deltas:
+                    one_by_one.store(float(delta[0]), float(delta[1]))
+                bulk.store_deltas(deltas)
+                assert bulk == one_by_one
+                assert bulk._index == one_by_one._index
+                assert sorted(bulk._levels) == sorted(level[0] for level in bulk)
+
+
+def test_apply_deltas():
+    order_book = OrderBook({
+        'asks': [[11.1, 13], [12.2, 14]],
+        'bids': [[10, 10], [9.1, 11]],
+        'nonce': 1,
+    })
+    order_book.apply_deltas([['11.1', '0'], ['11.5', '1'], ['11.5', '2']], [['10.5', '3'], ['9.1', '0']], 2, 1574827239000)
+    assert order_book['asks'] == [[11.5, 2], [12.2, 14]]
+    assert order_book['bids'] == [[10.5, 3], [10, 10]]
+    assert order_book['nonce'] == 2
+    assert order_book['datetime'] == '2019-11-27T04:00:39.000Z'
+    order_book.apply_deltas([], [])
+    assert order_book['nonce'] == 2
+
+
+def test_apply_deltas_counted():
+    # the third column is the number of orders at the level
+    order_book = CountedOrderBook({
+        'asks': [[11.1, 13, 2], [12.2, 14, 1]],
+        'bids': [[10, 10, 3]],
+    })
+    order_book.apply_deltas([['11.1', '0', '0'], ['12.2', '7', '4'], ['13', '1', '1']], [['10', '5', '0'], ['9.5', '2', '2']], 3)
+    assert order_book['asks'] == [[12.2, 7, 4], [13, 1, 1]]
+    assert order_book['bids'] == [[9.5, 2, 2]]
+    assert order_book['nonce'] == 3
+
+
+def test_apply_deltas_indexed():
+    # the third column is the order id, a None price keeps the price of a known order
+    order_book = IndexedOrderBook({
+        'asks': [[11.1, 13, 'a1'], [11.1, 1, 'a2']],
+        'bids': [[10, 10, 'b1'], [9, 1, 'b2']],
+    })
+    order_book.apply_deltas([['11.1', '0', 'a1'], [None, '4', 'a2'], ['11', '2', 'a3']], [['9.5', '10', 'b1'], ['9', '0', 'b2']], None, 1574827239000)
+    assert order_book['asks'] == [[11, 2, 'a3'], [11.1, 4, 'a2']]
+    assert order_book['bids'] == [[9.5, 10, 'b1']]
+    assert order_book['datetime'] == '2019-11-27T04:00:39.000Z'
+
+
+def test_store_deltas_missing_values():
+    # a None, empty or missing size removes the level, like safe_float did in the handlers
+    bids = Bids([[10.0, 1.0], [9.0, 2.0], [8.0, 3.0], [7.0, 4.0]])
+    bids.store_deltas([['10', None], ['9', ''], ['8'], ['6', None]])
+    assert bids == [[7.0, 4.0]]
+    counted = CountedOrderBook({'asks': [[11.1, 13, 2], [12.2, 14, 1]]})
+    counted['asks'].store_deltas([['11.1', '1', None], ['12.2', None, '1']])
+    assert counted['asks'] == []
+
+
+def test_ws_order_book_deltas():
+    test_store_deltas_matches_store()
+    test_store_deltas_missing_values()
+    test_apply_deltas()
+    test_apply_deltas_counted()
+    test_apply_deltas_indexed()
@@ -0,0 +1,123 @@
+import json
+import os
+import random
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.order_book_side import Asks, Bids, CountedAsks, CountedBids, IndexedAsks, IndexedBids  # noqa: E402
+
+
+def check_index(side):
+    # the index stays sorted and in line with the levels
+    assert side._index == sorted(side._index)
+    assert len(side._index) == list.__len__(side)
+
+
+def test_side_matches_reference():
+    rng = random.Random(7)
+    for cls in [Asks, Bids]:
+        side = cls()
+        reference = {}
+        for _ in range(2000):
+            price = rng.randrange(0, 200) / 10
+            size = rng.choice([0, 0, 1, 2.5])
+            side.store(price, size)
+            if size:
+                reference[price] = size
+            else:
+                reference.pop(price, None)
+        expected = [[price, reference[price]] for price in sorted(reference, reverse=cls.side)]
+        check_index(side)
+        assert side == expected
+        assert side[0] == expected[0]
+        assert side[-1] == expected[-1]
+        assert side[1:4] == expected[1:4]
+        assert len(side) == len(expected)
+        assert json.loads(json.dumps(side)) == expected
+        side._depth = 5
+        side.limit()
+        check_index(side)
+        assert side == expected[:5]
+        assert sorted(side._levels) == sorted(level[0] for level in side)
+        # the flat list is up to date for callers that bypass the overrides after limit()
+        assert json.dumps(side) == json.dumps(expected[:5])
+
+
+def test_counted_side():
+    for cls in [CountedAsks, CountedBids]:
+        side = cls()
+        for i in range(20):
+            side.store(float(i), 1.0, 1)
+        side.store(3.0, 2.0, 4)
+        side.store(4.0, 1.0, 0)
+        check_index(side)
+        assert len(side) == 19
+        assert [3.0, 2.0, 4] in side
+        assert all(level[0] != 4.0 for level in side)
+
+
+def test_indexed_side():
+    rng = random.Random(11)
+    for cls in [IndexedAsks, IndexedBids]:
+        side = cls()
+        reference = {}
+        for _ in range(2000):
+            order_id = 'id' + str(rng.randrange(0, 60))
+            price = rng.choice([None, rng.randrange(1, 20) / 2])
+            size = rng.choice([0, 1, 3])
+            if order_id not in reference and price is None:
+                price = 1.5
+            side.store(price, size, order_id)
+            if size:
+                if price is None:
+                    price = reference[order_id][0]
+                reference[order_id] = [price, size, order_id]
+            else:
+                reference.pop(order_id, None)
+        expected = sorted(reference.values(), key=lambda level: (-level[0] if cls.side else level[0], level[2]))
+        check_index(side)
+        assert side == expected
+        assert set(side._levels) == set(reference)
+        side._depth = 10
+        side.limit()
+        assert side == expected[:10]
+        assert sorted(side._levels) == sorted(level[2] for level in side)
+
+
+def test_side_is_current_list():
+    # readers of the list storage see a stored level right away, without going through the overrides first
+    for cls in [Asks, Bids]:
+        side = cls([[1.0, 1.0], [3.0, 1.0]])
+        level = [2.0, 5.0]
+        side.storeArray(level)
+        expected = [[1.0, 1.0], [2.0, 5.0], [3.0, 1.0]]
+        if cls.side:
+            expected.reverse()
+        assert json.dumps(side) == json.dumps(expected)
+        if orjson is not None:
+            assert orjson.loads(orjson.dumps(side)) == expected
+        assert list.copy(side) == expected
+        assert side.copy() == expected
+        assert side + [] == expected
+        assert side * 1 == expected
+        assert side.index(level) == expected.index(level)
+        assert side.count(level) == 1
+        side.store_deltas([['2', '0'], ['4', '1']] + [[str(i + 10), '1'] for i in range(20)])
+        assert side.count(level) == 0
+        assert list.__len__(side) == 23
+        assert [4.0, 1.0] in list.copy(side)
+        assert json.loads(json.dumps(side)) == sorted(list.copy(side), reverse=bool(cls.side))
+
+
+def test_ws_order_book_side():
+    test_side_is_current_list()
+    test_side_matches_reference()
+    test_counted_side()
+    test_indexed_side()
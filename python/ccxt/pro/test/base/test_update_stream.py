@@ -0,0 +1,61 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt import NetworkError
+from ccxt.async_support.base.ws.client import Client
+from ccxt.async_support.base.ws.message_queue import MessageQueue
+from ccxt.async_support.base.ws.update_stream import UpdateStream, current_update_stream
+
+
+async def test_ws_update_stream():
+    client = Client('wss://example.com', None, None, None, None)
+    stream = UpdateStream(MessageQueue('drop', 3))
+    # only the last attached hashes are streamed
+    stream.attach(client, ['authenticated'])
+    stream.attach(client, ['trade:BTC/USDT', 'trade:ETH/USDT'])
+    assert list(client.update_streams.keys()) == ['trade:BTC/USDT', 'trade:ETH/USDT']
+    cache = []
+    client.resolve(cache, 'trade:BTC/USDT')
+    client.resolve(cache, 'trade:BTC/USDT')
+    client.resolve({'symbol': 'ETH/USDT'}, 'trade:ETH/USDT')
+    client.resolve('ignored', 'authenticated')
+    # the same object queued twice in a row is queued once
+    assert await stream.__anext__() is cache
+    assert await stream.__anext__() == {'symbol': 'ETH/USDT'}
+    assert stream.stats()['coalesced'] == 1
+    # a consumer that waits is woken up by resolve
+    waiting = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    client.resolve(1, 'trade:ETH/USDT')
+    assert await waiting == 1
+    # queued values are delivered before the error that resets the connection
+    client.resolve(2, 'trade:BTC/USDT')
+    client.reset(NetworkError('closed'))
+    assert await stream.__anext__() == 2
+    try:
+        await stream.__anext__()
+        assert False
+    except NetworkError:
+        pass
+    stream.detach()
+    assert client.update_streams == {}
+    # a task spawned while the watch_* method runs inherits the stream with its context,
+    # its later watch calls do not replace the subscription
+    stream = UpdateStream(MessageQueue('drop', 3))
+    token = current_update_stream.set(stream)
+
+    async def keep_alive():
+        await asyncio.sleep(0)
+        current_update_stream.get().attach(client, ['authenticated'])
+
+    spawned = asyncio.ensure_future(keep_alive())
+    stream.attach(client, ['ticker:BTC/USDT'])
+    current_update_stream.reset(token)
+    await spawned
+    assert list(client.update_streams.keys()) == ['ticker:BTC/USDT']
+    stream.detach()
@@ -7,14 +7,30 @@ sys.path.append(root)
 from asyncio import run
 
 from ccxt.pro.test.base.test_order_book import test_ws_order_book  # noqa: F401
+from ccxt.pro.test.base.test_order_book_deltas import test_ws_order_book_deltas  # noqa: F401
+from ccxt.pro.test.base.test_order_book_side import test_ws_order_book_side  # noqa: F401
 from ccxt.pro.test.base.test_cache import test_ws_cache  # noqa: F401
+from ccxt.pro.test.base.test_cache_keyed import test_ws_cache_keyed  # noqa: F401
+from ccxt.pro.test.base.test_cache_columnar import test_ws_cache_columnar  # noqa: F401
 # todo : from ccxt.pro.test.base.test_close import test_ws_close  # noqa: F401
 from ccxt.pro.test.base.test_future import test_ws_future  # noqa: F401
 from ccxt.pro.test.base.test_abnormal_close import test_abnormal_close  # noqa: F401
+from ccxt.pro.test.base.test_decode_message import test_ws_decode_message  # noqa: F401
+from ccxt.pro.test.base.test_decode_workers import test_ws_decode_workers  # noqa: F401
+from ccxt.pro.test.base.test_message_queue import test_ws_message_queue  # noqa: F401
+from ccxt.pro.test.base.test_update_stream import test_ws_update_stream  # noqa: F401
 
 def test_base_init_ws():
     test_ws_order_book()
+    test_ws_order_book_deltas()
+    test_ws_order_book_side()
     test_ws_cache()
+    test_ws_cache_keyed()
+    test_ws_cache_columnar()
     # todo : run(test_ws_close())
     run(test_ws_future())
+    test_ws_decode_message()
+    run(test_ws_decode_workers())
+    run(test_ws_message_queue())
+    run(test_ws_update_stream())
     # run(test_abnormal_close()) stays in infinite loop in travis
@@ -524,14 +524,8 @@ class vertex(ccxt.async_support.vertex):
         orderbook['datetime'] = self.iso8601(timestamp)
         return orderbook
 
-    def handle_delta(self, bookside, delta):
-        price = self.safe_float(delta, 0)
-        amount = self.safe_float(delta, 1)
-        bookside.store(price, amount)
-
     def handle_deltas(self, bookside, deltas):
-        for i in range(0, len(deltas)):
-            self.handle_delta(bookside, deltas[i])
+        bookside.storeDeltas(deltas)
 
     def handle_subscription_status(self, client: Client, message):
         #
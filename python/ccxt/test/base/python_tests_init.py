@@ -0,0 +1,22 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# the base tests of the python implementation that have no typescript counterpart,
+# tests_init.py next to this file is generated from ts/src/test/base/tests.init.ts
+
+from ccxt.test.base.test_single_flight import test_single_flight  # noqa: F401
+from ccxt.test.base.test_shared_markets import test_shared_markets  # noqa: F401
+from ccxt.test.base.test_throttler import test_throttler  # noqa: F401
+from ccxt.test.base.test_markets_cache import test_markets_cache  # noqa: F401
+from ccxt.test.base.test_update_markets import test_update_markets  # noqa: F401
+
+
+def python_base_tests_init():
+    test_single_flight()
+    test_shared_markets()
+    test_throttler()
+    test_markets_cache()
+    test_update_markets()
@@ -108,7 +108,42 @@ def helper_test_init_market():
     assert exchange2.markets['BTC/USD'] is not None
 
 
+def helper_test_init_independent_instances():
+    # instances of the same class do not share their settings
+    first = ccxt.binance()
+    fetch_markets = first.options['fetchMarkets']
+    fetch_markets.append('sampleType')
+    first.options['defaultType'] = 'sampleType'
+    first.has['sampleMethod'] = True
+    first.fees['trading']['taker'] = 1
+    second = ccxt.binance()
+    assert not second.in_array('sampleType', second.options['fetchMarkets'])
+    assert second.options['defaultType'] == 'spot'
+    assert not ('sampleMethod' in second.has)
+    assert second.fees['trading']['taker'] != 1
+    # instances built from one shared config do not share it either
+    config = {
+        'headers': {
+            'User-Agent': 'sample',
+        },
+        'options': {
+            'sampleOption': {
+                'value': 1,
+            },
+        },
+    }
+    demo = ccxt.okx(config)
+    demo.set_sandbox_mode(True)
+    demo.options['sampleOption']['value'] = 2
+    live = ccxt.okx(config)
+    assert not ('x-simulated-trading' in live.headers)
+    assert live.headers['User-Agent'] == 'sample'
+    assert live.options['sampleOption']['value'] == 1
+    assert not ('x-simulated-trading' in config['headers'])
+
+
 def test_after_constructor():
     helper_test_init_throttler()
     helper_test_init_sandbox()
     helper_test_init_market()
+    helper_test_init_independent_instances()
@@ -0,0 +1,138 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import stat  # noqa: E402
+import tempfile  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+from ccxt.base.markets_cache import MarketsCache  # noqa: E402
+
+
+class MarketsExchange(Exchange):
+    # loads markets without requests, counts the loads and sets a derived option like the network ids of htx
+
+    def describe(self):
+        return self.deep_extend(super(MarketsExchange, self).describe(), {'id': 'marketscache'})
+
+    def __init__(self, config={}):
+        super(MarketsExchange, self).__init__(config)
+        self.loads = 0
+        self.quotes = ['USDT']
+
+    async def fetch_markets(self, params={}):
+        await asyncio.sleep(0.01)
+        self.loads += 1
+        self.options['networkIdsByName'] = dict((quote, quote.lower()) for quote in self.quotes)
+        return [{
+            'id': 'BTC' + quote,
+            'symbol': 'BTC/' + quote,
+            'base': 'BTC',
+            'quote': quote,
+            'baseId': 'BTC',
+            'quoteId': quote,
+            'type': 'spot',
+            'spot': True,
+            'active': True,
+            'precision': {'amount': 0.0001, 'price': 0.01},
+            'info': {},
+        } for quote in self.quotes]
+
+
+def age_cache(directory, ms):
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        info = os.stat(path)
+        os.utime(path, (info.st_atime - ms / 1000, info.st_mtime - ms / 1000))
+
+
+async def run_markets_cache():
+    # by default the files are in a directory that only the current user can access
+    if hasattr(os, 'getuid'):
+        info = os.lstat(os.path.dirname(MarketsCache().path('x')))
+        assert info.st_uid == os.getuid() and stat.S_IMODE(info.st_mode) == 0o700
+    with tempfile.TemporaryDirectory() as directory:
+        config = {'options': {'marketsCache': {'path': directory, 'ttl': 60000, 'staleTtl': 120000}}}
+        # a miss fetches the markets and saves them with the options that fetching them set
+        first = MarketsExchange(config)
+        await first.load_markets()
+        assert first.loads == 1
+        names = os.listdir(directory)
+        assert len(names) == 1 and names[0].endswith('.json')
+        with open(os.path.join(directory, names[0])) as file:
+            entry = json.load(file)
+        assert entry['options'] == {'networkIdsByName': {'USDT': 'usdt'}}
+        # a hit restores the tables and the derived options without fetching
+        second = MarketsExchange(config)
+        await second.load_markets()
+        assert second.loads == 0
+        assert second.symbols == ['BTC/USDT']
+        assert second.markets['BTC/USDT'] == first.markets['BTC/USDT']
+        assert second.markets_by_id['BTCUSDT'][0]['symbol'] == 'BTC/USDT'
+        assert second.currencies_by_id['BTC'] is second.currencies['BTC']
+        assert second.options['networkIdsByName'] == {'USDT': 'usdt'}
+        assert second.market('BTC/USDT')['id'] == 'BTCUSDT'
+        # options set after construction and credentials do not change the key, the config does
+        third = MarketsExchange(dict(config, apiKey='key', secret='secret'))
+        third.options['defaultType'] = 'spot'
+        assert third.markets_cache_key() == MarketsExchange(dict(config, apiKey='other')).markets_cache_key()
+        assert third.markets_cache_key() != first.markets_cache_key()
+        other = MarketsExchange({'options': {'marketsCache': {'path': directory}, 'defaultType': 'swap'}})
+        assert other.markets_cache_key() != first.markets_cache_key()
+        await other.load_markets()
+        assert other.loads == 1
+        # a file that does not match the schema is a miss
+        path = os.path.join(directory, first.markets_cache_key() + '.json')
+        with open(path, 'w') as file:
+            json.dump({'format': 'ccxt-markets-2', 'digest': 'x', 'tables': {'markets': []}, 'options': {}}, file)
+        broken = MarketsExchange(config)
+        await broken.load_markets()
+        assert broken.loads == 1
+        # an entry older than the ttl is served and revalidated in the background
+        age_cache(directory, 90000)
+        stale = MarketsExchange(config)
+        stale.quotes = ['USDT', 'USDC']
+        await stale.load_markets()
+        assert stale.loads == 0
+        assert stale.symbols == ['BTC/USDT']
+        await stale.markets_revalidating
+        assert stale.loads == 1
+        assert stale.symbols == ['BTC/USDC', 'BTC/USDT']
+        fresh = MarketsExchange(config)
+        await fresh.load_markets()
+        assert fresh.loads == 0
+        assert fresh.symbols == ['BTC/USDC', 'BTC/USDT']
+        assert fresh.options['networkIdsByName'] == {'USDT': 'usdt', 'USDC': 'usdc'}
+        # a revalidation that fetched the same markets only touches the file and keeps the options
+        age_cache(directory, 90000)
+        same = MarketsExchange(config)
+        same.quotes = ['USDT', 'USDC']
+        await same.load_markets()
+        await same.markets_revalidating
+        assert same.loads == 1
+        with open(path) as file:
+            assert json.load(file)['options'] == {'networkIdsByName': {'USDT': 'usdt', 'USDC': 'usdc'}}
+        assert MarketsExchange(config).restore_markets_cache() < 60000
+        # closing the instance cancels a revalidation that is still running
+        age_cache(directory, 90000)
+        closed = MarketsExchange(config)
+        await closed.load_markets()
+        revalidating = closed.markets_revalidating
+        await closed.close()
+        assert revalidating.cancelled()
+        assert closed.markets_revalidating is None
+        assert closed.loads == 0
+        # an entry older than the stale ttl is not used at all
+        age_cache(directory, 150000)
+        expired = MarketsExchange(config)
+        await expired.load_markets()
+        assert expired.loads == 1
+        assert expired.markets_revalidating is None
+        await asyncio.gather(*[exchange.close() for exchange in [first, second, third, other, broken, stale, fresh, same, expired]])
+
+
+def test_markets_cache():
+    asyncio.run(run_markets_cache())
@@ -54,6 +54,10 @@ def test_safe_methods():
     assert exchange.safe_value(input_dict, 'str') == 'heLlo'
     assert exchange.safe_value(input_dict, 'strNumber') == '3'
     assert exchange.safe_value(input_list, 0) == 'Hi'
+    assert exchange.safe_value(input_dict, 'zeroNumeric') == 0
+    assert exchange.safe_value(input_dict, 'undefined') is None
+    assert exchange.safe_value(input_dict, 'emptyString') is None
+    assert exchange.safe_value(input_dict, 'emptyString', 'default') == 'default'
     # safeValue2
     assert exchange.safe_value_2(input_dict, 'a', 'i') == 1
     assert exchange.safe_value_2(input_dict, 'a', 'f') == 0.123
@@ -116,6 +120,11 @@ def test_safe_methods():
     assert exchange.safe_string(input_dict, 'str') == 'heLlo'
     assert exchange.safe_string(input_dict, 'strNumber') == '3'
     assert exchange.safe_string(input_list, 0) == 'Hi'
+    assert exchange.safe_string(input_dict, 'zeroNumeric') == '0'
+    assert exchange.safe_string(input_dict, 'undefined') is None
+    assert exchange.safe_string(input_dict, 'emptyString') is None
+    assert exchange.safe_string(input_dict, 'emptyString', 'default') == 'default'
+    assert exchange.safe_string(input_dict, 'missing', 'default') == 'default'
     # safeString2
     assert exchange.safe_string_2(input_dict, 'a', 'i') == '1'
     assert exchange.safe_string_2(input_dict, 'a', 'f') == '0.123'
@@ -169,6 +178,10 @@ def test_safe_methods():
     assert exchange.safe_integer(input_dict, 'f') == 0
     assert exchange.safe_integer(input_dict, 'strNumber') == 3
     assert exchange.safe_integer(input_list, 1) == 2
+    assert exchange.safe_integer(input_dict, 'zeroString') == 0
+    assert exchange.safe_integer(input_dict, 'floatString') == 0
+    assert exchange.safe_integer(input_dict, 'emptyString') is None
+    assert exchange.safe_integer(input_dict, 'undefined', 1) == 1
     # safeInteger2
     assert exchange.safe_integer_2(input_dict, 'a', 'i') == 1
     assert exchange.safe_integer_2(input_dict, 'a', 'f') == 0
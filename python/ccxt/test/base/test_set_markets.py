@@ -0,0 +1,132 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+# PLEASE DO NOT EDIT THIS FILE, IT IS GENERATED AND WILL BE OVERWRITTEN:
+# https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
+
+# ----------------------------------------------------------------------------
+# -*- coding: utf-8 -*-
+
+import ccxt  # noqa: F402
+from ccxt.test.exchange.base import test_shared_methods  # noqa E402
+
+def helper_market(id, symbol, base, quote, settle, type, expiry):
+    spot = (type == 'spot')
+    return {
+        'id': id,
+        'symbol': symbol,
+        'base': base,
+        'quote': quote,
+        'settle': settle,
+        'baseId': base,
+        'quoteId': quote,
+        'settleId': settle,
+        'type': type,
+        'spot': spot,
+        'margin': False,
+        'swap': (type == 'swap'),
+        'future': (type == 'future'),
+        'option': False,
+        'active': True,
+        'contract': not spot,
+        'linear': None if spot else (settle == quote),
+        'inverse': None if spot else (settle == base),
+        'expiry': expiry,
+        'info': {},
+    }
+
+
+def helper_symbols(markets):
+    symbols = []
+    for i in range(0, len(markets)):
+        symbols.append(markets[i]['symbol'])
+    return symbols
+
+
+def test_set_markets():
+    exchange = ccxt.Exchange({
+        'id': 'sampleexchange',
+    })
+    spot = helper_market('BTCUSDT', 'BTC/USDT', 'BTC', 'USDT', None, 'spot', None)
+    linear = helper_market('BTCUSDT', 'BTC/USDT:USDT', 'BTC', 'USDT', 'USDT', 'swap', None)
+    inverse = helper_market('BTCUSD_PERP', 'BTC/USD:BTC', 'BTC', 'USD', 'BTC', 'swap', None)
+    future = helper_market('BTCUSD_240927', 'BTC/USD:BTC-240927', 'BTC', 'USD', 'BTC', 'future', 1727424000000)
+    eth = helper_market('ETHUSDT', 'ETH/USDT', 'ETH', 'USDT', None, 'spot', None)
+    ltc = helper_market('LTCUSDT', 'LTC/USDT', 'LTC', 'USDT', None, 'spot', None)
+    exchange.set_markets([linear, inverse, future, spot, eth])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', exchange.symbols, ['BTC/USD:BTC', 'BTC/USD:BTC-240927', 'BTC/USDT', 'BTC/USDT:USDT', 'ETH/USDT'])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', exchange.ids, ['BTCUSDT', 'BTCUSD_240927', 'BTCUSD_PERP', 'ETHUSDT'])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', exchange.codes, ['BTC', 'ETH', 'USD', 'USDT'])
+    # spot markets come first in markets_by_id
+    assert exchange.markets_by_id['BTCUSDT'][0]['symbol'] == 'BTC/USDT'
+    assert exchange.markets['BTC/USDT:USDT']['subType'] == 'linear'
+    assert exchange.markets['BTC/USDT']['subType'] is None
+    #
+    # filterMarkets
+    #
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets()), exchange.symbols)
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets('spot')), ['BTC/USDT', 'ETH/USDT'])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets(None, 'inverse')), ['BTC/USD:BTC', 'BTC/USD:BTC-240927'])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets(None, None, 'BTC', 'USDT')), ['BTC/USDT', 'BTC/USDT:USDT'])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets('swap', None, None, None, 'USDT')), ['BTC/USDT:USDT'])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets(None, None, None, None, None, 1727424000000)), ['BTC/USD:BTC-240927'])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets(None, None, None, None, None, None, 'BTC/USD')), ['BTC/USD:BTC', 'BTC/USD:BTC-240927'])
+    # the underlying of a spot market is not set
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets(None, None, None, None, None, None, 'BTC/USDT')), ['BTC/USDT:USDT'])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets('option')), [])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets('spot', None, 'LTC')), [])
+    #
+    # safeMarket
+    #
+    assert exchange.safe_market('ETHUSDT')['symbol'] == 'ETH/USDT'
+    assert exchange.safe_market('BTCUSDT', None, None, 'swap')['symbol'] == 'BTC/USDT:USDT'
+    assert exchange.safe_market('BTCUSDT', None, None, 'spot')['symbol'] == 'BTC/USDT'
+    assert exchange.safe_market('BTCUSDT', exchange.markets['BTC/USDT:USDT'])['symbol'] == 'BTC/USDT:USDT'
+    assert exchange.safe_market('LTC-USDT', None, '-')['symbol'] == 'LTC/USDT'
+    assert exchange.safe_market('LTCUSDT')['symbol'] == 'LTCUSDT'
+    # the market memoized for an id and a type is dropped when the markets are set again
+    delisted = exchange.extend(linear, {
+        'active': False,
+    })
+    exchange.set_markets([delisted, inverse, future, spot, eth])
+    assert not exchange.safe_market('BTCUSDT', None, None, 'swap')['active']
+    assert exchange.safe_market('BTCUSDT', None, None, 'spot')['active']
+    # the index is dropped too
+    exchange.set_markets([linear, spot, ltc])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets('spot')), ['BTC/USDT', 'LTC/USDT'])
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(exchange.filter_markets(None, 'inverse')), [])
+    #
+    # incremental reload
+    #
+    reloaded = ccxt.Exchange({
+        'id': 'sampleexchange',
+        'options': {
+            'incrementalReload': True,
+        },
+    })
+    reloaded.apply_markets([linear, inverse, future, spot, eth])
+    assert reloaded.safe_market('BTCUSDT', None, None, 'swap')['active']
+    assert len(reloaded.filter_markets('spot')) == 2
+    # eth is removed, ltc is added and the linear swap changes
+    fetched = [delisted, inverse, future, spot, ltc]
+    reloaded.apply_markets(fetched)
+    fresh = ccxt.Exchange({
+        'id': 'sampleexchange',
+    })
+    fresh.set_markets(fetched)
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', reloaded.symbols, fresh.symbols)
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', reloaded.ids, fresh.ids)
+    # currencies are extended like on every reload
+    assert 'LTC' in reloaded.currencies
+    for i in range(0, len(fresh.symbols)):
+        symbol = fresh.symbols[i]
+        test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', reloaded.markets[symbol], fresh.markets[symbol])
+    assert not ('ETH/USDT' in reloaded.markets)
+    assert not ('ETHUSDT' in reloaded.markets_by_id)
+    assert not reloaded.safe_market('BTCUSDT', None, None, 'swap')['active']
+    test_shared_methods.assert_deep_equal(exchange, None, 'testSetMarkets', helper_symbols(reloaded.filter_markets('spot')), ['BTC/USDT', 'LTC/USDT'])
@@ -0,0 +1,99 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import asyncio  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange as AsyncExchange  # noqa: E402
+
+SAMPLE_MARKET = {
+    'id': 'BtcUsd',
+    'symbol': 'BTC/USD',
+    'base': 'BTC',
+    'quote': 'USD',
+    'baseId': 'Btc',
+    'quoteId': 'Usd',
+    'type': 'spot',
+    'spot': True,
+}
+
+
+class SharedExchange(Exchange):
+    # counts the markets loads, every load sets the network ids option like htx does
+
+    def describe(self):
+        return self.deep_extend(super(SharedExchange, self).describe(), {'id': 'sharedsample'})
+
+    def __init__(self, config={}):
+        super(SharedExchange, self).__init__(config)
+        self.loads = 0
+
+    def fetch_markets(self, params={}):
+        self.loads += 1
+        self.options['networkChainIdsByNames'] = {'USDT': {'TRC20': 'trc20usdt'}}
+        self.options['loads'] = self.loads
+        return [SAMPLE_MARKET]
+
+
+class AsyncSharedExchange(AsyncExchange):
+
+    def describe(self):
+        return self.deep_extend(super(AsyncSharedExchange, self).describe(), {'id': 'sharedsample'})
+
+    def __init__(self, config={}):
+        super(AsyncSharedExchange, self).__init__(config)
+        self.loads = 0
+
+    async def fetch_markets(self, params={}):
+        self.loads += 1
+        await asyncio.sleep(0.01)
+        self.options['networkChainIdsByNames'] = {'USDT': {'TRC20': 'trc20usdt'}}
+        return [SAMPLE_MARKET]
+
+
+def helper_test_shared_markets_sync():
+    config = {'options': {'sharedMarkets': True, 'sample': 'sync'}}
+    first = SharedExchange(config)
+    second = SharedExchange(config)
+    first.load_markets()
+    second.load_markets()
+    # the markets are loaded once and the tables are shared, the options set by the load reach every instance
+    assert first.loads == 1
+    assert second.loads == 0
+    assert second.markets is first.markets
+    assert second.options['networkChainIdsByNames']['USDT']['TRC20'] == 'trc20usdt'
+    # each instance has its own copy of them
+    assert second.options['networkChainIdsByNames'] is not first.options['networkChainIdsByNames']
+    # a reload publishes the options it changed to the instances attached already
+    first.options['loads'] = 0
+    second.load_markets(True)
+    assert second.loads == 1
+    assert first.options['loads'] == 1
+    # instances with other options do not share
+    other = SharedExchange({'options': {'sharedMarkets': True, 'sample': 'other'}})
+    other.load_markets()
+    assert other.loads == 1
+    assert other.markets is not first.markets
+
+
+async def helper_test_shared_markets_async():
+    config = {'options': {'sharedMarkets': True, 'sample': 'async'}}
+    first = AsyncSharedExchange(config)
+    second = AsyncSharedExchange(config)
+    await asyncio.gather(first.load_markets(), second.load_markets())
+    assert first.loads + second.loads == 1
+    assert second.markets is first.markets
+    assert first.options['networkChainIdsByNames']['USDT']['TRC20'] == 'trc20usdt'
+    assert second.options['networkChainIdsByNames']['USDT']['TRC20'] == 'trc20usdt'
+    third = AsyncSharedExchange(config)
+    await third.load_markets()
+    assert third.loads == 0
+    assert third.options['networkChainIdsByNames']['USDT']['TRC20'] == 'trc20usdt'
+    await asyncio.gather(first.close(), second.close(), third.close())
+
+
+def test_shared_markets():
+    helper_test_shared_markets_sync()
+    asyncio.run(helper_test_shared_markets_async())
@@ -0,0 +1,104 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import asyncio  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+from ccxt.base.errors import ExchangeNotAvailable  # noqa: E402
+
+
+class CountingExchange(Exchange):
+    # answers every http request after a short delay and counts the requests and the rate limiter charges
+    id = 'counting'
+
+    def __init__(self, config={}):
+        super(CountingExchange, self).__init__(config)
+        self.calls = []
+        self.charges = []
+        self.failures = 0
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        url = 'https://a/' + path
+        if api == 'private':
+            url += '?nonce=' + str(len(self.calls))
+        return {'url': url, 'method': method, 'body': body, 'headers': headers}
+
+    async def throttle(self, cost=None, api=None):
+        self.charges.append(cost)
+
+    async def fetch(self, url, method='GET', headers=None, body=None):
+        self.calls.append(url)
+        await asyncio.sleep(0.01)
+        if self.failures:
+            self.failures -= 1
+            raise ExchangeNotAvailable('counting ' + url)
+        return {'url': url, 'levels': [[1.0, 2.0]]}
+
+
+async def run_single_flight():
+    # without the option every request goes out
+    exchange = CountingExchange()
+    await asyncio.gather(exchange.fetch2('x'), exchange.fetch2('x'))
+    assert len(exchange.calls) == 2
+    # concurrent identical public requests share one call and one rate limiter charge, every caller gets its own copy
+    exchange = CountingExchange({'options': {'singleFlight': True}})
+    responses = await asyncio.gather(*[exchange.fetch2('x') for _ in range(5)])
+    assert len(exchange.calls) == 1
+    assert len(exchange.charges) == 1
+    assert all(response == responses[0] for response in responses)
+    responses[0]['levels'][0][0] = 100.0
+    assert responses[1]['levels'][0][0] == 1.0
+    assert len(set(id(response) for response in responses)) == 5
+    assert exchange.requests_in_flight == {}
+    # different paths, headers, methods or sections are not shared, private sections never are
+    await asyncio.gather(exchange.fetch2('x'), exchange.fetch2('y'), exchange.fetch2('x', 'public', 'GET', {}, {'X-Key': '1'}), exchange.fetch2('x', 'public', 'POST'))
+    assert len(exchange.calls) == 5
+    await asyncio.gather(exchange.fetch2('x', ['fapi', 'private']), exchange.fetch2('x', ['fapi', 'private']), exchange.fetch2('x', 'spot'))
+    assert len(exchange.calls) == 8
+    assert len(exchange.charges) == 8
+    assert not exchange.is_single_flight_request(['spot', 'publicGet'], 'POST')
+    assert exchange.is_single_flight_request(['fapiPublic'], 'GET')
+    assert not exchange.is_single_flight_request(['fapiPublic', 'private'], 'GET')
+    # without a ttl nothing is cached once the call is done
+    await exchange.fetch2('x')
+    assert len(exchange.calls) == 9
+    # a cancelled caller does not cancel the call for the others
+    first = asyncio.ensure_future(exchange.fetch2('c'))
+    second = asyncio.ensure_future(exchange.fetch2('c'))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert (await second)['url'] == 'https://a/c'
+    assert first.cancelled()
+    # an error reaches every caller and is not cached
+    exchange.failures = 1
+    results = await asyncio.gather(exchange.fetch2('e'), exchange.fetch2('e'), return_exceptions=True)
+    assert all(isinstance(result, ExchangeNotAvailable) for result in results)
+    assert exchange.calls.count('https://a/e') == 1
+    assert (await exchange.fetch2('e'))['url'] == 'https://a/e'
+    assert exchange.calls.count('https://a/e') == 2
+    # with a ttl the response is reused until it expires without another charge, cached copies are independent too
+    exchange = CountingExchange({'options': {'singleFlight': {'ttl': 50}}})
+    first = await exchange.fetch2('t')
+    first['levels'].clear()
+    second = await exchange.fetch2('t')
+    assert len(exchange.calls) == 1
+    assert len(exchange.charges) == 1
+    assert second['levels'] == [[1.0, 2.0]]
+    await asyncio.sleep(0.06)
+    await exchange.fetch2('t')
+    assert len(exchange.calls) == 2
+    # the cache is bounded by size, the oldest responses are dropped first
+    exchange = CountingExchange({'options': {'singleFlight': {'ttl': 60000, 'size': 2}}})
+    for path in ['1', '2', '3']:
+        await exchange.fetch2(path)
+    assert len(exchange.response_cache) == 2
+    await exchange.fetch2('3')
+    assert len(exchange.calls) == 3
+    await exchange.fetch2('1')
+    assert len(exchange.calls) == 4
+
+
+def test_single_flight():
+    asyncio.run(run_single_flight())
@@ -0,0 +1,144 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import asyncio  # noqa: E402
+import tempfile  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.throttler import Throttler, ProcessThrottler, shared_throttler  # noqa: E402
+
+# 50 ms per request, a token comes back every 50 ms
+BUCKET = {'refillRate': 1 / 50, 'capacity': 1.0, 'tokens': 0}
+
+
+def test_process_throttler_shared_key():
+    # two handles on one key draw from one bucket, another key has a bucket of its own
+    with tempfile.TemporaryDirectory() as directory:
+        first = ProcessThrottler(dict(BUCKET), None, 'host:key', directory)
+        second = ProcessThrottler(dict(BUCKET), None, 'host:key', directory)
+        other = ProcessThrottler(dict(BUCKET), None, 'host:other', directory)
+        try:
+            assert first.acquire(100) == 0
+            # the 100 tokens taken by the first handle take about 5 seconds to come back
+            wait = second.acquire(1)
+            assert 4.5 < wait <= 5
+            assert other.acquire(1) == 0
+            # a closed handle reopens the same state
+            first.close()
+            assert 4.5 < first.acquire(1) <= 5
+        finally:
+            first.close()
+            second.close()
+            other.close()
+
+
+async def run_shared_throttler_key():
+    assert shared_throttler('test:shared', dict(BUCKET)) is shared_throttler('test:shared', dict(BUCKET))
+    assert shared_throttler('test:shared', dict(BUCKET)) is not shared_throttler('test:other', dict(BUCKET))
+    # instances with the shared backend use one bucket per api host and key
+    config = {'urls': {'api': {'public': 'https://api.example.com'}}, 'options': {'rateLimiter': {'backend': 'shared'}}}
+    first = Exchange(config)
+    second = Exchange(config)
+    assert first.host_throttler('api.example.com') is second.host_throttler('api.example.com')
+    assert first.host_throttler('api.example.com') is shared_throttler('api.example.com:', dict(BUCKET))
+    assert first.host_throttler('fapi.example.com') is not first.host_throttler('api.example.com')
+    return shared_throttler('test:shared', dict(BUCKET))
+
+
+async def run_shared_throttler_queued():
+    # the loop ends while a request is still queued in the shared bucket
+    throttler = shared_throttler('test:queued', dict(BUCKET))
+    await throttler(100)
+    asyncio.ensure_future(throttler(1))
+    await asyncio.sleep(0)
+    return throttler
+
+
+async def run_shared_throttler_next_loop():
+    throttler = shared_throttler('test:queued', dict(BUCKET))
+    await asyncio.wait_for(throttler(0), 1)
+    return throttler
+
+
+def test_shared_throttler_key():
+    # every event loop has buckets of its own
+    assert asyncio.run(run_shared_throttler_key()) is not asyncio.run(run_shared_throttler_key())
+    previous = asyncio.run(run_shared_throttler_queued())
+    assert not previous.running
+    assert asyncio.run(run_shared_throttler_next_loop()) is not previous
+
+
+async def run_throttler_cancelled():
+    # a looper cancelled with its loop does not keep the bucket running, the next loop releases the queue
+    throttler = Throttler(dict(BUCKET))
+    await throttler(100)
+    asyncio.ensure_future(throttler(1))
+    await asyncio.sleep(0)
+    return throttler
+
+
+def test_throttler_cancelled():
+    throttler = asyncio.run(run_throttler_cancelled())
+    assert not throttler.running
+    assert len(throttler.queue) == 1
+    throttler.config['tokens'] = 0
+
+    async def release():
+        await asyncio.wait_for(throttler(1), 1)
+
+    asyncio.run(release())
+    assert len(throttler.queue) == 0
+
+
+def test_throttler_sync():
+    # 900 of 1200 requests used with 30 seconds of a minute left, the other 300 are spread over those 30 seconds
+    throttler = Throttler(dict(BUCKET))
+    throttler.sync(900, 1200, 60000, 30000)
+    # 300 requests at the configured 50 ms take 15 seconds, the bucket is 15 seconds short of the window end
+    assert abs(throttler.config['tokens'] + 300) < 1
+    assert 14.9 < throttler.acquire(1) <= 15
+    assert throttler.config['refillRate'] == BUCKET['refillRate']
+    # adaptive sync paces the rest of the window instead, one request every 100 ms
+    throttler = Throttler(dict(BUCKET))
+    throttler.sync(900, 1200, 60000, 30000, True)
+    assert abs(throttler.config['refillRate'] - 1 / 100) < 1e-9
+    assert abs(throttler.config['tokens']) < 1
+    # the adaptive rate is kept within adaptiveRatio of the configured rate
+    throttler.sync(1199, 1200, 60000, 30000, True)
+    assert abs(throttler.config['refillRate'] - BUCKET['refillRate'] / 2) < 1e-9
+    throttler.sync(0, 1200, 60000, 30000, True)
+    assert abs(throttler.config['refillRate'] - BUCKET['refillRate'] * 2) < 1e-9
+
+
+def test_throttler_backoff():
+    throttler = Throttler(dict(BUCKET, maxBackoff=5000))
+    assert throttler.backoff(1000) == 1000
+    assert throttler.config['tokens'] <= -1000 * BUCKET['refillRate']
+    assert throttler.backoff(1000) == 2000
+    assert throttler.backoff(1000) == 4000
+    assert throttler.config['tokens'] <= -4000 * BUCKET['refillRate']
+    # capped at maxBackoff
+    assert throttler.backoff(1000) == 5000
+    throttler.reset_backoff()
+    assert throttler.backoff(1000) == 1000
+    # the process bucket doubles the same way and keeps the empty bucket in the shared state
+    with tempfile.TemporaryDirectory() as directory:
+        first = ProcessThrottler(dict(BUCKET), None, 'host:key', directory)
+        second = ProcessThrottler(dict(BUCKET), None, 'host:key', directory)
+        try:
+            assert first.backoff(1000) == 1000
+            assert first.backoff(1000) == 2000
+            assert 1.9 < second.acquire(1) <= 2
+        finally:
+            first.close()
+            second.close()
+
+
+def test_throttler():
+    test_process_throttler_shared_key()
+    test_shared_throttler_key()
+    test_throttler_cancelled()
+    test_throttler_sync()
+    test_throttler_backoff()
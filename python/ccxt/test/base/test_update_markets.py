@@ -0,0 +1,79 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import asyncio  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+
+
+class ReloadingExchange(Exchange):
+    # loads the markets in self.fetched without requests
+
+    def describe(self):
+        return self.deep_extend(super(ReloadingExchange, self).describe(), {'id': 'reloading'})
+
+    def __init__(self, config={}):
+        super(ReloadingExchange, self).__init__(config)
+        self.fetched = []
+
+    async def fetch_markets(self, params={}):
+        return self.fetched
+
+
+def spot_market(base, quote, active=True):
+    return {
+        'id': base + quote,
+        'symbol': base + '/' + quote,
+        'base': base,
+        'quote': quote,
+        'baseId': base,
+        'quoteId': quote,
+        'type': 'spot',
+        'spot': True,
+        'active': active,
+        'precision': {'amount': 0.0001, 'price': 0.01},
+        'info': {},
+    }
+
+
+async def run_update_markets():
+    events = []
+    exchange = ReloadingExchange({'options': {'incrementalReload': True}})
+    exchange.markets_change_callback = lambda added, removed, changed: events.append((added, removed, changed))
+    exchange.fetched = [spot_market('BTC', 'USDT'), spot_market('ETH', 'USDT'), spot_market('LTC', 'USDT')]
+    await exchange.load_markets()
+    # the first load sets the markets and is not a change
+    assert events == []
+    markets = exchange.markets
+    btc = markets['BTC/USDT']
+    ltc = markets['LTC/USDT']
+    # an unchanged reload keeps every object and calls nothing
+    await exchange.load_markets(True)
+    assert events == []
+    assert exchange.markets is markets and exchange.markets['BTC/USDT'] is btc
+    # eth is removed, xrp is added and ltc changes in place
+    exchange.fetched = [spot_market('BTC', 'USDT'), spot_market('LTC', 'USDT', False), spot_market('XRP', 'USDT')]
+    await exchange.load_markets(True)
+    assert len(events) == 1
+    added, removed, changed = events[0]
+    assert [market['symbol'] for market in added] == ['XRP/USDT']
+    assert [market['symbol'] for market in removed] == ['ETH/USDT']
+    assert len(changed) == 1 and changed[0] is ltc
+    assert exchange.markets is markets
+    assert exchange.markets['BTC/USDT'] is btc
+    assert exchange.markets['LTC/USDT'] is ltc and ltc['active'] is False
+    assert exchange.symbols == ['BTC/USDT', 'LTC/USDT', 'XRP/USDT']
+    assert exchange.market('XRP/USDT')['id'] == 'XRPUSDT'
+    assert exchange.safe_market('LTCUSDT')['active'] is False
+    # without the option a reload replaces the markets and calls nothing
+    exchange.options['incrementalReload'] = False
+    await exchange.load_markets(True)
+    assert len(events) == 1
+    assert exchange.markets is not markets and exchange.markets['BTC/USDT'] is not btc
+    await exchange.close()
+
+
+def test_update_markets():
+    asyncio.run(run_update_markets())
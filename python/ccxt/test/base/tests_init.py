@@ -24,6 +24,9 @@ from ccxt.test.base.test_sum import test_sum  # noqa E402
 from ccxt.test.base.test_omit import test_omit  # noqa E402
 from ccxt.test.base.test_group_by import test_group_by  # noqa E402
 from ccxt.test.base.test_filter_by import test_filter_by  # noqa E402
+from ccxt.test.base.test_set_markets import test_set_markets  # noqa E402
+from ccxt.test.base.test_parse_trades_batch import test_parse_trades_batch  # noqa E402
+from ccxt.test.base.test_order_book_checksum import test_order_book_checksum  # noqa E402
 from ccxt.test.base.test_after_constructor import test_after_constructor  # noqa E402
 from ccxt.test.base.test_handle_methods import test_handle_methods  # noqa E402
 from ccxt.test.base.test_remove_repeated_elements_from_array import test_remove_repeated_elements_from_array  # noqa E402
@@ -43,5 +46,8 @@ def base_tests_init():
     test_omit()
     test_group_by()
     test_filter_by()
+    test_set_markets()
+    test_parse_trades_batch()
+    test_order_book_checksum()
     test_handle_methods()
     test_remove_repeated_elements_from_array()
@@ -8,6 +8,7 @@ except ImportError:
     asyncio = None
 
 from base.tests_init import base_tests_init  # noqa: F401
+from base.python_tests_init import python_base_tests_init  # noqa: F401
 from ccxt.pro.test.base.tests_init import test_base_init_ws  # noqa: F401
 
 # fix : https://github.com/aio-libs/aiodns/issues/86
@@ -27,6 +28,7 @@ if (isBaseTests):
         print('base WS tests passed!')
     else:
         base_tests_init()
+        python_base_tests_init()
         print('base REST tests passed!')
     if not runAll:
         exit(0)
@@ -263,6 +263,7 @@ export default class Exchange {
     balance      = {}
     liquidations: Dictionary<Liquidation> = {}
     orderbooks: Dictionary<Ob>   = {}
+    orderbookChecksums: Dictionary<any> = {}
     tickers: Dictionary<Ticker>  = {}
     fundingRates: Dictionary<FundingRate> = {}
     bidsasks: Dictionary<Ticker>  = {}
@@ -367,6 +368,12 @@ export default class Exchange {
     quoteCurrencies = undefined
     currencies_by_id = undefined
     codes = undefined
+    // marketType: marketId: market, for market ids shared by markets of different types
+    markets_by_id_type = undefined
+    // field: value: markets, built by filterMarkets when first queried
+    markets_index = undefined
+    // called with the added, removed and changed markets by an incremental reload
+    markets_change_callback = undefined
 
     reloadingMarkets: boolean = undefined
     marketsLoading: Promise<Dictionary<any>> = undefined
@@ -548,6 +555,7 @@ export default class Exchange {
         // placeholders for cached data
         this.balance      = {}
         this.orderbooks   = {}
+        this.orderbookChecksums = {}
         this.tickers      = {}
         this.liquidations = {}
         this.orders       = undefined
@@ -656,7 +664,7 @@ export default class Exchange {
         return result
     }
 
-    throttle (cost = undefined) {
+    throttle (cost = undefined, api = undefined) {
         return this.throttler.throttle (cost)
     }
 
@@ -816,6 +824,11 @@ export default class Exchange {
     }
 
 
+    async fetchSingleFlight (path, api: any = 'public', method = 'GET', params = {}, headers: any = undefined, body: any = undefined, config = {}) {
+        // identical requests are only shared by the python async client, here every caller sends its own
+        return await this.sendRequest (path, api, method, params, headers, body, config);
+    }
+
     async fetch (url, method = 'GET', headers: any = undefined, body: any = undefined) {
 
         // load node-http(s) modules only on first call
@@ -1015,7 +1028,13 @@ export default class Exchange {
             currencies = await this.fetchCurrencies ()
         }
         const markets = await this.fetchMarkets (params)
-        return this.setMarkets (markets, currencies)
+        return this.applyMarkets (markets, currencies)
+    }
+
+    onMarketsChange (added, removed, changed) {
+        if (this.markets_change_callback !== undefined) {
+            this.markets_change_callback (added, removed, changed)
+        }
     }
 
     async loadMarkets (reload = false, params = {}): Promise<Dictionary<Market>> {
@@ -1148,6 +1167,10 @@ export default class Exchange {
         return new CountedOrderBook (snapshot, depth);
     }
 
+    ohlcvCache (limit = undefined) {
+        return new ArrayCacheByTimestamp (limit);
+    }
+
     handleMessage (client, message) {} // stub to override
 
     // ping (client: Client) {} // stub to override
@@ -2942,6 +2965,146 @@ export default class Exchange {
         return symbol + ' : ' + 'orderbook data checksum validation failed. You can reconnect by calling watchOrderBook again or you can mute the error by setting exchange.options["watchOrderBook"]["checksum"] = false';
     }
 
+    orderBookChecksum (symbol: string, orderbook, format: string, depth: Int, keyIndex: Int = 0, priceLength: Int = undefined, amountLength: Int = undefined): Int {
+        //
+        // crc32 of the top depth levels of the orderbook in the layout the exchange checksums
+        //
+        //     'interleaved' bid price:bid amount:ask price:ask amount:... (okx)
+        //     'signed'      same as interleaved with negative ask amounts (bitfinex)
+        //     'stripped'    asks then bids, decimals padded to priceLength/amountLength, no dot, no leading zeros (kraken)
+        //
+        // the strings of the levels that stay in the top depth are reused between updates
+        // and the previous checksum is returned when none of the top depth levels changed
+        //
+        const previous = this.safeDict (this.orderbookChecksums, symbol, {});
+        let previousBids = [];
+        let previousAsks = [];
+        let checksum = undefined;
+        const sameFormat = (this.safeString (previous, 'format') === format) && (this.safeInteger (previous, 'depth') === depth) && (this.safeInteger (previous, 'keyIndex') === keyIndex);
+        const sameLengths = (this.safeInteger (previous, 'priceLength') === priceLength) && (this.safeInteger (previous, 'amountLength') === amountLength);
+        if (sameFormat && sameLengths) {
+            previousBids = previous['bids'];
+            previousAsks = previous['asks'];
+            checksum = this.safeInteger (previous, 'checksum');
+        }
+        const bids = this.orderBookChecksumLevels (orderbook['bids'], previousBids, format, depth, keyIndex, priceLength, amountLength, false);
+        const asks = this.orderBookChecksumLevels (orderbook['asks'], previousAsks, format, depth, keyIndex, priceLength, amountLength, true);
+        if ((checksum === undefined) || bids['changed'] || asks['changed']) {
+            const payload = this.orderBookChecksumPayload (bids['levels'], asks['levels'], format, depth);
+            checksum = this.crc32 (payload, format !== 'stripped');
+        }
+        this.orderbookChecksums[symbol] = {
+            'format': format,
+            'depth': depth,
+            'keyIndex': keyIndex,
+            'priceLength': priceLength,
+            'amountLength': amountLength,
+            'bids': bids['levels'],
+            'asks': asks['levels'],
+            'checksum': checksum,
+        };
+        return checksum;
+    }
+
+    orderBookChecksumLevels (bookside, previous, format: string, depth: Int, keyIndex: Int, priceLength: Int, amountLength: Int, isAsk: boolean) {
+        // returns [ key, amount, keyString, amountString ] for the top depth levels of one side
+        const booksideLength = bookside.length;
+        const previousLength = previous.length;
+        const count = Math.min (depth, booksideLength);
+        const negate = isAsk && (format === 'signed');
+        let changed = (count !== previousLength);
+        const levels = [];
+        let j = 0;
+        for (let i = 0; i < count; i++) {
+            const level = bookside[i];
+            const key = level[keyIndex];
+            const amount = level[1];
+            let keyString = undefined;
+            let amountString = undefined;
+            // a level added or removed above shifts the level by a few positions
+            for (let offset = 0; offset < 4; offset++) {
+                const k = j + offset;
+                if (k >= previousLength) {
+                    break;
+                }
+                const entry = previous[k];
+                if (entry[0] === key) {
+                    keyString = entry[2];
+                    if (entry[1] === amount) {
+                        amountString = entry[3];
+                    }
+                    if (k !== i) {
+                        changed = true;
+                    }
+                    j = k + 1;
+                    break;
+                }
+            }
+            if (keyString === undefined) {
+                keyString = this.orderBookChecksumString (key, format, priceLength, false);
+                changed = true;
+            }
+            if (amountString === undefined) {
+                amountString = this.orderBookChecksumString (amount, format, amountLength, negate);
+                changed = true;
+            }
+            levels.push ([ key, amount, keyString, amountString ]);
+        }
+        return {
+            'levels': levels,
+            'changed': changed,
+        };
+    }
+
+    orderBookChecksumString (value, format: string, length: Int = undefined, negate = false): string {
+        if (negate) {
+            return this.numberToString (-value);
+        }
+        const stringNumber = this.numberToString (value);
+        if (format !== 'stripped') {
+            return stringNumber;
+        }
+        const parts = stringNumber.split ('.');
+        const integer = this.safeString (parts, 0);
+        const decimals = this.safeString (parts, 1, '');
+        const paddedDecimals = decimals.padEnd (length, '0');
+        const joined = integer + paddedDecimals;
+        let i = 0;
+        while ((i < joined.length) && (joined[i] === '0')) {
+            i += 1;
+        }
+        if (i > 0) {
+            return joined.slice (i);
+        }
+        return joined;
+    }
+
+    orderBookChecksumPayload (bids, asks, format: string, depth: Int): string {
+        const bidsLength = bids.length;
+        const asksLength = asks.length;
+        const payloadArray = [];
+        if (format === 'stripped') {
+            for (let i = 0; i < asksLength; i++) {
+                payloadArray.push (asks[i][2] + asks[i][3]);
+            }
+            for (let i = 0; i < bidsLength; i++) {
+                payloadArray.push (bids[i][2] + bids[i][3]);
+            }
+            return payloadArray.join ('');
+        }
+        for (let i = 0; i < depth; i++) {
+            if (i < bidsLength) {
+                payloadArray.push (bids[i][2]);
+                payloadArray.push (bids[i][3]);
+            }
+            if (i < asksLength) {
+                payloadArray.push (asks[i][2]);
+                payloadArray.push (asks[i][3]);
+            }
+        }
+        return payloadArray.join (':');
+    }
+
     createNetworksByIdObject () {
         // automatically generate network-id-to-code mappings
         const networkIdsToCodesGenerated = this.invertFlatStringDictionary (this.safeValue (this.options, 'networks', {})); // invert defined networks dictionary
@@ -3211,96 +3374,374 @@ export default class Exchange {
     }
 
     setMarkets (markets, currencies = undefined) {
-        const values = [];
+        // one pass over the markets builds the markets, markets_by_id and the currencies derived from them
+        // the defaults every market is merged with are merged once
+        this.markets = {} as any;
         this.markets_by_id = {};
+        this.markets_by_id_type = undefined;
+        this.markets_index = undefined;
+        const template = this.marketTemplate ();
+        const defaultCurrencyPrecision = (this.precisionMode === DECIMAL_PLACES) ? 8 : this.parseNumber ('1e-8');
+        const baseCurrencies = [];
+        const quoteCurrencies = [];
         // handle marketId conflicts
         // we insert spot markets first
         const marketValues = this.sortBy (this.toArray (markets), 'spot', true, true);
         for (let i = 0; i < marketValues.length; i++) {
             const value = marketValues[i];
-            if (value['id'] in this.markets_by_id) {
-                const marketsByIdArray = (this.markets_by_id[value['id']] as any);
+            const marketId = value['id'];
+            if (marketId in this.markets_by_id) {
+                const marketsByIdArray = (this.markets_by_id[marketId] as any);
                 marketsByIdArray.push (value);
-                this.markets_by_id[value['id']] = marketsByIdArray;
+                this.markets_by_id[marketId] = marketsByIdArray;
             } else {
-                this.markets_by_id[value['id']] = [ value ] as any;
-            }
-            const market = this.deepExtend (this.safeMarketStructure (), {
-                'precision': this.precision,
-                'limits': this.limits,
-            }, this.fees['trading'], value);
-            if (market['linear']) {
-                market['subType'] = 'linear';
-            } else if (market['inverse']) {
-                market['subType'] = 'inverse';
+                this.markets_by_id[marketId] = [ value ] as any;
+            }
+            const market = this.extendMarket (template, value);
+            const symbol = this.safeString (market, 'symbol');
+            if (symbol !== undefined) {
+                this.markets[symbol] = market;
+            }
+            if (currencies === undefined) {
+                if ('base' in market) {
+                    baseCurrencies.push (this.marketCurrency (market, 'base', defaultCurrencyPrecision));
+                }
+                if ('quote' in market) {
+                    quoteCurrencies.push (this.marketCurrency (market, 'quote', defaultCurrencyPrecision));
+                }
+            }
+        }
+        this.symbols = Object.keys (this.keysort (this.markets));
+        this.ids = Object.keys (this.keysort (this.markets_by_id));
+        this.setMarketCurrencies (currencies, baseCurrencies, quoteCurrencies);
+        return this.markets;
+    }
+
+    updateMarkets (markets, currencies = undefined) {
+        // setMarkets for a reload that keeps the loaded market objects
+        // markets fetched unchanged keep their object, changed ones are updated in place,
+        // this.markets and this.markets_by_id are updated instead of replaced
+        // onMarketsChange is called with the added, removed and changed markets
+        if (this.isEmpty (this.markets)) {
+            return this.setMarkets (markets, currencies);
+        }
+        const marketsById = {};
+        const fetched = {};
+        const unchanged = {};
+        const template = this.marketTemplate ();
+        const defaultCurrencyPrecision = (this.precisionMode === DECIMAL_PLACES) ? 8 : this.parseNumber ('1e-8');
+        const baseCurrencies = [];
+        const quoteCurrencies = [];
+        const marketValues = this.sortBy (this.toArray (markets), 'spot', true, true);
+        for (let i = 0; i < marketValues.length; i++) {
+            const value = marketValues[i];
+            const marketId = value['id'];
+            if (marketId in marketsById) {
+                const marketsByIdArray = marketsById[marketId];
+                marketsByIdArray.push (value);
+                marketsById[marketId] = marketsByIdArray;
             } else {
-                market['subType'] = undefined;
+                marketsById[marketId] = [ value ];
+            }
+            let market = undefined;
+            const symbol = this.safeString (value, 'symbol');
+            if ((symbol !== undefined) && (symbol in this.markets) && !(symbol in fetched)) {
+                const loaded = this.markets[symbol];
+                if (this.json (this.loadedMarketValue (loaded)) === this.json (value)) {
+                    market = loaded;
+                    unchanged[symbol] = true;
+                }
+            }
+            if (market === undefined) {
+                market = this.extendMarket (template, value);
+            }
+            const marketSymbol = this.safeString (market, 'symbol');
+            if (marketSymbol !== undefined) {
+                fetched[marketSymbol] = market;
+            }
+            if (currencies === undefined) {
+                if ('base' in market) {
+                    baseCurrencies.push (this.marketCurrency (market, 'base', defaultCurrencyPrecision));
+                }
+                if ('quote' in market) {
+                    quoteCurrencies.push (this.marketCurrency (market, 'quote', defaultCurrencyPrecision));
+                }
+            }
+        }
+        const added = [];
+        const removed = [];
+        const changed = [];
+        const fetchedSymbols = Object.keys (fetched);
+        for (let i = 0; i < fetchedSymbols.length; i++) {
+            const symbol = fetchedSymbols[i];
+            const market = fetched[symbol];
+            if (!(symbol in this.markets)) {
+                this.markets[symbol] = market;
+                added.push (market);
+            } else if (!(symbol in unchanged)) {
+                const loaded = this.markets[symbol];
+                const loadedKeys = Object.keys (loaded);
+                for (let j = 0; j < loadedKeys.length; j++) {
+                    const key = loadedKeys[j];
+                    if (!(key in market)) {
+                        delete loaded[key];
+                    }
+                }
+                const marketKeys = Object.keys (market);
+                for (let j = 0; j < marketKeys.length; j++) {
+                    const key = marketKeys[j];
+                    loaded[key] = market[key];
+                }
+                this.markets[symbol] = loaded;
+                changed.push (loaded);
+            }
+        }
+        const loadedSymbols = Object.keys (this.markets);
+        for (let i = 0; i < loadedSymbols.length; i++) {
+            const symbol = loadedSymbols[i];
+            if (!(symbol in fetched)) {
+                removed.push (this.markets[symbol]);
+                delete this.markets[symbol];
+            }
+        }
+        const loadedIds = Object.keys (this.markets_by_id);
+        for (let i = 0; i < loadedIds.length; i++) {
+            delete this.markets_by_id[loadedIds[i]];
+        }
+        const fetchedIds = Object.keys (marketsById);
+        for (let i = 0; i < fetchedIds.length; i++) {
+            const marketId = fetchedIds[i];
+            this.markets_by_id[marketId] = marketsById[marketId];
+        }
+        this.markets_by_id_type = undefined;
+        this.markets_index = undefined;
+        this.symbols = Object.keys (this.keysort (this.markets));
+        this.ids = Object.keys (this.keysort (this.markets_by_id));
+        this.setMarketCurrencies (currencies, baseCurrencies, quoteCurrencies);
+        if ((added.length > 0) || (removed.length > 0) || (changed.length > 0)) {
+            this.onMarketsChange (added, removed, changed);
+        }
+        return this.markets;
+    }
+
+    applyMarkets (markets, currencies = undefined) {
+        // options['incrementalReload'] = true reloads the markets with updateMarkets
+        if (!this.isEmpty (this.markets) && this.safeBool (this.options, 'incrementalReload', false)) {
+            return this.updateMarkets (markets, currencies);
+        }
+        return this.setMarkets (markets, currencies);
+    }
+
+    loadedMarketValue (market: Dict) {
+        // the fetched market a loaded market was built from
+        const values = this.safeList (this.markets_by_id, market['id'], []);
+        let result = undefined;
+        for (let i = 0; i < values.length; i++) {
+            if (this.safeString (values[i], 'symbol') === market['symbol']) {
+                result = values[i];
             }
-            values.push (market);
         }
-        this.markets = this.indexBy (values, 'symbol') as any;
-        const marketsSortedBySymbol = this.keysort (this.markets);
-        const marketsSortedById = this.keysort (this.markets_by_id);
-        this.symbols = Object.keys (marketsSortedBySymbol);
-        this.ids = Object.keys (marketsSortedById);
+        return result;
+    }
+
+    marketTemplate () {
+        // the defaults every market is merged with
+        return this.deepExtend (this.safeMarketStructure (), {
+            'precision': this.precision,
+            'limits': this.limits,
+        }, this.fees['trading']);
+    }
+
+    extendMarket (template: Dict, value: Dict) {
+        const market = this.deepExtend (template, value);
+        if (market['linear']) {
+            market['subType'] = 'linear';
+        } else if (market['inverse']) {
+            market['subType'] = 'inverse';
+        } else {
+            market['subType'] = undefined;
+        }
+        return market;
+    }
+
+    marketCurrency (market: Dict, key: string, defaultPrecision) {
+        // [ code, id, numericId, precision ] of the base or the quote currency of a market
+        const marketPrecision = this.safeDict (market, 'precision', {});
+        const precisionKey = (key === 'base') ? 'amount' : 'price';
+        return [
+            this.safeString (market, key),
+            this.safeString2 (market, key + 'Id', key),
+            this.safeInteger (market, key + 'NumericId'),
+            this.safeValue2 (marketPrecision, key, precisionKey, defaultPrecision),
+        ];
+    }
+
+    setMarketCurrencies (currencies, baseCurrencies: any[], quoteCurrencies: any[]) {
         if (currencies !== undefined) {
             // currencies is always undefined when called in constructor but not when called from loadMarkets
             this.currencies = this.deepExtend (this.currencies, currencies);
         } else {
-            let baseCurrencies = [];
-            let quoteCurrencies = [];
-            for (let i = 0; i < values.length; i++) {
-                const market = values[i];
-                const defaultCurrencyPrecision = (this.precisionMode === DECIMAL_PLACES) ? 8 : this.parseNumber ('1e-8');
-                const marketPrecision = this.safeDict (market, 'precision', {});
-                if ('base' in market) {
-                    const currency = this.safeCurrencyStructure ({
-                        'id': this.safeString2 (market, 'baseId', 'base'),
-                        'numericId': this.safeInteger (market, 'baseNumericId'),
-                        'code': this.safeString (market, 'base'),
-                        'precision': this.safeValue2 (marketPrecision, 'base', 'amount', defaultCurrencyPrecision),
-                    });
-                    baseCurrencies.push (currency);
+            // the last base and quote currency of each code, and its most precise currency
+            // quote currencies compete for the highest precision after all base currencies of the same code
+            const lastBase = {};
+            const lastQuote = {};
+            const best = {};
+            const lowestIsHighestPrecision = (this.precisionMode === TICK_SIZE);
+            const numBase = baseCurrencies.length;
+            const allCurrencies = this.arrayConcat (baseCurrencies, quoteCurrencies);
+            for (let i = 0; i < allCurrencies.length; i++) {
+                const currency = allCurrencies[i];
+                const code = currency[0];
+                if (code !== undefined) {
+                    if (i < numBase) {
+                        lastBase[code] = currency;
+                    } else {
+                        lastQuote[code] = currency;
+                    }
+                    if (!(code in best)) {
+                        best[code] = currency;
+                    } else if (lowestIsHighestPrecision) {
+                        if (currency[3] < best[code][3]) {
+                            best[code] = currency;
+                        }
+                    } else if (currency[3] > best[code][3]) {
+                        best[code] = currency;
+                    }
                 }
-                if ('quote' in market) {
-                    const currency = this.safeCurrencyStructure ({
-                        'id': this.safeString2 (market, 'quoteId', 'quote'),
-                        'numericId': this.safeInteger (market, 'quoteNumericId'),
-                        'code': this.safeString (market, 'quote'),
-                        'precision': this.safeValue2 (marketPrecision, 'quote', 'price', defaultCurrencyPrecision),
-                    });
-                    quoteCurrencies.push (currency);
+            }
+            this.baseCurrencies = this.marketsCurrencyStructures (lastBase);
+            this.quoteCurrencies = this.marketsCurrencyStructures (lastQuote);
+            this.currencies = this.deepExtend (this.currencies, this.marketsCurrencyStructures (best));
+        }
+        this.codes = Object.keys (this.keysort (this.currencies));
+        this.currencies_by_id = {};
+        for (let i = 0; i < this.codes.length; i++) {
+            const currency = this.currencies[this.codes[i]];
+            const currencyId = this.safeValue (currency, 'id');
+            if (currencyId !== undefined) {
+                this.currencies_by_id[currencyId] = currency;
+            }
+        }
+    }
+
+    marketsCurrencyStructures (currencies: Dict) {
+        // code: currency structure sorted by code, for code: [ code, id, numericId, precision ]
+        const result = {};
+        const codes = Object.keys (this.keysort (currencies));
+        for (let i = 0; i < codes.length; i++) {
+            const code = codes[i];
+            const currency = currencies[code];
+            result[code] = this.safeCurrencyStructure ({
+                'id': currency[1],
+                'numericId': currency[2],
+                'code': code,
+                'precision': currency[3],
+            });
+        }
+        return result;
+    }
+
+    filterMarkets (type: Str = undefined, subType: Str = undefined, base: Str = undefined, quote: Str = undefined, settle: Str = undefined, expiry: Int = undefined, underlying: Str = undefined): Market[] {
+        /**
+         * @method
+         * @name Exchange#filterMarkets
+         * @description markets matching all of the given fields, sorted by symbol
+         * @param {string} [type] 'spot', 'margin', 'swap', 'future' or 'option'
+         * @param {string} [subType] 'linear' or 'inverse'
+         * @param {string} [base] unified base currency code
+         * @param {string} [quote] unified quote currency code
+         * @param {string} [settle] unified settle currency code
+         * @param {int} [expiry] expiry timestamp in ms
+         * @param {string} [underlying] base/quote of the derivatives, like BTC/USD for BTC/USD:BTC-240927-60000-C
+         * @returns {object[]} a list of [market structures]{@link https://docs.ccxt.com/#/?id=market-structure}
+         */
+        const criteria = {
+            'type': type,
+            'subType': subType,
+            'base': base,
+            'quote': quote,
+            'settle': settle,
+            'expiry': this.numberToString (expiry),
+            'underlying': underlying,
+        };
+        const index = this.getMarketsIndex ();
+        const fields = Object.keys (criteria);
+        const selected = [];
+        let candidates = undefined;
+        for (let i = 0; i < fields.length; i++) {
+            const field = fields[i];
+            const value = criteria[field];
+            if (value !== undefined) {
+                const marketsByValue = this.safeList (index[field], value, []);
+                if ((candidates === undefined) || (marketsByValue.length < candidates.length)) {
+                    candidates = marketsByValue;
                 }
+                selected.push (field);
             }
-            baseCurrencies = this.sortBy (baseCurrencies, 'code', false, '');
-            quoteCurrencies = this.sortBy (quoteCurrencies, 'code', false, '');
-            this.baseCurrencies = this.indexBy (baseCurrencies, 'code');
-            this.quoteCurrencies = this.indexBy (quoteCurrencies, 'code');
-            const allCurrencies = this.arrayConcat (baseCurrencies, quoteCurrencies);
-            const groupedCurrencies = this.groupBy (allCurrencies, 'code');
-            const codes = Object.keys (groupedCurrencies);
-            const resultingCurrencies = [];
-            for (let i = 0; i < codes.length; i++) {
-                const code = codes[i];
-                const groupedCurrenciesCode = this.safeList (groupedCurrencies, code, []);
-                let highestPrecisionCurrency = this.safeValue (groupedCurrenciesCode, 0);
-                for (let j = 1; j < groupedCurrenciesCode.length; j++) {
-                    const currentCurrency = groupedCurrenciesCode[j];
-                    if (this.precisionMode === TICK_SIZE) {
-                        highestPrecisionCurrency = (currentCurrency['precision'] < highestPrecisionCurrency['precision']) ? currentCurrency : highestPrecisionCurrency;
-                    } else {
-                        highestPrecisionCurrency = (currentCurrency['precision'] > highestPrecisionCurrency['precision']) ? currentCurrency : highestPrecisionCurrency;
+        }
+        const result = [];
+        if (candidates === undefined) {
+            const symbols = (this.symbols === undefined) ? [] : this.symbols;
+            for (let i = 0; i < symbols.length; i++) {
+                result.push (this.markets[symbols[i]]);
+            }
+            return result;
+        }
+        // the markets of the most selective field that match all other fields
+        for (let i = 0; i < candidates.length; i++) {
+            const market = candidates[i];
+            let matches = true;
+            for (let j = 0; j < selected.length; j++) {
+                const field = selected[j];
+                if (this.marketIndexValue (market, field) !== criteria[field]) {
+                    matches = false;
+                    break;
+                }
+            }
+            if (matches) {
+                result.push (market);
+            }
+        }
+        return result;
+    }
+
+    getMarketsIndex () {
+        // field: value: markets sorted by symbol, built on the first query
+        // setMarkets and updateMarkets drop it
+        if (this.markets_index === undefined) {
+            const fields = [ 'type', 'subType', 'base', 'quote', 'settle', 'expiry', 'underlying' ];
+            const index = {};
+            for (let i = 0; i < fields.length; i++) {
+                index[fields[i]] = {};
+            }
+            const symbols = (this.symbols === undefined) ? [] : this.symbols;
+            for (let i = 0; i < symbols.length; i++) {
+                const market = this.markets[symbols[i]];
+                for (let j = 0; j < fields.length; j++) {
+                    const field = fields[j];
+                    const value = this.marketIndexValue (market, field);
+                    if (value !== undefined) {
+                        if (value in index[field]) {
+                            index[field][value].push (market);
+                        } else {
+                            index[field][value] = [ market ];
+                        }
                     }
                 }
-                resultingCurrencies.push (highestPrecisionCurrency);
             }
-            const sortedCurrencies = this.sortBy (resultingCurrencies, 'code');
-            this.currencies = this.deepExtend (this.currencies, this.indexBy (sortedCurrencies, 'code'));
+            this.markets_index = index;
         }
-        this.currencies_by_id = this.indexBy (this.currencies, 'id');
-        const currenciesSortedByCode = this.keysort (this.currencies);
-        this.codes = Object.keys (currenciesSortedByCode);
-        return this.markets;
+        return this.markets_index;
+    }
+
+    marketIndexValue (market: Dict, field: string): Str {
+        if (field === 'underlying') {
+            if (market['spot'] || (market['base'] === undefined) || (market['quote'] === undefined)) {
+                return undefined;
+            }
+            return market['base'] + '/' + market['quote'];
+        }
+        return this.safeString (market, field);
     }
 
     getDescribeForExtendedWsExchange (currentRestInstance: any, parentRestInstance: any, wsBaseDescribe: Dictionary<any>) {
@@ -4551,16 +4992,68 @@ export default class Exchange {
 
     parseTrades (trades: any[], market: Market = undefined, since: Int = undefined, limit: Int = undefined, params = {}): Trade[] {
         trades = this.toArray (trades);
-        let result = [];
-        for (let i = 0; i < trades.length; i++) {
-            const trade = this.extend (this.parseTrade (trades[i], market), params);
-            result.push (trade);
+        let result = this.parseTradesBatch (trades, market);
+        if (!this.isEmpty (params)) {
+            for (let i = 0; i < result.length; i++) {
+                result[i] = this.extend (result[i], params);
+            }
         }
         result = this.sortBy2 (result, 'timestamp', 'id');
         const symbol = (market !== undefined) ? market['symbol'] : undefined;
         return this.filterBySymbolSinceLimit (result, symbol, since, limit) as Trade[];
     }
 
+    parseTradesBatch (trades: any[], market: Market = undefined): Trade[] {
+        // parseTrade for every trade, exchanges override it with loops over the trades of their most common responses
+        const result = [];
+        for (let i = 0; i < trades.length; i++) {
+            result.push (this.parseTrade (trades[i], market));
+        }
+        return result;
+    }
+
+    safeTradeWithoutFee (trade: Dict, contractSize: Str = undefined, inverse = false): Trade {
+        // safeTrade for a trade without a fee, with string or undefined price, amount and cost
+        // contractSize and inverse are the safeString and safeBool of the market, looked up once per batch
+        const price = trade['price'];
+        const amount = trade['amount'];
+        let cost = trade['cost'];
+        if (cost === undefined) {
+            // contract trading
+            let multiplyPrice = price;
+            if (contractSize !== undefined) {
+                if (inverse) {
+                    multiplyPrice = Precise.stringDiv ('1', price);
+                }
+                multiplyPrice = Precise.stringMul (multiplyPrice, contractSize);
+            }
+            cost = Precise.stringMul (multiplyPrice, amount);
+        }
+        trade['fee'] = {
+            'cost': undefined,
+            'currency': undefined,
+        };
+        trade['fees'] = [];
+        trade['amount'] = this.parseNumber (amount);
+        trade['price'] = this.parseNumber (price);
+        trade['cost'] = this.parseNumber (cost);
+        return trade as Trade;
+    }
+
+    hasOnlyKeys (value, keys: Dict): boolean {
+        // true if value is a dictionary and every key of it is a key of keys
+        if ((value !== undefined) && (typeof value === 'object') && !Array.isArray (value)) {
+            const valueKeys = Object.keys (value);
+            for (let i = 0; i < valueKeys.length; i++) {
+                if (!(valueKeys[i] in keys)) {
+                    return false;
+                }
+            }
+            return true;
+        }
+        return false;
+    }
+
     parseTransactions (transactions: any[], currency: Currency = undefined, since: Int = undefined, limit: Int = undefined, params = {}): Transaction[] {
         transactions = this.toArray (transactions);
         let result = [];
@@ -4766,12 +5259,45 @@ export default class Exchange {
     }
 
     async fetch2 (path, api: any = 'public', method = 'GET', params = {}, headers: any = undefined, body: any = undefined, config = {}) {
+        if (this.isSingleFlightRequest (api, method)) {
+            return await this.fetchSingleFlight (path, api, method, params, headers, body, config);
+        }
+        return await this.sendRequest (path, api, method, params, headers, body, config);
+    }
+
+    isSingleFlightRequest (api, method) {
+        // options['singleFlight'] shares identical public GET requests between concurrent callers
+        // sections named private are signed and never shared
+        const singleFlight = this.safeValue (this.options, 'singleFlight');
+        if ((method !== 'GET') || !singleFlight) {
+            return false;
+        }
+        let parts = api;
+        if (!Array.isArray (api)) {
+            parts = [ api ];
+        }
+        let isPublic = false;
+        for (let i = 0; i < parts.length; i++) {
+            const part = parts[i].toLowerCase ();
+            if (part.indexOf ('private') >= 0) {
+                return false;
+            }
+            if (part.indexOf ('public') >= 0) {
+                isPublic = true;
+            }
+        }
+        return isPublic;
+    }
+
+    async sendRequest (path, api: any = 'public', method = 'GET', params = {}, headers: any = undefined, body: any = undefined, config = {}, request: any = undefined) {
         if (this.enableRateLimit) {
             const cost = this.calculateRateLimiterCost (api, method, path, params, config);
-            await this.throttle (cost);
+            await this.throttle (cost, api);
         }
         this.lastRestRequestTimestamp = this.milliseconds ();
-        const request = this.sign (path, api, method, params, headers, body);
+        if (request === undefined) {
+            request = this.sign (path, api, method, params, headers, body);
+        }
         this.last_request_headers = request['headers'];
         this.last_request_body = request['body'];
         this.last_request_url = request['url'];
@@ -4998,45 +5524,56 @@ export default class Exchange {
     }
 
     safeMarket (marketId: Str = undefined, market: Market = undefined, delimiter: Str = undefined, marketType: Str = undefined): MarketInterface {
+        if ((marketId === undefined) && (market !== undefined)) {
+            return market;
+        }
+        if ((marketId !== undefined) && (this.markets_by_id !== undefined) && (marketId in this.markets_by_id)) {
+            // known market ids are returned before the structure for unknown ones is built
+            const markets = this.markets_by_id[marketId];
+            const numMarkets = markets.length;
+            if (numMarkets === 1) {
+                return markets[0];
+            }
+            if (marketType === undefined) {
+                if (market === undefined) {
+                    throw new ArgumentsRequired (this.id + ' safeMarket() requires a fourth argument for ' + marketId + ' to disambiguate between different markets with the same market id');
+                } else {
+                    marketType = market['type'];
+                }
+            }
+            // the market of a type is memoized for market ids shared by markets of different types
+            if (this.markets_by_id_type === undefined) {
+                this.markets_by_id_type = {};
+            }
+            if (!(marketType in this.markets_by_id_type)) {
+                this.markets_by_id_type[marketType] = {};
+            }
+            if (marketId in this.markets_by_id_type[marketType]) {
+                return this.markets_by_id_type[marketType][marketId];
+            }
+            for (let i = 0; i < markets.length; i++) {
+                const currentMarket = markets[i];
+                if (currentMarket[marketType]) {
+                    this.markets_by_id_type[marketType][marketId] = currentMarket;
+                    return currentMarket;
+                }
+            }
+        }
         const result = this.safeMarketStructure ({
             'symbol': marketId,
             'marketId': marketId,
         });
-        if (marketId !== undefined) {
-            if ((this.markets_by_id !== undefined) && (marketId in this.markets_by_id)) {
-                const markets = this.markets_by_id[marketId];
-                const numMarkets = markets.length;
-                if (numMarkets === 1) {
-                    return markets[0];
-                } else {
-                    if (marketType === undefined) {
-                        if (market === undefined) {
-                            throw new ArgumentsRequired (this.id + ' safeMarket() requires a fourth argument for ' + marketId + ' to disambiguate between different markets with the same market id');
-                        } else {
-                            marketType = market['type'];
-                        }
-                    }
-                    for (let i = 0; i < markets.length; i++) {
-                        const currentMarket = markets[i];
-                        if (currentMarket[marketType]) {
-                            return currentMarket;
-                        }
-                    }
-                }
-            } else if (delimiter !== undefined && delimiter !== '') {
-                const parts = marketId.split (delimiter);
-                const partsLength = parts.length;
-                if (partsLength === 2) {
-                    result['baseId'] = this.safeString (parts, 0);
-                    result['quoteId'] = this.safeString (parts, 1);
-                    result['base'] = this.safeCurrencyCode (result['baseId']);
-                    result['quote'] = this.safeCurrencyCode (result['quoteId']);
-                    result['symbol'] = result['base'] + '/' + result['quote'];
-                    return result;
-                } else {
-                    return result;
-                }
+        if ((marketId !== undefined) && (delimiter !== undefined) && (delimiter !== '') && !((this.markets_by_id !== undefined) && (marketId in this.markets_by_id))) {
+            const parts = marketId.split (delimiter);
+            const partsLength = parts.length;
+            if (partsLength === 2) {
+                result['baseId'] = this.safeString (parts, 0);
+                result['quoteId'] = this.safeString (parts, 1);
+                result['base'] = this.safeCurrencyCode (result['baseId']);
+                result['quote'] = this.safeCurrencyCode (result['quoteId']);
+                result['symbol'] = result['base'] + '/' + result['quote'];
             }
+            return result;
         }
         if (market !== undefined) {
             return market;
@@ -1265,6 +1265,20 @@ export default class binance extends Exchange {
             // exchange-specific options
             'options': {
                 'sandboxMode': false,
+                'rateLimiter': {
+                    'headers': {
+                        // IP weight used in the current minute, the limits differ by api host
+                        'x-mbx-used-weight-1m': {
+                            'window': 60000,
+                            'limit': {
+                                'api': 6000,
+                                'fapi': 2400,
+                                'dapi': 2400,
+                                'papi': 6000,
+                            },
+                        },
+                    },
+                },
                 'fetchMargins': true,
                 'fetchMarkets': [
                     'spot', // allows CORS in browsers
@@ -4908,6 +4922,48 @@ export default class binance extends Exchange {
         }, market);
     }
 
+    parseTradesBatch (trades: any[], market: Market = undefined): Trade[] {
+        // aggregate trades of the public endpoints, { "a", "p", "q", "f", "l", "T", "m", "M" }, are parsed in one loop
+        // that only reads their fields, other trades and option markets go through parseTrade
+        if ((market === undefined) || market['option']) {
+            return super.parseTradesBatch (trades, market);
+        }
+        const aggregateTradeKeys: Dict = { 'a': true, 'p': true, 'q': true, 'f': true, 'l': true, 'T': true, 'm': true, 'M': true };
+        const symbol = market['symbol'];
+        const contractSize = this.safeString (market, 'contractSize');
+        const inverse = this.safeBool (market, 'inverse', false);
+        const result = [];
+        for (let i = 0; i < trades.length; i++) {
+            const trade = trades[i];
+            if (this.hasOnlyKeys (trade, aggregateTradeKeys)) {
+                const timestamp = this.safeInteger (trade, 'T');
+                const buyerMaker = this.safeBool (trade, 'm');
+                let side = undefined;
+                if (buyerMaker !== undefined) {
+                    side = buyerMaker ? 'sell' : 'buy'; // this is reversed intentionally
+                }
+                result.push (this.safeTradeWithoutFee ({
+                    'info': trade,
+                    'timestamp': timestamp,
+                    'datetime': this.iso8601 (timestamp),
+                    'symbol': symbol,
+                    'id': this.safeString (trade, 'a'),
+                    'order': undefined,
+                    'type': undefined,
+                    'side': side,
+                    'takerOrMaker': undefined,
+                    'price': this.safeString (trade, 'p'),
+                    'amount': this.safeString (trade, 'q'),
+                    'cost': undefined,
+                    'fee': undefined,
+                }, contractSize, inverse));
+            } else {
+                result.push (this.parseTrade (trade, market));
+            }
+        }
+        return result;
+    }
+
     /**
      * @method
      * @name binance#fetchTrades
@@ -9466,25 +9522,22 @@ export default class binance extends Exchange {
             //         ...
             //     }
             //
-            const symbols = Object.keys (this.markets);
+            const markets = this.filterMarkets (undefined, 'linear');
             const result: Dict = {};
             const feeTier = this.safeInteger (response, 'feeTier');
             const feeTiers = this.fees['linear']['trading']['tiers'];
             const maker = feeTiers['maker'][feeTier][1];
             const taker = feeTiers['taker'][feeTier][1];
-            for (let i = 0; i < symbols.length; i++) {
-                const symbol = symbols[i];
-                const market = this.markets[symbol];
-                if (market['linear']) {
-                    result[symbol] = {
-                        'info': {
-                            'feeTier': feeTier,
-                        },
-                        'symbol': symbol,
-                        'maker': maker,
-                        'taker': taker,
-                    };
-                }
+            for (let i = 0; i < markets.length; i++) {
+                const symbol = markets[i]['symbol'];
+                result[symbol] = {
+                    'info': {
+                        'feeTier': feeTier,
+                    },
+                    'symbol': symbol,
+                    'maker': maker,
+                    'taker': taker,
+                };
             }
             return result;
         } else if (isInverse) {
@@ -9497,25 +9550,22 @@ export default class binance extends Exchange {
             //         "updateTime": 0
             //     }
             //
-            const symbols = Object.keys (this.markets);
+            const markets = this.filterMarkets (undefined, 'inverse');
             const result: Dict = {};
             const feeTier = this.safeInteger (response, 'feeTier');
             const feeTiers = this.fees['inverse']['trading']['tiers'];
             const maker = feeTiers['maker'][feeTier][1];
             const taker = feeTiers['taker'][feeTier][1];
-            for (let i = 0; i < symbols.length; i++) {
-                const symbol = symbols[i];
-                const market = this.markets[symbol];
-                if (market['inverse']) {
-                    result[symbol] = {
-                        'info': {
-                            'feeTier': feeTier,
-                        },
-                        'symbol': symbol,
-                        'maker': maker,
-                        'taker': taker,
-                    };
-                }
+            for (let i = 0; i < markets.length; i++) {
+                const symbol = markets[i]['symbol'];
+                result[symbol] = {
+                    'info': {
+                        'feeTier': feeTier,
+                    },
+                    'symbol': symbol,
+                    'maker': maker,
+                    'taker': taker,
+                };
             }
             return result;
         }
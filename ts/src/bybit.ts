@@ -1022,6 +1022,19 @@ export default class bybit extends Exchange {
             },
             'precisionMode': TICK_SIZE,
             'options': {
+                'rateLimiter': {
+                    'headers': {
+                        // requests left in the per endpoint window
+                        'x-bapi-limit-status': {
+                            'type': 'remaining',
+                            'limitHeader': 'x-bapi-limit',
+                            'resetHeader': 'x-bapi-limit-reset-timestamp',
+                            'resetType': 'timestamp',
+                            'window': 1000,
+                            'scope': 'path',
+                        },
+                    },
+                },
                 'usePrivateInstrumentsInfo': false,
                 'enableDemoTrading': false,
                 'fetchMarkets': [ 'spot', 'linear', 'inverse', 'option' ],
@@ -3117,6 +3130,45 @@ export default class bybit extends Exchange {
         }, market);
     }
 
+    parseTradesBatch (trades: any[], market: Market = undefined): Trade[] {
+        // public trades, { "execId", "symbol", "price", "size", "side", "time", "isBlockTrade" }, are parsed in one loop
+        // that only reads their fields and resolves every symbol once, other trades go through parseTrade
+        const publicTradeKeys: Dict = { 'execId': true, 'symbol': true, 'price': true, 'size': true, 'side': true, 'time': true, 'isBlockTrade': true, 'isRPITrade': true, 'seq': true, 'mP': true, 'iP': true, 'mIv': true, 'iv': true };
+        const marketType = (market === undefined) ? 'spot' : market['type'];
+        const markets: Dict = {};
+        const result = [];
+        for (let i = 0; i < trades.length; i++) {
+            const trade = trades[i];
+            const marketId = this.hasOnlyKeys (trade, publicTradeKeys) ? this.safeString (trade, 'symbol') : undefined;
+            if (marketId === undefined) {
+                result.push (this.parseTrade (trade, market));
+            } else {
+                if (!(marketId in markets)) {
+                    const tradeMarket = this.safeMarket (marketId, market, undefined, marketType);
+                    markets[marketId] = [ tradeMarket['symbol'], this.safeString (tradeMarket, 'contractSize'), this.safeBool (tradeMarket, 'inverse', false) ];
+                }
+                const cached = markets[marketId];
+                const timestamp = this.safeInteger (trade, 'time');
+                result.push (this.safeTradeWithoutFee ({
+                    'id': this.safeString (trade, 'execId'),
+                    'info': trade,
+                    'timestamp': timestamp,
+                    'datetime': this.iso8601 (timestamp),
+                    'symbol': cached[0],
+                    'order': undefined,
+                    'type': undefined,
+                    'side': this.safeStringLower (trade, 'side'),
+                    'takerOrMaker': undefined,
+                    'price': this.safeString (trade, 'price'),
+                    'amount': this.safeString (trade, 'size'),
+                    'cost': undefined,
+                    'fee': undefined,
+                }, cached[1], cached[2]));
+            }
+        }
+        return result;
+    }
+
     /**
      * @method
      * @name bybit#fetchTrades
@@ -638,6 +638,18 @@ export default class kucoin extends Exchange {
                 'FUD': 'FTX Users\' Debt',
             },
             'options': {
+                'rateLimiter': {
+                    'headers': {
+                        // weight left in the resource pool of the api host
+                        'gw-ratelimit-remaining': {
+                            'type': 'remaining',
+                            'limitHeader': 'gw-ratelimit-limit',
+                            'resetHeader': 'gw-ratelimit-reset',
+                            'resetType': 'delta',
+                            'window': 30000,
+                        },
+                    },
+                },
                 'hf': undefined, // would be auto set to `true/false` after first load
                 'version': 'v1',
                 'symbolSeparator': '-',
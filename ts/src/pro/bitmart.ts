@@ -3,7 +3,7 @@
 
 import bitmartRest from '../bitmart.js';
 import { AuthenticationError, ExchangeError, NotSupported } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import type { Int, Market, Str, Strings, OrderBook, Order, Trade, Ticker, Tickers, OHLCV, Position, Balances, Dict } from '../base/types.js';
 import Client from '../base/ws/Client.js';
@@ -1228,7 +1228,7 @@ export default class bitmart extends bitmartRest {
                 let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
                 if (stored === undefined) {
                     const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-                    stored = new ArrayCacheByTimestamp (limit);
+                    stored = this.ohlcvCache (limit);
                     this.ohlcvs[symbol][timeframe] = stored;
                 }
                 stored.append (parsed);
@@ -1244,7 +1244,7 @@ export default class bitmart extends bitmartRest {
             let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
             if (stored === undefined) {
                 const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-                stored = new ArrayCacheByTimestamp (limit);
+                stored = this.ohlcvCache (limit);
                 this.ohlcvs[symbol][timeframe] = stored;
             }
             for (let i = 0; i < items.length; i++) {
@@ -1284,16 +1284,8 @@ export default class bitmart extends bitmartRest {
         return orderbook.limit ();
     }
 
-    handleDelta (bookside, delta) {
-        const price = this.safeFloat (delta, 0);
-        const amount = this.safeFloat (delta, 1);
-        bookside.store (price, amount);
-    }
-
     handleDeltas (bookside, deltas) {
-        for (let i = 0; i < deltas.length; i++) {
-            this.handleDelta (bookside, deltas[i]);
-        }
+        bookside.storeDeltas (deltas);
     }
 
     handleOrderBookMessage (client: Client, message, orderbook) {
@@ -5,7 +5,7 @@ import { AuthenticationError, ExchangeError, NotSupported } from '../base/errors
 import { Ticker, Int, Trade, OrderBook, Market, Dict, Strings, FundingRate, FundingRates, Tickers, OHLCV } from '../base/types.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import Client from '../base/ws/Client.js';
-import { ArrayCache, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache } from '../base/ws/Cache.js';
 
 //  ---------------------------------------------------------------------------
 
@@ -496,7 +496,7 @@ export default class coinbaseinternational extends coinbaseinternationalRest {
         this.ohlcvs[symbol] = this.safeValue (this.ohlcvs, symbol, {});
         if (this.safeValue (this.ohlcvs[symbol], timeframe) === undefined) {
             const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-            this.ohlcvs[symbol][timeframe] = new ArrayCacheByTimestamp (limit);
+            this.ohlcvs[symbol][timeframe] = this.ohlcvCache (limit);
         }
         const stored = this.ohlcvs[symbol][timeframe];
         const data = this.safeList (message, 'candles', []);
@@ -3,7 +3,7 @@
 
 import krakenRest from '../kraken.js';
 import { ExchangeError, BadSymbol, PermissionDenied, AccountSuspended, BadRequest, InsufficientFunds, InvalidOrder, OrderNotFound, NotSupported, RateLimitExceeded, ExchangeNotAvailable, ChecksumError, AuthenticationError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 import { Precise } from '../base/Precise.js';
 import type { Int, Strings, OrderSide, OrderType, Str, OrderBook, Order, Trade, Ticker, Tickers, OHLCV, Num, Dict, Balances } from '../base/types.js';
 import Client from '../base/ws/Client.js';
@@ -442,7 +442,7 @@ export default class kraken extends krakenRest {
             let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
             if (stored === undefined) {
                 const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-                stored = new ArrayCacheByTimestamp (limit);
+                stored = this.ohlcvCache (limit);
                 this.ohlcvs[symbol][timeframe] = stored;
             }
             stored.append (result);
@@ -843,19 +843,10 @@ export default class kraken extends krakenRest {
                 const amountParts = amountString.split ('.');
                 const priceLength = priceParts[1].length - 0;
                 const amountLength = amountParts[1].length - 0;
-                const payloadArray = [];
+                let localChecksum = undefined;
                 if (c !== undefined) {
-                    for (let i = 0; i < 10; i++) {
-                        const formatted = this.formatNumber (storedAsks[i][0], priceLength) + this.formatNumber (storedAsks[i][1], amountLength);
-                        payloadArray.push (formatted);
-                    }
-                    for (let i = 0; i < 10; i++) {
-                        const formatted = this.formatNumber (storedBids[i][0], priceLength) + this.formatNumber (storedBids[i][1], amountLength);
-                        payloadArray.push (formatted);
-                    }
+                    localChecksum = this.orderBookChecksum (symbol, orderbook, 'stripped', 10, 0, priceLength, amountLength);
                 }
-                const payload = payloadArray.join ('');
-                const localChecksum = this.crc32 (payload, false);
                 if (localChecksum !== c) {
                     const error = new ChecksumError (this.id + ' ' + this.orderbookChecksumMessage (symbol));
                     delete client.subscriptions[messageHash];
@@ -871,24 +862,6 @@ export default class kraken extends krakenRest {
         }
     }
 
-    formatNumber (n, length) {
-        const stringNumber = this.numberToString (n);
-        const parts = stringNumber.split ('.');
-        const integer = this.safeString (parts, 0);
-        const decimals = this.safeString (parts, 1, '');
-        const paddedDecimals = decimals.padEnd (length, '0');
-        const joined = integer + paddedDecimals;
-        let i = 0;
-        while (joined[i] === '0') {
-            i += 1;
-        }
-        if (i > 0) {
-            return joined.slice (i);
-        } else {
-            return joined;
-        }
-    }
-
     customHandleDeltas (bookside, deltas, timestamp = undefined) {
         for (let j = 0; j < deltas.length; j++) {
             const delta = deltas[j];
@@ -3,7 +3,7 @@
 
 import okxRest from '../okx.js';
 import { ArgumentsRequired, BadRequest, ExchangeError, ChecksumError, AuthenticationError, InvalidNonce } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import type { Int, OrderSide, OrderType, Str, Strings, OrderBook, Order, Trade, Ticker, Tickers, OHLCV, Position, Balances, Num, FundingRate, FundingRates, Dict, Liquidation } from '../base/types.js';
 import Client from '../base/ws/Client.js';
@@ -1093,7 +1093,7 @@ export default class okx extends okxRest {
             let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
             if (stored === undefined) {
                 const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-                stored = new ArrayCacheByTimestamp (limit);
+                stored = this.ohlcvCache (limit);
                 this.ohlcvs[symbol][timeframe] = stored;
             }
             stored.append (parsed);
@@ -1264,24 +1264,8 @@ export default class okx extends okxRest {
         return await this.unWatchOrderBookForSymbols ([ symbol ], params);
     }
 
-    handleDelta (bookside, delta) {
-        //
-        //     [
-        //         "31685", // price
-        //         "0.78069158", // amount
-        //         "0", // liquidated orders
-        //         "17" // orders
-        //     ]
-        //
-        const price = this.safeFloat (delta, 0);
-        const amount = this.safeFloat (delta, 1);
-        bookside.store (price, amount);
-    }
-
     handleDeltas (bookside, deltas) {
-        for (let i = 0; i < deltas.length; i++) {
-            this.handleDelta (bookside, deltas[i]);
-        }
+        bookside.storeDeltas (deltas);
     }
 
     handleOrderBookMessage (client: Client, message, orderbook, messageHash, market = undefined) {
@@ -1317,22 +1301,8 @@ export default class okx extends okxRest {
         if (checksum) {
             const prevSeqId = this.safeInteger (message, 'prevSeqId');
             const nonce = orderbook['nonce'];
-            const asksLength = storedAsks.length;
-            const bidsLength = storedBids.length;
-            const payloadArray = [];
-            for (let i = 0; i < 25; i++) {
-                if (i < bidsLength) {
-                    payloadArray.push (this.numberToString (storedBids[i][0]));
-                    payloadArray.push (this.numberToString (storedBids[i][1]));
-                }
-                if (i < asksLength) {
-                    payloadArray.push (this.numberToString (storedAsks[i][0]));
-                    payloadArray.push (this.numberToString (storedAsks[i][1]));
-                }
-            }
-            const payload = payloadArray.join (':');
             const responseChecksum = this.safeInteger (message, 'checksum');
-            const localChecksum = this.crc32 (payload, true);
+            const localChecksum = this.orderBookChecksum (symbol, orderbook, 'interleaved', 25);
             let error = undefined;
             if (prevSeqId !== -1 && nonce !== prevSeqId) {
                 error = new InvalidNonce (this.id + ' watchOrderBook received invalid nonce');
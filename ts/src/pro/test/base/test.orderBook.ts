@@ -60,6 +60,15 @@ function testWsOrderBook () {
         'symbol': undefined,
     };
 
+    const deltasOrderBookTarget = {
+        'bids': [ [ 10.5, 3 ], [ 10.0, 10 ], [ 9.1, 11 ], [ 8.2, 12 ], [ 7.3, 13 ], [ 6.4, 14 ], [ 3, 4 ] ],
+        'asks': [ [ 11.5, 2 ], [ 12.2, 14 ], [ 13.3, 13 ], [ 14.4, 12 ], [ 15.5, 11 ], [ 16.6, 10 ] ],
+        'timestamp': 1574827240000,
+        'datetime': '2019-11-27T04:00:40.000Z',
+        'nonce': 70,
+        'symbol': undefined,
+    };
+
     const limitedDeletedOrderBookTarget = {
         'bids': [ [ 10.0, 10 ], [ 9.1, 11 ], [ 8.2, 12 ], [ 7.3, 13 ], [ 6.4, 14 ] ],
         'asks': [ [ 11.1, 13 ], [ 12.2, 14 ], [ 13.3, 13 ], [ 14.4, 12 ] ],
@@ -391,6 +400,23 @@ function testWsOrderBook () {
 
     // --------------------------------------------------------------------------------------------------------------------
 
+    const deltasOrderBook = new OrderBook (orderBookInput);
+    deltasOrderBook.applyDeltas ([ [ '11.1', '0' ], [ '11.5', '1' ], [ '11.5', '2' ] ], [ [ '10.5', '3' ], [ '4.5', '0' ], [ '3', '4' ] ], 70, 1574827240000);
+    deltasOrderBook.limit ();
+    assert (equals (deltasOrderBook, deltasOrderBookTarget));
+    const countedDeltasOrderBook = new CountedOrderBook (countedOrderBookInput);
+    const countedDeltasBids = countedDeltasOrderBook['bids'];
+    countedDeltasBids.storeDeltas ([ [ '5', '0', '6' ], [ '1', '1', '6' ] ]);
+    countedDeltasOrderBook.limit ();
+    assert (equals (countedDeltasOrderBook, storedCountedOrderbookTarget));
+    const indexedDeltasOrderBook = new IndexedOrderBook (indexedOrderBookInput);
+    const indexedDeltasAsks = indexedDeltasOrderBook['asks'];
+    indexedDeltasAsks.storeDeltas ([ [ '13.5', '13', '1244' ] ]);
+    indexedDeltasOrderBook.limit ();
+    assert (equals (indexedDeltasOrderBook, overwrite1244));
+
+    // --------------------------------------------------------------------------------------------------------------------
+
     const resetBook = new OrderBook (storeBid);
     resetBook.limit ();
     resetBook.reset (orderBookInput);
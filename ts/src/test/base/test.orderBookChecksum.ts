@@ -0,0 +1,40 @@
+
+// AUTO_TRANSPILE_ENABLED
+
+import assert from 'assert';
+import ccxt from '../../../ccxt.js';
+
+function testOrderBookChecksum () {
+
+    const exchange = new ccxt.Exchange ({
+        'id': 'sampleexchange',
+    });
+
+    const orderbook = {
+        'bids': [ [ 100.5, 1.25 ], [ 100.4, 0.5 ], [ 100.3, 3.5 ] ],
+        'asks': [ [ 100.6, 2.5 ], [ 100.7, 0.75 ], [ 100.8, 1.5 ] ],
+    };
+
+    // CASE 1: okx, 100.5:1.25:100.6:2.5:100.4:0.5:100.7:0.75
+    assert (exchange.orderBookChecksum ('BTC/USDT', orderbook, 'interleaved', 2) === -1678454923);
+    const stored = exchange.orderbookChecksums['BTC/USDT'];
+    assert (stored['bids'][0][2] === '100.5');
+    assert (stored['asks'][0][3] === '2.5');
+
+    // CASE 2: a level below the top depth changes, the checksum stays
+    orderbook['bids'][2][1] = 9.5;
+    assert (exchange.orderBookChecksum ('BTC/USDT', orderbook, 'interleaved', 2) === -1678454923);
+
+    // CASE 3: a level in the top depth changes, 100.5:2.25:100.6:2.5:100.4:0.5:100.7:0.75
+    orderbook['bids'][0][1] = 2.25;
+    assert (exchange.orderBookChecksum ('BTC/USDT', orderbook, 'interleaved', 2) === 271053164);
+    orderbook['bids'][0][1] = 1.25;
+
+    // CASE 4: bitfinex, 100.5:1.25:100.6:-2.5:100.4:0.5:100.7:-0.75
+    assert (exchange.orderBookChecksum ('BTC/USDT', orderbook, 'signed', 2) === -21409025);
+
+    // CASE 5: kraken, asks then bids, 10062500000001007750000001005125000000100450000000
+    assert (exchange.orderBookChecksum ('BTC/USDT', orderbook, 'stripped', 2, 0, 1, 8) === 20302849);
+}
+
+export default testOrderBookChecksum;
@@ -0,0 +1,106 @@
+// AUTO_TRANSPILE_ENABLED
+
+import assert from 'assert';
+import ccxt from '../../../ccxt.js';
+import testSharedMethods from '../Exchange/base/test.sharedMethods.js';
+
+function helperTradesMarket (id, symbol, base, quote, settle, type, contractSize) {
+    const spot = (type === 'spot');
+    return {
+        'id': id,
+        'symbol': symbol,
+        'base': base,
+        'quote': quote,
+        'settle': settle,
+        'baseId': base,
+        'quoteId': quote,
+        'settleId': settle,
+        'type': type,
+        'spot': spot,
+        'margin': false,
+        'swap': (type === 'swap'),
+        'future': false,
+        'option': false,
+        'active': true,
+        'contract': !spot,
+        'linear': spot ? undefined : (settle === quote),
+        'inverse': spot ? undefined : (settle === base),
+        'contractSize': contractSize,
+        'info': {},
+    };
+}
+
+function helperTestParseTradesBatch (exchange, trades, market) {
+    // the batch parser returns what parseTrade returns for every trade
+    const parsed = exchange.parseTradesBatch (trades, market);
+    assert (parsed.length === trades.length);
+    for (let i = 0; i < trades.length; i++) {
+        testSharedMethods.assertDeepEqual (exchange, undefined, 'testParseTradesBatch', parsed[i], exchange.parseTrade (trades[i], market));
+    }
+}
+
+function testParseTradesBatchBinance () {
+    const exchange = new ccxt.binance ();
+    const spot = helperTradesMarket ('BTCUSDT', 'BTC/USDT', 'BTC', 'USDT', undefined, 'spot', undefined);
+    const linear = helperTradesMarket ('BTCUSDT', 'BTC/USDT:USDT', 'BTC', 'USDT', 'USDT', 'swap', '1');
+    const inverse = helperTradesMarket ('BTCUSD_PERP', 'BTC/USD:BTC', 'BTC', 'USD', 'BTC', 'swap', '100');
+    exchange.setMarkets ([ spot, linear, inverse ]);
+    // the last trade is from fetchMyTrades and goes through parseTrade
+    const spotTrades = [
+        { 'a': 26129, 'p': '0.01633102', 'q': '4.70443515', 'f': 27781, 'l': 27781, 'T': 1498793709153, 'm': true, 'M': true },
+        { 'a': 26130, 'p': '0.01633103', 'q': '0.1', 'f': 27782, 'l': 27783, 'T': 1498793709154, 'm': false, 'M': true },
+        { 'symbol': 'BTCUSDT', 'id': 470227543, 'orderId': 4421170947, 'price': '0.53880000', 'qty': '10.00000000', 'quoteQty': '5.38800000', 'commission': '0.00538800', 'commissionAsset': 'USDT', 'time': 1707545780522, 'isBuyer': false, 'isMaker': false, 'isBestMatch': true },
+    ];
+    helperTestParseTradesBatch (exchange, spotTrades, exchange.markets['BTC/USDT']);
+    const contractTrades = [
+        { 'a': '269772814', 'p': '25864.1', 'q': '3', 'f': '662149354', 'l': '662149355', 'T': '1694209776022', 'm': false },
+        { 'a': '269772815', 'p': '25864.2', 'q': '1', 'f': '662149356', 'l': '662149356', 'T': '1694209776023', 'm': true },
+    ];
+    helperTestParseTradesBatch (exchange, contractTrades, exchange.markets['BTC/USDT:USDT']);
+    helperTestParseTradesBatch (exchange, contractTrades, exchange.markets['BTC/USD:BTC']);
+}
+
+function testParseTradesBatchOkx () {
+    const exchange = new ccxt.okx ();
+    const spot = helperTradesMarket ('BTC-USDT', 'BTC/USDT', 'BTC', 'USDT', undefined, 'spot', undefined);
+    const inverse = helperTradesMarket ('BTC-USD-SWAP', 'BTC/USD:BTC', 'BTC', 'USD', 'BTC', 'swap', '100');
+    exchange.setMarkets ([ spot, inverse ]);
+    // the fourth trade has an unknown instId, the last one is from fetchMyTrades and goes through parseTrade
+    const trades = [
+        { 'instId': 'BTC-USDT', 'side': 'buy', 'sz': '0.00001', 'px': '29963.2', 'tradeId': '242720720', 'ts': '1654161646974' },
+        { 'instId': 'BTC-USD-SWAP', 'side': 'sell', 'sz': '2', 'px': '29963.3', 'tradeId': '242720721', 'ts': '1654161646975', 'count': '1', 'source': '0' },
+        { 'instId': 'BTC-USDT', 'side': 'sell', 'sz': '0.5', 'px': '29963.1', 'tradeId': '242720722', 'ts': '1654161646976' },
+        { 'instId': 'ETH-USDC', 'side': 'buy', 'sz': '1', 'px': '1800', 'tradeId': '242720723', 'ts': '1654161646977' },
+        { 'side': 'buy', 'fillSz': '0.00001', 'fillPx': '29963.2', 'fee': '-0.00000001', 'feeCcy': 'BTC', 'ordId': '4414', 'instId': 'BTC-USDT', 'instType': 'SPOT', 'posSide': 'net', 'tradeId': '242720724', 'ts': '1654161646978', 'execType': 'T' },
+    ];
+    helperTestParseTradesBatch (exchange, trades, undefined);
+    helperTestParseTradesBatch (exchange, trades, exchange.markets['BTC/USDT']);
+}
+
+function testParseTradesBatchBybit () {
+    const exchange = new ccxt.bybit ();
+    const spot = helperTradesMarket ('BTCUSDT', 'BTC/USDT', 'BTC', 'USDT', undefined, 'spot', undefined);
+    const linear = helperTradesMarket ('BTCUSDT', 'BTC/USDT:USDT', 'BTC', 'USDT', 'USDT', 'swap', '1');
+    const inverse = helperTradesMarket ('BTCUSD', 'BTC/USD:BTC', 'BTC', 'USD', 'BTC', 'swap', '1');
+    exchange.setMarkets ([ spot, linear, inverse ]);
+    // the last trade is from fetchMyTrades and goes through parseTrade
+    const trades = [
+        { 'execId': '666042b4-50c6-58f3-bd9c-89b2088663ff', 'symbol': 'BTCUSDT', 'price': '16619.5', 'size': '0.001', 'side': 'Sell', 'time': '1669191277315', 'isBlockTrade': false },
+        { 'execId': '666042b4-50c6-58f3-bd9c-89b2088663fe', 'symbol': 'BTCUSDT', 'price': '16619.6', 'size': '0.002', 'side': 'Buy', 'time': '1669191277316', 'isBlockTrade': false, 'isRPITrade': false, 'seq': '1' },
+        { 'symbol': 'BTCUSDT', 'orderType': 'Market', 'orderId': '1', 'execFee': '0.01', 'feeCurrency': 'USDT', 'execId': '2', 'execPrice': '16619.5', 'execQty': '0.001', 'execValue': '16.6195', 'execTime': '1669191277317', 'isMaker': false, 'side': 'Buy', 'createType': 'CreateByUser' },
+    ];
+    helperTestParseTradesBatch (exchange, trades, undefined);
+    helperTestParseTradesBatch (exchange, trades, exchange.markets['BTC/USDT:USDT']);
+    const inverseTrades = [
+        { 'execId': '666042b4-50c6-58f3-bd9c-89b2088663fd', 'symbol': 'BTCUSD', 'price': '16619.5', 'size': '100', 'side': 'Buy', 'time': '1669191277318', 'isBlockTrade': false },
+    ];
+    helperTestParseTradesBatch (exchange, inverseTrades, exchange.markets['BTC/USD:BTC']);
+}
+
+function testParseTradesBatch () {
+    testParseTradesBatchBinance ();
+    testParseTradesBatchOkx ();
+    testParseTradesBatchBybit ();
+}
+
+export default testParseTradesBatch;
@@ -58,6 +58,10 @@ function testSafeMethods () {
     assert (exchange.safeValue (inputDict, 'str') === 'heLlo');
     assert (exchange.safeValue (inputDict, 'strNumber') === '3');
     assert (exchange.safeValue (inputList, 0) === 'Hi');
+    assert (exchange.safeValue (inputDict, 'zeroNumeric') === 0);
+    assert (exchange.safeValue (inputDict, 'undefined') === undefined);
+    assert (exchange.safeValue (inputDict, 'emptyString') === undefined);
+    assert (exchange.safeValue (inputDict, 'emptyString', 'default') === 'default');
 
     // safeValue2
     assert (exchange.safeValue2 (inputDict, 'a', 'i') === 1);
@@ -128,6 +132,11 @@ function testSafeMethods () {
     assert (exchange.safeString (inputDict, 'str') === 'heLlo');
     assert (exchange.safeString (inputDict, 'strNumber') === '3');
     assert (exchange.safeString (inputList, 0) === 'Hi');
+    assert (exchange.safeString (inputDict, 'zeroNumeric') === '0');
+    assert (exchange.safeString (inputDict, 'undefined') === undefined);
+    assert (exchange.safeString (inputDict, 'emptyString') === undefined);
+    assert (exchange.safeString (inputDict, 'emptyString', 'default') === 'default');
+    assert (exchange.safeString (inputDict, 'missing', 'default') === 'default');
 
     // safeString2
     assert (exchange.safeString2 (inputDict, 'a', 'i') === '1');
@@ -190,6 +199,10 @@ function testSafeMethods () {
     assert (exchange.safeInteger (inputDict, 'f') === 0);
     assert (exchange.safeInteger (inputDict, 'strNumber') === 3);
     assert (exchange.safeInteger (inputList, 1) === 2);
+    assert (exchange.safeInteger (inputDict, 'zeroString') === 0);
+    assert (exchange.safeInteger (inputDict, 'floatString') === 0);
+    assert (exchange.safeInteger (inputDict, 'emptyString') === undefined);
+    assert (exchange.safeInteger (inputDict, 'undefined', 1) === 1);
 
     // safeInteger2
     assert (exchange.safeInteger2 (inputDict, 'a', 'i') === 1);
@@ -0,0 +1,124 @@
+// AUTO_TRANSPILE_ENABLED
+
+import assert from 'assert';
+import ccxt from '../../../ccxt.js';
+import testSharedMethods from '../Exchange/base/test.sharedMethods.js';
+
+function helperMarket (id, symbol, base, quote, settle, type, expiry) {
+    const spot = (type === 'spot');
+    return {
+        'id': id,
+        'symbol': symbol,
+        'base': base,
+        'quote': quote,
+        'settle': settle,
+        'baseId': base,
+        'quoteId': quote,
+        'settleId': settle,
+        'type': type,
+        'spot': spot,
+        'margin': false,
+        'swap': (type === 'swap'),
+        'future': (type === 'future'),
+        'option': false,
+        'active': true,
+        'contract': !spot,
+        'linear': spot ? undefined : (settle === quote),
+        'inverse': spot ? undefined : (settle === base),
+        'expiry': expiry,
+        'info': {},
+    };
+}
+
+function helperSymbols (markets) {
+    const symbols = [];
+    for (let i = 0; i < markets.length; i++) {
+        symbols.push (markets[i]['symbol']);
+    }
+    return symbols;
+}
+
+function testSetMarkets () {
+    const exchange = new ccxt.Exchange ({
+        'id': 'sampleexchange',
+    });
+    const spot = helperMarket ('BTCUSDT', 'BTC/USDT', 'BTC', 'USDT', undefined, 'spot', undefined);
+    const linear = helperMarket ('BTCUSDT', 'BTC/USDT:USDT', 'BTC', 'USDT', 'USDT', 'swap', undefined);
+    const inverse = helperMarket ('BTCUSD_PERP', 'BTC/USD:BTC', 'BTC', 'USD', 'BTC', 'swap', undefined);
+    const future = helperMarket ('BTCUSD_240927', 'BTC/USD:BTC-240927', 'BTC', 'USD', 'BTC', 'future', 1727424000000);
+    const eth = helperMarket ('ETHUSDT', 'ETH/USDT', 'ETH', 'USDT', undefined, 'spot', undefined);
+    const ltc = helperMarket ('LTCUSDT', 'LTC/USDT', 'LTC', 'USDT', undefined, 'spot', undefined);
+    exchange.setMarkets ([ linear, inverse, future, spot, eth ]);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', exchange.symbols, [ 'BTC/USD:BTC', 'BTC/USD:BTC-240927', 'BTC/USDT', 'BTC/USDT:USDT', 'ETH/USDT' ]);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', exchange.ids, [ 'BTCUSDT', 'BTCUSD_240927', 'BTCUSD_PERP', 'ETHUSDT' ]);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', exchange.codes, [ 'BTC', 'ETH', 'USD', 'USDT' ]);
+    // spot markets come first in markets_by_id
+    assert (exchange.markets_by_id['BTCUSDT'][0]['symbol'] === 'BTC/USDT');
+    assert (exchange.markets['BTC/USDT:USDT']['subType'] === 'linear');
+    assert (exchange.markets['BTC/USDT']['subType'] === undefined);
+    //
+    // filterMarkets
+    //
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets ()), exchange.symbols);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets ('spot')), [ 'BTC/USDT', 'ETH/USDT' ]);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets (undefined, 'inverse')), [ 'BTC/USD:BTC', 'BTC/USD:BTC-240927' ]);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets (undefined, undefined, 'BTC', 'USDT')), [ 'BTC/USDT', 'BTC/USDT:USDT' ]);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets ('swap', undefined, undefined, undefined, 'USDT')), [ 'BTC/USDT:USDT' ]);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets (undefined, undefined, undefined, undefined, undefined, 1727424000000)), [ 'BTC/USD:BTC-240927' ]);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets (undefined, undefined, undefined, undefined, undefined, undefined, 'BTC/USD')), [ 'BTC/USD:BTC', 'BTC/USD:BTC-240927' ]);
+    // the underlying of a spot market is not set
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets (undefined, undefined, undefined, undefined, undefined, undefined, 'BTC/USDT')), [ 'BTC/USDT:USDT' ]);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets ('option')), []);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets ('spot', undefined, 'LTC')), []);
+    //
+    // safeMarket
+    //
+    assert (exchange.safeMarket ('ETHUSDT')['symbol'] === 'ETH/USDT');
+    assert (exchange.safeMarket ('BTCUSDT', undefined, undefined, 'swap')['symbol'] === 'BTC/USDT:USDT');
+    assert (exchange.safeMarket ('BTCUSDT', undefined, undefined, 'spot')['symbol'] === 'BTC/USDT');
+    assert (exchange.safeMarket ('BTCUSDT', exchange.markets['BTC/USDT:USDT'])['symbol'] === 'BTC/USDT:USDT');
+    assert (exchange.safeMarket ('LTC-USDT', undefined, '-')['symbol'] === 'LTC/USDT');
+    assert (exchange.safeMarket ('LTCUSDT')['symbol'] === 'LTCUSDT');
+    // the market memoized for an id and a type is dropped when the markets are set again
+    const delisted = exchange.extend (linear, { 'active': false });
+    exchange.setMarkets ([ delisted, inverse, future, spot, eth ]);
+    assert (!exchange.safeMarket ('BTCUSDT', undefined, undefined, 'swap')['active']);
+    assert (exchange.safeMarket ('BTCUSDT', undefined, undefined, 'spot')['active']);
+    // the index is dropped too
+    exchange.setMarkets ([ linear, spot, ltc ]);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets ('spot')), [ 'BTC/USDT', 'LTC/USDT' ]);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (exchange.filterMarkets (undefined, 'inverse')), []);
+    //
+    // incremental reload
+    //
+    const reloaded = new ccxt.Exchange ({
+        'id': 'sampleexchange',
+        'options': {
+            'incrementalReload': true,
+        },
+    });
+    reloaded.applyMarkets ([ linear, inverse, future, spot, eth ]);
+    assert (reloaded.safeMarket ('BTCUSDT', undefined, undefined, 'swap')['active']);
+    assert (reloaded.filterMarkets ('spot').length === 2);
+    // eth is removed, ltc is added and the linear swap changes
+    const fetched = [ delisted, inverse, future, spot, ltc ];
+    reloaded.applyMarkets (fetched);
+    const fresh = new ccxt.Exchange ({
+        'id': 'sampleexchange',
+    });
+    fresh.setMarkets (fetched);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', reloaded.symbols, fresh.symbols);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', reloaded.ids, fresh.ids);
+    // currencies are extended like on every reload
+    assert ('LTC' in reloaded.currencies);
+    for (let i = 0; i < fresh.symbols.length; i++) {
+        const symbol = fresh.symbols[i];
+        testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', reloaded.markets[symbol], fresh.markets[symbol]);
+    }
+    assert (!('ETH/USDT' in reloaded.markets));
+    assert (!('ETHUSDT' in reloaded.markets_by_id));
+    assert (!reloaded.safeMarket ('BTCUSDT', undefined, undefined, 'swap')['active']);
+    testSharedMethods.assertDeepEqual (exchange, undefined, 'testSetMarkets', helperSymbols (reloaded.filterMarkets ('spot')), [ 'BTC/USDT', 'LTC/USDT' ]);
+}
+
+export default testSetMarkets;
@@ -14,6 +14,9 @@ import testSum from './test.sum.js';
 import testOmit from './test.omit.js';
 import testGroupBy from './test.groupBy.js';
 import testFilterBy from './test.filterBy.js';
+import testSetMarkets from './test.setMarkets.js';
+import testParseTradesBatch from './test.parseTradesBatch.js';
+import testOrderBookChecksum from './test.orderBookChecksum.js';
 import testAfterConstructor from './test.afterConstructor.js';
 import testHandleMethods from './test.handleMethods.js';
 import testRemoveRepeatedElementsFromArray from './test.removeRepeatedElementsFromArray.js';
@@ -33,6 +36,9 @@ function baseTestsInit () {
     testOmit ();
     testGroupBy ();
     testFilterBy ();
+    testSetMarkets ();
+    testParseTradesBatch ();
+    testOrderBookChecksum ();
     testHandleMethods ();
     testRemoveRepeatedElementsFromArray ();
 }